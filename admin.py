@@ -35,6 +35,10 @@ admin.site.register(
     admission.Admission,
     admission.AdmissionAdmin
 )
+admin.site.register(
+    admission_search_document.AdmissionSearchDocument,
+    admission_search_document.AdmissionSearchDocumentAdmin
+)
 admin.site.register(
     continuing_education_person.ContinuingEducationPerson,
     continuing_education_person.ContinuingEducationPersonAdmin
@@ -51,10 +55,26 @@ admin.site.register(
     prospect.Prospect,
     prospect.ProspectAdmin
 )
+admin.site.register(
+    prospect_export_watermark.ProspectExportWatermark,
+    prospect_export_watermark.ProspectExportWatermarkAdmin
+)
 admin.site.register(
     continuing_education_training.ContinuingEducationTraining,
     continuing_education_training.ContinuingEducationTrainingAdmin
 )
+admin.site.register(
+    export_job.ExportJob,
+    export_job.ExportJobAdmin
+)
+admin.site.register(
+    admission_state_notification.AdmissionStateNotification,
+    admission_state_notification.AdmissionStateNotificationAdmin
+)
+admin.site.register(
+    formation_catalog.FormationCatalog,
+    formation_catalog.FormationCatalogAdmin
+)
 admin.site.register(
     continuing_education_manager.ContinuingEducationManager,
     continuing_education_manager.ContinuingEducationManagerAdmin,
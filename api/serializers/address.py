@@ -25,6 +25,7 @@
 ##############################################################################
 from rest_framework import serializers
 
+from continuing_education.business.address import get_address_content
 from continuing_education.models.address import Address
 from reference.api.serializers.country import CountrySerializer
 from reference.models.country import Country
@@ -52,10 +53,15 @@ class AddressPostSerializer(AddressSerializer):
         allow_null=True,
     )
 
-    def update(self, instance, validated_data, main_address=None):
-        if instance is None or instance == main_address:
-            address = Address.objects.create(**validated_data)
-        else:
-            Address.objects.filter(uuid=instance.uuid).update(**validated_data)
-            address = Address.objects.get(uuid=instance.uuid)
-        return address
+    def create(self, validated_data):
+        return Address.objects.intern(**validated_data)
+
+    def update(self, instance, validated_data):
+        """ Addresses are shared by identical content: the updated content is interned, the instance is left as is """
+        return self.intern_content(instance, validated_data)
+
+    def intern_content(self, instance, validated_data):
+        """ The new content of an address edited for one of its usages, the other usages keep the instance """
+        content = get_address_content(instance) if instance else {}
+        content.update(validated_data)
+        return Address.objects.intern(**content)
@@ -31,12 +31,12 @@ from continuing_education.api.serializers.continuing_education_person import Con
     ContinuingEducationPersonPostSerializer
 from continuing_education.api.serializers.continuing_education_training import ContinuingEducationTrainingSerializer
 from continuing_education.business.admission import save_state_changed_and_send_email
+from continuing_education.business.revision import save_and_create_revision, ADMISSION_CREATION, \
+    get_revision_messages
 from continuing_education.models.address import Address
 from continuing_education.models.admission import Admission
 from continuing_education.models.continuing_education_person import ContinuingEducationPerson
 from continuing_education.models.continuing_education_training import ContinuingEducationTraining
-from continuing_education.views.common import save_and_create_revision, ADMISSION_CREATION, \
-    get_revision_messages
 from reference.api.serializers.country import CountrySerializer
 from reference.models.country import Country
 
@@ -76,6 +76,19 @@ class AdmissionDetailSerializer(AdmissionListSerializer):
     professional_status_text = serializers.CharField(source='get_professional_status_display', read_only=True)
     activity_sector_text = serializers.CharField(source='get_activity_sector_display', read_only=True)
 
+    # Boolean views of the awareness channels bits
+    awareness_ucl_website = serializers.BooleanField(required=False)
+    awareness_formation_website = serializers.BooleanField(required=False)
+    awareness_press = serializers.BooleanField(required=False)
+    awareness_facebook = serializers.BooleanField(required=False)
+    awareness_linkedin = serializers.BooleanField(required=False)
+    awareness_customized_mail = serializers.BooleanField(required=False)
+    awareness_emailing = serializers.BooleanField(required=False)
+    awareness_word_of_mouth = serializers.BooleanField(required=False)
+    awareness_friends = serializers.BooleanField(required=False)
+    awareness_former_students = serializers.BooleanField(required=False)
+    awareness_moocs = serializers.BooleanField(required=False)
+
     class Meta:
         model = Admission
         fields = AdmissionListSerializer.Meta.fields + (
@@ -144,7 +157,8 @@ class AdmissionPostSerializer(AdmissionDetailSerializer):
     )
 
     def update(self, instance, validated_data):
-        self.update_field('address', validated_data, instance.address)
+        if 'address' in validated_data:
+            self.update_address(instance, validated_data.pop('address'))
         if 'person_information' in validated_data:
             validated_data.pop('person_information')
         instance._original_state = instance.state
@@ -153,11 +167,14 @@ class AdmissionPostSerializer(AdmissionDetailSerializer):
             save_state_changed_and_send_email(instance, connected_user=self.context.get('request').user)
         return update_result
 
-    def update_field(self, field, validated_data, instance):
-        if field in validated_data:
-            field_serializer = self.fields[field]
-            field_data = validated_data.pop(field)
-            field_serializer.update(instance, field_data)
+    def update_address(self, admission, address_data):
+        """ The billing and residence addresses sharing the main address follow it to its new content """
+        previous_address = admission.address
+        admission.address = self.fields['address'].intern_content(previous_address, address_data)
+        if admission.billing_address_id and admission.billing_address == previous_address:
+            admission.billing_address = admission.address
+        if admission.residence_address_id and admission.residence_address == previous_address:
+            admission.residence_address = admission.address
 
     def create(self, validated_data):
         if 'person_information' in validated_data:
@@ -171,7 +188,7 @@ class AdmissionPostSerializer(AdmissionDetailSerializer):
 
         if 'address' in validated_data:
             address_data = validated_data.pop('address')
-            address = Address.objects.create(**address_data)
+            address = Address.objects.intern(**address_data)
             validated_data['address'] = address
         admission = Admission(**validated_data)
         admission.residence_address = admission.address
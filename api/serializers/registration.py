@@ -174,7 +174,7 @@ class RegistrationPostSerializer(RegistrationDetailSerializer):
             field_serializer = self.fields[field]
             field_data = validated_data.pop(field)
             if to_update:
-                return field_serializer.update(getattr(instance, field), field_data, instance.address)
+                return field_serializer.intern_content(getattr(instance, field), field_data)
             else:
                 return instance.address
         return getattr(instance, field)
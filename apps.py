@@ -28,3 +28,6 @@ from django.apps import AppConfig
 
 class ContinuingEducationConfig(AppConfig):
     name = 'continuing_education'
+
+    def ready(self):
+        from continuing_education import signals  # noqa: F401
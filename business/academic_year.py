@@ -0,0 +1,57 @@
+##############################################################################
+#
+#    OSIS stands for Open Student Information System. It's an application
+#    designed to manage the core business of higher education institutions,
+#    such as universities, faculties, institutes and professional schools.
+#    The core business involves the administration of students, teachers,
+#    courses, programs and so on.
+#
+#    Copyright (C) 2015-2022 Université catholique de Louvain (http://www.uclouvain.be)
+#
+#    This program is free software: you can redistribute it and/or modify
+#    it under the terms of the GNU General Public License as published by
+#    the Free Software Foundation, either version 3 of the License, or
+#    (at your option) any later version.
+#
+#    This program is distributed in the hope that it will be useful,
+#    but WITHOUT ANY WARRANTY; without even the implied warranty of
+#    MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+#    GNU General Public License for more details.
+#
+#    A copy of this license - GNU General Public License - is available
+#    at the root of the source code of this program.  If not,
+#    see http://www.gnu.org/licenses/.
+#
+##############################################################################
+import threading
+import time
+
+from django.conf import settings
+
+from base.models import academic_year
+
+CURRENT_ACADEMIC_YEAR_TIMEOUT = getattr(settings, 'CONTINUING_EDUCATION_CURRENT_ACADEMIC_YEAR_TIMEOUT', 60)
+
+_current_academic_year = {}
+_lock = threading.Lock()
+
+
+def current_academic_year():
+    """
+    base.models.academic_year.current_academic_year, resolved once per time bucket by each process.
+    The academic years are saved in the rollover, which clears the memoized one through the signals;
+    the other processes pick the new year at the end of their bucket.
+    """
+    bucket = int(time.time() // CURRENT_ACADEMIC_YEAR_TIMEOUT)
+    with _lock:
+        if _current_academic_year.get('bucket') == bucket:
+            return _current_academic_year['academic_year']
+    current_year = academic_year.current_academic_year()
+    with _lock:
+        _current_academic_year.update(bucket=bucket, academic_year=current_year)
+    return current_year
+
+
+def clear_current_academic_year_cache():
+    with _lock:
+        _current_academic_year.clear()
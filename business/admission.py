@@ -31,12 +31,12 @@ from django.utils.translation import gettext as _
 
 from base.models.entity_version import EntityVersion
 from base.models.enums.entity_type import FACULTY
+from continuing_education.business.revision import save_and_create_revision, MAIL_MESSAGE, MAIL, \
+    get_valid_state_change_message, get_revision_messages, get_versions
 from continuing_education.models.enums.admission_state_choices import ACCEPTED, ACCEPTED_NO_REGISTRATION_REQUIRED, \
     SUBMITTED, REGISTRATION_SUBMITTED, REJECTED, WAITING, VALIDATED
 from continuing_education.models.enums.groups import MANAGERS_GROUP
 from continuing_education.models.file import AdmissionFile
-from continuing_education.views.common import save_and_create_revision, MAIL_MESSAGE, MAIL, \
-    get_valid_state_change_message, get_revision_messages, get_versions
 from osis_common.messaging import message_config
 from osis_common.messaging import send_message as message_service
 
@@ -44,11 +44,15 @@ MAX_DOCUMENTS_SIZE = 20000000
 
 
 def save_state_changed_and_send_email(admission, connected_user=None):
+    state_message = get_valid_state_change_message(admission)
+    save_and_create_revision(get_revision_messages(state_message), admission, connected_user)
+    send_state_changed_email(admission, connected_user)
+
+
+def send_state_changed_email(admission, connected_user=None):
     person = admission.person_information.person
     mails = _get_managers_mails(admission.formation)
     condition_of_acceptance, registration_required = None, None
-    state_message = get_valid_state_change_message(admission)
-    save_and_create_revision(get_revision_messages(state_message), admission, connected_user)
     if admission.state in (SUBMITTED, REGISTRATION_SUBMITTED):
         send_submission_email_to_admission_managers(admission, connected_user)
         send_submission_email_to_participant(admission, connected_user)
@@ -149,8 +153,8 @@ def _get_admission_managers_email_receivers(admission):
         ]
     else:
         return [
-            message_config.create_receiver(manager.id, manager.email, manager.language)
-            for manager in admission.formation.managers.all() if manager.email
+            message_config.create_receiver(contact.person_id, contact.email, contact.language)
+            for contact in admission.formation.get_manager_contacts() if contact.email
         ]
 
 
@@ -289,9 +293,8 @@ def _get_faculty_parent(management_entity):
 
 
 def _get_managers_mails(formation):
-    managers_mail = formation.managers.exclude(email="")\
-        .order_by('last_name').\
-        values_list('email', flat=True) if formation else []
+    managers_mail = [contact.email for contact in formation.get_manager_contacts() if contact.email] \
+        if formation else []
     return _(" or ").join(managers_mail)
 
 
@@ -0,0 +1,151 @@
+##############################################################################
+#
+#    OSIS stands for Open Student Information System. It's an application
+#    designed to manage the core business of higher education institutions,
+#    such as universities, faculties, institutes and professional schools.
+#    The core business involves the administration of students, teachers,
+#    courses, programs and so on.
+#
+#    Copyright (C) 2015-2022 Université catholique de Louvain (http://www.uclouvain.be)
+#
+#    This program is free software: you can redistribute it and/or modify
+#    it under the terms of the GNU General Public License as published by
+#    the Free Software Foundation, either version 3 of the License, or
+#    (at your option) any later version.
+#
+#    This program is distributed in the hope that it will be useful,
+#    but WITHOUT ANY WARRANTY; without even the implied warranty of
+#    MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+#    GNU General Public License for more details.
+#
+#    A copy of this license - GNU General Public License - is available
+#    at the root of the source code of this program.  If not,
+#    see http://www.gnu.org/licenses/.
+#
+##############################################################################
+import logging
+from collections import defaultdict, namedtuple
+from typing import Dict, Iterable, List
+
+from django.conf import settings
+from django.contrib.auth.models import User
+from django.db import transaction
+from django.utils import translation
+
+from continuing_education.business.admission import send_state_changed_email
+from continuing_education.business.background import run_in_background_on_commit
+from continuing_education.business.formation_choices import clear_formation_choices_cache
+from continuing_education.business.result_count import clear_result_counts_cache
+from continuing_education.business.revision import get_revision_messages, get_valid_state_change_message, \
+    create_admissions_revision
+from continuing_education.models.admission import Admission
+from continuing_education.models.admission_state_notification import AdmissionStateNotification
+from continuing_education.models.enums.admission_state_choices import NEW_ADMIN_STATE, ACCEPTED, \
+    ACCEPTED_NO_REGISTRATION_REQUIRED
+
+logger = logging.getLogger(settings.DEFAULT_LOGGER)
+
+NOTIFICATION_WORKERS = getattr(settings, 'CONTINUING_EDUCATION_NOTIFICATION_WORKERS', 1)
+TRANSITION_FIELDS = ['state', 'state_reason', 'condition_of_acceptance', 'academic_year']
+ACCEPTED_STATES = [ACCEPTED, ACCEPTED_NO_REGISTRATION_REQUIRED]
+
+TransitionResult = namedtuple('TransitionResult', ['moved_ids', 'rejected_ids'])
+
+def is_transition_allowed(state, new_state) -> bool:
+    return new_state in NEW_ADMIN_STATE.get(state, {}).get('states', [])
+
+
+def apply_state_transition(admission_ids: Iterable[int], new_state, user, reason_by_state: Dict[str, str] = None,
+                           academic_year_id=None) -> TransitionResult:
+    """
+    Move the admissions whose current state allows it to the new state, all together: one update, one revision per
+    state change message and the participant notifications, stored with the transition and sent in background once
+    committed. The other admissions, as well as the unknown ids, are rejected and left unchanged.
+    """
+    admission_ids = {int(admission_id) for admission_id in admission_ids}
+    reason = (reason_by_state or {}).get(new_state) or ''
+    with transaction.atomic():
+        admissions = Admission.objects.select_for_update().filter(id__in=admission_ids).order_by('pk')
+        moved_admissions = [
+            admission for admission in admissions if is_transition_allowed(admission.state, new_state)
+        ]
+        for admission in moved_admissions:
+            _set_new_state(admission, new_state, reason, academic_year_id)
+        if moved_admissions:
+            Admission.objects.bulk_update(moved_admissions, TRANSITION_FIELDS)
+            _create_state_change_revisions(moved_admissions, user)
+            # The bulk update sends no post_save signal: clear the caches depending on the admission states
+            clear_result_counts_cache()
+            clear_formation_choices_cache()
+            _create_state_change_notifications(moved_admissions, reason, user)
+            run_in_background_on_commit('notification', NOTIFICATION_WORKERS, send_state_change_notifications)
+    moved_ids = [admission.pk for admission in moved_admissions]
+    return TransitionResult(moved_ids, sorted(admission_ids.difference(moved_ids)))
+
+
+def _set_new_state(admission, new_state, reason, academic_year_id):
+    admission._original_state = admission.state
+    admission.state = new_state
+    if new_state in ACCEPTED_STATES:
+        admission.condition_of_acceptance = reason
+        admission.academic_year_id = academic_year_id
+    else:
+        admission.state_reason = reason
+
+
+def _create_state_change_revisions(admissions: List[Admission], user):
+    admissions_by_message = defaultdict(list)
+    for admission in admissions:
+        message = get_revision_messages(get_valid_state_change_message(admission))
+        admissions_by_message[message].append(admission)
+    for message, message_admissions in admissions_by_message.items():
+        create_admissions_revision(message, message_admissions, user)
+
+
+def _create_state_change_notifications(admissions: List[Admission], reason, user):
+    """
+    The emails are written in the language of the manager moving the admissions and show the state and reason of the
+    transition, whatever happens to the admissions before they are sent
+    """
+    language = translation.get_language() or ''
+    AdmissionStateNotification.objects.bulk_create([
+        AdmissionStateNotification(
+            admission=admission,
+            original_state=admission._original_state,
+            new_state=admission.state,
+            reason=reason,
+            sender=user,
+            language=language,
+        ) for admission in admissions
+    ])
+
+
+def send_state_change_notifications() -> int:
+    """
+    Send the pending state change notifications, including the ones left by a previous failure or restart.
+    A notification is deleted once sent, the ones being sent by another worker are skipped.
+    Returns the number of notifications sent.
+    """
+    with transaction.atomic():
+        notifications = list(
+            AdmissionStateNotification.objects.select_for_update(skip_locked=True).order_by('pk')
+        )
+        admissions = Admission.objects.filter(
+            pk__in={notification.admission_id for notification in notifications}
+        ).select_related('person_information__person', 'formation').with_formation_managers()
+        admissions_by_id = {admission.pk: admission for admission in admissions}
+        senders = User.objects.in_bulk({notification.sender_id for notification in notifications} - {None})
+        sent_ids = []
+        for notification in notifications:
+            admission = admissions_by_id[notification.admission_id]
+            _set_new_state(admission, notification.new_state, notification.reason, admission.academic_year_id)
+            admission._original_state = notification.original_state
+            try:
+                with transaction.atomic(), translation.override(notification.language or settings.LANGUAGE_CODE):
+                    send_state_changed_email(admission, senders.get(notification.sender_id))
+            except Exception:
+                logger.exception('State change notification of admission %s failed', admission.uuid)
+            else:
+                sent_ids.append(notification.pk)
+        AdmissionStateNotification.objects.filter(pk__in=sent_ids).delete()
+    return len(sent_ids)
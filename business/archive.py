@@ -0,0 +1,61 @@
+##############################################################################
+#
+#    OSIS stands for Open Student Information System. It's an application
+#    designed to manage the core business of higher education institutions,
+#    such as universities, faculties, institutes and professional schools.
+#    The core business involves the administration of students, teachers,
+#    courses, programs and so on.
+#
+#    Copyright (C) 2015-2022 Université catholique de Louvain (http://www.uclouvain.be)
+#
+#    This program is free software: you can redistribute it and/or modify
+#    it under the terms of the GNU General Public License as published by
+#    the Free Software Foundation, either version 3 of the License, or
+#    (at your option) any later version.
+#
+#    This program is distributed in the hope that it will be useful,
+#    but WITHOUT ANY WARRANTY; without even the implied warranty of
+#    MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+#    GNU General Public License for more details.
+#
+#    A copy of this license - GNU General Public License - is available
+#    at the root of the source code of this program.  If not,
+#    see http://www.gnu.org/licenses/.
+#
+##############################################################################
+from typing import Iterable, List
+
+from django.conf import settings
+from django.db import transaction
+
+from continuing_education.business.formation_choices import clear_formation_choices_cache
+from continuing_education.business.result_count import clear_result_counts_cache
+from continuing_education.business.revision import FILE_ARCHIVED, FILE_UNARCHIVED, get_revision_messages, \
+    create_admissions_revision
+from continuing_education.models.admission import Admission
+
+ARCHIVE_BATCH_SIZE = getattr(settings, 'CONTINUING_EDUCATION_ARCHIVE_BATCH_SIZE', 500)
+
+
+def set_archived_state(user, admission_ids: Iterable[int], archived: bool) -> List[Admission]:
+    """
+    Archive the admissions, or move them back to the live ones, by batches in a single transaction:
+    either all of them move, with one revision, or none does.
+    """
+    with transaction.atomic():
+        admissions = list(Admission.objects.select_for_update().filter(id__in=admission_ids).order_by('pk'))
+        for admission in admissions:
+            admission.archived = archived
+        moved_ids = [admission.pk for admission in admissions]
+        for start in range(0, len(moved_ids), ARCHIVE_BATCH_SIZE):
+            Admission.objects.filter(pk__in=moved_ids[start:start + ARCHIVE_BATCH_SIZE]).update(archived=archived)
+        if admissions:
+            create_admissions_revision(
+                get_revision_messages(FILE_ARCHIVED if archived else FILE_UNARCHIVED),
+                admissions,
+                user
+            )
+            # The update sends no post_save signal: clear the caches depending on the archived state
+            clear_result_counts_cache()
+            clear_formation_choices_cache()
+    return admissions
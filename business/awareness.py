@@ -0,0 +1,56 @@
+##############################################################################
+#
+#    OSIS stands for Open Student Information System. It's an application
+#    designed to manage the core business of higher education institutions,
+#    such as universities, faculties, institutes and professional schools.
+#    The core business involves the administration of students, teachers,
+#    courses, programs and so on.
+#
+#    Copyright (C) 2015-2022 Université catholique de Louvain (http://www.uclouvain.be)
+#
+#    This program is free software: you can redistribute it and/or modify
+#    it under the terms of the GNU General Public License as published by
+#    the Free Software Foundation, either version 3 of the License, or
+#    (at your option) any later version.
+#
+#    This program is distributed in the hope that it will be useful,
+#    but WITHOUT ANY WARRANTY; without even the implied warranty of
+#    MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+#    GNU General Public License for more details.
+#
+#    A copy of this license - GNU General Public License - is available
+#    at the root of the source code of this program.  If not,
+#    see http://www.gnu.org/licenses/.
+#
+##############################################################################
+from typing import List
+
+from django.db.models import Count, F, Q, Sum
+from django.utils.translation import gettext_lazy as _
+
+from continuing_education.models.enums.awareness_channel import AwarenessChannel, AWARENESS_BITS
+
+OTHER_CHANNEL = 'OTHER'
+
+
+def get_awareness_statistics(admission_list) -> List[dict]:
+    """
+    Number of admissions, and of admissions per awareness channel, for each formation and academic year of the list.
+    A single query sums the bit of each channel in awareness_channels over the groups.
+    """
+    channels_counts = {
+        channel.name: Sum(F('awareness_channels').bitand(bit).bitrightshift(bit.bit_length() - 1))
+        for channel, bit in AWARENESS_BITS.items()
+    }
+    return list(
+        admission_list.order_by().values('formation_id', 'academic_year_id').annotate(
+            admissions_number=Count('pk'),
+            **channels_counts,
+            **{OTHER_CHANNEL: Count('pk', filter=~Q(awareness_other=''))}
+        ).order_by('formation_id', 'academic_year_id')
+    )
+
+
+def get_awareness_channel_labels():
+    """ (key in the statistics, label) of the channels, in display order """
+    return [(channel.name, channel.value) for channel in AwarenessChannel] + [(OTHER_CHANNEL, _('Other'))]
@@ -0,0 +1,56 @@
+##############################################################################
+#
+#    OSIS stands for Open Student Information System. It's an application
+#    designed to manage the core business of higher education institutions,
+#    such as universities, faculties, institutes and professional schools.
+#    The core business involves the administration of students, teachers,
+#    courses, programs and so on.
+#
+#    Copyright (C) 2015-2022 Université catholique de Louvain (http://www.uclouvain.be)
+#
+#    This program is free software: you can redistribute it and/or modify
+#    it under the terms of the GNU General Public License as published by
+#    the Free Software Foundation, either version 3 of the License, or
+#    (at your option) any later version.
+#
+#    This program is distributed in the hope that it will be useful,
+#    but WITHOUT ANY WARRANTY; without even the implied warranty of
+#    MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+#    GNU General Public License for more details.
+#
+#    A copy of this license - GNU General Public License - is available
+#    at the root of the source code of this program.  If not,
+#    see http://www.gnu.org/licenses/.
+#
+##############################################################################
+import threading
+from concurrent.futures import ThreadPoolExecutor
+
+from django.db import connection, transaction
+
+_executors = {}
+_executors_lock = threading.Lock()
+
+
+def get_executor(name, max_workers) -> ThreadPoolExecutor:
+    """ One thread pool per name, created on first use and shared by the whole process """
+    with _executors_lock:
+        if name not in _executors:
+            _executors[name] = ThreadPoolExecutor(
+                max_workers=max_workers,
+                thread_name_prefix='continuing_education_{}'.format(name)
+            )
+    return _executors[name]
+
+
+def run_in_background_on_commit(name, max_workers, function, *args):
+    """ Run the function in a worker thread of the named pool once the current transaction is committed """
+    transaction.on_commit(lambda: get_executor(name, max_workers).submit(_run_in_worker, function, *args))
+
+
+def _run_in_worker(function, *args):
+    try:
+        return function(*args)
+    finally:
+        # Worker threads get their own database connection, which must not be left open
+        connection.close()
@@ -0,0 +1,86 @@
+##############################################################################
+#
+#    OSIS stands for Open Student Information System. It's an application
+#    designed to manage the core business of higher education institutions,
+#    such as universities, faculties, institutes and professional schools.
+#    The core business involves the administration of students, teachers,
+#    courses, programs and so on.
+#
+#    Copyright (C) 2015-2022 Université catholique de Louvain (http://www.uclouvain.be)
+#
+#    This program is free software: you can redistribute it and/or modify
+#    it under the terms of the GNU General Public License as published by
+#    the Free Software Foundation, either version 3 of the License, or
+#    (at your option) any later version.
+#
+#    This program is distributed in the hope that it will be useful,
+#    but WITHOUT ANY WARRANTY; without even the implied warranty of
+#    MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+#    GNU General Public License for more details.
+#
+#    A copy of this license - GNU General Public License - is available
+#    at the root of the source code of this program.  If not,
+#    see http://www.gnu.org/licenses/.
+#
+##############################################################################
+from collections import defaultdict
+from typing import List
+
+from django.conf import settings
+from django.core.cache import cache
+from django.db.models import Q
+from django.utils import timezone
+
+from base.models.entity_version import EntityVersion
+from base.models.enums.entity_type import FACULTY
+
+FACULTY_ENTITIES_CACHE_KEY = 'continuing_education_faculty_entities'
+FACULTY_ENTITIES_CACHE_TIMEOUT = getattr(settings, 'CONTINUING_EDUCATION_FACULTY_ENTITIES_CACHE_TIMEOUT', 24 * 60 * 60)
+
+
+def get_faculty_entity_ids(faculty_entity_id) -> List[int]:
+    """ Ids of the faculty entity and of all its subordinate entities """
+    return get_faculty_entities_map().get(faculty_entity_id, [faculty_entity_id])
+
+
+def get_faculty_entities_map():
+    faculty_entities = cache.get(FACULTY_ENTITIES_CACHE_KEY)
+    if faculty_entities is None:
+        faculty_entities = build_faculty_entities_map()
+        cache.set(FACULTY_ENTITIES_CACHE_KEY, faculty_entities, FACULTY_ENTITIES_CACHE_TIMEOUT)
+    return faculty_entities
+
+
+def build_faculty_entities_map(date=None):
+    """
+    Map each faculty entity id to its id and the ids of all the entities below it,
+    according to the entity versions valid at the given date (today by default).
+    """
+    date = date or timezone.now().date()
+    entity_versions = EntityVersion.objects.filter(
+        Q(end_date__isnull=True) | Q(end_date__gte=date),
+        start_date__lte=date,
+    ).values_list('entity_id', 'parent_id', 'entity_type')
+
+    children = defaultdict(set)
+    faculty_ids = set()
+    for entity_id, parent_id, entity_type in entity_versions:
+        if parent_id:
+            children[parent_id].add(entity_id)
+        if entity_type == FACULTY:
+            faculty_ids.add(entity_id)
+    return {faculty_id: _get_subordinate_ids(faculty_id, children) for faculty_id in faculty_ids}
+
+
+def _get_subordinate_ids(entity_id, children):
+    entity_ids = [entity_id]
+    visited = {entity_id}
+    for current_id in entity_ids:
+        for child_id in sorted(children[current_id] - visited):
+            visited.add(child_id)
+            entity_ids.append(child_id)
+    return entity_ids
+
+
+def clear_faculty_entities_cache():
+    cache.delete(FACULTY_ENTITIES_CACHE_KEY)
@@ -0,0 +1,262 @@
+##############################################################################
+#
+#    OSIS stands for Open Student Information System. It's an application
+#    designed to manage the core business of higher education institutions,
+#    such as universities, faculties, institutes and professional schools.
+#    The core business involves the administration of students, teachers,
+#    courses, programs and so on.
+#
+#    Copyright (C) 2015-2022 Université catholique de Louvain (http://www.uclouvain.be)
+#
+#    This program is free software: you can redistribute it and/or modify
+#    it under the terms of the GNU General Public License as published by
+#    the Free Software Foundation, either version 3 of the License, or
+#    (at your option) any later version.
+#
+#    This program is distributed in the hope that it will be useful,
+#    but WITHOUT ANY WARRANTY; without even the implied warranty of
+#    MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+#    GNU General Public License for more details.
+#
+#    A copy of this license - GNU General Public License - is available
+#    at the root of the source code of this program.  If not,
+#    see http://www.gnu.org/licenses/.
+#
+##############################################################################
+import datetime
+import logging
+import tempfile
+
+from django.conf import settings
+from django.core.files import File
+from django.http import QueryDict
+from django.utils import timezone, translation
+
+from continuing_education.auth.roles.continuing_education_student_worker import \
+    is_continuing_education_student_worker
+from continuing_education.business.background import run_in_background_on_commit
+from continuing_education.business.search_results import get_cached_search_result_ids, get_search_filters, \
+    get_user_scope, filter_by_ordered_ids, ADMISSIONS_SEARCH, REGISTRATIONS_SEARCH, ARCHIVES_SEARCH, \
+    ALL_TRAININGS_SCOPE
+from continuing_education.business.xls import xls_admission, xls_registration, xls_archive, \
+    xls_registration_by_formation
+from continuing_education.business.xls.xls_columns import EXPORT_COLUMNS_PARAMETER
+from continuing_education.business.xls.xls_streaming import write_xls, write_xls_sheets
+from continuing_education.forms.search import AdmissionFilterForm, RegistrationFilterForm, ArchiveFilterForm
+from continuing_education.models.admission import Admission, filter_authorized_admissions
+from continuing_education.models.enums.export_job_choices import ExportJobState, ExportJobKind
+from continuing_education.models.export_job import ExportJob
+
+logger = logging.getLogger(settings.DEFAULT_LOGGER)
+
+EXPORT_JOB_WORKERS = getattr(settings, 'CONTINUING_EDUCATION_EXPORT_JOB_WORKERS', 2)
+EXPORT_JOB_TTL = datetime.timedelta(
+    seconds=getattr(settings, 'CONTINUING_EDUCATION_EXPORT_JOB_TTL', 24 * 60 * 60)
+)
+EXPORT_JOB_STALE_AFTER = datetime.timedelta(
+    seconds=getattr(settings, 'CONTINUING_EDUCATION_EXPORT_JOB_STALE_AFTER', 60 * 60)
+)
+STALE_JOB_ERROR = 'Interrupted before completion'
+SYNCHRONOUS_EXPORT_LIMIT = getattr(settings, 'CONTINUING_EDUCATION_SYNCHRONOUS_EXPORT_LIMIT', 1000)
+PROGRESS_STEP = 500
+EXCLUDED_FILTERS = ['xls_status', 'csrfmiddlewaretoken', 'page']
+
+def write_small_export(output, user, kind, query_params):
+    """
+    Write the export into output right away if it has at most SYNCHRONOUS_EXPORT_LIMIT rows (0 disables it) and
+    return its file name. Larger exports are not written and None is returned: they go through an export job.
+    """
+    filters = _get_filters(query_params)
+    object_list, search_form = _get_object_list(user, kind, filters)
+    if not SYNCHRONOUS_EXPORT_LIMIT or object_list.count() > SYNCHRONOUS_EXPORT_LIMIT:
+        return None
+    return _write_export_file(output, user, kind, object_list, search_form, filters)
+
+
+def create_export_job(user, kind, query_params):
+    job = ExportJob.objects.create(
+        user=user,
+        kind=kind,
+        filters=_get_filters(query_params),
+        language=translation.get_language() or '',
+    )
+    run_in_background_on_commit('export', EXPORT_JOB_WORKERS, run_export_job, job.pk)
+    delete_expired_export_jobs()
+    fail_stale_export_jobs()
+    return job
+
+
+def run_export_job(job_id):
+    job = ExportJob.objects.select_related('user').get(pk=job_id)
+    # Headers and values are rendered in the language of the manager who asked for the export
+    with translation.override(job.language or settings.LANGUAGE_CODE):
+        return _build_export_file(job)
+
+
+def _build_export_file(job):
+    try:
+        object_list, search_form = _get_object_list(job.user, job.kind, job.filters)
+        job.state = ExportJobState.RUNNING.name
+        job.total = object_list.count()
+        job.save(update_fields=['state', 'total', 'updated_at'])
+
+        with tempfile.TemporaryFile() as output:
+            filename = _write_export_file(output, job.user, job.kind, object_list, search_form, job.filters, job)
+            output.seek(0)
+            job.file.save(filename, File(output), save=False)
+
+        job.state = ExportJobState.DONE.name
+        job.progress = job.total
+    except Exception as e:
+        logger.exception('Export job %s failed', job.uuid)
+        job.state = ExportJobState.FAILED.name
+        job.error = str(e)
+    job.finished_at = timezone.now()
+    _save_finished_job(job)
+    return job
+
+
+def _save_finished_job(job):
+    """ A job failed as stale in the meantime keeps its state: the file it wrote too late is dropped """
+    saved = ExportJob.objects.filter(
+        pk=job.pk,
+        state__in=[ExportJobState.PENDING.name, ExportJobState.RUNNING.name],
+    ).update(
+        state=job.state,
+        progress=job.progress,
+        error=job.error,
+        file=job.file.name or '',
+        finished_at=job.finished_at,
+        updated_at=job.finished_at,
+    )
+    if not saved:
+        logger.warning('Export job %s finished after being failed as stale', job.uuid)
+        if job.file:
+            job.file.delete(save=False)
+        job.refresh_from_db()
+
+
+def _write_export_file(output, user, kind, object_list, search_form, filters, job=None):
+    """ Write the export into output and return its file name, tracking the progress on the job if any """
+    parameters = EXPORT_MODULES[kind].get_export_parameters(
+        user, object_list, search_form, filters.get(EXPORT_COLUMNS_PARAMETER)
+    )
+    filename = "{}.xlsx".format(parameters.pop('filename'))
+    if 'sheets' in parameters:
+        if job:
+            parameters['sheets'] = _track_sheets_progress(job, parameters['sheets'])
+        write_xls_sheets(output, **parameters)
+    else:
+        if job:
+            parameters['rows'] = _track_progress(job, parameters['rows'])
+        write_xls(output, **parameters)
+    return filename
+
+
+def _track_progress(job, rows, start=0):
+    for progress, row in enumerate(rows, start=start + 1):
+        yield row
+        if progress % PROGRESS_STEP == 0:
+            ExportJob.objects.filter(pk=job.pk).update(progress=progress, updated_at=timezone.now())
+
+
+def _track_sheets_progress(job, sheets):
+    progress = 0
+    for title, rows in sheets:
+        yield title, _track_progress(job, rows, start=progress)
+        progress += len(rows)
+
+
+def _get_filters(query_params):
+    return {key: values for key, values in query_params.lists() if key not in EXCLUDED_FILTERS}
+
+
+def _get_object_list(user, kind, filters):
+    data = QueryDict(mutable=True)
+    for key, values in filters.items():
+        data.setlist(key, values)
+    object_list, search_form = OBJECT_LIST_GETTERS[kind](user, data)
+    # The manager usually exports the search being browsed: its result ids are then already cached
+    result_ids = get_cached_search_result_ids(SEARCHES[kind], _get_search_scope(user, kind), get_search_filters(data))
+    if result_ids is not None:
+        object_list = filter_by_ordered_ids(Admission.objects.all(), result_ids)
+    return object_list, search_form
+
+
+def _get_search_scope(user, kind):
+    if SEARCHES[kind] == REGISTRATIONS_SEARCH and is_continuing_education_student_worker(user):
+        return ALL_TRAININGS_SCOPE
+    return get_user_scope(user)
+
+
+def _get_admissions(user, data):
+    search_form = AdmissionFilterForm(data)
+    if search_form.is_valid():
+        return filter_authorized_admissions(user, search_form.get_admissions()), search_form
+    return Admission.objects.none(), search_form
+
+
+def _get_registrations(user, data):
+    search_form = RegistrationFilterForm(data, user=user)
+    admission_list = Admission.registration_objects.all()
+    if search_form.is_valid():
+        admission_list = search_form.get_registrations()
+    if not is_continuing_education_student_worker(user):
+        admission_list = filter_authorized_admissions(user, admission_list)
+    return admission_list, search_form
+
+
+def _get_archives(user, data):
+    search_form = ArchiveFilterForm(data=data, user=user)
+    if search_form.is_valid():
+        return filter_authorized_admissions(user, search_form.get_archives()), search_form
+    return Admission.objects.none(), search_form
+
+
+OBJECT_LIST_GETTERS = {
+    ExportJobKind.ADMISSIONS.name: _get_admissions,
+    ExportJobKind.REGISTRATIONS.name: _get_registrations,
+    ExportJobKind.REGISTRATIONS_BY_FORMATION.name: _get_registrations,
+    ExportJobKind.ARCHIVES.name: _get_archives,
+}
+
+SEARCHES = {
+    ExportJobKind.ADMISSIONS.name: ADMISSIONS_SEARCH,
+    ExportJobKind.REGISTRATIONS.name: REGISTRATIONS_SEARCH,
+    ExportJobKind.REGISTRATIONS_BY_FORMATION.name: REGISTRATIONS_SEARCH,
+    ExportJobKind.ARCHIVES.name: ARCHIVES_SEARCH,
+}
+
+EXPORT_MODULES = {
+    ExportJobKind.ADMISSIONS.name: xls_admission,
+    ExportJobKind.REGISTRATIONS.name: xls_registration,
+    ExportJobKind.REGISTRATIONS_BY_FORMATION.name: xls_registration_by_formation,
+    ExportJobKind.ARCHIVES.name: xls_archive,
+}
+
+
+def delete_expired_export_jobs(now=None):
+    limit = (now or timezone.now()) - EXPORT_JOB_TTL
+    expired_jobs = ExportJob.objects.filter(created_at__lt=limit)
+    for job in expired_jobs:
+        if job.file:
+            job.file.delete(save=False)
+    return expired_jobs.delete()[0]
+
+
+def fail_stale_export_jobs(now=None):
+    """
+    Jobs run in a thread of the web process: a running job without any progress for too long was lost with its
+    process (e.g. by a restart) and will never finish. Pending jobs may be waiting behind others, they expire with
+    the other jobs after EXPORT_JOB_TTL.
+    """
+    now = now or timezone.now()
+    return ExportJob.objects.filter(
+        state=ExportJobState.RUNNING.name,
+        updated_at__lt=now - EXPORT_JOB_STALE_AFTER,
+    ).update(
+        state=ExportJobState.FAILED.name,
+        error=STALE_JOB_ERROR,
+        finished_at=now,
+        updated_at=now,
+    )
@@ -0,0 +1,87 @@
+##############################################################################
+#
+#    OSIS stands for Open Student Information System. It's an application
+#    designed to manage the core business of higher education institutions,
+#    such as universities, faculties, institutes and professional schools.
+#    The core business involves the administration of students, teachers,
+#    courses, programs and so on.
+#
+#    Copyright (C) 2015-2022 Université catholique de Louvain (http://www.uclouvain.be)
+#
+#    This program is free software: you can redistribute it and/or modify
+#    it under the terms of the GNU General Public License as published by
+#    the Free Software Foundation, either version 3 of the License, or
+#    (at your option) any later version.
+#
+#    This program is distributed in the hope that it will be useful,
+#    but WITHOUT ANY WARRANTY; without even the implied warranty of
+#    MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+#    GNU General Public License for more details.
+#
+#    A copy of this license - GNU General Public License - is available
+#    at the root of the source code of this program.  If not,
+#    see http://www.gnu.org/licenses/.
+#
+##############################################################################
+from collections import Counter, defaultdict
+from typing import Dict
+
+from django.db.models import Count, F
+
+from base.models.education_group_year import EducationGroupYear
+from base.models.entity_version import EntityVersion
+from continuing_education.business.entity import get_faculty_entity_ids
+from continuing_education.business.filter_choices import get_faculty_choices
+
+STATE_FACET = 'state'
+FORMATION_FACET = 'formation'
+FACULTY_FACET = 'faculty'
+FACETS = (STATE_FACET, FORMATION_FACET, FACULTY_FACET)
+
+
+def get_facet_counts(admission_list) -> Dict[str, Dict]:
+    """
+    Number of admissions of the list per state, formation and faculty, keyed like the options of the search form
+    filters. The state and formation facets are summed from a single query grouped on the state and formation.
+    """
+    counts = {facet: Counter() for facet in FACETS}
+    admissions_by_education_group = Counter()
+    groups = admission_list.order_by().values(
+        STATE_FACET,
+        FORMATION_FACET,
+        education_group=F('formation__education_group_id'),
+    ).annotate(admissions_number=Count('pk'))
+    for group in groups:
+        counts[STATE_FACET][group[STATE_FACET]] += group['admissions_number']
+        counts[FORMATION_FACET][group[FORMATION_FACET]] += group['admissions_number']
+        if group['education_group']:
+            admissions_by_education_group[group['education_group']] += group['admissions_number']
+    counts[FACULTY_FACET] = _by_faculty_choice(admissions_by_education_group)
+    return {facet: dict(facet_counts) for facet, facet_counts in counts.items()}
+
+
+def _by_faculty_choice(admissions_by_education_group):
+    """
+    Same predicate as the faculty filter: an admission counts for a faculty if the management entity of any year of
+    its education group is the faculty or one of its subordinate entities.
+    """
+    management_entities = defaultdict(set)
+    for education_group_id, entity_id in EducationGroupYear.objects.filter(
+        education_group_id__in=list(admissions_by_education_group),
+        management_entity__isnull=False,
+    ).values_list('education_group_id', 'management_entity_id').distinct():
+        management_entities[education_group_id].add(entity_id)
+
+    faculty_version_ids = [version_id for version_id, acronym in get_faculty_choices()]
+    counts = {}
+    for version_id, entity_id in EntityVersion.objects.filter(pk__in=faculty_version_ids).values_list(
+        'pk', 'entity_id'
+    ):
+        faculty_entity_ids = set(get_faculty_entity_ids(entity_id))
+        admissions_number = sum(
+            admissions_number for education_group_id, admissions_number in admissions_by_education_group.items()
+            if management_entities[education_group_id] & faculty_entity_ids
+        )
+        if admissions_number:
+            counts[version_id] = admissions_number
+    return counts
@@ -0,0 +1,107 @@
+##############################################################################
+#
+#    OSIS stands for Open Student Information System. It's an application
+#    designed to manage the core business of higher education institutions,
+#    such as universities, faculties, institutes and professional schools.
+#    The core business involves the administration of students, teachers,
+#    courses, programs and so on.
+#
+#    Copyright (C) 2015-2022 Université catholique de Louvain (http://www.uclouvain.be)
+#
+#    This program is free software: you can redistribute it and/or modify
+#    it under the terms of the GNU General Public License as published by
+#    the Free Software Foundation, either version 3 of the License, or
+#    (at your option) any later version.
+#
+#    This program is distributed in the hope that it will be useful,
+#    but WITHOUT ANY WARRANTY; without even the implied warranty of
+#    MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+#    GNU General Public License for more details.
+#
+#    A copy of this license - GNU General Public License - is available
+#    at the root of the source code of this program.  If not,
+#    see http://www.gnu.org/licenses/.
+#
+##############################################################################
+import datetime
+from typing import List, Tuple
+
+from django.core.cache import cache
+from django.utils import timezone
+
+from base.models import entity_version
+from base.models.enums import entity_type
+from base.models.person import Person
+from continuing_education.auth.roles.continuing_education_training_manager import ContinuingEducationTrainingManager
+from continuing_education.models.continuing_education_training import ContinuingEducationTraining
+
+FACULTY_CHOICES_CACHE_KEY = 'continuing_education_faculty_choices'
+MANAGER_CHOICES_CACHE_KEY = 'continuing_education_manager_choices'
+MANAGED_TRAINING_CHOICES_CACHE_KEY = 'continuing_education_managed_training_choices'
+TRAINING_MANAGERS_GROUP = 'continuing_education_training_managers'
+
+
+def get_faculty_choices() -> List[Tuple[int, str]]:
+    """ (entity version id, acronym) of the faculties valid today, sorted by acronym """
+    return _get_cached_choices(FACULTY_CHOICES_CACHE_KEY, _build_faculty_choices)
+
+
+def get_manager_choices() -> List[Tuple[int, str]]:
+    """ (person id, name) of the training managers, sorted by last name """
+    return _get_cached_choices(MANAGER_CHOICES_CACHE_KEY, _build_manager_choices)
+
+
+def get_managed_training_choices() -> List[Tuple[int, str]]:
+    """ (training id, acronym and title) of the trainings having at least one manager """
+    return _get_cached_choices(MANAGED_TRAINING_CHOICES_CACHE_KEY, _build_managed_training_choices)
+
+
+def get_training_managers():
+    return Person.objects.filter(user__groups__name=TRAINING_MANAGERS_GROUP).order_by('last_name')
+
+
+def clear_faculty_choices_cache():
+    cache.delete(FACULTY_CHOICES_CACHE_KEY)
+
+
+def clear_manager_choices_cache():
+    cache.delete_many([MANAGER_CHOICES_CACHE_KEY, MANAGED_TRAINING_CHOICES_CACHE_KEY])
+
+
+def clear_filter_choices_cache():
+    clear_faculty_choices_cache()
+    clear_manager_choices_cache()
+
+
+def _get_cached_choices(cache_key, build_choices):
+    choices = cache.get(cache_key)
+    if choices is None:
+        choices = build_choices()
+        cache.set(cache_key, choices, _seconds_until_tomorrow())
+    return choices
+
+
+def _seconds_until_tomorrow():
+    """ The choices depend on the current date, so they are refreshed every day """
+    now = timezone.localtime()
+    tomorrow = timezone.make_aware(datetime.datetime.combine(now.date() + datetime.timedelta(days=1), datetime.time()))
+    return max(int((tomorrow - now).total_seconds()), 1)
+
+
+def _build_faculty_choices():
+    return list(
+        entity_version.find_latest_version(timezone.now())
+        .filter(entity_type=entity_type.FACULTY).order_by('acronym')
+        .values_list('pk', 'acronym')
+    )
+
+
+def _build_manager_choices():
+    return [(person.pk, str(person)) for person in get_training_managers()]
+
+
+def _build_managed_training_choices():
+    trainings = ContinuingEducationTraining.objects.formations().filter(
+        id__in=ContinuingEducationTrainingManager.objects.values_list('training', flat=True)
+    )
+    return sorted(((training.pk, training.acronym_and_title) for training in trainings), key=lambda choice: choice[1])
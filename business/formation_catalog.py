@@ -0,0 +1,157 @@
+##############################################################################
+#
+#    OSIS stands for Open Student Information System. It's an application
+#    designed to manage the core business of higher education institutions,
+#    such as universities, faculties, institutes and professional schools.
+#    The core business involves the administration of students, teachers,
+#    courses, programs and so on.
+#
+#    Copyright (C) 2015-2022 Université catholique de Louvain (http://www.uclouvain.be)
+#
+#    This program is free software: you can redistribute it and/or modify
+#    it under the terms of the GNU General Public License as published by
+#    the Free Software Foundation, either version 3 of the License, or
+#    (at your option) any later version.
+#
+#    This program is distributed in the hope that it will be useful,
+#    but WITHOUT ANY WARRANTY; without even the implied warranty of
+#    MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+#    GNU General Public License for more details.
+#
+#    A copy of this license - GNU General Public License - is available
+#    at the root of the source code of this program.  If not,
+#    see http://www.gnu.org/licenses/.
+#
+##############################################################################
+from typing import Dict, Iterable
+
+from django.db import transaction
+from django.db.models import Exists, OuterRef, Q
+
+from base.models.education_group import EducationGroup
+from base.models.education_group_year import EducationGroupYear
+from base.models.entity_version import EntityVersion
+from base.models.enums.entity_type import FACULTY
+from continuing_education.models.continuing_education_training import ContinuingEducationTraining, \
+    CONTINUING_EDUCATION_TRAINING_TYPES
+from continuing_education.models.formation_catalog import FormationCatalog
+
+
+def refresh_formation_catalog(education_group_ids: Iterable[int] = None):
+    """
+    Rebuild the catalog rows of the given education groups (of every education group by default)
+    from their most recent education group year.
+    """
+    education_group_ids = None if education_group_ids is None else list(education_group_ids)
+    catalog_rows = build_formation_catalog_rows(get_catalog_education_group_ids(education_group_ids))
+
+    with transaction.atomic():
+        catalog = FormationCatalog.objects.all()
+        if education_group_ids is not None:
+            catalog = catalog.filter(education_group_id__in=education_group_ids)
+        catalog.delete()
+        FormationCatalog.objects.bulk_create(catalog_rows.values())
+
+
+def build_formation_catalog_rows(education_group_ids: Iterable[int]) -> Dict[int, FormationCatalog]:
+    """ Catalog rows of the given education groups by education group id, built from their current data, unsaved """
+    most_recent_education_group_years = get_most_recent_education_group_years(list(education_group_ids))
+    faculties = get_management_faculties(
+        {egy.management_entity_id for egy in most_recent_education_group_years.values()}
+    )
+    trainings_by_education_group = {
+        training.education_group_id: training
+        for training in ContinuingEducationTraining.objects.filter(
+            education_group_id__in=list(most_recent_education_group_years)
+        )
+    }
+    return {
+        education_group_id: _build_catalog_row(
+            egy, faculties.get(egy.management_entity_id), trainings_by_education_group
+        ) for education_group_id, egy in most_recent_education_group_years.items()
+    }
+
+
+def refresh_formation_catalog_on_commit(education_group_ids: Iterable[int]):
+    """ Refresh outside of the transaction of the change, which is not slowed down by the rebuild """
+    education_group_ids = list(education_group_ids)
+    transaction.on_commit(lambda: refresh_formation_catalog(education_group_ids))
+
+
+def refresh_formation_catalog_of_entity_on_commit(entity_id):
+    transaction.on_commit(lambda: refresh_formation_catalog_of_entity(entity_id))
+
+
+def get_catalog_education_group_ids(education_group_ids=None):
+    """
+    Education groups listed by the catalog: those having a continuing education training,
+    and those of a continuing education type, which can be organized.
+    """
+    if education_group_ids is not None and not education_group_ids:
+        return []
+    education_groups = EducationGroup.objects.filter(
+        Q(continuingeducationtraining__isnull=False) | Exists(
+            EducationGroupYear.objects.filter(
+                education_group=OuterRef('pk'),
+                education_group_type__name__in=CONTINUING_EDUCATION_TRAINING_TYPES,
+            )
+        )
+    )
+    if education_group_ids is not None:
+        education_groups = education_groups.filter(pk__in=education_group_ids)
+    return list(education_groups.values_list('pk', flat=True))
+
+
+def refresh_formation_catalog_of_entity(entity_id):
+    """ The faculty of a row depends on the versions of its management entity """
+    refresh_formation_catalog(
+        FormationCatalog.objects.filter(management_entity_id=entity_id).values_list('education_group_id', flat=True)
+    )
+
+
+def get_most_recent_education_group_years(education_group_ids=None):
+    if education_group_ids is not None and not education_group_ids:
+        return {}
+    education_group_years = EducationGroupYear.objects.select_related(
+        'academic_year', 'management_entity'
+    ).order_by(
+        'education_group_id', '-academic_year__year'
+    ).distinct('education_group_id')
+    if education_group_ids is not None:
+        education_group_years = education_group_years.filter(education_group_id__in=education_group_ids)
+    return {egy.education_group_id: egy for egy in education_group_years}
+
+
+def get_management_faculties(entity_ids):
+    """
+    Same rule as get_management_faculty: the management entity itself if its (first) version is a faculty,
+    the parent of that version otherwise.
+    """
+    if not entity_ids:
+        return {}
+    entity_versions = EntityVersion.objects.filter(entity_id__in=entity_ids).select_related('entity', 'parent')
+    if not entity_versions.ordered:
+        entity_versions = entity_versions.order_by('pk')
+    faculties = {}
+    for entity_version in entity_versions:
+        if entity_version.entity_id not in faculties:
+            faculties[entity_version.entity_id] = entity_version.entity \
+                if entity_version.entity_type == FACULTY else entity_version.parent
+    return faculties
+
+
+def _build_catalog_row(education_group_year, faculty, trainings_by_education_group):
+    training = trainings_by_education_group.get(education_group_year.education_group_id)
+    return FormationCatalog(
+        education_group_id=education_group_year.education_group_id,
+        education_group_year=education_group_year,
+        acronym=education_group_year.acronym or '',
+        partial_acronym=education_group_year.partial_acronym or '',
+        title=education_group_year.title or '',
+        education_group_type_id=education_group_year.education_group_type_id,
+        management_entity_id=education_group_year.management_entity_id,
+        faculty=faculty,
+        training=training,
+        active=training.active if training else False,
+        training_aid=training.training_aid if training else False,
+    )
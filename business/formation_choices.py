@@ -0,0 +1,65 @@
+##############################################################################
+#
+#    OSIS stands for Open Student Information System. It's an application
+#    designed to manage the core business of higher education institutions,
+#    such as universities, faculties, institutes and professional schools.
+#    The core business involves the administration of students, teachers,
+#    courses, programs and so on.
+#
+#    Copyright (C) 2015-2022 Université catholique de Louvain (http://www.uclouvain.be)
+#
+#    This program is free software: you can redistribute it and/or modify
+#    it under the terms of the GNU General Public License as published by
+#    the Free Software Foundation, either version 3 of the License, or
+#    (at your option) any later version.
+#
+#    This program is distributed in the hope that it will be useful,
+#    but WITHOUT ANY WARRANTY; without even the implied warranty of
+#    MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+#    GNU General Public License for more details.
+#
+#    A copy of this license - GNU General Public License - is available
+#    at the root of the source code of this program.  If not,
+#    see http://www.gnu.org/licenses/.
+#
+##############################################################################
+from typing import List, Tuple
+
+from django.conf import settings
+from django.core.cache import cache
+
+from continuing_education.models.admission import Admission
+from continuing_education.models.continuing_education_training import ContinuingEducationTraining
+
+FORMATION_CHOICES_CACHE_KEY = 'continuing_education_formation_choices'
+FORMATION_CHOICES_CACHE_TIMEOUT = getattr(settings, 'CONTINUING_EDUCATION_FORMATION_CHOICES_CACHE_TIMEOUT', 24 * 60 * 60)
+
+
+def get_formation_choices(states, archived_status=False) -> List[Tuple[int, str]]:
+    """
+    (id, acronym and title) of the trainings having admissions in the given states, sorted by label.
+    The options of each state group are cached until an admission or a training changes.
+    """
+    group_key = (str(states), archived_status)
+    formation_choices = cache.get(FORMATION_CHOICES_CACHE_KEY) or {}
+    if group_key not in formation_choices:
+        formation_choices[group_key] = build_formation_choices(states, archived_status)
+        cache.set(FORMATION_CHOICES_CACHE_KEY, formation_choices, FORMATION_CHOICES_CACHE_TIMEOUT)
+    return formation_choices[group_key]
+
+
+def build_formation_choices(states, archived_status=False):
+    trainings = ContinuingEducationTraining.objects.formations().filter(
+        id__in=Admission.objects.filter(
+            state__in=states,
+            archived=archived_status
+        ).values_list('formation', flat=False)
+    )
+    return sorted(
+        ((training.pk, training.acronym_and_title) for training in trainings),
+        key=lambda choice: choice[1]
+    )
+
+
+def clear_formation_choices_cache():
+    cache.delete(FORMATION_CHOICES_CACHE_KEY)
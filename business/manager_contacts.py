@@ -0,0 +1,80 @@
+##############################################################################
+#
+#    OSIS stands for Open Student Information System. It's an application
+#    designed to manage the core business of higher education institutions,
+#    such as universities, faculties, institutes and professional schools.
+#    The core business involves the administration of students, teachers,
+#    courses, programs and so on.
+#
+#    Copyright (C) 2015-2022 Université catholique de Louvain (http://www.uclouvain.be)
+#
+#    This program is free software: you can redistribute it and/or modify
+#    it under the terms of the GNU General Public License as published by
+#    the Free Software Foundation, either version 3 of the License, or
+#    (at your option) any later version.
+#
+#    This program is distributed in the hope that it will be useful,
+#    but WITHOUT ANY WARRANTY; without even the implied warranty of
+#    MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+#    GNU General Public License for more details.
+#
+#    A copy of this license - GNU General Public License - is available
+#    at the root of the source code of this program.  If not,
+#    see http://www.gnu.org/licenses/.
+#
+##############################################################################
+from collections import namedtuple
+from typing import Dict, Iterable, List
+
+from django.conf import settings
+from django.core.cache import cache
+
+from continuing_education.auth.roles.continuing_education_training_manager import ContinuingEducationTrainingManager
+
+MANAGER_CONTACTS_CACHE_KEY = 'continuing_education_manager_contacts_{}'
+MANAGER_CONTACTS_CACHE_TIMEOUT = getattr(settings, 'CONTINUING_EDUCATION_MANAGER_CONTACTS_CACHE_TIMEOUT', 24 * 60 * 60)
+
+ManagerContact = namedtuple('ManagerContact', ['person_id', 'name', 'email', 'language'])
+
+
+def get_manager_contacts(training_id) -> List[ManagerContact]:
+    return get_manager_contacts_by_training([training_id])[training_id]
+
+
+def get_manager_contacts_by_training(training_ids: Iterable[int]) -> Dict[int, List[ManagerContact]]:
+    """ Contacts of the managers of each training, sorted by name, read from the cache and loaded when missing """
+    cache_keys = {MANAGER_CONTACTS_CACHE_KEY.format(training_id): training_id for training_id in set(training_ids)}
+    contacts = {cache_keys[key]: value for key, value in cache.get_many(list(cache_keys)).items()}
+    missing_training_ids = [training_id for training_id in cache_keys.values() if training_id not in contacts]
+    if missing_training_ids:
+        loaded_contacts = _load_manager_contacts(missing_training_ids)
+        cache.set_many(
+            {MANAGER_CONTACTS_CACHE_KEY.format(training_id): value for training_id, value in loaded_contacts.items()},
+            MANAGER_CONTACTS_CACHE_TIMEOUT
+        )
+        contacts.update(loaded_contacts)
+    return contacts
+
+
+def build_manager_contacts(persons) -> List[ManagerContact]:
+    return [ManagerContact(person.pk, str(person), person.email, person.language) for person in persons]
+
+
+def clear_manager_contacts_cache(training_ids: Iterable[int]):
+    cache.delete_many([MANAGER_CONTACTS_CACHE_KEY.format(training_id) for training_id in training_ids])
+
+
+def clear_person_manager_contacts_cache(person_id):
+    clear_manager_contacts_cache(
+        ContinuingEducationTrainingManager.objects.filter(person_id=person_id).values_list('training_id', flat=True)
+    )
+
+
+def _load_manager_contacts(training_ids):
+    persons_by_training = {training_id: [] for training_id in training_ids}
+    training_managers = ContinuingEducationTrainingManager.objects.filter(
+        training_id__in=training_ids
+    ).select_related('person').order_by('person__last_name', 'person__first_name')
+    for training_manager in training_managers:
+        persons_by_training[training_manager.training_id].append(training_manager.person)
+    return {training_id: build_manager_contacts(persons) for training_id, persons in persons_by_training.items()}
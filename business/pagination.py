@@ -0,0 +1,189 @@
+##############################################################################
+#
+#    OSIS stands for Open Student Information System. It's an application
+#    designed to manage the core business of higher education institutions,
+#    such as universities, faculties, institutes and professional schools.
+#    The core business involves the administration of students, teachers,
+#    courses, programs and so on.
+#
+#    Copyright (C) 2015-2022 Université catholique de Louvain (http://www.uclouvain.be)
+#
+#    This program is free software: you can redistribute it and/or modify
+#    it under the terms of the GNU General Public License as published by
+#    the Free Software Foundation, either version 3 of the License, or
+#    (at your option) any later version.
+#
+#    This program is distributed in the hope that it will be useful,
+#    but WITHOUT ANY WARRANTY; without even the implied warranty of
+#    MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+#    GNU General Public License for more details.
+#
+#    A copy of this license - GNU General Public License - is available
+#    at the root of the source code of this program.  If not,
+#    see http://www.gnu.org/licenses/.
+#
+##############################################################################
+import base64
+import binascii
+import json
+from collections.abc import Sequence
+
+from django.conf import settings
+from django.core.serializers.json import DjangoJSONEncoder
+from django.db.models import Q
+
+PAGE_SIZES = getattr(settings, 'CONTINUING_EDUCATION_PAGE_SIZES', (10, 25, 50, 100))
+DEFAULT_PAGE_SIZE = PAGE_SIZES[0]
+
+CURSOR_PARAMETER = 'cursor'
+DIRECTION_PARAMETER = 'direction'
+PAGE_SIZE_PARAMETER = 'page_size'
+
+NEXT = 'next'
+PREVIOUS = 'previous'
+
+
+class InvalidCursor(ValueError):
+    pass
+
+
+class KeysetPage(Sequence):
+    def __init__(self, object_list, page_size, has_next=False, has_previous=False, next_cursor=None,
+                 previous_cursor=None):
+        self.object_list = object_list
+        self.page_size = page_size
+        self.has_next = has_next
+        self.has_previous = has_previous
+        self.next_cursor = next_cursor
+        self.previous_cursor = previous_cursor
+
+    def __getitem__(self, index):
+        return self.object_list[index]
+
+    def __len__(self):
+        return len(self.object_list)
+
+    def has_other_pages(self):
+        return self.has_next or self.has_previous
+
+
+class KeysetPaginator:
+    """
+    Seek pagination over a queryset sorted on keys, the last of which must be unique (e.g. 'pk').
+    A page is read from the key values of the row bounding the previous one, so no OFFSET nor COUNT
+    is executed. Keys are field or annotation names, prefixed by '-' for a descending order, and
+    must not be null.
+    """
+
+    def __init__(self, queryset, keys, page_size=DEFAULT_PAGE_SIZE):
+        self.queryset = queryset
+        self.keys = tuple(keys)
+        self.page_size = page_size
+
+    def page(self, cursor=None, direction=NEXT):
+        if cursor is None:
+            return self._get_page(self.queryset, reverse=False, has_previous=False)
+        values = decode_cursor(cursor, len(self.keys))
+        if direction == PREVIOUS:
+            page = self._get_page(self._seek(values, reverse=True), reverse=True, has_next=True)
+            return page if page.has_previous else self.page()
+        return self._get_page(self._seek(values, reverse=False), reverse=False, has_previous=True)
+
+    def _get_page(self, queryset, reverse, has_next=False, has_previous=False):
+        rows = list(queryset.order_by(*self._get_ordering(reverse))[:self.page_size + 1])
+        has_more = len(rows) > self.page_size
+        rows = rows[:self.page_size]
+        if reverse:
+            rows.reverse()
+            has_previous = has_more
+        else:
+            has_next = has_more
+        return KeysetPage(
+            rows,
+            self.page_size,
+            has_next=has_next,
+            has_previous=has_previous,
+            next_cursor=self._get_cursor(rows[-1]) if has_next and rows else None,
+            previous_cursor=self._get_cursor(rows[0]) if has_previous and rows else None,
+        )
+
+    def _seek(self, values, reverse):
+        condition = Q()
+        equal_keys = {}
+        for key, value in zip(self.keys, values):
+            name = key.lstrip('-')
+            lookup = 'lt' if key.startswith('-') != reverse else 'gt'
+            condition |= Q(**equal_keys, **{'{}__{}'.format(name, lookup): value})
+            equal_keys[name] = value
+        return self.queryset.filter(condition)
+
+    def _get_ordering(self, reverse):
+        if not reverse:
+            return self.keys
+        return tuple(key[1:] if key.startswith('-') else '-' + key for key in self.keys)
+
+    def _get_cursor(self, row):
+        return encode_cursor([getattr(row, key.lstrip('-')) for key in self.keys])
+
+
+def encode_cursor(values):
+    return base64.urlsafe_b64encode(json.dumps(values, cls=DjangoJSONEncoder).encode()).decode()
+
+
+def decode_cursor(cursor, keys_number):
+    try:
+        values = json.loads(base64.urlsafe_b64decode(cursor.encode()))
+    except (binascii.Error, UnicodeError, ValueError):
+        raise InvalidCursor(cursor)
+    if not isinstance(values, list) or len(values) != keys_number or None in values:
+        raise InvalidCursor(cursor)
+    return values
+
+
+def get_page_size(value):
+    try:
+        page_size = int(value)
+    except (TypeError, ValueError):
+        return DEFAULT_PAGE_SIZE
+    return page_size if page_size in PAGE_SIZES else DEFAULT_PAGE_SIZE
+
+
+class SearchResultPaginator:
+    """
+    Pages of a search whose sorted key values are already known (see search_results.get_search_result_keys):
+    a page slices them and fetches its rows by primary key. Cursors are the same as KeysetPaginator ones.
+    """
+
+    def __init__(self, queryset, result_keys, page_size=DEFAULT_PAGE_SIZE):
+        self.queryset = queryset
+        self.result_keys = result_keys
+        self.page_size = page_size
+
+    def page(self, cursor=None, direction=NEXT):
+        if cursor is None or not self.result_keys:
+            return self._get_page(0)
+        position = self._get_position(decode_cursor(cursor, len(self.result_keys[0])))
+        if direction == PREVIOUS:
+            start = position - self.page_size
+            return self._get_page(start) if start > 0 else self.page()
+        return self._get_page(position + 1)
+
+    def _get_page(self, start):
+        page_keys = self.result_keys[start:start + self.page_size]
+        rows_by_pk = self.queryset.in_bulk([values[-1] for values in page_keys])
+        has_next = start + self.page_size < len(self.result_keys)
+        has_previous = start > 0
+        return KeysetPage(
+            [rows_by_pk[values[-1]] for values in page_keys if values[-1] in rows_by_pk],
+            self.page_size,
+            has_next=has_next,
+            has_previous=has_previous,
+            next_cursor=encode_cursor(list(page_keys[-1])) if has_next and page_keys else None,
+            previous_cursor=encode_cursor(list(page_keys[0])) if has_previous and page_keys else None,
+        )
+
+    def _get_position(self, values):
+        for position, result_values in enumerate(self.result_keys):
+            if result_values[-1] == values[-1]:
+                return position
+        raise InvalidCursor(values)
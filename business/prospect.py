@@ -23,13 +23,82 @@
 #    see http://www.gnu.org/licenses/.
 #
 ##############################################################################
+import datetime
+
+from django.conf import settings
+from django.db import transaction
+from django.db.models import Max, Q
+from django.utils import timezone
+
 from continuing_education.auth.roles.continuing_education_training_manager import ContinuingEducationTrainingManager
 from continuing_education.models.prospect import Prospect
+from continuing_education.models.prospect_export_watermark import ProspectExportWatermark
+
+PROSPECT_COMMIT_DELAY = datetime.timedelta(
+    seconds=getattr(settings, 'CONTINUING_EDUCATION_PROSPECT_COMMIT_DELAY', 60)
+)
 
 
 def get_prospects_by_user(user):
+    prospects_list = list(get_prospects_queryset_by_user(user))
+    return prospects_list
+
+
+def get_prospects_queryset_by_user(user):
     person_trainings = ContinuingEducationTrainingManager.objects.filter(
         person=user.person
     ).values_list('training', flat=True)
-    prospects_list = list(Prospect.objects.filter(formation_id__in=person_trainings))
-    return prospects_list
+    return Prospect.objects.filter(formation_id__in=person_trainings)
+
+
+def get_last_prospect_export_date(user):
+    return ProspectExportWatermark.objects.filter(user=user).aggregate(Max('exported_at'))['exported_at__max']
+
+
+def get_last_prospect_id():
+    """
+    Last prospect id a delta export can go up to. Prospect ids are given on insert, not on commit: a prospect still
+    being saved may have a lower id than a committed one and would be skipped forever once the watermark is past it.
+    The prospects created during the last PROSPECT_COMMIT_DELAY are therefore left for the next export; only a
+    prospect whose transaction lasts longer than this delay can still be missed.
+    """
+    settled_prospects = Q(created_at__lte=timezone.now() - PROSPECT_COMMIT_DELAY) | Q(created_at__isnull=True)
+    return Prospect.objects.filter(settled_prospects).aggregate(Max('id'))['id__max'] or 0
+
+
+def get_new_prospects_by_user(user, up_to_id):
+    """
+    Prospects of the user's trainings not yet acknowledged as exported, up to the prospect id up_to_id.
+    Each training has its own watermark: a training newly assigned to the user has all its prospects exported.
+    Reading them does not move the watermarks, see acknowledge_prospect_export.
+    """
+    last_exported_ids = dict(
+        ProspectExportWatermark.objects.filter(user=user).values_list('training_id', 'last_exported_id')
+    )
+    new_prospects_filter = Q()
+    for training_id in _get_training_ids(user):
+        new_prospects_filter |= Q(formation_id=training_id, id__gt=last_exported_ids.get(training_id, 0))
+    if not new_prospects_filter:
+        return []
+    return list(Prospect.objects.filter(new_prospects_filter, id__lte=up_to_id).order_by('id'))
+
+
+@transaction.atomic
+def acknowledge_prospect_export(user, up_to_id):
+    """ Move the watermarks of the user's trainings to up_to_id, once the export file has been received """
+    for training_id in _get_training_ids(user):
+        watermark, _ = ProspectExportWatermark.objects.select_for_update().get_or_create(
+            user=user,
+            training_id=training_id
+        )
+        if watermark.last_exported_id < up_to_id:
+            watermark.last_exported_id = up_to_id
+            watermark.save()
+
+
+def _get_training_ids(user):
+    return set(
+        ContinuingEducationTrainingManager.objects.filter(
+            person=user.person, training__isnull=False
+        ).values_list('training', flat=True)
+    )
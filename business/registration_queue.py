@@ -37,12 +37,12 @@ from django.utils.translation import gettext_lazy as _
 from rules.contrib.views import permission_required
 
 from base.views.common import display_error_messages
+from continuing_education.business.revision import save_and_create_revision, get_revision_messages, \
+    UCL_REGISTRATION_SENDED, UCL_REGISTRATION_REJECTED, UCL_REGISTRATION_STATE_CHANGED, \
+    UCL_REGISTRATION_REGISTERED
 from continuing_education.models.admission import Admission
 from continuing_education.models.admission import admission_getter
 from continuing_education.models.enums.ucl_registration_state_choices import UCLRegistrationState
-from continuing_education.views.common import save_and_create_revision, get_revision_messages, \
-    UCL_REGISTRATION_SENDED, UCL_REGISTRATION_REJECTED, UCL_REGISTRATION_STATE_CHANGED, \
-    UCL_REGISTRATION_REGISTERED
 from osis_common.queue.queue_sender import send_message
 
 
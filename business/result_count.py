@@ -0,0 +1,102 @@
+##############################################################################
+#
+#    OSIS stands for Open Student Information System. It's an application
+#    designed to manage the core business of higher education institutions,
+#    such as universities, faculties, institutes and professional schools.
+#    The core business involves the administration of students, teachers,
+#    courses, programs and so on.
+#
+#    Copyright (C) 2015-2022 Université catholique de Louvain (http://www.uclouvain.be)
+#
+#    This program is free software: you can redistribute it and/or modify
+#    it under the terms of the GNU General Public License as published by
+#    the Free Software Foundation, either version 3 of the License, or
+#    (at your option) any later version.
+#
+#    This program is distributed in the hope that it will be useful,
+#    but WITHOUT ANY WARRANTY; without even the implied warranty of
+#    MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+#    GNU General Public License for more details.
+#
+#    A copy of this license - GNU General Public License - is available
+#    at the root of the source code of this program.  If not,
+#    see http://www.gnu.org/licenses/.
+#
+##############################################################################
+import hashlib
+import json
+
+from django.conf import settings
+from django.core.cache import cache
+from django.db import connections
+
+RESULT_COUNT_CACHE_KEY = 'continuing_education_result_count_{version}_{list_name}_{scope}_{filters_hash}'
+RESULT_COUNT_VERSION_CACHE_KEY = 'continuing_education_result_count_version'
+RESULT_COUNT_CACHE_TIMEOUT = getattr(settings, 'CONTINUING_EDUCATION_RESULT_COUNT_CACHE_TIMEOUT', 60)
+ESTIMATED_COUNT_THRESHOLD = getattr(settings, 'CONTINUING_EDUCATION_ESTIMATED_COUNT_THRESHOLD', 50000)
+
+
+class ResultCount(int):
+    """ Number of results of a list, flagged when it is the planner estimate rather than an exact count """
+
+    def __new__(cls, value, estimated=False):
+        result_count = super().__new__(cls, value)
+        result_count.estimated = estimated
+        return result_count
+
+    def __reduce__(self):
+        return ResultCount, (int(self), self.estimated)
+
+
+def get_result_count(queryset, list_name, scope, filters=None, estimate=False) -> ResultCount:
+    """
+    Number of rows of the queryset, cached for a short time per list, user scope and filters.
+    With estimate, an unfiltered list whose planner estimate exceeds ESTIMATED_COUNT_THRESHOLD
+    is not counted and the estimate is returned.
+    """
+    filters = {name: sorted(values) for name, values in (filters or {}).items() if any(values)}
+    cache_key = RESULT_COUNT_CACHE_KEY.format(
+        version=get_results_cache_version(),
+        list_name=list_name,
+        scope=scope,
+        filters_hash=get_filters_hash(filters)
+    )
+    result_count = cache.get(cache_key)
+    if result_count is None:
+        result_count = _count(queryset, estimate and not filters)
+        cache.set(cache_key, result_count, RESULT_COUNT_CACHE_TIMEOUT)
+    return result_count
+
+
+def get_results_cache_version():
+    return cache.get_or_set(RESULT_COUNT_VERSION_CACHE_KEY, 1, None)
+
+
+def clear_result_counts_cache():
+    """ Outdate every cached count and search result list at once by moving to a new version of their keys """
+    try:
+        cache.incr(RESULT_COUNT_VERSION_CACHE_KEY)
+    except ValueError:
+        pass
+
+
+def get_filters_hash(filters):
+    return hashlib.sha1(json.dumps(filters, sort_keys=True).encode()).hexdigest()
+
+
+def get_estimated_count(queryset):
+    sql, params = queryset.query.sql_with_params()
+    with connections[queryset.db].cursor() as cursor:
+        cursor.execute('EXPLAIN (FORMAT JSON) ' + sql, params)
+        plan = cursor.fetchone()[0]
+    if isinstance(plan, str):
+        plan = json.loads(plan)
+    return int(plan[0]['Plan']['Plan Rows'])
+
+
+def _count(queryset, estimate):
+    if estimate:
+        estimated_count = get_estimated_count(queryset)
+        if estimated_count > ESTIMATED_COUNT_THRESHOLD:
+            return ResultCount(estimated_count, estimated=True)
+    return ResultCount(queryset.count())
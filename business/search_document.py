@@ -0,0 +1,112 @@
+##############################################################################
+#
+#    OSIS stands for Open Student Information System. It's an application
+#    designed to manage the core business of higher education institutions,
+#    such as universities, faculties, institutes and professional schools.
+#    The core business involves the administration of students, teachers,
+#    courses, programs and so on.
+#
+#    Copyright (C) 2015-2022 Université catholique de Louvain (http://www.uclouvain.be)
+#
+#    This program is free software: you can redistribute it and/or modify
+#    it under the terms of the GNU General Public License as published by
+#    the Free Software Foundation, either version 3 of the License, or
+#    (at your option) any later version.
+#
+#    This program is distributed in the hope that it will be useful,
+#    but WITHOUT ANY WARRANTY; without even the implied warranty of
+#    MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+#    GNU General Public License for more details.
+#
+#    A copy of this license - GNU General Public License - is available
+#    at the root of the source code of this program.  If not,
+#    see http://www.gnu.org/licenses/.
+#
+##############################################################################
+import re
+import unicodedata
+from typing import Iterable
+
+from django.contrib.postgres.search import SearchVector, SearchQuery, SearchRank
+from django.db import transaction
+from django.db.models import Prefetch, F, FloatField
+from django.db.models.functions import Cast
+
+from base.models.education_group_year import EducationGroupYear
+from continuing_education.models.admission import Admission
+from continuing_education.models.admission_search_document import AdmissionSearchDocument
+
+CHUNK_SIZE = 500
+SEARCH_CONFIG = 'simple'
+
+
+def normalize_search_text(text):
+    """ Lowercased text without accents, as stored in the search documents """
+    decomposed = unicodedata.normalize('NFKD', text or '')
+    return ''.join(character for character in decomposed if not unicodedata.combining(character)).lower().strip()
+
+
+def build_document_text(admission):
+    person = admission.person_information.person if admission.person_information else None
+    values = [
+        person.first_name if person else '',
+        person.last_name if person else '',
+        person.email if person else '',
+        admission.email,
+    ]
+    for education_group_year in admission.formation.education_group.educationgroupyear_set.all():
+        values += [education_group_year.acronym, education_group_year.title]
+    if admission.address:
+        values += [admission.address.country.name if admission.address.country else '', admission.address.city]
+    return ' '.join(normalize_search_text(value) for value in values if value)
+
+
+def update_search_documents(admission_ids: Iterable[int]):
+    """ Rebuild the search documents of the given admissions, CHUNK_SIZE admissions at a time """
+    admission_ids = list(admission_ids)
+    for start in range(0, len(admission_ids), CHUNK_SIZE):
+        _update_search_documents_chunk(admission_ids[start:start + CHUNK_SIZE])
+
+
+@transaction.atomic
+def _update_search_documents_chunk(admission_ids):
+    admissions = Admission.objects.filter(pk__in=admission_ids).select_related(
+        'person_information__person',
+        'address__country',
+        'formation__education_group',
+    ).prefetch_related(
+        Prefetch(
+            'formation__education_group__educationgroupyear_set',
+            queryset=EducationGroupYear.objects.only('education_group_id', 'acronym', 'title')
+        )
+    )
+    documents = [
+        AdmissionSearchDocument(admission_id=admission.pk, document=build_document_text(admission))
+        for admission in admissions
+    ]
+    AdmissionSearchDocument.objects.filter(admission_id__in=admission_ids).delete()
+    AdmissionSearchDocument.objects.bulk_create(documents)
+    AdmissionSearchDocument.objects.filter(admission_id__in=admission_ids).update(
+        search_vector=SearchVector('document', config=SEARCH_CONFIG)
+    )
+
+
+def search_admissions(free_text, qs):
+    """
+    Admissions of qs whose search document contains free_text (trigram index),
+    ranked by the full-text match of its words (tsvector index).
+    """
+    search_text = normalize_search_text(free_text)
+    qs = qs.filter(search_document__document__contains=search_text)
+    words = re.findall(r'\w+', search_text)
+    if not words:
+        return qs
+    query = SearchQuery(
+        ' & '.join('{}:*'.format(word) for word in words),
+        config=SEARCH_CONFIG,
+        search_type='raw'
+    )
+    # ts_rank returns a real: cast it to a double so its value survives a round trip in a pagination cursor
+    return qs.annotate(
+        search_rank=Cast(SearchRank(F('search_document__search_vector'), query), FloatField())
+    ).order_by('-search_rank', 'pk')
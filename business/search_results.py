@@ -0,0 +1,109 @@
+##############################################################################
+#
+#    OSIS stands for Open Student Information System. It's an application
+#    designed to manage the core business of higher education institutions,
+#    such as universities, faculties, institutes and professional schools.
+#    The core business involves the administration of students, teachers,
+#    courses, programs and so on.
+#
+#    Copyright (C) 2015-2022 Université catholique de Louvain (http://www.uclouvain.be)
+#
+#    This program is free software: you can redistribute it and/or modify
+#    it under the terms of the GNU General Public License as published by
+#    the Free Software Foundation, either version 3 of the License, or
+#    (at your option) any later version.
+#
+#    This program is distributed in the hope that it will be useful,
+#    but WITHOUT ANY WARRANTY; without even the implied warranty of
+#    MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+#    GNU General Public License for more details.
+#
+#    A copy of this license - GNU General Public License - is available
+#    at the root of the source code of this program.  If not,
+#    see http://www.gnu.org/licenses/.
+#
+##############################################################################
+from typing import List, Optional, Tuple
+
+from django.conf import settings
+from django.contrib.postgres.fields import ArrayField
+from django.core.cache import cache
+from django.db.models import Func, IntegerField, Value
+
+from continuing_education.business.pagination import CURSOR_PARAMETER, DIRECTION_PARAMETER, PAGE_SIZE_PARAMETER
+from continuing_education.business.result_count import get_filters_hash, get_results_cache_version
+from continuing_education.business.xls.xls_columns import EXPORT_COLUMNS_PARAMETER
+
+SEARCH_RESULTS_CACHE_KEY = 'continuing_education_search_results_{version}_{list_name}_{scope}_{filters_hash}'
+SEARCH_RESULTS_CACHE_TIMEOUT = getattr(settings, 'CONTINUING_EDUCATION_SEARCH_RESULTS_CACHE_TIMEOUT', 5 * 60)
+SEARCH_RESULTS_MAX_SIZE = getattr(settings, 'CONTINUING_EDUCATION_SEARCH_RESULTS_MAX_SIZE', 10000)
+TOO_MANY_RESULTS = False
+
+ADMISSIONS_SEARCH = 'admissions'
+REGISTRATIONS_SEARCH = 'registrations'
+ARCHIVES_SEARCH = 'archives'
+
+ALL_TRAININGS_SCOPE = 'all'
+NOT_FILTERING_PARAMETERS = {
+    CURSOR_PARAMETER, DIRECTION_PARAMETER, PAGE_SIZE_PARAMETER, EXPORT_COLUMNS_PARAMETER,
+    'page', 'xls_status', 'csrfmiddlewaretoken'
+}
+
+
+def get_search_filters(data):
+    """ Search parameters of the query dict, without the pagination and export ones """
+    filters = {name: values for name, values in data.lists() if name not in NOT_FILTERING_PARAMETERS}
+    return {name: sorted(values) for name, values in filters.items() if any(values)}
+
+
+def get_user_scope(user):
+    if user.has_perm('continuing_education.manage_all_trainings'):
+        return ALL_TRAININGS_SCOPE
+    return user.pk
+
+
+def get_search_result_keys(queryset, keys, list_name, scope, filters) -> Optional[List[Tuple]]:
+    """
+    Sort key values of the rows of the searched queryset, in order, the last key being the primary key.
+    They are cached for a short time per list, user scope and filters, so that the search runs once
+    while the manager browses its pages. None when the search has more than SEARCH_RESULTS_MAX_SIZE results.
+    """
+    cache_key = _get_cache_key(list_name, scope, filters)
+    result_keys = cache.get(cache_key)
+    if result_keys is None:
+        result_keys = list(
+            queryset.order_by(*keys).values_list(*[key.lstrip('-') for key in keys])[:SEARCH_RESULTS_MAX_SIZE + 1]
+        )
+        if len(result_keys) > SEARCH_RESULTS_MAX_SIZE:
+            result_keys = TOO_MANY_RESULTS
+        cache.set(cache_key, result_keys, SEARCH_RESULTS_CACHE_TIMEOUT)
+    if result_keys is TOO_MANY_RESULTS:
+        return None
+    return result_keys
+
+
+def get_cached_search_result_ids(list_name, scope, filters) -> Optional[List[int]]:
+    """ Ordered ids of a search already cached by get_search_result_keys, None if it is not """
+    result_keys = cache.get(_get_cache_key(list_name, scope, filters))
+    if result_keys is None or result_keys is TOO_MANY_RESULTS:
+        return None
+    return [values[-1] for values in result_keys]
+
+
+def filter_by_ordered_ids(queryset, ids):
+    return queryset.filter(pk__in=ids).order_by(
+        Func(
+            Value(ids, output_field=ArrayField(IntegerField())), 'pk',
+            function='array_position',
+            output_field=IntegerField()
+        )
+    )
+
+
+def _get_cache_key(list_name, scope, filters):
+    return SEARCH_RESULTS_CACHE_KEY.format(
+        version=get_results_cache_version(),
+        list_name=list_name,
+        scope=scope,
+        filters_hash=get_filters_hash(filters)
+    )
@@ -0,0 +1,79 @@
+##############################################################################
+#
+#    OSIS stands for Open Student Information System. It's an application
+#    designed to manage the core business of higher education institutions,
+#    such as universities, faculties, institutes and professional schools.
+#    The core business involves the administration of students, teachers,
+#    courses, programs and so on.
+#
+#    Copyright (C) 2015-2022 Université catholique de Louvain (http://www.uclouvain.be)
+#
+#    This program is free software: you can redistribute it and/or modify
+#    it under the terms of the GNU General Public License as published by
+#    the Free Software Foundation, either version 3 of the License, or
+#    (at your option) any later version.
+#
+#    This program is distributed in the hope that it will be useful,
+#    but WITHOUT ANY WARRANTY; without even the implied warranty of
+#    MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+#    GNU General Public License for more details.
+#
+#    A copy of this license - GNU General Public License - is available
+#    at the root of the source code of this program.  If not,
+#    see http://www.gnu.org/licenses/.
+#
+##############################################################################
+from typing import Iterable
+
+from base.models.education_group_year import EducationGroupYear
+from continuing_education.business.academic_year import current_academic_year
+from continuing_education.models.continuing_education_training import ContinuingEducationTraining
+
+SNAPSHOT_FIELDS = [
+    'current_education_group_year',
+    'current_acronym',
+    'current_partial_acronym',
+    'current_title',
+    'current_year',
+    'current_management_entity',
+]
+
+
+def refresh_training_snapshots(education_group_ids: Iterable[int] = None) -> int:
+    """
+    Store on the trainings of the given education groups (on every training by default) the fields of their current
+    education group year. Must run when the current academic year changes.
+    """
+    trainings = ContinuingEducationTraining.objects.all()
+    if education_group_ids is not None:
+        trainings = trainings.filter(education_group_id__in=list(education_group_ids))
+    trainings = list(trainings)
+    current_education_group_years = get_current_education_group_years(
+        {training.education_group_id for training in trainings}
+    )
+    for training in trainings:
+        training.set_current_education_group_year(current_education_group_years.get(training.education_group_id))
+    ContinuingEducationTraining.objects.bulk_update(trainings, SNAPSHOT_FIELDS, batch_size=500)
+    return len(trainings)
+
+
+def get_current_education_group_years(education_group_ids):
+    """
+    Set-based ContinuingEducationTraining.get_current_education_group_year: the most recent education group year
+    until the current academic year, the one of the next academic year otherwise.
+    """
+    academic_year = current_academic_year()
+    if not education_group_ids or academic_year is None:
+        return {}
+    education_group_years = EducationGroupYear.objects.filter(
+        education_group_id__in=education_group_ids,
+        academic_year__year__lte=academic_year.year + 1,
+    ).select_related('academic_year').order_by('education_group_id', '-academic_year__year')
+    current_education_group_years = {}
+    next_education_group_years = {}
+    for education_group_year in education_group_years:
+        if education_group_year.academic_year.year > academic_year.year:
+            next_education_group_years[education_group_year.education_group_id] = education_group_year
+        else:
+            current_education_group_years.setdefault(education_group_year.education_group_id, education_group_year)
+    return {**next_education_group_years, **current_education_group_years}
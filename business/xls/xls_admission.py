@@ -25,28 +25,22 @@
 ##############################################################################
 from django.utils.translation import gettext_lazy as _
 
-from base.business.xls import get_name_or_username
-from continuing_education.business.xls.xls_common import form_filters, extract_xls_data_from_admission, \
-    ADMISSION_HEADERS
-from osis_common.document import xls_build
+from continuing_education.business.xls.xls_columns import ADMISSION_COLUMNS, iterate_column_rows, get_headers
+from continuing_education.business.xls.xls_common import form_filters
 
 XLS_DESCRIPTION = _('Admissions list')
 XLS_FILENAME = _('Admissions_list')
 WORKSHEET_TITLE = _('Admissions list')
 
 
-def create_xls(user, admission_list, form):
-    filters = form_filters(form)
-
-    working_sheets_data = prepare_xls_content(admission_list)
-    parameters = {xls_build.DESCRIPTION: XLS_DESCRIPTION,
-                  xls_build.USER: get_name_or_username(user),
-                  xls_build.FILENAME: XLS_FILENAME,
-                  xls_build.HEADER_TITLES: ADMISSION_HEADERS,
-                  xls_build.WS_TITLE: WORKSHEET_TITLE}
-
-    return xls_build.generate_xls(xls_build.prepare_xls_parameters_list(working_sheets_data, parameters), filters)
-
-
-def prepare_xls_content(admission_list):
-    return [extract_xls_data_from_admission(admission) for admission in admission_list]
+def get_export_parameters(user, admission_list, form, columns=None):
+    columns = ADMISSION_COLUMNS.select(columns)
+    return {
+        'user': user,
+        'rows': iterate_column_rows(admission_list, columns),
+        'header_titles': get_headers(columns),
+        'description': XLS_DESCRIPTION,
+        'filename': XLS_FILENAME,
+        'worksheet_title': WORKSHEET_TITLE,
+        'filters': form_filters(form),
+    }
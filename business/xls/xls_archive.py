@@ -25,45 +25,22 @@
 ##############################################################################
 from django.utils.translation import gettext_lazy as _
 
-from base.business.xls import get_name_or_username
-from continuing_education.business.xls.xls_common import form_filters, ADMISSION_HEADERS
-from continuing_education.business.xls.xls_common import get_titles_registration, extract_xls_data_from_registration
-from osis_common.document import xls_build
-
-ARCHIVE_TITLES = [
-    str(_('Name')),
-    str(_('First name')),
-    str(_('Email')),
-    str(_('Formation')),
-    str(_('Faculty')),
-    str(_('State')),
-]
+from continuing_education.business.xls.xls_columns import REGISTRATION_COLUMNS, iterate_column_rows, get_headers
+from continuing_education.business.xls.xls_common import form_filters
 
 XLS_DESCRIPTION = _('Archives list')
 XLS_FILENAME = _('Archives_list')
 WORKSHEET_TITLE = _('Archives list')
 
 
-def create_xls(user, archive_list, form):
-    filters = form_filters(form)
-
-    working_sheets_data = prepare_xls_content(archive_list)
-    parameters = {xls_build.DESCRIPTION: XLS_DESCRIPTION,
-                  xls_build.USER: get_name_or_username(user),
-                  xls_build.FILENAME: XLS_FILENAME,
-                  xls_build.HEADER_TITLES: _get_titles(),
-                  xls_build.WS_TITLE: WORKSHEET_TITLE}
-
-    return xls_build.generate_xls(xls_build.prepare_xls_parameters_list(working_sheets_data, parameters), filters)
-
-
-def prepare_xls_content(archive_list):
-    return [extract_xls_data_from_archive(archive) for archive in archive_list]
-
-
-def extract_xls_data_from_archive(archive):
-    return extract_xls_data_from_registration(archive)
-
-
-def _get_titles():
-    return ADMISSION_HEADERS + get_titles_registration()
+def get_export_parameters(user, archive_list, form, columns=None):
+    columns = REGISTRATION_COLUMNS.select(columns)
+    return {
+        'user': user,
+        'rows': iterate_column_rows(archive_list, columns),
+        'header_titles': get_headers(columns),
+        'description': XLS_DESCRIPTION,
+        'filename': XLS_FILENAME,
+        'worksheet_title': WORKSHEET_TITLE,
+        'filters': form_filters(form),
+    }
@@ -0,0 +1,319 @@
+##############################################################################
+#
+#    OSIS stands for Open Student Information System. It's an application
+#    designed to manage the core business of higher education institutions,
+#    such as universities, faculties, institutes and professional schools.
+#    The core business involves the administration of students, teachers,
+#    courses, programs and so on.
+#
+#    Copyright (C) 2015-2022 Université catholique de Louvain (http://www.uclouvain.be)
+#
+#    This program is free software: you can redistribute it and/or modify
+#    it under the terms of the GNU General Public License as published by
+#    the Free Software Foundation, either version 3 of the License, or
+#    (at your option) any later version.
+#
+#    This program is distributed in the hope that it will be useful,
+#    but WITHOUT ANY WARRANTY; without even the implied warranty of
+#    MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+#    GNU General Public License for more details.
+#
+#    A copy of this license - GNU General Public License - is available
+#    at the root of the source code of this program.  If not,
+#    see http://www.gnu.org/licenses/.
+#
+##############################################################################
+from typing import Callable, Iterable, List, Sequence
+
+from django.utils.functional import cached_property
+from django.utils.translation import gettext_lazy as _
+
+from base.models.person import Person
+from continuing_education.business.xls.xls_common import _get_formation_administrators_by_formation
+from continuing_education.business.xls.xls_streaming import CHUNK_SIZE
+from continuing_education.models.admission import Admission, format_awareness
+from continuing_education.models.continuing_education_training import ContinuingEducationTraining
+
+EXPORT_COLUMNS_PARAMETER = 'columns'
+PRIMARY_KEY_FIELD = 'pk'
+
+
+class ExportColumn:
+    """
+    A column of an export: its header, the fields (values() lookups) it needs and how to format them.
+    The formatter receives the row as a dict of these fields and a ColumnRowContext.
+    """
+
+    def __init__(self, name: str, header, fields: Sequence[str], formatter: Callable = None):
+        self.name = name
+        self.header = header
+        self.fields = tuple(fields)
+        self.formatter = formatter or _value(self.fields[0])
+
+    def format(self, row: dict, context: 'ColumnRowContext'):
+        return self.formatter(row, context)
+
+
+class ColumnRegistry:
+    def __init__(self, columns: Iterable[ExportColumn]):
+        self.columns = list(columns)
+
+    def __add__(self, other):
+        return ColumnRegistry(self.columns + list(other))
+
+    def __iter__(self):
+        return iter(self.columns)
+
+    def choices(self):
+        return [(column.name, column.header) for column in self.columns]
+
+    def select(self, names: Iterable[str] = None) -> List[ExportColumn]:
+        """
+        Columns matching the given names, in the order of the registry.
+        Unknown names are ignored and all the columns are returned when no name is given.
+        """
+        names = set(names or [])
+        selected = [column for column in self.columns if column.name in names]
+        return selected or list(self.columns)
+
+
+class ColumnRowContext:
+    """
+    Data shared by the rows of an export and that cannot be fetched with values(), loaded once per export and only
+    if a column uses it.
+    """
+
+    def __init__(self, queryset):
+        self.queryset = queryset
+
+    @cached_property
+    def formations(self):
+        return ContinuingEducationTraining.objects.select_related('education_group').formations().filter(
+            pk__in=self.queryset.order_by().values('formation')
+        ).in_bulk()
+
+    @cached_property
+    def formation_administrators(self):
+        return _get_formation_administrators_by_formation(list(self.formations))
+
+    def formation_acronym(self, formation_id):
+        formation = self.formations.get(formation_id)
+        return formation.acronym if formation else ''
+
+    def faculty(self, formation_id):
+        formation = self.formations.get(formation_id)
+        return formation.management_entity if formation else ''
+
+    def administrators(self, formation_id):
+        return self.formation_administrators.get(formation_id, '')
+
+
+def get_fields(columns: Iterable[ExportColumn]) -> List[str]:
+    fields = [PRIMARY_KEY_FIELD]
+    for column in columns:
+        fields.extend(field for field in column.fields if field not in fields)
+    return fields
+
+
+def get_headers(columns: Iterable[ExportColumn]) -> List[str]:
+    return [str(column.header) for column in columns]
+
+
+def iterate_column_rows(queryset, columns: Sequence[ExportColumn], chunk_size=CHUNK_SIZE):
+    """
+    Yield the export rows of the queryset, fetching only the fields needed by the columns.
+    The primary key is always part of the fetched values so that distinct() never merges two rows.
+    """
+    queryset = queryset.prefetch_related(None)
+    context = ColumnRowContext(queryset)
+    values = queryset.values(*get_fields(columns)).iterator(chunk_size=chunk_size)
+    for row in values:
+        yield [column.format(row, context) for column in columns]
+
+
+def _value(field):
+    return lambda row, context: row[field]
+
+
+def _or_blank(field):
+    return lambda row, context: row[field] if row[field] else ''
+
+
+def _upper(field):
+    return lambda row, context: row[field].upper() if row[field] else ''
+
+
+def _yes_no(field):
+    return lambda row, context: _('Yes') if row[field] else _('No')
+
+
+def _display(field, model_field):
+    choices = dict(model_field.flatchoices)
+    return lambda row, context: str(choices.get(row[field], row[field])) if row[field] else ''
+
+
+def _address_fields(prefix):
+    return (
+        prefix,
+        '{}__location'.format(prefix),
+        '{}__postal_code'.format(prefix),
+        '{}__city'.format(prefix),
+        '{}__country__name'.format(prefix),
+    )
+
+
+def _address(prefix):
+    def format_address(row, context):
+        if not row[prefix]:
+            return ''
+        location, postal_code, city, country = (row[field] for field in _address_fields(prefix)[1:])
+        return "{} - {} {} {}".format(location or '',
+                                      postal_code or '',
+                                      city.upper() if city else '',
+                                      "- {}".format(country.upper()) if country else '')
+    return format_address
+
+
+def _awareness(row, context):
+    return format_awareness(row['awareness_channels'], row['awareness_other'])
+
+
+ADMISSION_COLUMNS = ColumnRegistry([
+    ExportColumn('last_name', _('Name'), ['person_information__person__last_name']),
+    ExportColumn('first_name', _('First name'), ['person_information__person__first_name']),
+    ExportColumn('email', _('Email'), ['person_information__person__email']),
+    ExportColumn('state', _('State'), ['state'], lambda row, context: _(row['state']) if row['state'] else ''),
+    ExportColumn(
+        'gender', _('Gender'), ['person_information__person__gender'],
+        _display('person_information__person__gender', Person._meta.get_field('gender'))
+    ),
+    ExportColumn('citizenship', _('Citizenship'), ['citizenship__name'], _upper('citizenship__name')),
+    ExportColumn('birth_date', _('Birth date'), ['person_information__birth_date']),
+    ExportColumn(
+        'birth_location', _('Birth location'), ['person_information__birth_location'],
+        _upper('person_information__birth_location')
+    ),
+    ExportColumn(
+        'birth_country', _('Birth country'), ['person_information__birth_country__name'],
+        _upper('person_information__birth_country__name')
+    ),
+    ExportColumn('phone_mobile', _('Mobile phone'), ['phone_mobile']),
+    ExportColumn('address', _('Contact address'), _address_fields('address'), _address('address')),
+    ExportColumn(
+        'high_school_diploma', _('High school diploma'), ['high_school_diploma'], _yes_no('high_school_diploma')
+    ),
+    ExportColumn(
+        'high_school_graduation_year', _('High school graduation year'), ['high_school_graduation_year']
+    ),
+    ExportColumn('last_degree_level', _('Last degree level'), ['last_degree_level']),
+    ExportColumn('last_degree_field', _('Last degree field'), ['last_degree_field'], _or_blank('last_degree_field')),
+    ExportColumn('last_degree_institution', _('Last degree institution'), ['last_degree_institution']),
+    ExportColumn(
+        'last_degree_graduation_year', _('Last degree graduation year'), ['last_degree_graduation_year']
+    ),
+    ExportColumn(
+        'other_educational_background', _('Other educational background'), ['other_educational_background'],
+        _or_blank('other_educational_background')
+    ),
+    ExportColumn(
+        'professional_status', _('Professional status'), ['professional_status'],
+        _display('professional_status', Admission._meta.get_field('professional_status'))
+    ),
+    ExportColumn(
+        'current_occupation', _('Current occupation'), ['current_occupation'], _or_blank('current_occupation')
+    ),
+    ExportColumn('current_employer', _('Current employer'), ['current_employer'], _or_blank('current_employer')),
+    ExportColumn(
+        'activity_sector', _('Activity sector'), ['activity_sector'],
+        _display('activity_sector', Admission._meta.get_field('activity_sector'))
+    ),
+    ExportColumn(
+        'past_professional_activities', _('Past professional activities'), ['past_professional_activities'],
+        _or_blank('past_professional_activities')
+    ),
+    ExportColumn('motivation', _('Motivation'), ['motivation'], _or_blank('motivation')),
+    ExportColumn(
+        'professional_personal_interests', _('Professional and personal interests'),
+        ['professional_personal_interests'], _or_blank('professional_personal_interests')
+    ),
+    ExportColumn(
+        'formation', _('Formation'), ['formation'],
+        lambda row, context: context.formation_acronym(row['formation'])
+    ),
+    ExportColumn(
+        'registration_required', _('Registration required'), ['formation__registration_required'],
+        _yes_no('formation__registration_required')
+    ),
+    ExportColumn('additional_information', _('Additional information'), ['additional_information']),
+    ExportColumn('training_aid', _('Training aid'), ['formation__training_aid'], _yes_no('formation__training_aid')),
+    ExportColumn(
+        'faculty', _('Faculty'), ['formation'],
+        lambda row, context: context.faculty(row['formation']) or ''
+    ),
+    ExportColumn(
+        'formation_administrators', _('Formation administrator(s)'), ['formation'],
+        lambda row, context: context.administrators(row['formation'])
+    ),
+    ExportColumn('awareness', _('Awareness'), ['awareness_channels', 'awareness_other'], _awareness),
+])
+
+REGISTRATION_COLUMNS = ADMISSION_COLUMNS + [
+    ExportColumn(
+        'registration_type', _('Registration type'), ['registration_type'],
+        _display('registration_type', Admission._meta.get_field('registration_type'))
+    ),
+    ExportColumn('head_office_name', _('Head office name'), ['head_office_name'], _or_blank('head_office_name')),
+    ExportColumn('company_number', _('Company number'), ['company_number'], _or_blank('company_number')),
+    ExportColumn('vat_number', _('VAT number'), ['vat_number'], _or_blank('vat_number')),
+    ExportColumn(
+        'billing_address', _('Billing address'), _address_fields('billing_address'), _address('billing_address')
+    ),
+    ExportColumn(
+        'national_registry_number', _('National registry number'), ['national_registry_number'],
+        _or_blank('national_registry_number')
+    ),
+    ExportColumn('id_card_number', _('ID card number'), ['id_card_number'], _or_blank('id_card_number')),
+    ExportColumn('passport_number', _('Passport number'), ['passport_number'], _or_blank('passport_number')),
+    ExportColumn(
+        'marital_status', _('Marital status'), ['marital_status'],
+        _display('marital_status', Admission._meta.get_field('marital_status'))
+    ),
+    ExportColumn('spouse_name', _('Spouse name'), ['spouse_name'], _or_blank('spouse_name')),
+    ExportColumn('children_number', _('Children number'), ['children_number'], _or_blank('children_number')),
+    ExportColumn(
+        'previous_ucl_registration', _('Previous uclouvain registration'), ['previous_ucl_registration'],
+        _or_blank('previous_ucl_registration')
+    ),
+    ExportColumn('previous_noma', _('Previous NOMA'), ['previous_noma'], _or_blank('previous_noma')),
+    ExportColumn(
+        'residence_address', _('Residence address'), _address_fields('residence_address'),
+        _address('residence_address')
+    ),
+    ExportColumn('residence_phone', _('Residence phone'), ['residence_phone'], _or_blank('residence_phone')),
+    ExportColumn(
+        'ucl_registration_complete', _('UCLouvain registration complete'), ['ucl_registration_complete'],
+        _yes_no('ucl_registration_complete')
+    ),
+    ExportColumn('payment_complete', _('Payment complete'), ['payment_complete'], _yes_no('payment_complete')),
+    ExportColumn(
+        'registration_file_received', _('Registration file received'), ['registration_file_received'],
+        _yes_no('registration_file_received')
+    ),
+    ExportColumn(
+        'formation_spreading', _('Formation spreading'), ['formation_spreading'], _yes_no('formation_spreading')
+    ),
+    ExportColumn(
+        'prior_experience_validation', _('Prior experience validation'), ['prior_experience_validation'],
+        _yes_no('prior_experience_validation')
+    ),
+    ExportColumn(
+        'assessment_presented', _('Assessment presented'), ['assessment_presented'],
+        _yes_no('assessment_presented')
+    ),
+    ExportColumn(
+        'assessment_succeeded', _('Assessment succeeded'), ['assessment_succeeded'],
+        _yes_no('assessment_succeeded')
+    ),
+    ExportColumn('diploma_produced', _('Diploma produced'), ['diploma_produced'], _yes_no('diploma_produced')),
+    ExportColumn('comment', _('Comment'), ['comment'], _or_blank('comment')),
+]
@@ -23,13 +23,15 @@
 #    see http://www.gnu.org/licenses/.
 #
 ##############################################################################
-from django.core.exceptions import ObjectDoesNotExist
+from typing import Iterable
+
 from django.utils.translation import gettext_lazy as _, pgettext_lazy
 
 from base.business.xls import get_name_or_username
-from continuing_education.business.xls.xls_common import form_filters
-from continuing_education.templatetags.formation import get_faculty, get_most_recent_education_group, \
-    get_active_continuing_education_formation
+from base.models.education_group import EducationGroup
+from continuing_education.business.formation_catalog import build_formation_catalog_rows
+from continuing_education.business.xls.xls_common import form_filters, _get_formation_administrators_by_formation
+from continuing_education.models.formation_catalog import FormationCatalog
 from osis_common.document import xls_build
 
 XLS_DESCRIPTION = _('Formations list')
@@ -51,25 +53,70 @@ def create_xls(user, formation_list, form):
 
 
 def prepare_xls_content(formation_list):
-    return [extract_xls_data_from_formation(formation) for formation in formation_list]
+    formation_list = list(formation_list)
+    context = FormationExportContext(formation_list)
+    return [extract_xls_data_from_formation(formation, context) for formation in formation_list]
+
+
+class FormationExportContext:
+    """
+    Catalog row (most recent education group year, faculty, continuing education training) and administrators
+    of a set of education groups, resolved with a fixed number of queries.
+    """
+
+    def __init__(self, formations: Iterable[EducationGroup]):
+        education_group_ids = [formation.pk for formation in formations]
+        self.catalog = {
+            catalog_row.education_group_id: catalog_row
+            for catalog_row in FormationCatalog.objects.filter(
+                education_group_id__in=education_group_ids
+            ).select_related('education_group_year', 'faculty', 'training')
+        }
+        # The catalog is refreshed once the changes are committed: a row may be missing meanwhile
+        missing_ids = [education_group_id for education_group_id in education_group_ids
+                       if education_group_id not in self.catalog]
+        if missing_ids:
+            self.catalog.update(build_formation_catalog_rows(missing_ids))
+        self.training_administrators = _get_formation_administrators_by_formation(
+            [catalog_row.training_id for catalog_row in self.catalog.values() if catalog_row.training_id]
+        )
+
+    def most_recent_education_group_year(self, formation):
+        catalog_row = self.catalog.get(formation.pk)
+        return catalog_row.education_group_year if catalog_row else None
+
+    def faculty(self, formation):
+        catalog_row = self.catalog.get(formation.pk)
+        return catalog_row.faculty if catalog_row else ''
+
+    def training(self, formation):
+        catalog_row = self.catalog.get(formation.pk)
+        return catalog_row.training if catalog_row else None
+
+    def active_state(self, formation):
+        catalog_row = self.catalog.get(formation.pk)
+        return catalog_row.active_state if catalog_row else _('Not organized')
 
+    def administrators(self, formation):
+        catalog_row = self.catalog.get(formation.pk)
+        if not catalog_row or not catalog_row.training_id:
+            return ''
+        return self.training_administrators.get(catalog_row.training_id, '')
 
-def extract_xls_data_from_formation(formation):
-    most_recent_education_grp = get_most_recent_education_group(formation)
 
-    try:
-        continuing_education_training = formation.continuingeducationtraining
-    except ObjectDoesNotExist:
-        continuing_education_training = None
+def extract_xls_data_from_formation(formation, context: FormationExportContext = None):
+    context = context or FormationExportContext([formation])
+    most_recent_education_grp = context.most_recent_education_group_year(formation)
+    continuing_education_training = context.training(formation)
 
     return [
-        formation.most_recent_acronym,
-        get_faculty(most_recent_education_grp),
-        most_recent_education_grp.title,
-        get_active_continuing_education_formation(formation),
+        most_recent_education_grp.acronym if most_recent_education_grp else '',
+        context.faculty(formation),
+        most_recent_education_grp.title if most_recent_education_grp else '',
+        context.active_state(formation),
         _('Yes') if continuing_education_training and continuing_education_training.training_aid else _('No'),
         _('Yes') if continuing_education_training and continuing_education_training.registration_required else _('No'),
-        continuing_education_training.formation_administrators if continuing_education_training else '',
+        context.administrators(formation),
     ]
 
 
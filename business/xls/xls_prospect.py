@@ -26,20 +26,29 @@
 from django.utils.translation import gettext_lazy as _
 
 from base.business.xls import get_name_or_username
-from continuing_education.business.prospect import get_prospects_by_user
+from continuing_education.business.prospect import get_prospects_by_user, get_new_prospects_by_user
 from osis_common.document import xls_build
 
 XLS_DESCRIPTION = _('Prospects list')
 XLS_FILENAME = _('Prospects_list')
+XLS_DELTA_DESCRIPTION = _('New prospects list')
+XLS_DELTA_FILENAME = _('New_prospects_list')
 WORKSHEET_TITLE = _('Prospects list')
 
 
 def create_xls(user):
-    prospects_list = get_prospects_by_user(user)
+    return _create_xls(user, get_prospects_by_user(user), XLS_DESCRIPTION, XLS_FILENAME)
+
+
+def create_delta_xls(user, up_to_id):
+    return _create_xls(user, get_new_prospects_by_user(user, up_to_id), XLS_DELTA_DESCRIPTION, XLS_DELTA_FILENAME)
+
+
+def _create_xls(user, prospects_list, description, filename):
     working_sheets_data = _prepare_xls_content(prospects_list)
-    parameters = {xls_build.DESCRIPTION: XLS_DESCRIPTION,
+    parameters = {xls_build.DESCRIPTION: description,
                   xls_build.USER: get_name_or_username(user),
-                  xls_build.FILENAME: XLS_FILENAME,
+                  xls_build.FILENAME: filename,
                   xls_build.HEADER_TITLES: _get_titles(),
                   xls_build.WS_TITLE: WORKSHEET_TITLE}
 
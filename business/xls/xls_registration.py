@@ -25,31 +25,22 @@
 ##############################################################################
 from django.utils.translation import gettext_lazy as _
 
-from base.business.xls import get_name_or_username
-from continuing_education.business.xls.xls_common import form_filters, get_titles_registration, \
-    extract_xls_data_from_registration, ADMISSION_HEADERS
-from osis_common.document import xls_build
+from continuing_education.business.xls.xls_columns import REGISTRATION_COLUMNS, iterate_column_rows, get_headers
+from continuing_education.business.xls.xls_common import form_filters
 
 XLS_DESCRIPTION = _('Registrations list')
 XLS_FILENAME = _('Registrations_list')
 WORKSHEET_TITLE = _('Registrations list')
 
 
-def create_xls_registration(user, registrations_list, form):
-    working_sheets_data = prepare_xls_content(registrations_list)
-    parameters = {xls_build.DESCRIPTION: XLS_DESCRIPTION,
-                  xls_build.USER: get_name_or_username(user),
-                  xls_build.FILENAME: XLS_FILENAME,
-                  xls_build.HEADER_TITLES: _get_titles(),
-                  xls_build.WS_TITLE: WORKSHEET_TITLE}
-
-    return xls_build.generate_xls(xls_build.prepare_xls_parameters_list(working_sheets_data, parameters),
-                                  form_filters(form))
-
-
-def prepare_xls_content(registrations_list):
-    return [extract_xls_data_from_registration(registration) for registration in registrations_list]
-
-
-def _get_titles():
-    return ADMISSION_HEADERS + get_titles_registration()
+def get_export_parameters(user, registrations_list, form, columns=None):
+    columns = REGISTRATION_COLUMNS.select(columns)
+    return {
+        'user': user,
+        'rows': iterate_column_rows(registrations_list, columns),
+        'header_titles': get_headers(columns),
+        'description': XLS_DESCRIPTION,
+        'filename': XLS_FILENAME,
+        'worksheet_title': WORKSHEET_TITLE,
+        'filters': form_filters(form),
+    }
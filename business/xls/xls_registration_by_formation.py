@@ -0,0 +1,126 @@
+##############################################################################
+#
+#    OSIS stands for Open Student Information System. It's an application
+#    designed to manage the core business of higher education institutions,
+#    such as universities, faculties, institutes and professional schools.
+#    The core business involves the administration of students, teachers,
+#    courses, programs and so on.
+#
+#    Copyright (C) 2015-2022 Université catholique de Louvain (http://www.uclouvain.be)
+#
+#    This program is free software: you can redistribute it and/or modify
+#    it under the terms of the GNU General Public License as published by
+#    the Free Software Foundation, either version 3 of the License, or
+#    (at your option) any later version.
+#
+#    This program is distributed in the hope that it will be useful,
+#    but WITHOUT ANY WARRANTY; without even the implied warranty of
+#    MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+#    GNU General Public License for more details.
+#
+#    A copy of this license - GNU General Public License - is available
+#    at the root of the source code of this program.  If not,
+#    see http://www.gnu.org/licenses/.
+#
+##############################################################################
+import multiprocessing
+from collections import OrderedDict, deque
+from concurrent.futures import ProcessPoolExecutor
+from functools import partial
+
+import django
+from django.conf import settings
+from django.utils import translation
+from django.utils.translation import gettext_lazy as _
+
+from continuing_education.business.search_results import filter_by_ordered_ids
+from continuing_education.business.xls.xls_columns import REGISTRATION_COLUMNS, iterate_column_rows, get_headers
+from continuing_education.business.xls.xls_common import form_filters
+from continuing_education.business.xls.xls_streaming import _to_cell_value
+from continuing_education.models.admission import Admission
+from continuing_education.models.continuing_education_training import ContinuingEducationTraining
+
+SHEET_WORKERS = getattr(settings, 'CONTINUING_EDUCATION_EXPORT_SHEET_WORKERS', 2)
+
+XLS_DESCRIPTION = _('Registrations list by formation')
+XLS_FILENAME = _('Registrations_list_by_formation')
+
+
+def get_export_parameters(user, registrations_list, form, columns=None):
+    return {
+        'user': user,
+        'sheets': build_sheets(registrations_list, columns),
+        'header_titles': get_headers(REGISTRATION_COLUMNS.select(columns)),
+        'description': XLS_DESCRIPTION,
+        'filename': XLS_FILENAME,
+        'filters': form_filters(form),
+    }
+
+
+def build_sheets(registrations_list, columns=None, workers=None):
+    """
+    Yield a (title, rows) pair per formation of the registrations, ordered by formation acronym.
+    The rows of each formation are built by a separate process of a pool of workers.
+    Workers receive what they need to build the rows (column names, ids in list order, active language) in picklable
+    form: the rows keep the order of the list, even when it is ordered by an annotation such as the search rank.
+    At most one sheet per worker is submitted ahead of the one being written, so only a few sheets are in memory.
+    """
+    workers = SHEET_WORKERS if workers is None else workers
+    ids_by_formation = _get_registration_ids_by_formation(registrations_list)
+    titles = _get_formation_titles(ids_by_formation.keys())
+    formation_ids = sorted(ids_by_formation, key=lambda formation_id: titles[formation_id])
+    registration_ids = [ids_by_formation[formation_id] for formation_id in formation_ids]
+    build_rows = partial(
+        build_sheet_rows,
+        columns=columns,
+        language=translation.get_language(),
+    )
+
+    if workers <= 1 or len(formation_ids) <= 1:
+        for formation_id, ids in zip(formation_ids, registration_ids):
+            yield titles[formation_id], build_rows(ids)
+        return
+
+    max_workers = min(workers, len(formation_ids))
+    # Spawned workers do not inherit the database connection of the parent process
+    with ProcessPoolExecutor(
+            max_workers=max_workers,
+            mp_context=multiprocessing.get_context('spawn'),
+            initializer=_init_worker
+    ) as executor:
+        pending = deque()
+        for formation_id, ids in zip(formation_ids, registration_ids):
+            pending.append((formation_id, executor.submit(build_rows, ids)))
+            if len(pending) > max_workers:
+                formation_id, future = pending.popleft()
+                yield titles[formation_id], future.result()
+        while pending:
+            formation_id, future = pending.popleft()
+            yield titles[formation_id], future.result()
+
+
+def build_sheet_rows(registration_ids, columns=None, language=None):
+    registrations = filter_by_ordered_ids(Admission.objects.all(), registration_ids)
+    with translation.override(language or translation.get_language()):
+        return [
+            [_to_cell_value(value) for value in row]
+            for row in iterate_column_rows(registrations, REGISTRATION_COLUMNS.select(columns))
+        ]
+
+
+def _init_worker():
+    django.setup()
+
+
+def _get_registration_ids_by_formation(registrations_list):
+    ids_by_formation = OrderedDict()
+    for pk, formation_id in registrations_list.values_list('pk', 'formation_id'):
+        ids_by_formation.setdefault(formation_id, OrderedDict())[pk] = None
+    return OrderedDict((formation_id, list(ids)) for formation_id, ids in ids_by_formation.items())
+
+
+def _get_formation_titles(formation_ids):
+    formations = ContinuingEducationTraining.objects.select_related('education_group').formations().in_bulk(
+        list(formation_ids)
+    )
+    return {formation_id: formation.acronym for formation_id, formation in formations.items()}
@@ -0,0 +1,108 @@
+##############################################################################
+#
+#    OSIS stands for Open Student Information System. It's an application
+#    designed to manage the core business of higher education institutions,
+#    such as universities, faculties, institutes and professional schools.
+#    The core business involves the administration of students, teachers,
+#    courses, programs and so on.
+#
+#    Copyright (C) 2015-2022 Université catholique de Louvain (http://www.uclouvain.be)
+#
+#    This program is free software: you can redistribute it and/or modify
+#    it under the terms of the GNU General Public License as published by
+#    the Free Software Foundation, either version 3 of the License, or
+#    (at your option) any later version.
+#
+#    This program is distributed in the hope that it will be useful,
+#    but WITHOUT ANY WARRANTY; without even the implied warranty of
+#    MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+#    GNU General Public License for more details.
+#
+#    A copy of this license - GNU General Public License - is available
+#    at the root of the source code of this program.  If not,
+#    see http://www.gnu.org/licenses/.
+#
+##############################################################################
+import datetime
+import decimal
+import re
+
+from django.utils.translation import gettext_lazy as _
+from openpyxl import Workbook
+from openpyxl.cell import WriteOnlyCell
+from openpyxl.styles import Font
+
+from base.business.xls import get_name_or_username
+
+CHUNK_SIZE = 500
+PARAMETERS_WORKSHEET_TITLE = _('Parameters')
+MAX_WORKSHEET_TITLE_LENGTH = 31
+INVALID_WORKSHEET_TITLE_CHARACTERS = re.compile(r'[\\/*?:\[\]]')
+
+NATIVE_CELL_TYPES = (int, float, decimal.Decimal, datetime.date, datetime.datetime, datetime.time)
+
+
+def write_xls(output, user, rows, header_titles, description, worksheet_title, filters=None):
+    """
+    Write the rows one by one into a write-only workbook saved into output (a path or a file object).
+    Rows can be any iterable (e.g. a generator), so the whole content is never held in memory.
+    """
+    write_xls_sheets(output, user, [(worksheet_title, rows)], header_titles, description, filters)
+
+
+def write_xls_sheets(output, user, sheets, header_titles, description, filters=None):
+    """
+    Same as write_xls with one worksheet per (title, rows) pair of sheets, all sharing the same header.
+    """
+    workbook = Workbook(write_only=True)
+    used_titles = set()
+    for worksheet_title, rows in sheets:
+        title = _get_unique_worksheet_title(worksheet_title, used_titles)
+        used_titles.add(title)
+        worksheet = workbook.create_sheet(title=title)
+        worksheet.append(_build_header_row(worksheet, header_titles))
+        for row in rows:
+            worksheet.append([_to_cell_value(value) for value in row])
+    _append_parameters_worksheet(workbook, user, description, filters)
+    workbook.save(output)
+
+
+def _build_header_row(worksheet, header_titles):
+    header_row = []
+    for title in header_titles:
+        cell = WriteOnlyCell(worksheet, value=str(title))
+        cell.font = Font(bold=True)
+        header_row.append(cell)
+    return header_row
+
+
+def _append_parameters_worksheet(workbook, user, description, filters):
+    worksheet = workbook.create_sheet(title=_get_worksheet_title(PARAMETERS_WORKSHEET_TITLE))
+    worksheet.append([str(_('Description')), str(description)])
+    worksheet.append([str(_('Author')), get_name_or_username(user)])
+    worksheet.append([str(_('Creation date')), datetime.datetime.now()])
+    for label, value in (filters or {}).items():
+        worksheet.append([str(label), _to_cell_value(value)])
+
+
+def _get_worksheet_title(title):
+    return INVALID_WORKSHEET_TITLE_CHARACTERS.sub('-', str(title))[:MAX_WORKSHEET_TITLE_LENGTH]
+
+
+def _get_unique_worksheet_title(title, used_titles):
+    title = _get_worksheet_title(title)
+    index = 1
+    unique_title = title
+    while unique_title.lower() in {used_title.lower() for used_title in used_titles}:
+        index += 1
+        suffix = " ({})".format(index)
+        unique_title = title[:MAX_WORKSHEET_TITLE_LENGTH - len(suffix)] + suffix
+    return unique_title
+
+
+def _to_cell_value(value):
+    if value is None:
+        return ''
+    if isinstance(value, NATIVE_CELL_TYPES):
+        return value
+    return str(value)
@@ -80,6 +80,10 @@ class AddressForm(ModelForm):
                                    )
         return cleaned_data
 
+    def save(self, commit=True):
+        """ The edited address may be shared with other usages: its new content is interned, never updated """
+        return Address.objects.intern(**{field: self.cleaned_data.get(field) for field in self._meta.fields})
+
 
 def are_postal_code_and_city_compatible(cities, city_encoded) -> bool:
     for city in cities:
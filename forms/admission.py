@@ -6,6 +6,7 @@ from django.forms import ModelForm, ChoiceField
 from django.utils.translation import gettext_lazy as _, pgettext_lazy
 
 from base.models.academic_year import AcademicYear
+from continuing_education.business.academic_year import current_academic_year
 from continuing_education.business.enums.rejected_reason import REJECTED_REASON_CHOICES, OTHER
 from continuing_education.business.enums.waiting_reason import WAITING_REASON_CHOICES, \
     WAITING_REASON_CHOICES_SHORTENED_DISPLAY
@@ -18,6 +19,7 @@ from continuing_education.models.continuing_education_training import Continuing
 from continuing_education.models.enums import admission_state_choices
 from continuing_education.models.enums import enums
 from continuing_education.models.enums.admission_state_choices import STATES_ACADEMIC_YEAR_MANDATORY
+from continuing_education.models.enums.awareness_channel import AWARENESS_FIELD_NAMES, AwarenessChannel
 from reference.models.country import Country
 
 CONTINUING_EDUCATION_YEAR_SWITCH_DATE = {"month": 9, "day": 15}
@@ -81,10 +83,25 @@ class AdmissionForm(ModelForm):
         label=_('Academic year')
     )
 
+    # Boolean views of the awareness channels bits, not model fields
+    awareness_ucl_website = forms.BooleanField(required=False, label=AwarenessChannel.UCL_WEBSITE.value)
+    awareness_formation_website = forms.BooleanField(required=False, label=AwarenessChannel.FORMATION_WEBSITE.value)
+    awareness_press = forms.BooleanField(required=False, label=AwarenessChannel.PRESS.value)
+    awareness_facebook = forms.BooleanField(required=False, label=AwarenessChannel.FACEBOOK.value)
+    awareness_linkedin = forms.BooleanField(required=False, label=AwarenessChannel.LINKEDIN.value)
+    awareness_customized_mail = forms.BooleanField(required=False, label=AwarenessChannel.CUSTOMIZED_MAIL.value)
+    awareness_emailing = forms.BooleanField(required=False, label=AwarenessChannel.EMAILING.value)
+    awareness_word_of_mouth = forms.BooleanField(required=False, label=AwarenessChannel.WORD_OF_MOUTH.value)
+    awareness_friends = forms.BooleanField(required=False, label=AwarenessChannel.FRIENDS.value)
+    awareness_former_students = forms.BooleanField(required=False, label=AwarenessChannel.FORMER_STUDENTS.value)
+    awareness_moocs = forms.BooleanField(required=False, label=AwarenessChannel.MOOCS.value)
+
     def __init__(self, data, user=None, **kwargs):
         super().__init__(data, **kwargs)
+        for field_name in AWARENESS_FIELD_NAMES.values():
+            self.initial.setdefault(field_name, getattr(self.instance, field_name))
         try:
-            starting_year = AcademicYear.objects.current().year
+            starting_year = current_academic_year().year
             self.fields['academic_year'].queryset = AcademicYear.objects.filter(year__gte=starting_year - 2)\
                 .order_by('year')
         except AttributeError:
@@ -111,6 +128,11 @@ class AdmissionForm(ModelForm):
             'education_group'
         )
 
+    def save(self, commit=True):
+        for field_name in AWARENESS_FIELD_NAMES.values():
+            setattr(self.instance, field_name, self.cleaned_data[field_name])
+        return super().save(commit)
+
     class Meta:
         model = Admission
         fields = [
@@ -1,21 +1,23 @@
 
-from datetime import datetime
 from operator import itemgetter
 
 from django import forms
-from django.db.models import Q
+from django.db.models import Q, Exists, OuterRef
 from django.forms import ModelChoiceField
 from django.utils.translation import gettext_lazy as _, pgettext
 from django.utils.translation import pgettext_lazy
 
-from base.business.entity import get_entities_ids
-from base.models import entity_version
 from base.models.academic_year import AcademicYear
 from base.models.education_group import EducationGroup
+from base.models.education_group_year import EducationGroupYear
 from base.models.entity_version import EntityVersion
-from base.models.enums import entity_type
 from base.models.person import Person
 from continuing_education.auth.roles.continuing_education_training_manager import ContinuingEducationTrainingManager
+from continuing_education.business.entity import get_faculty_entity_ids
+from continuing_education.business.filter_choices import get_faculty_choices, get_manager_choices, \
+    get_managed_training_choices
+from continuing_education.business.formation_choices import get_formation_choices
+from continuing_education.business.search_document import search_admissions
 from continuing_education.models.admission import Admission
 from continuing_education.models.continuing_education_training import CONTINUING_EDUCATION_TRAINING_TYPES, \
     ContinuingEducationTraining
@@ -76,8 +78,7 @@ class FormationModelChoiceField(ModelChoiceField):
 
 class CommonFilterForm(BootstrapForm):
     faculty = FacultyModelChoiceField(
-        queryset=entity_version.find_latest_version(datetime.now())
-                               .filter(entity_type=entity_type.FACULTY).order_by('acronym'),
+        queryset=EntityVersion.objects.none(),
         widget=forms.Select(),
         empty_label=pgettext("plural", "All"),
         required=False,
@@ -102,6 +103,7 @@ class CommonFilterForm(BootstrapForm):
 
     def __init__(self, data=None, *args, **kwargs):
         super(CommonFilterForm, self).__init__(data, *args, **kwargs)
+        _build_faculty_choices(self.fields['faculty'])
         _build_formation_choices(self.fields['formation'], STATE_TO_DISPLAY)
 
     def get_admissions(self):
@@ -135,17 +137,7 @@ class CommonFilterForm(BootstrapForm):
 
 
 def search_admissions_with_free_text(free_text, qs):
-    qs = qs.filter(
-        Q(person_information__person__first_name__unaccent__icontains=free_text) |
-        Q(person_information__person__last_name__unaccent__icontains=free_text) |
-        Q(person_information__person__email__icontains=free_text) |
-        Q(email__icontains=free_text) |
-        Q(formation__education_group__educationgroupyear__acronym__icontains=free_text) |
-        Q(formation__education_group__educationgroupyear__title__unaccent__icontains=free_text) |
-        Q(address__country__name__unaccent__icontains=free_text) |
-        Q(address__city__unaccent__icontains=free_text)
-    ).distinct()
-    return qs
+    return search_admissions(free_text, qs)
 
 
 class AdmissionFilterForm(CommonFilterForm):
@@ -243,8 +235,9 @@ class ArchiveFilterForm(CommonFilterForm):
         self.fields['state'].choices = _get_state_choices(ARCHIVE_STATE_CHOICES)
         _build_formation_choices(self.fields['formation'], STATES_FOR_ARCHIVE, True)
         if user and not user.groups.filter(name='continuing_education_managers').exists():
-            self.fields['formation'].queryset = self.fields['formation'].queryset.filter(
-                managers=user.person
+            _restrict_formation_choices(
+                self.fields['formation'],
+                self.fields['formation'].queryset.filter(managers=user.person)
             )
 
     def get_archives(self):
@@ -286,15 +279,12 @@ def get_queryset_by_faculty_formation(faculty, formation, states, archived_statu
             )
 
     if faculty:
-        qs = _get_filter_entity_management(
-            qs,
-            faculty.acronym,
-            True
-        )
+        qs = _get_filter_entity_management(qs, faculty)
 
     if formation:
         qs = qs.filter(formation=formation)
 
+    # Answered by the partial index of the archived admissions or by the one of the live admissions, never both
     qs = qs.filter(archived=archived_status)
 
     if received_file:
@@ -304,21 +294,47 @@ def get_queryset_by_faculty_formation(faculty, formation, states, archived_statu
 
 
 def _build_formation_choices(field, states, archived_status=False):
-    field.queryset = ContinuingEducationTraining.objects.formations().filter(
-        id__in=Admission.objects.filter(
-            state__in=states,
-            archived=archived_status
-        ).values_list('formation', flat=False)
-    )
+    _set_cached_choices(field, ContinuingEducationTraining.objects.all(), get_formation_choices(states, archived_status))
+
+
+def _build_faculty_choices(field):
+    _set_cached_choices(field, EntityVersion.objects.order_by('acronym'), get_faculty_choices())
+
+
+def _set_cached_choices(field, queryset, choices):
+    """ Render the cached choices while the queryset, restricted to them, still validates the submitted value """
+    field.queryset = queryset.filter(id__in=[choice_id for choice_id, label in choices])
+    field.choices = [('', field.empty_label)] + choices
+
+
+def _restrict_formation_choices(field, queryset):
+    field.queryset = queryset
+    allowed_formation_ids = set(queryset.values_list('pk', flat=True))
+    field.choices = [
+        (formation_id, label) for formation_id, label in field.choices
+        if not formation_id or formation_id in allowed_formation_ids
+    ]
 
 
 def _get_state_choices(choices):
     return [ALL_CHOICE] + sorted(choices, key=itemgetter(1))
 
 
-def _get_filter_entity_management(qs, requirement_entity_acronym, with_entity_subordinated):
-    entity_ids = get_entities_ids(requirement_entity_acronym, with_entity_subordinated)
-    return qs.filter(formation__education_group__educationgroupyear__management_entity__in=entity_ids).distinct()
+def _get_filter_entity_management(qs, faculty):
+    entity_ids = get_faculty_entity_ids(faculty.entity_id)
+    return qs.filter(
+        _has_education_group_year('formation__education_group', management_entity__in=entity_ids)
+    )
+
+
+def _has_education_group_year(education_group_ref, *args, **kwargs):
+    """
+    EXISTS condition on the education group years of the referenced education group.
+    Unlike a filter through educationgroupyear__, it does not multiply the rows, so no distinct() is needed.
+    """
+    return Exists(
+        EducationGroupYear.objects.filter(*args, education_group=OuterRef(education_group_ref), **kwargs)
+    )
 
 
 class FormationFilterForm(CommonFilterForm):
@@ -340,57 +356,53 @@ class FormationFilterForm(CommonFilterForm):
         free_text = self.cleaned_data.get('free_text')
 
         qs = EducationGroup.objects.filter(
-            educationgroupyear__education_group_type__name__in=CONTINUING_EDUCATION_TRAINING_TYPES,
+            formation_catalog__education_group_type__name__in=CONTINUING_EDUCATION_TRAINING_TYPES
         )
 
         qs = _build_active_parameter(qs, self.cleaned_data.get('state'))
         if faculty:
-            qs = _get_formation_filter_entity_management(
-                qs,
-                faculty.acronym,
-                True
-            )
+            qs = _get_formation_filter_entity_management(qs, faculty)
 
         if acronym:
             qs = qs.filter(
-                Q(educationgroupyear__acronym__icontains=acronym) |
-                Q(educationgroupyear__partial_acronym__icontains=acronym))
+                Q(formation_catalog__acronym__icontains=acronym) |
+                Q(formation_catalog__partial_acronym__icontains=acronym)
+            )
 
         if title:
-            qs = qs.filter(educationgroupyear__title__icontains=title)
+            qs = qs.filter(formation_catalog__title__icontains=title)
 
         if training_aid:
-            qs = qs.filter(continuingeducationtraining__training_aid=training_aid)
+            qs = qs.filter(formation_catalog__training_aid=training_aid)
 
         if free_text:
             qs = qs.filter(
-                Q(educationgroupyear__acronym__icontains=free_text) |
-                Q(educationgroupyear__title__icontains=free_text)
+                Q(formation_catalog__acronym__icontains=free_text) | Q(formation_catalog__title__icontains=free_text)
             )
 
-        return qs.select_related('continuingeducationtraining').order_by('educationgroupyear__acronym').distinct()
+        return qs.select_related(
+            'continuingeducationtraining',
+            'formation_catalog__education_group_year',
+            'formation_catalog__faculty',
+        ).order_by('formation_catalog__acronym', 'pk')
 
 
 def _build_active_parameter(qs, state):
     if state in (ACTIVE, INACTIVE):
         active_state = state == ACTIVE
-        return qs.filter(continuingeducationtraining__active=active_state)
+        return qs.filter(formation_catalog__training__isnull=False, formation_catalog__active=active_state)
     elif state == NOT_ORGANIZED:
-        return qs.filter(continuingeducationtraining__isnull=True)
+        return qs.filter(formation_catalog__training__isnull=True)
     return qs
 
 
-def _get_formation_filter_entity_management(qs, requirement_entity_acronym, with_entity_subordinated):
-    exact_requirement_entity_acronym = "^{}$".format(requirement_entity_acronym)
-    entity_ids = get_entities_ids(exact_requirement_entity_acronym, with_entity_subordinated)
-    return qs.filter(educationgroupyear__management_entity__in=entity_ids)
+def _get_formation_filter_entity_management(qs, faculty):
+    return qs.filter(formation_catalog__management_entity__in=get_faculty_entity_ids(faculty.entity_id))
 
 
 class ManagerFilterForm(BootstrapForm):
     person = ModelChoiceField(
-        queryset=Person.objects.filter(
-            user__groups__name='continuing_education_training_managers'
-        ).order_by('last_name'),
+        queryset=Person.objects.none(),
         widget=forms.Select(),
         empty_label=pgettext("plural", "All"),
         required=False,
@@ -398,8 +410,7 @@ class ManagerFilterForm(BootstrapForm):
     )
 
     faculty = FacultyModelChoiceField(
-        queryset=entity_version.find_latest_version(datetime.now())
-                               .filter(entity_type=entity_type.FACULTY).order_by('acronym'),
+        queryset=EntityVersion.objects.none(),
         widget=forms.Select(),
         empty_label=pgettext("plural", "All"),
         required=False,
@@ -407,9 +418,7 @@ class ManagerFilterForm(BootstrapForm):
     )
 
     training = FormationModelChoiceField(
-        queryset=ContinuingEducationTraining.objects.filter(
-            id__in=ContinuingEducationTrainingManager.objects.values_list('training', flat=True)
-        ),
+        queryset=ContinuingEducationTraining.objects.none(),
         widget=forms.Select(),
         empty_label=pgettext("plural", "All"),
         required=False,
@@ -418,6 +427,11 @@ class ManagerFilterForm(BootstrapForm):
 
     def __init__(self, *args, **kwargs):
         super(ManagerFilterForm, self).__init__(*args, **kwargs)
+        _set_cached_choices(self.fields['person'], Person.objects.order_by('last_name'), get_manager_choices())
+        _build_faculty_choices(self.fields['faculty'])
+        _set_cached_choices(
+            self.fields['training'], ContinuingEducationTraining.objects.all(), get_managed_training_choices()
+        )
 
     def get_managers(self):
         training = self.cleaned_data.get('training')
@@ -437,9 +451,10 @@ class ManagerFilterForm(BootstrapForm):
                 ).values_list('person__id')
             )
         if faculty:
-            entity = EntityVersion.objects.filter(id=faculty.id).first().entity
             trainings_by_faculty = ContinuingEducationTraining.objects.filter(
-                education_group__educationgroupyear__management_entity=entity
+                _has_education_group_year(
+                    'education_group', management_entity__in=get_faculty_entity_ids(faculty.entity_id)
+                )
             )
             qs = qs.filter(
                 id__in=ContinuingEducationTrainingManager.objects.filter(
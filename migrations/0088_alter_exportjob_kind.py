@@ -0,0 +1,18 @@
+# Generated by Django 3.2.12 on 2022-05-09 14:37
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('continuing_education', '0087_exportjob'),
+    ]
+
+    operations = [
+        migrations.AlterField(
+            model_name='exportjob',
+            name='kind',
+            field=models.CharField(choices=[('ADMISSIONS', 'Admissions list'), ('REGISTRATIONS', 'Registrations list'), ('REGISTRATIONS_BY_FORMATION', 'Registrations list by formation'), ('ARCHIVES', 'Archives list')], max_length=50, verbose_name='Kind'),
+        ),
+    ]
@@ -0,0 +1,34 @@
+# Generated by Django 3.2.12 on 2022-05-16 09:21
+
+from django.conf import settings
+from django.db import migrations, models
+import django.db.models.deletion
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        migrations.swappable_dependency(settings.AUTH_USER_MODEL),
+        ('continuing_education', '0088_alter_exportjob_kind'),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name='ProspectExportWatermark',
+            fields=[
+                ('id', models.AutoField(auto_created=True, primary_key=True, serialize=False, verbose_name='ID')),
+                ('last_exported_id', models.PositiveIntegerField(default=0, verbose_name='Last exported prospect')),
+                ('exported_at', models.DateTimeField(auto_now=True)),
+                ('training', models.ForeignKey(on_delete=django.db.models.deletion.CASCADE, to='continuing_education.continuingeducationtraining')),
+                ('user', models.ForeignKey(on_delete=django.db.models.deletion.CASCADE, to=settings.AUTH_USER_MODEL)),
+            ],
+            options={
+                'default_permissions': [],
+                'unique_together': {('user', 'training')},
+            },
+        ),
+        migrations.AddIndex(
+            model_name='prospect',
+            index=models.Index(fields=['formation', 'id'], name='prospect_formation_id'),
+        ),
+    ]
@@ -0,0 +1,78 @@
+# Generated by Django 3.2.12 on 2022-05-23 11:05
+
+import unicodedata
+
+import django.contrib.postgres.indexes
+import django.contrib.postgres.search
+import django.db.models.deletion
+from django.contrib.postgres.operations import TrigramExtension
+from django.contrib.postgres.search import SearchVector
+from django.db import migrations, models
+
+CHUNK_SIZE = 500
+
+
+def _normalize(text):
+    decomposed = unicodedata.normalize('NFKD', text or '')
+    return ''.join(character for character in decomposed if not unicodedata.combining(character)).lower().strip()
+
+
+def _document_text(admission):
+    person = admission.person_information.person if admission.person_information else None
+    values = [
+        person.first_name if person else '',
+        person.last_name if person else '',
+        person.email if person else '',
+        admission.email,
+    ]
+    for education_group_year in admission.formation.education_group.educationgroupyear_set.all():
+        values += [education_group_year.acronym, education_group_year.title]
+    if admission.address:
+        values += [admission.address.country.name if admission.address.country else '', admission.address.city]
+    return ' '.join(_normalize(value) for value in values if value)
+
+
+def build_search_documents(apps, schema_editor):
+    Admission = apps.get_model('continuing_education', 'Admission')
+    AdmissionSearchDocument = apps.get_model('continuing_education', 'AdmissionSearchDocument')
+    admission_ids = list(Admission.objects.values_list('pk', flat=True))
+    for start in range(0, len(admission_ids), CHUNK_SIZE):
+        admissions = Admission.objects.filter(pk__in=admission_ids[start:start + CHUNK_SIZE]).select_related(
+            'person_information__person', 'address__country', 'formation__education_group'
+        ).prefetch_related('formation__education_group__educationgroupyear_set')
+        AdmissionSearchDocument.objects.bulk_create([
+            AdmissionSearchDocument(admission_id=admission.pk, document=_document_text(admission))
+            for admission in admissions
+        ])
+    AdmissionSearchDocument.objects.update(search_vector=SearchVector('document', config='simple'))
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('continuing_education', '0089_prospect_export_watermark'),
+    ]
+
+    operations = [
+        TrigramExtension(),
+        migrations.CreateModel(
+            name='AdmissionSearchDocument',
+            fields=[
+                ('admission', models.OneToOneField(on_delete=django.db.models.deletion.CASCADE, primary_key=True, related_name='search_document', serialize=False, to='continuing_education.admission')),
+                ('document', models.TextField(blank=True, default='')),
+                ('search_vector', django.contrib.postgres.search.SearchVectorField(null=True)),
+            ],
+            options={
+                'default_permissions': [],
+            },
+        ),
+        migrations.AddIndex(
+            model_name='admissionsearchdocument',
+            index=django.contrib.postgres.indexes.GinIndex(fields=['search_vector'], name='admission_search_vector'),
+        ),
+        migrations.AddIndex(
+            model_name='admissionsearchdocument',
+            index=django.contrib.postgres.indexes.GinIndex(fields=['document'], name='admission_search_trigram', opclasses=['gin_trgm_ops']),
+        ),
+        migrations.RunPython(build_search_documents, migrations.RunPython.noop),
+    ]
@@ -0,0 +1,88 @@
+# Generated by Django 3.2.12 on 2022-05-30 09:12
+
+import django.contrib.postgres.indexes
+import django.db.models.deletion
+from django.db import migrations, models
+
+FACULTY = 'FACULTY'
+
+
+def build_formation_catalog(apps, schema_editor):
+    EducationGroupYear = apps.get_model('base', 'EducationGroupYear')
+    EntityVersion = apps.get_model('base', 'EntityVersion')
+    ContinuingEducationTraining = apps.get_model('continuing_education', 'ContinuingEducationTraining')
+    FormationCatalog = apps.get_model('continuing_education', 'FormationCatalog')
+
+    education_group_years = EducationGroupYear.objects.order_by(
+        'education_group_id', '-academic_year__year'
+    ).distinct('education_group_id')
+    faculties = {}
+    for entity_version in EntityVersion.objects.order_by('pk'):
+        if entity_version.entity_id not in faculties:
+            faculties[entity_version.entity_id] = entity_version.entity_id \
+                if entity_version.entity_type == FACULTY else entity_version.parent_id
+    trainings = {training.education_group_id: training for training in ContinuingEducationTraining.objects.all()}
+
+    FormationCatalog.objects.bulk_create([
+        _catalog_row(FormationCatalog, egy, faculties.get(egy.management_entity_id), trainings.get(egy.education_group_id))
+        for egy in education_group_years
+    ], batch_size=500)
+
+
+def _catalog_row(FormationCatalog, egy, faculty_id, training):
+    return FormationCatalog(
+        education_group_id=egy.education_group_id,
+        education_group_year_id=egy.pk,
+        acronym=egy.acronym or '',
+        partial_acronym=egy.partial_acronym or '',
+        title=egy.title or '',
+        education_group_type_id=egy.education_group_type_id,
+        management_entity_id=egy.management_entity_id,
+        faculty_id=faculty_id,
+        training=training,
+        active=training.active if training else False,
+        training_aid=training.training_aid if training else False,
+    )
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('base', '0583_auto_20210324_0954'),
+        ('continuing_education', '0090_admissionsearchdocument'),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name='FormationCatalog',
+            fields=[
+                ('education_group', models.OneToOneField(on_delete=django.db.models.deletion.CASCADE, primary_key=True, related_name='formation_catalog', serialize=False, to='base.educationgroup')),
+                ('acronym', models.CharField(db_index=True, max_length=40, verbose_name='Acronym')),
+                ('partial_acronym', models.CharField(blank=True, default='', max_length=15)),
+                ('title', models.CharField(blank=True, default='', max_length=255, verbose_name='Title')),
+                ('active', models.BooleanField(default=False, verbose_name='Active')),
+                ('training_aid', models.BooleanField(default=False, verbose_name='Training aid')),
+                ('education_group_type', models.ForeignKey(null=True, on_delete=django.db.models.deletion.SET_NULL, related_name='+', to='base.educationgrouptype')),
+                ('education_group_year', models.ForeignKey(on_delete=django.db.models.deletion.CASCADE, related_name='+', to='base.educationgroupyear')),
+                ('faculty', models.ForeignKey(null=True, on_delete=django.db.models.deletion.SET_NULL, related_name='+', to='base.entity', verbose_name='Faculty')),
+                ('management_entity', models.ForeignKey(null=True, on_delete=django.db.models.deletion.SET_NULL, related_name='+', to='base.entity')),
+                ('training', models.OneToOneField(null=True, on_delete=django.db.models.deletion.SET_NULL, related_name='formation_catalog', to='continuing_education.continuingeducationtraining')),
+            ],
+            options={
+                'default_permissions': [],
+            },
+        ),
+        migrations.AddIndex(
+            model_name='formationcatalog',
+            index=django.contrib.postgres.indexes.GinIndex(fields=['acronym'], name='formation_catalog_acronym', opclasses=['gin_trgm_ops']),
+        ),
+        migrations.AddIndex(
+            model_name='formationcatalog',
+            index=django.contrib.postgres.indexes.GinIndex(fields=['partial_acronym'], name='formation_catalog_partial', opclasses=['gin_trgm_ops']),
+        ),
+        migrations.AddIndex(
+            model_name='formationcatalog',
+            index=django.contrib.postgres.indexes.GinIndex(fields=['title'], name='formation_catalog_title', opclasses=['gin_trgm_ops']),
+        ),
+        migrations.RunPython(build_formation_catalog, migrations.RunPython.noop),
+    ]
@@ -0,0 +1,86 @@
+# Generated by Django 3.2.12 on 2022-06-02 14:27
+
+import django.db.models.deletion
+from django.db import migrations, models
+
+
+def build_training_snapshots(apps, schema_editor):
+    from base.models.academic_year import current_academic_year
+    EducationGroupYear = apps.get_model('base', 'EducationGroupYear')
+    ContinuingEducationTraining = apps.get_model('continuing_education', 'ContinuingEducationTraining')
+
+    academic_year = current_academic_year()
+    if academic_year is None:
+        return
+    current_education_group_years = {}
+    next_education_group_years = {}
+    for egy in EducationGroupYear.objects.filter(
+        education_group__continuingeducationtraining__isnull=False,
+        academic_year__year__lte=academic_year.year + 1,
+    ).select_related('academic_year').order_by('education_group_id', '-academic_year__year'):
+        if egy.academic_year.year > academic_year.year:
+            next_education_group_years[egy.education_group_id] = egy
+        else:
+            current_education_group_years.setdefault(egy.education_group_id, egy)
+    current_education_group_years = {**next_education_group_years, **current_education_group_years}
+
+    trainings = list(ContinuingEducationTraining.objects.all())
+    for training in trainings:
+        egy = current_education_group_years.get(training.education_group_id)
+        if egy:
+            training.current_education_group_year_id = egy.pk
+            training.current_acronym = egy.acronym or ''
+            training.current_partial_acronym = egy.partial_acronym or ''
+            training.current_title = egy.title or ''
+            training.current_year_id = egy.academic_year_id
+            training.current_management_entity_id = egy.management_entity_id
+    ContinuingEducationTraining.objects.bulk_update(trainings, [
+        'current_education_group_year',
+        'current_acronym',
+        'current_partial_acronym',
+        'current_title',
+        'current_year',
+        'current_management_entity',
+    ], batch_size=500)
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('base', '0583_auto_20210324_0954'),
+        ('continuing_education', '0091_formationcatalog'),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name='continuingeducationtraining',
+            name='current_acronym',
+            field=models.CharField(blank=True, default='', editable=False, max_length=40),
+        ),
+        migrations.AddField(
+            model_name='continuingeducationtraining',
+            name='current_education_group_year',
+            field=models.ForeignKey(editable=False, null=True, on_delete=django.db.models.deletion.SET_NULL, related_name='+', to='base.educationgroupyear'),
+        ),
+        migrations.AddField(
+            model_name='continuingeducationtraining',
+            name='current_management_entity',
+            field=models.ForeignKey(editable=False, null=True, on_delete=django.db.models.deletion.SET_NULL, related_name='+', to='base.entity'),
+        ),
+        migrations.AddField(
+            model_name='continuingeducationtraining',
+            name='current_partial_acronym',
+            field=models.CharField(blank=True, default='', editable=False, max_length=15),
+        ),
+        migrations.AddField(
+            model_name='continuingeducationtraining',
+            name='current_title',
+            field=models.CharField(blank=True, default='', editable=False, max_length=255),
+        ),
+        migrations.AddField(
+            model_name='continuingeducationtraining',
+            name='current_year',
+            field=models.ForeignKey(editable=False, null=True, on_delete=django.db.models.deletion.SET_NULL, related_name='+', to='base.academicyear'),
+        ),
+        migrations.RunPython(build_training_snapshots, migrations.RunPython.noop),
+    ]
@@ -0,0 +1,50 @@
+# Generated by Django 3.2.12 on 2022-06-08 10:12
+
+from django.db import migrations, models
+
+AWARENESS_FIELDS = [
+    'awareness_ucl_website',
+    'awareness_formation_website',
+    'awareness_press',
+    'awareness_facebook',
+    'awareness_linkedin',
+    'awareness_customized_mail',
+    'awareness_emailing',
+    'awareness_word_of_mouth',
+    'awareness_friends',
+    'awareness_former_students',
+    'awareness_moocs',
+]
+
+PACK_AWARENESS_SQL = "UPDATE continuing_education_admission SET awareness_channels = {}".format(
+    " | ".join("({}::int << {})".format(field, position) for position, field in enumerate(AWARENESS_FIELDS))
+)
+
+UNPACK_AWARENESS_SQL = "UPDATE continuing_education_admission SET {}".format(
+    ", ".join(
+        "{} = (awareness_channels & {}) <> 0".format(field, 1 << position)
+        for position, field in enumerate(AWARENESS_FIELDS)
+    )
+)
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('continuing_education', '0092_auto_20220602_1427'),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name='admission',
+            name='awareness_channels',
+            field=models.PositiveIntegerField(default=0, verbose_name='Awareness'),
+        ),
+        migrations.RunSQL(PACK_AWARENESS_SQL, UNPACK_AWARENESS_SQL),
+    ] + [
+        migrations.RemoveField(
+            model_name='admission',
+            name=field,
+        )
+        for field in AWARENESS_FIELDS
+    ]
@@ -0,0 +1,18 @@
+# Generated by Django 3.2.12 on 2022-06-13 09:41
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('continuing_education', '0093_auto_20220608_1012'),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name='address',
+            name='content_hash',
+            field=models.CharField(db_index=True, editable=False, max_length=64, null=True),
+        ),
+    ]
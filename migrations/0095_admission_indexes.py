@@ -0,0 +1,33 @@
+# Generated by Django 3.2.12 on 2022-06-15 14:03
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('continuing_education', '0094_address_content_hash'),
+    ]
+
+    operations = [
+        migrations.AddIndex(
+            model_name='admission',
+            index=models.Index(fields=['state', 'archived'], name='admission_state_archived'),
+        ),
+        migrations.AddIndex(
+            model_name='admission',
+            index=models.Index(fields=['formation', 'state', 'archived', 'registration_file_received'], name='admission_formation_state'),
+        ),
+        migrations.AddIndex(
+            model_name='admission',
+            index=models.Index(condition=models.Q(('registration_file_received', False), ('state', 'Registration submitted')), fields=['formation'], name='admission_registration_todo'),
+        ),
+        migrations.AddIndex(
+            model_name='admission',
+            index=models.Index(condition=models.Q(('state__in', ['Submitted', 'Waiting'])), fields=['formation'], name='admission_to_accept'),
+        ),
+        migrations.AddIndex(
+            model_name='admission',
+            index=models.Index(condition=models.Q(('assessment_succeeded', True), ('diploma_produced', False), ('payment_complete', True), ('state', 'Validated')), fields=['formation'], name='admission_diploma_todo'),
+        ),
+    ]
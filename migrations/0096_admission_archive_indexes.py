@@ -0,0 +1,25 @@
+# Generated by Django 3.2.12 on 2022-06-20 10:27
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('continuing_education', '0095_admission_indexes'),
+    ]
+
+    operations = [
+        migrations.RemoveIndex(
+            model_name='admission',
+            name='admission_state_archived',
+        ),
+        migrations.AddIndex(
+            model_name='admission',
+            index=models.Index(condition=models.Q(('archived', False)), fields=['state'], name='admission_live_state'),
+        ),
+        migrations.AddIndex(
+            model_name='admission',
+            index=models.Index(condition=models.Q(('archived', True)), fields=['state'], name='admission_archive_state'),
+        ),
+    ]
@@ -0,0 +1,34 @@
+# Generated by Django 3.2.12 on 2022-06-28 09:10
+
+from django.db import migrations, models
+import django.db.models.deletion
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('continuing_education', '0097_exportjob_language_updated_at'),
+    ]
+
+    operations = [
+        migrations.AlterField(
+            model_name='admission',
+            name='address',
+            field=models.ForeignKey(blank=True, null=True, on_delete=django.db.models.deletion.PROTECT, to='continuing_education.address', verbose_name='Address'),
+        ),
+        migrations.AlterField(
+            model_name='admission',
+            name='billing_address',
+            field=models.ForeignKey(blank=True, null=True, on_delete=django.db.models.deletion.PROTECT, related_name='billing_address', to='continuing_education.address', verbose_name='Billing address'),
+        ),
+        migrations.AlterField(
+            model_name='admission',
+            name='residence_address',
+            field=models.ForeignKey(blank=True, null=True, on_delete=django.db.models.deletion.PROTECT, related_name='residence_address', to='continuing_education.address', verbose_name='Residence address'),
+        ),
+        migrations.AlterField(
+            model_name='continuingeducationtraining',
+            name='postal_address',
+            field=models.ForeignKey(blank=True, default=None, null=True, on_delete=django.db.models.deletion.PROTECT, to='continuing_education.address'),
+        ),
+    ]
@@ -0,0 +1,56 @@
+# Generated by Django 3.2.12 on 2022-06-28 09:15
+
+import hashlib
+import json
+
+from django.db import migrations
+from django.db.models import Count, Min
+
+BATCH_SIZE = 1000
+
+
+def get_address_content_hash(address):
+    content = json.dumps([address.location or '', address.postal_code or '', address.city or '', address.country_id])
+    return hashlib.sha256(content.encode()).hexdigest()
+
+
+def fill_address_hashes(apps, schema_editor):
+    Address = apps.get_model('continuing_education', 'Address')
+    while True:
+        addresses = list(Address.objects.filter(content_hash__isnull=True).order_by('pk')[:BATCH_SIZE])
+        if not addresses:
+            return
+        for address in addresses:
+            address.content_hash = get_address_content_hash(address)
+        Address.objects.bulk_update(addresses, ['content_hash'])
+
+
+def merge_duplicate_addresses(apps, schema_editor):
+    """ Keep the oldest row of each address content: the references to the others are moved to it """
+    Address = apps.get_model('continuing_education', 'Address')
+    duplicated_contents = list(Address.objects.values('content_hash').annotate(
+        kept_id=Min('pk'),
+        addresses_number=Count('pk'),
+    ).filter(addresses_number__gt=1).values_list('content_hash', 'kept_id'))
+    for content_hash, kept_id in duplicated_contents:
+        duplicate_ids = list(Address.objects.filter(content_hash=content_hash).exclude(pk=kept_id).values_list(
+            'pk', flat=True
+        ))
+        for relation in Address._meta.related_objects:
+            field_name = relation.field.attname
+            relation.related_model._base_manager.filter(**{field_name + '__in': duplicate_ids}).update(**{
+                field_name: kept_id
+            })
+        Address.objects.filter(pk__in=duplicate_ids).delete()
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('continuing_education', '0099_address_references_protected'),
+    ]
+
+    operations = [
+        migrations.RunPython(fill_address_hashes, migrations.RunPython.noop),
+        migrations.RunPython(merge_duplicate_addresses, migrations.RunPython.noop),
+    ]
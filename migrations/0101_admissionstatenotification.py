@@ -0,0 +1,33 @@
+# Generated by Django 3.2.12 on 2022-06-28 15:40
+
+from django.conf import settings
+from django.db import migrations, models
+import django.db.models.deletion
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        migrations.swappable_dependency(settings.AUTH_USER_MODEL),
+        ('continuing_education', '0100_merge_duplicate_addresses'),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name='AdmissionStateNotification',
+            fields=[
+                ('id', models.AutoField(auto_created=True, primary_key=True, serialize=False, verbose_name='ID')),
+                ('original_state', models.CharField(choices=[('Accepted', 'Accepted'), ('Accepted (no registration required)', 'Accepted (no registration required)'), ('Rejected', 'Rejected'), ('Waiting', 'Waiting'), ('Draft', 'Draft'), ('Submitted', 'Submitted'), ('Registration submitted', 'Registration submitted'), ('Validated', 'Validated'), ('Cancelled', 'Cancelled'), ('Cancelled (no registration required)', 'Cancelled (no registration required)')], max_length=50, verbose_name='Original state')),
+                ('new_state', models.CharField(choices=[('Accepted', 'Accepted'), ('Accepted (no registration required)', 'Accepted (no registration required)'), ('Rejected', 'Rejected'), ('Waiting', 'Waiting'), ('Draft', 'Draft'), ('Submitted', 'Submitted'), ('Registration submitted', 'Registration submitted'), ('Validated', 'Validated'), ('Cancelled', 'Cancelled'), ('Cancelled (no registration required)', 'Cancelled (no registration required)')], max_length=50, verbose_name='New state')),
+                ('reason', models.TextField(blank=True)),
+                ('language', models.CharField(blank=True, max_length=30)),
+                ('created_at', models.DateTimeField(auto_now_add=True)),
+                ('admission', models.ForeignKey(on_delete=django.db.models.deletion.CASCADE, to='continuing_education.admission', verbose_name='Admission')),
+                ('sender', models.ForeignKey(blank=True, null=True, on_delete=django.db.models.deletion.SET_NULL, to=settings.AUTH_USER_MODEL)),
+            ],
+            options={
+                'ordering': ('created_at',),
+                'default_permissions': [],
+            },
+        ),
+    ]
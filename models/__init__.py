@@ -26,7 +26,12 @@
 
 from continuing_education.models import address
 from continuing_education.models import admission
+from continuing_education.models import admission_search_document
+from continuing_education.models import admission_state_notification
 from continuing_education.models import continuing_education_person
 from continuing_education.models import continuing_education_training
+from continuing_education.models import export_job
 from continuing_education.models import file
+from continuing_education.models import formation_catalog
 from continuing_education.models import prospect
+from continuing_education.models import prospect_export_watermark
@@ -1,3 +1,5 @@
+import hashlib
+import json
 import uuid as uuid
 
 from django.contrib.admin import ModelAdmin
@@ -12,8 +14,24 @@ class AddressAdmin(ModelAdmin):
     raw_id_fields = ('country',)
 
 
+class AddressQuerySet(models.QuerySet):
+    def intern(self, location='', postal_code='', city='', country=None, country_id=None):
+        """
+        The address having this content, created if there is none yet: identical addresses share a single row.
+        A usage edited on its own interns its new content instead of updating the shared row (copy-on-write), and the
+        references to an address are protected: a shared row is never deleted along with one of its usages.
+        """
+        country_id = country.pk if country else country_id
+        content_hash = get_address_content_hash(location, postal_code, city, country_id)
+        address = self.filter(content_hash=content_hash).order_by('pk').first()
+        if address is None:
+            address = self.create(location=location, postal_code=postal_code, city=city, country_id=country_id)
+        return address
+
+
 class Address(Model):
     uuid = models.UUIDField(default=uuid.uuid4, unique=True, editable=False)
+    content_hash = models.CharField(max_length=64, null=True, db_index=True, editable=False)
 
     location = models.CharField(
         max_length=255,
@@ -39,5 +57,16 @@ class Address(Model):
         on_delete=models.CASCADE
     )
 
+    objects = AddressQuerySet.as_manager()
+
+    def save(self, *args, **kwargs):
+        self.content_hash = get_address_content_hash(self.location, self.postal_code, self.city, self.country_id)
+        super().save(*args, **kwargs)
+
     class Meta:
         default_permissions = []
+
+
+def get_address_content_hash(location, postal_code, city, country_id):
+    content = json.dumps([location or '', postal_code or '', city or '', country_id])
+    return hashlib.sha256(content.encode()).hexdigest()
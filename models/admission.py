@@ -24,17 +24,19 @@
 #
 ##############################################################################
 import uuid as uuid
+from functools import lru_cache
 
 from django.contrib.admin import ModelAdmin
 from django.core.exceptions import PermissionDenied
 from django.core.validators import RegexValidator
 from django.db import models
 from django.db.models import Model
-from django.utils.translation import gettext_lazy as _
+from django.utils.translation import gettext_lazy as _, get_language
 from reversion.admin import VersionAdmin
 
 from continuing_education.auth.roles.continuing_education_training_manager import ContinuingEducationTrainingManager
 from continuing_education.models.enums import admission_state_choices, enums
+from continuing_education.models.enums.awareness_channel import AwarenessChannel, AWARENESS_BITS
 from continuing_education.models.enums.ucl_registration_error_choices import UCLRegistrationError
 from continuing_education.models.enums.ucl_registration_state_choices import UCLRegistrationState
 from osis_common.utils.models import get_object_or_none
@@ -43,14 +45,34 @@ from osis_common.utils.validators import belgium_national_register_number_valida
 NEWLY_CREATED_STATE = "NEWLY_CREATED"
 
 
+def awareness_channel_property(channel):
+    """ Boolean view of one bit of awareness_channels """
+    bit = AWARENESS_BITS[channel]
+
+    def getter(admission):
+        return bool(admission.awareness_channels & bit)
+
+    def setter(admission, value):
+        if value:
+            admission.awareness_channels |= bit
+        else:
+            admission.awareness_channels &= ~bit
+
+    return property(getter, setter)
+
+
 class AdmissionQuerySet(models.QuerySet):
     def formations(self):
         from continuing_education.models.continuing_education_training import ContinuingEducationTrainingQuerySet
         return ContinuingEducationTrainingQuerySet.prefetch_education_group_years(
-            self,
+            self.select_related('formation__current_year', 'formation__current_management_entity'),
             "formation__education_group__educationgroupyear_set"
         )
 
+    def with_formation_managers(self):
+        from continuing_education.models.continuing_education_training import ContinuingEducationTrainingQuerySet
+        return ContinuingEducationTrainingQuerySet.prefetch_managers(self, "formation__managers")
+
 
 class RegistrationManager(models.Manager):
     def get_queryset(self):
@@ -126,7 +148,7 @@ class Admission(Model):
         blank=True,
         null=True,
         verbose_name=_("Address"),
-        on_delete=models.CASCADE
+        on_delete=models.PROTECT
     )
     phone_mobile = models.CharField(
         max_length=30,
@@ -214,55 +236,27 @@ class Admission(Model):
     )
 
     # Awareness
-    awareness_ucl_website = models.BooleanField(
-        default=False,
-        verbose_name=_("By UCLouvain website")
-    )
-    awareness_formation_website = models.BooleanField(
-        default=False,
-        verbose_name=_("By formation website")
-    )
-    awareness_press = models.BooleanField(
-        default=False,
-        verbose_name=_("By press")
-    )
-    awareness_facebook = models.BooleanField(
-        default=False,
-        verbose_name=_("By Facebook")
-    )
-    awareness_linkedin = models.BooleanField(
-        default=False,
-        verbose_name=_("By LinkedIn")
-    )
-    awareness_customized_mail = models.BooleanField(
-        default=False,
-        verbose_name=_("By customized mail")
-    )
-    awareness_emailing = models.BooleanField(
-        default=False,
-        verbose_name=_("By emailing")
+    awareness_channels = models.PositiveIntegerField(
+        default=0,
+        verbose_name=_("Awareness")
     )
     awareness_other = models.CharField(
         max_length=100,
         blank=True,
         verbose_name=_("Other")
     )
-    awareness_word_of_mouth = models.BooleanField(
-        default=False,
-        verbose_name=_("By word of mouth")
-    )
-    awareness_friends = models.BooleanField(
-        default=False,
-        verbose_name=_("By friends")
-    )
-    awareness_former_students = models.BooleanField(
-        default=False,
-        verbose_name=_("By former students")
-    )
-    awareness_moocs = models.BooleanField(
-        default=False,
-        verbose_name=_("By Moocs")
-    )
+    awareness_ucl_website = awareness_channel_property(AwarenessChannel.UCL_WEBSITE)
+    awareness_formation_website = awareness_channel_property(AwarenessChannel.FORMATION_WEBSITE)
+    awareness_press = awareness_channel_property(AwarenessChannel.PRESS)
+    awareness_facebook = awareness_channel_property(AwarenessChannel.FACEBOOK)
+    awareness_linkedin = awareness_channel_property(AwarenessChannel.LINKEDIN)
+    awareness_customized_mail = awareness_channel_property(AwarenessChannel.CUSTOMIZED_MAIL)
+    awareness_emailing = awareness_channel_property(AwarenessChannel.EMAILING)
+    awareness_word_of_mouth = awareness_channel_property(AwarenessChannel.WORD_OF_MOUTH)
+    awareness_friends = awareness_channel_property(AwarenessChannel.FRIENDS)
+    awareness_former_students = awareness_channel_property(AwarenessChannel.FORMER_STUDENTS)
+    awareness_moocs = awareness_channel_property(AwarenessChannel.MOOCS)
+
     # State
     state = models.CharField(
         max_length=50,
@@ -294,7 +288,7 @@ class Admission(Model):
         null=True,
         related_name="billing_address",
         verbose_name=_("Billing address"),
-        on_delete=models.CASCADE
+        on_delete=models.PROTECT
     )
 
     head_office_name = models.CharField(
@@ -369,7 +363,7 @@ class Admission(Model):
         null=True,
         related_name="residence_address",
         verbose_name=_("Residence address"),
-        on_delete=models.CASCADE
+        on_delete=models.PROTECT
     )
 
     residence_phone = models.CharField(
@@ -425,6 +419,8 @@ class Admission(Model):
         default=False,
         verbose_name=_("Registration file received")
     )
+    # The live and archived admissions are searched through separate partial indexes (admission_live_state and
+    # admission_archive_state): a query filtering on archived only reads the index entries of its own rows
     archived = models.BooleanField(
         default=False,
         verbose_name=_("Archived")
@@ -476,12 +472,11 @@ class Admission(Model):
 
     @property
     def formation_display(self):
-        education_group_year = self.formation.get_current_education_group_year()
         return get_formation_display(
-            education_group_year.partial_acronym,
-            education_group_year.acronym,
-            education_group_year.title,
-            education_group_year.academic_year
+            self.formation.partial_acronym,
+            self.formation.acronym,
+            self.formation.title,
+            self.formation.academic_year
         )
 
     @property
@@ -498,22 +493,7 @@ class Admission(Model):
 
     @property
     def awareness_list(self):
-        list_awareness = [
-            self._get_awareness_values(field)
-            for field in Admission._meta.get_fields()
-            if 'awareness_' in field.name and self._get_awareness_values(field)
-        ]
-        return ", ".join(list_awareness)
-
-    def _get_awareness_values(self, field):
-        if getattr(self, field.name) is True:
-            return str(_(field.verbose_name))
-        elif self._has_awareness_other(field):
-            return "{} : {}".format(_('Other'), getattr(self, field.name))
-
-    def _has_awareness_other(self, field):
-        return isinstance(getattr(self, field.name), str) and field.name == "awareness_other" and len(
-            getattr(self, field.name)) > 0
+        return format_awareness(self.awareness_channels, self.awareness_other)
 
     def is_draft(self):
         return self.state == admission_state_choices.DRAFT
@@ -554,8 +534,7 @@ class Admission(Model):
         return self.is_waiting() or self.is_rejected() or self.is_submitted()
 
     def get_faculty(self):
-        education_group_year = self.formation.get_current_education_group_year()
-        return education_group_year.management_entity
+        return self.formation.management_entity
 
     class Meta:
         default_permissions = ['view', 'change']
@@ -571,6 +550,40 @@ class Admission(Model):
             ("export_admission", "Export an admission into XLSX file"),
             ("cancel_admission", "Cancel an admission"),
         )
+        indexes = [
+            # Search forms: state(s) of the live or archived admissions, then the formation and the received
+            # registration file
+            models.Index(fields=['state'], condition=models.Q(archived=False), name='admission_live_state'),
+            models.Index(fields=['state'], condition=models.Q(archived=True), name='admission_archive_state'),
+            models.Index(
+                fields=['formation', 'state', 'archived', 'registration_file_received'],
+                name='admission_formation_state',
+            ),
+            # Tasks, restricted to the formations of the training manager
+            models.Index(
+                fields=['formation'],
+                condition=models.Q(
+                    state=admission_state_choices.REGISTRATION_SUBMITTED,
+                    registration_file_received=False,
+                ),
+                name='admission_registration_todo',
+            ),
+            models.Index(
+                fields=['formation'],
+                condition=models.Q(state__in=[admission_state_choices.SUBMITTED, admission_state_choices.WAITING]),
+                name='admission_to_accept',
+            ),
+            models.Index(
+                fields=['formation'],
+                condition=models.Q(
+                    state=admission_state_choices.VALIDATED,
+                    diploma_produced=False,
+                    payment_complete=True,
+                    assessment_succeeded=True,
+                ),
+                name='admission_diploma_todo',
+            ),
+        ]
 
 
 def search(**kwargs):
@@ -586,6 +599,19 @@ def search(**kwargs):
     return qs
 
 
+def format_awareness(awareness_channels, awareness_other):
+    labels = list(_get_awareness_labels(awareness_channels, get_language()))
+    if awareness_other:
+        labels.append("{} : {}".format(_('Other'), awareness_other))
+    return ", ".join(labels)
+
+
+@lru_cache(maxsize=None)
+def _get_awareness_labels(awareness_channels, language):
+    """ Translated labels of each combination of channels, computed once per language """
+    return tuple(str(channel.value) for channel in AwarenessChannel if awareness_channels & AWARENESS_BITS[channel])
+
+
 def get_formation_display(partial_acronym, acronym, title, academic_year):
     return "{}{} - {} - {}".format(
         "{} - ".format(partial_acronym) if partial_acronym else "",
@@ -0,0 +1,59 @@
+##############################################################################
+#
+#    OSIS stands for Open Student Information System. It's an application
+#    designed to manage the core business of higher education institutions,
+#    such as universities, faculties, institutes and professional schools.
+#    The core business involves the administration of students, teachers,
+#    courses, programs and so on.
+#
+#    Copyright (C) 2015-2022 Université catholique de Louvain (http://www.uclouvain.be)
+#
+#    This program is free software: you can redistribute it and/or modify
+#    it under the terms of the GNU General Public License as published by
+#    the Free Software Foundation, either version 3 of the License, or
+#    (at your option) any later version.
+#
+#    This program is distributed in the hope that it will be useful,
+#    but WITHOUT ANY WARRANTY; without even the implied warranty of
+#    MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+#    GNU General Public License for more details.
+#
+#    A copy of this license - GNU General Public License - is available
+#    at the root of the source code of this program.  If not,
+#    see http://www.gnu.org/licenses/.
+#
+##############################################################################
+from django.contrib.admin import ModelAdmin
+from django.contrib.postgres.indexes import GinIndex
+from django.contrib.postgres.search import SearchVectorField
+from django.db import models
+from django.db.models import Model
+
+
+class AdmissionSearchDocumentAdmin(ModelAdmin):
+    list_display = ('admission', 'document')
+    raw_id_fields = ('admission',)
+
+
+class AdmissionSearchDocument(Model):
+    """
+    Denormalized, unaccented and lowercased text of the admission fields searched by the "In all fields" filter.
+    """
+    admission = models.OneToOneField(
+        'continuing_education.Admission',
+        on_delete=models.CASCADE,
+        primary_key=True,
+        related_name='search_document'
+    )
+    document = models.TextField(default='', blank=True)
+    search_vector = SearchVectorField(null=True)
+
+    class Meta:
+        default_permissions = []
+        indexes = [
+            GinIndex(fields=['search_vector'], name='admission_search_vector'),
+            GinIndex(fields=['document'], opclasses=['gin_trgm_ops'], name='admission_search_trigram'),
+        ]
+
+    def __str__(self):
+        return str(self.admission_id)
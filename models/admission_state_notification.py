@@ -0,0 +1,75 @@
+##############################################################################
+#
+#    OSIS stands for Open Student Information System. It's an application
+#    designed to manage the core business of higher education institutions,
+#    such as universities, faculties, institutes and professional schools.
+#    The core business involves the administration of students, teachers,
+#    courses, programs and so on.
+#
+#    Copyright (C) 2015-2022 Université catholique de Louvain (http://www.uclouvain.be)
+#
+#    This program is free software: you can redistribute it and/or modify
+#    it under the terms of the GNU General Public License as published by
+#    the Free Software Foundation, either version 3 of the License, or
+#    (at your option) any later version.
+#
+#    This program is distributed in the hope that it will be useful,
+#    but WITHOUT ANY WARRANTY; without even the implied warranty of
+#    MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+#    GNU General Public License for more details.
+#
+#    A copy of this license - GNU General Public License - is available
+#    at the root of the source code of this program.  If not,
+#    see http://www.gnu.org/licenses/.
+#
+##############################################################################
+from django.conf import settings
+from django.contrib.admin import ModelAdmin
+from django.db import models
+from django.db.models import Model
+from django.utils.translation import gettext_lazy as _
+
+from continuing_education.models.enums import admission_state_choices
+
+
+class AdmissionStateNotificationAdmin(ModelAdmin):
+    list_display = ('admission', 'original_state', 'new_state', 'sender', 'language', 'created_at')
+    raw_id_fields = ('admission', 'sender')
+
+
+class AdmissionStateNotification(Model):
+    """ State change email of an admission, kept until it has been sent """
+    admission = models.ForeignKey(
+        'continuing_education.Admission',
+        on_delete=models.CASCADE,
+        verbose_name=_("Admission")
+    )
+
+    original_state = models.CharField(
+        max_length=50,
+        choices=admission_state_choices.STATE_CHOICES,
+        verbose_name=_("Original state")
+    )
+
+    new_state = models.CharField(
+        max_length=50,
+        choices=admission_state_choices.STATE_CHOICES,
+        verbose_name=_("New state")
+    )
+
+    reason = models.TextField(blank=True)
+
+    sender = models.ForeignKey(
+        settings.AUTH_USER_MODEL,
+        null=True,
+        blank=True,
+        on_delete=models.SET_NULL
+    )
+
+    language = models.CharField(max_length=30, blank=True)
+
+    created_at = models.DateTimeField(auto_now_add=True, editable=False)
+
+    class Meta:
+        ordering = ('created_at',)
+        default_permissions = []
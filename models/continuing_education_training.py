@@ -31,10 +31,10 @@ from django.db import models
 from django.db.models import Model, Prefetch, Case, When, Value, IntegerField
 from django.utils.translation import gettext_lazy as _
 
-from base.models.academic_year import current_academic_year
 from base.models.education_group_year import EducationGroupYear
 from base.models.enums.education_group_types import TrainingType
 from base.models.person import Person
+from continuing_education.business.academic_year import current_academic_year
 from continuing_education.models.address import Address
 
 CONTINUING_EDUCATION_TRAINING_TYPES = [
@@ -49,14 +49,30 @@ CONTINUING_EDUCATION_TRAINING_TYPES = [
 
 class ContinuingEducationTrainingAdmin(ModelAdmin):
     list_display = ('acronym', 'active', 'training_aid', 'send_notification_emails')
-    search_fields = ['education_group__educationgroupyear__acronym']
+    search_fields = ['current_acronym', 'education_group__educationgroupyear__acronym']
     list_filter = ('active', 'training_aid', 'send_notification_emails',)
     raw_id_fields = ('education_group',)
 
 
 class ContinuingEducationTrainingQuerySet(models.QuerySet):
     def formations(self):
-        return self.prefetch_education_group_years(self, "education_group__educationgroupyear_set")
+        return self.prefetch_education_group_years(
+            self.select_related('current_year', 'current_management_entity'),
+            "education_group__educationgroupyear_set"
+        )
+
+    def with_managers(self):
+        return self.prefetch_managers(self, 'managers')
+
+    @staticmethod
+    def prefetch_managers(qs, prefetch_path: str):
+        return qs.prefetch_related(
+            Prefetch(
+                prefetch_path,
+                queryset=Person.objects.order_by('last_name', 'first_name'),
+                to_attr='prefetched_managers'
+            )
+        )
 
     @staticmethod
     def prefetch_education_group_years(qs, prefetch_path: str):
@@ -75,6 +91,7 @@ class ContinuingEducationTrainingQuerySet(models.QuerySet):
                     )
                 ).select_related(
                     'academic_year',
+                    'management_entity',
                 ).order_by("ordering"),
                 to_attr="prefetched_education_group_years"
             )
@@ -117,7 +134,7 @@ class ContinuingEducationTraining(Model):
 
     managers = models.ManyToManyField(Person, through='ContinuingEducationTrainingManager')
 
-    postal_address = models.ForeignKey(Address, default=None, blank=True, null=True, on_delete=models.CASCADE)
+    postal_address = models.ForeignKey(Address, default=None, blank=True, null=True, on_delete=models.PROTECT)
 
     additional_information_label = models.TextField(
         default='',
@@ -131,6 +148,31 @@ class ContinuingEducationTraining(Model):
         verbose_name=_("Registration required")
     )
 
+    current_education_group_year = models.ForeignKey(
+        'base.EducationGroupYear',
+        on_delete=models.SET_NULL,
+        null=True,
+        editable=False,
+        related_name='+',
+    )
+    current_acronym = models.CharField(max_length=40, blank=True, default='', editable=False)
+    current_partial_acronym = models.CharField(max_length=15, blank=True, default='', editable=False)
+    current_title = models.CharField(max_length=255, blank=True, default='', editable=False)
+    current_year = models.ForeignKey(
+        'base.AcademicYear',
+        on_delete=models.SET_NULL,
+        null=True,
+        editable=False,
+        related_name='+',
+    )
+    current_management_entity = models.ForeignKey(
+        'base.Entity',
+        on_delete=models.SET_NULL,
+        null=True,
+        editable=False,
+        related_name='+',
+    )
+
     objects = ContinuingEducationTrainingManager()
 
     def clean(self):
@@ -157,17 +199,32 @@ class ContinuingEducationTraining(Model):
         if hasattr(self.education_group, "prefetched_education_group_years") \
                 and self.education_group.prefetched_education_group_years:
             return self.education_group.prefetched_education_group_years[0]
+        if self.current_education_group_year_id:
+            return self.current_education_group_year
         try:
             return self.__get_education_group_year_with_delta(0)
         except EducationGroupYear.DoesNotExist:
             return self.__get_education_group_year_with_delta(1)
 
+    def set_current_education_group_year(self, education_group_year):
+        """ Copy the fields of the current education group year, read by the properties below without query """
+        self.current_education_group_year = education_group_year
+        self.current_acronym = getattr(education_group_year, 'acronym', None) or ''
+        self.current_partial_acronym = getattr(education_group_year, 'partial_acronym', None) or ''
+        self.current_title = getattr(education_group_year, 'title', None) or ''
+        self.current_year_id = getattr(education_group_year, 'academic_year_id', None)
+        self.current_management_entity_id = getattr(education_group_year, 'management_entity_id', None)
+
     @property
     def acronym(self):
+        if self.current_education_group_year_id:
+            return self.current_acronym
         return self.get_current_education_group_year().acronym
 
     @property
     def partial_acronym(self):
+        if self.current_education_group_year_id:
+            return self.current_partial_acronym
         return self.get_current_education_group_year().partial_acronym
 
     @property
@@ -176,32 +233,45 @@ class ContinuingEducationTraining(Model):
 
     @property
     def title(self):
+        if self.current_education_group_year_id:
+            return self.current_title
         return self.get_current_education_group_year().title
 
     @property
     def academic_year(self):
+        if self.current_education_group_year_id:
+            return self.current_year
         return self.get_current_education_group_year().academic_year
 
     @property
     def management_entity(self):
+        if self.current_education_group_year_id:
+            return self.current_management_entity
         return self.get_current_education_group_year().management_entity
 
+    def get_manager_contacts(self):
+        """ Prefetched by with_managers() for the lists, read from the shared cache for a single training """
+        from continuing_education.business import manager_contacts
+        if hasattr(self, 'prefetched_managers'):
+            return manager_contacts.build_manager_contacts(self.prefetched_managers)
+        if not hasattr(self, '_manager_contacts'):
+            self._manager_contacts = manager_contacts.get_manager_contacts(self.pk)
+        return self._manager_contacts
+
     @property
     def formation_administrators(self):
-        return " - ".join([str(mgr) for mgr in self.managers.all().order_by('last_name', 'first_name')])
+        return " - ".join(contact.name for contact in self.get_manager_contacts())
 
     @property
     def acronym_and_title(self):
-        most_recent_education_group_year = self.get_current_education_group_year()
-        return "{} - {}".format(most_recent_education_group_year.acronym, most_recent_education_group_year.title)
+        return "{} - {}".format(self.acronym, self.title)
 
     def get_alternative_notification_email_receivers(self):
         return [adr.strip() for adr in self.alternate_notification_email_addresses.split(',') if adr]
 
     def __str__(self):
-        education_group_year = self.get_current_education_group_year()
         training_aid_mention = " ({})".format(_('Training aid available')) if self.training_aid else ''
-        return "{} - {}{}".format(education_group_year.acronym, education_group_year.title, training_aid_mention)
+        return "{}{}".format(self.acronym_and_title, training_aid_mention)
 
     class Meta:
         ordering = ('education_group', )
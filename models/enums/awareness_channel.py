@@ -0,0 +1,47 @@
+##############################################################################
+#
+#    OSIS stands for Open Student Information System. It's an application
+#    designed to manage the core business of higher education institutions,
+#    such as universities, faculties, institutes and professional schools.
+#    The core business involves the administration of students, teachers,
+#    courses, programs and so on.
+#
+#    Copyright (C) 2015-2022 Université catholique de Louvain (http://www.uclouvain.be)
+#
+#    This program is free software: you can redistribute it and/or modify
+#    it under the terms of the GNU General Public License as published by
+#    the Free Software Foundation, either version 3 of the License, or
+#    (at your option) any later version.
+#
+#    This program is distributed in the hope that it will be useful,
+#    but WITHOUT ANY WARRANTY; without even the implied warranty of
+#    MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+#    GNU General Public License for more details.
+#
+#    A copy of this license - GNU General Public License - is available
+#    at the root of the source code of this program.  If not,
+#    see http://www.gnu.org/licenses/.
+#
+##############################################################################
+from django.utils.translation import gettext_lazy as _
+
+from base.models.utils.utils import ChoiceEnum
+
+
+class AwarenessChannel(ChoiceEnum):
+    """ The bit of a channel in Admission.awareness_channels is its position: only append new channels """
+    UCL_WEBSITE = _("By UCLouvain website")
+    FORMATION_WEBSITE = _("By formation website")
+    PRESS = _("By press")
+    FACEBOOK = _("By Facebook")
+    LINKEDIN = _("By LinkedIn")
+    CUSTOMIZED_MAIL = _("By customized mail")
+    EMAILING = _("By emailing")
+    WORD_OF_MOUTH = _("By word of mouth")
+    FRIENDS = _("By friends")
+    FORMER_STUDENTS = _("By former students")
+    MOOCS = _("By Moocs")
+
+
+AWARENESS_BITS = {channel: 1 << position for position, channel in enumerate(AwarenessChannel)}
+AWARENESS_FIELD_NAMES = {channel: 'awareness_{}'.format(channel.name.lower()) for channel in AwarenessChannel}
@@ -0,0 +1,103 @@
+##############################################################################
+#
+#    OSIS stands for Open Student Information System. It's an application
+#    designed to manage the core business of higher education institutions,
+#    such as universities, faculties, institutes and professional schools.
+#    The core business involves the administration of students, teachers,
+#    courses, programs and so on.
+#
+#    Copyright (C) 2015-2022 Université catholique de Louvain (http://www.uclouvain.be)
+#
+#    This program is free software: you can redistribute it and/or modify
+#    it under the terms of the GNU General Public License as published by
+#    the Free Software Foundation, either version 3 of the License, or
+#    (at your option) any later version.
+#
+#    This program is distributed in the hope that it will be useful,
+#    but WITHOUT ANY WARRANTY; without even the implied warranty of
+#    MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+#    GNU General Public License for more details.
+#
+#    A copy of this license - GNU General Public License - is available
+#    at the root of the source code of this program.  If not,
+#    see http://www.gnu.org/licenses/.
+#
+##############################################################################
+import uuid as uuid
+
+from django.conf import settings
+from django.contrib.admin import ModelAdmin
+from django.db import models
+from django.db.models import Model
+from django.utils.translation import gettext_lazy as _
+
+from continuing_education.models.enums.export_job_choices import ExportJobState, ExportJobKind
+
+
+def export_job_directory_path(instance, filename):
+    return 'continuing_education/exports/{}/{}'.format(
+        instance.uuid,
+        filename
+    )
+
+
+class ExportJobAdmin(ModelAdmin):
+    list_display = ('uuid', 'kind', 'state', 'user', 'progress', 'total', 'created_at', 'updated_at', 'finished_at')
+    list_filter = ('kind', 'state')
+    raw_id_fields = ('user',)
+
+
+class ExportJob(Model):
+    uuid = models.UUIDField(default=uuid.uuid4, unique=True, editable=False)
+
+    user = models.ForeignKey(
+        settings.AUTH_USER_MODEL,
+        on_delete=models.CASCADE
+    )
+
+    kind = models.CharField(
+        max_length=50,
+        choices=ExportJobKind.choices(),
+        verbose_name=_("Kind")
+    )
+
+    state = models.CharField(
+        max_length=50,
+        choices=ExportJobState.choices(),
+        default=ExportJobState.PENDING.name,
+        verbose_name=_("State")
+    )
+
+    filters = models.JSONField(default=dict)
+
+    language = models.CharField(max_length=30, blank=True)
+
+    progress = models.PositiveIntegerField(default=0)
+    total = models.PositiveIntegerField(default=0)
+
+    file = models.FileField(
+        upload_to=export_job_directory_path,
+        blank=True,
+    )
+
+    error = models.TextField(blank=True)
+
+    created_at = models.DateTimeField(auto_now_add=True, editable=False)
+    updated_at = models.DateTimeField(auto_now=True, editable=False)
+    finished_at = models.DateTimeField(null=True, blank=True)
+
+    @property
+    def percentage(self):
+        if self.state == ExportJobState.DONE.name:
+            return 100
+        return int(self.progress * 100 / self.total) if self.total else 0
+
+    def is_done(self):
+        return self.state == ExportJobState.DONE.name
+
+    def is_finished(self):
+        return self.state in (ExportJobState.DONE.name, ExportJobState.FAILED.name)
+
+    class Meta:
+        ordering = ('-created_at',)
+        default_permissions = []
@@ -0,0 +1,103 @@
+##############################################################################
+#
+#    OSIS stands for Open Student Information System. It's an application
+#    designed to manage the core business of higher education institutions,
+#    such as universities, faculties, institutes and professional schools.
+#    The core business involves the administration of students, teachers,
+#    courses, programs and so on.
+#
+#    Copyright (C) 2015-2022 Université catholique de Louvain (http://www.uclouvain.be)
+#
+#    This program is free software: you can redistribute it and/or modify
+#    it under the terms of the GNU General Public License as published by
+#    the Free Software Foundation, either version 3 of the License, or
+#    (at your option) any later version.
+#
+#    This program is distributed in the hope that it will be useful,
+#    but WITHOUT ANY WARRANTY; without even the implied warranty of
+#    MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+#    GNU General Public License for more details.
+#
+#    A copy of this license - GNU General Public License - is available
+#    at the root of the source code of this program.  If not,
+#    see http://www.gnu.org/licenses/.
+#
+##############################################################################
+from django.contrib.admin import ModelAdmin
+from django.contrib.postgres.indexes import GinIndex
+from django.db import models
+from django.db.models import Model
+from django.utils.translation import gettext_lazy as _, pgettext_lazy
+
+
+class FormationCatalogAdmin(ModelAdmin):
+    list_display = ('acronym', 'title', 'faculty', 'active', 'training_aid')
+    search_fields = ['acronym', 'title']
+    list_filter = ('active', 'training_aid')
+    raw_id_fields = ('education_group', 'education_group_year', 'training')
+
+
+class FormationCatalog(Model):
+    """
+    Denormalized row of the formations list: current (most recent) year of an education group,
+    its faculty and its continuing education training, maintained by signals.
+    """
+    education_group = models.OneToOneField(
+        'base.EducationGroup',
+        on_delete=models.CASCADE,
+        primary_key=True,
+        related_name='formation_catalog'
+    )
+    education_group_year = models.ForeignKey(
+        'base.EducationGroupYear',
+        on_delete=models.CASCADE,
+        related_name='+'
+    )
+    acronym = models.CharField(max_length=40, db_index=True, verbose_name=_('Acronym'))
+    partial_acronym = models.CharField(max_length=15, blank=True, default='')
+    title = models.CharField(max_length=255, blank=True, default='',
+                             verbose_name=pgettext_lazy('continuing_education', 'Title'))
+    education_group_type = models.ForeignKey(
+        'base.EducationGroupType',
+        on_delete=models.SET_NULL,
+        null=True,
+        related_name='+'
+    )
+    management_entity = models.ForeignKey(
+        'base.Entity',
+        on_delete=models.SET_NULL,
+        null=True,
+        related_name='+'
+    )
+    faculty = models.ForeignKey(
+        'base.Entity',
+        on_delete=models.SET_NULL,
+        null=True,
+        related_name='+',
+        verbose_name=_('Faculty')
+    )
+    training = models.OneToOneField(
+        'continuing_education.ContinuingEducationTraining',
+        on_delete=models.SET_NULL,
+        null=True,
+        related_name='formation_catalog'
+    )
+    active = models.BooleanField(default=False, verbose_name=_("Active"))
+    training_aid = models.BooleanField(default=False, verbose_name=_("Training aid"))
+
+    class Meta:
+        default_permissions = []
+        indexes = [
+            GinIndex(fields=['acronym'], opclasses=['gin_trgm_ops'], name='formation_catalog_acronym'),
+            GinIndex(fields=['partial_acronym'], opclasses=['gin_trgm_ops'], name='formation_catalog_partial'),
+            GinIndex(fields=['title'], opclasses=['gin_trgm_ops'], name='formation_catalog_title'),
+        ]
+
+    def __str__(self):
+        return self.acronym
+
+    @property
+    def active_state(self):
+        if self.training_id:
+            return _('Active') if self.active else _('Inactive')
+        return _('Not organized')
@@ -81,6 +81,9 @@ class Prospect(Model):
         permissions = (
             ("export_prospect", "Export a prospect into XLSX file"),
         )
+        indexes = [
+            models.Index(fields=['formation', 'id'], name='prospect_formation_id'),
+        ]
 
     def __str__(self):
         return "{} - {} {}".format(self.id, self.first_name, self.name)
@@ -0,0 +1,58 @@
+##############################################################################
+#
+#    OSIS stands for Open Student Information System. It's an application
+#    designed to manage the core business of higher education institutions,
+#    such as universities, faculties, institutes and professional schools.
+#    The core business involves the administration of students, teachers,
+#    courses, programs and so on.
+#
+#    Copyright (C) 2015-2022 Université catholique de Louvain (http://www.uclouvain.be)
+#
+#    This program is free software: you can redistribute it and/or modify
+#    it under the terms of the GNU General Public License as published by
+#    the Free Software Foundation, either version 3 of the License, or
+#    (at your option) any later version.
+#
+#    This program is distributed in the hope that it will be useful,
+#    but WITHOUT ANY WARRANTY; without even the implied warranty of
+#    MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+#    GNU General Public License for more details.
+#
+#    A copy of this license - GNU General Public License - is available
+#    at the root of the source code of this program.  If not,
+#    see http://www.gnu.org/licenses/.
+#
+##############################################################################
+from django.conf import settings
+from django.contrib.admin import ModelAdmin
+from django.db import models
+from django.db.models import Model
+from django.utils.translation import gettext_lazy as _
+
+
+class ProspectExportWatermarkAdmin(ModelAdmin):
+    list_display = ('user', 'training', 'last_exported_id', 'exported_at')
+    raw_id_fields = ('user', 'training')
+
+
+class ProspectExportWatermark(Model):
+    user = models.ForeignKey(
+        settings.AUTH_USER_MODEL,
+        on_delete=models.CASCADE
+    )
+    training = models.ForeignKey(
+        'continuing_education.ContinuingEducationTraining',
+        on_delete=models.CASCADE
+    )
+    last_exported_id = models.PositiveIntegerField(
+        default=0,
+        verbose_name=_("Last exported prospect")
+    )
+    exported_at = models.DateTimeField(auto_now=True)
+
+    class Meta:
+        default_permissions = []
+        unique_together = ('user', 'training')
+
+    def __str__(self):
+        return "{} - {} - {}".format(self.user, self.training_id, self.last_exported_id)
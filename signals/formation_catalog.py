@@ -0,0 +1,47 @@
+##############################################################################
+#
+#    OSIS stands for Open Student Information System. It's an application
+#    designed to manage the core business of higher education institutions,
+#    such as universities, faculties, institutes and professional schools.
+#    The core business involves the administration of students, teachers,
+#    courses, programs and so on.
+#
+#    Copyright (C) 2015-2022 Université catholique de Louvain (http://www.uclouvain.be)
+#
+#    This program is free software: you can redistribute it and/or modify
+#    it under the terms of the GNU General Public License as published by
+#    the Free Software Foundation, either version 3 of the License, or
+#    (at your option) any later version.
+#
+#    This program is distributed in the hope that it will be useful,
+#    but WITHOUT ANY WARRANTY; without even the implied warranty of
+#    MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+#    GNU General Public License for more details.
+#
+#    A copy of this license - GNU General Public License - is available
+#    at the root of the source code of this program.  If not,
+#    see http://www.gnu.org/licenses/.
+#
+##############################################################################
+from django.db.models.signals import post_save, post_delete
+from django.dispatch import receiver
+
+from base.models.education_group_year import EducationGroupYear
+from base.models.entity_version import EntityVersion
+from continuing_education.business.formation_catalog import refresh_formation_catalog_on_commit, \
+    refresh_formation_catalog_of_entity_on_commit
+from continuing_education.models.continuing_education_training import ContinuingEducationTraining
+
+
+@receiver(post_save, sender=EducationGroupYear)
+@receiver(post_delete, sender=EducationGroupYear)
+@receiver(post_save, sender=ContinuingEducationTraining)
+@receiver(post_delete, sender=ContinuingEducationTraining)
+def refresh_education_group_catalog(sender, instance, **kwargs):
+    refresh_formation_catalog_on_commit([instance.education_group_id])
+
+
+@receiver(post_save, sender=EntityVersion)
+@receiver(post_delete, sender=EntityVersion)
+def refresh_entity_catalog(sender, instance, **kwargs):
+    refresh_formation_catalog_of_entity_on_commit(instance.entity_id)
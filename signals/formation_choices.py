@@ -0,0 +1,62 @@
+##############################################################################
+#
+#    OSIS stands for Open Student Information System. It's an application
+#    designed to manage the core business of higher education institutions,
+#    such as universities, faculties, institutes and professional schools.
+#    The core business involves the administration of students, teachers,
+#    courses, programs and so on.
+#
+#    Copyright (C) 2015-2022 Université catholique de Louvain (http://www.uclouvain.be)
+#
+#    This program is free software: you can redistribute it and/or modify
+#    it under the terms of the GNU General Public License as published by
+#    the Free Software Foundation, either version 3 of the License, or
+#    (at your option) any later version.
+#
+#    This program is distributed in the hope that it will be useful,
+#    but WITHOUT ANY WARRANTY; without even the implied warranty of
+#    MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+#    GNU General Public License for more details.
+#
+#    A copy of this license - GNU General Public License - is available
+#    at the root of the source code of this program.  If not,
+#    see http://www.gnu.org/licenses/.
+#
+##############################################################################
+from django.db.models.signals import post_save, post_delete, post_init
+from django.dispatch import receiver
+
+from base.models.education_group_year import EducationGroupYear
+from continuing_education.business.formation_choices import clear_formation_choices_cache
+from continuing_education.models.admission import Admission
+from continuing_education.models.continuing_education_training import ContinuingEducationTraining
+
+ADMISSION_FORMATION_CHOICES_FIELDS = {'state', 'archived', 'formation'}
+
+
+@receiver(post_init, sender=Admission)
+def keep_original_formation_choices_values(sender, instance, **kwargs):
+    instance._original_formation_choices_values = _get_formation_choices_values(instance)
+
+
+@receiver(post_save, sender=Admission)
+def clear_formation_choices_on_admission_save(sender, instance, created=False, update_fields=None, **kwargs):
+    if update_fields is not None and not ADMISSION_FORMATION_CHOICES_FIELDS.intersection(update_fields):
+        return
+    values = _get_formation_choices_values(instance)
+    if created or values != getattr(instance, '_original_formation_choices_values', None):
+        clear_formation_choices_cache()
+    instance._original_formation_choices_values = values
+
+
+@receiver(post_delete, sender=Admission)
+@receiver(post_save, sender=ContinuingEducationTraining)
+@receiver(post_delete, sender=ContinuingEducationTraining)
+@receiver(post_save, sender=EducationGroupYear)
+def clear_formation_choices(sender, **kwargs):
+    clear_formation_choices_cache()
+
+
+def _get_formation_choices_values(admission):
+    # Read from __dict__ so that a deferred field is not loaded on initialization
+    return tuple(admission.__dict__.get(attname) for attname in ('state', 'archived', 'formation_id'))
@@ -0,0 +1,57 @@
+##############################################################################
+#
+#    OSIS stands for Open Student Information System. It's an application
+#    designed to manage the core business of higher education institutions,
+#    such as universities, faculties, institutes and professional schools.
+#    The core business involves the administration of students, teachers,
+#    courses, programs and so on.
+#
+#    Copyright (C) 2015-2022 Université catholique de Louvain (http://www.uclouvain.be)
+#
+#    This program is free software: you can redistribute it and/or modify
+#    it under the terms of the GNU General Public License as published by
+#    the Free Software Foundation, either version 3 of the License, or
+#    (at your option) any later version.
+#
+#    This program is distributed in the hope that it will be useful,
+#    but WITHOUT ANY WARRANTY; without even the implied warranty of
+#    MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+#    GNU General Public License for more details.
+#
+#    A copy of this license - GNU General Public License - is available
+#    at the root of the source code of this program.  If not,
+#    see http://www.gnu.org/licenses/.
+#
+##############################################################################
+from django.db.models.signals import post_save, post_delete, m2m_changed
+from django.dispatch import receiver
+
+from base.models.person import Person
+from continuing_education.auth.roles.continuing_education_training_manager import ContinuingEducationTrainingManager
+from continuing_education.business.manager_contacts import clear_manager_contacts_cache, \
+    clear_person_manager_contacts_cache
+from continuing_education.models.continuing_education_training import ContinuingEducationTraining
+
+
+@receiver(post_save, sender=ContinuingEducationTrainingManager)
+@receiver(post_delete, sender=ContinuingEducationTrainingManager)
+def clear_training_manager_contacts(sender, instance, **kwargs):
+    clear_manager_contacts_cache([instance.training_id])
+
+
+@receiver(m2m_changed, sender=ContinuingEducationTraining.managers.through)
+def clear_training_manager_contacts_on_managers_change(sender, instance, action, reverse, pk_set, **kwargs):
+    if action in ('post_add', 'post_remove', 'pre_clear'):
+        if not reverse:
+            clear_manager_contacts_cache([instance.pk])
+        elif pk_set:
+            clear_manager_contacts_cache(pk_set)
+        else:
+            clear_person_manager_contacts_cache(instance.pk)
+
+
+@receiver(post_save, sender=Person)
+def clear_person_manager_contacts(sender, instance, raw=False, **kwargs):
+    """ The contacts hold the name, email and language of the managers """
+    if not raw:
+        clear_person_manager_contacts_cache(instance.pk)
@@ -0,0 +1,75 @@
+##############################################################################
+#
+#    OSIS stands for Open Student Information System. It's an application
+#    designed to manage the core business of higher education institutions,
+#    such as universities, faculties, institutes and professional schools.
+#    The core business involves the administration of students, teachers,
+#    courses, programs and so on.
+#
+#    Copyright (C) 2015-2022 Université catholique de Louvain (http://www.uclouvain.be)
+#
+#    This program is free software: you can redistribute it and/or modify
+#    it under the terms of the GNU General Public License as published by
+#    the Free Software Foundation, either version 3 of the License, or
+#    (at your option) any later version.
+#
+#    This program is distributed in the hope that it will be useful,
+#    but WITHOUT ANY WARRANTY; without even the implied warranty of
+#    MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+#    GNU General Public License for more details.
+#
+#    A copy of this license - GNU General Public License - is available
+#    at the root of the source code of this program.  If not,
+#    see http://www.gnu.org/licenses/.
+#
+##############################################################################
+from django.db.models.signals import post_save
+from django.dispatch import receiver
+
+from base.models.education_group_year import EducationGroupYear
+from base.models.person import Person
+from continuing_education.business.search_document import update_search_documents
+from continuing_education.models.address import Address
+from continuing_education.models.admission import Admission
+from continuing_education.models.continuing_education_person import ContinuingEducationPerson
+from continuing_education.models.continuing_education_training import ContinuingEducationTraining
+
+
+@receiver(post_save, sender=Admission)
+def update_admission_search_document(sender, instance, raw=False, **kwargs):
+    if not raw:
+        update_search_documents([instance.pk])
+
+
+@receiver(post_save, sender=Person)
+def update_person_search_documents(sender, instance, raw=False, **kwargs):
+    if not raw:
+        _update_admissions_search_documents(person_information__person=instance)
+
+
+@receiver(post_save, sender=ContinuingEducationPerson)
+def update_person_information_search_documents(sender, instance, raw=False, created=False, **kwargs):
+    if not raw and not created:
+        _update_admissions_search_documents(person_information=instance)
+
+
+@receiver(post_save, sender=Address)
+def update_address_search_documents(sender, instance, raw=False, created=False, **kwargs):
+    if not raw and not created:
+        _update_admissions_search_documents(address=instance)
+
+
+@receiver(post_save, sender=ContinuingEducationTraining)
+def update_training_search_documents(sender, instance, raw=False, created=False, **kwargs):
+    if not raw and not created:
+        _update_admissions_search_documents(formation=instance)
+
+
+@receiver(post_save, sender=EducationGroupYear)
+def update_education_group_year_search_documents(sender, instance, raw=False, **kwargs):
+    if not raw:
+        _update_admissions_search_documents(formation__education_group_id=instance.education_group_id)
+
+
+def _update_admissions_search_documents(**filters):
+    update_search_documents(Admission.objects.filter(**filters).values_list('pk', flat=True))
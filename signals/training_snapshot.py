@@ -0,0 +1,57 @@
+##############################################################################
+#
+#    OSIS stands for Open Student Information System. It's an application
+#    designed to manage the core business of higher education institutions,
+#    such as universities, faculties, institutes and professional schools.
+#    The core business involves the administration of students, teachers,
+#    courses, programs and so on.
+#
+#    Copyright (C) 2015-2022 Université catholique de Louvain (http://www.uclouvain.be)
+#
+#    This program is free software: you can redistribute it and/or modify
+#    it under the terms of the GNU General Public License as published by
+#    the Free Software Foundation, either version 3 of the License, or
+#    (at your option) any later version.
+#
+#    This program is distributed in the hope that it will be useful,
+#    but WITHOUT ANY WARRANTY; without even the implied warranty of
+#    MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+#    GNU General Public License for more details.
+#
+#    A copy of this license - GNU General Public License - is available
+#    at the root of the source code of this program.  If not,
+#    see http://www.gnu.org/licenses/.
+#
+##############################################################################
+from django.db.models.signals import post_save, post_delete, pre_save
+from django.dispatch import receiver
+
+from base.models.academic_year import AcademicYear
+from base.models.education_group_year import EducationGroupYear
+from continuing_education.business.training_snapshot import SNAPSHOT_FIELDS, get_current_education_group_years, \
+    refresh_training_snapshots
+from continuing_education.models.continuing_education_training import ContinuingEducationTraining
+
+
+@receiver(pre_save, sender=ContinuingEducationTraining)
+def set_training_snapshot(sender, instance, raw=False, update_fields=None, **kwargs):
+    if raw or not instance.education_group_id:
+        return
+    if update_fields is not None and not set(update_fields) & {'education_group', *SNAPSHOT_FIELDS}:
+        return
+    instance.set_current_education_group_year(
+        get_current_education_group_years([instance.education_group_id]).get(instance.education_group_id)
+    )
+
+
+@receiver(post_save, sender=EducationGroupYear)
+@receiver(post_delete, sender=EducationGroupYear)
+def refresh_education_group_training_snapshot(sender, instance, **kwargs):
+    refresh_training_snapshots([instance.education_group_id])
+
+
+@receiver(post_save, sender=AcademicYear)
+@receiver(post_delete, sender=AcademicYear)
+def refresh_all_training_snapshots(sender, **kwargs):
+    """ The dates of the academic years decide which one is current """
+    refresh_training_snapshots()
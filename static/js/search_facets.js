@@ -0,0 +1,37 @@
+function display_facet_counts(form) {
+    var url = form.data('facets-url');
+    if (!url) {
+        return;
+    }
+    $.get(url, form.serialize(), function(facets) {
+        $.each(facets, function(facet, counts) {
+            form.find("select[name='" + facet + "'] option").each(function() {
+                display_facet_count($(this), counts);
+            });
+            form.find("input:checkbox[name='" + facet + "']").each(function() {
+                display_facet_count($(this).parent('label'), counts, $(this).val());
+            });
+        });
+    });
+}
+
+function display_facet_count(element, counts, value) {
+    value = value === undefined ? element.val() : value;
+    element.find('.facet-count').remove();
+    if (!value) {
+        return;
+    }
+    var count = counts[value] || 0;
+    if (element.is('option')) {
+        if (element.data('label') === undefined) {
+            element.data('label', element.text());
+        }
+        element.text(element.data('label') + ' (' + count + ')');
+    } else {
+        element.append($('<span class="facet-count text-muted">').text(' (' + count + ')'));
+    }
+}
+
+$(document).ready(function() {
+    display_facet_counts($("#search_form"));
+});
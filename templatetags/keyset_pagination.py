@@ -0,0 +1,49 @@
+##############################################################################
+#
+#    OSIS stands for Open Student Information System. It's an application
+#    designed to manage the core business of higher education institutions,
+#    such as universities, faculties, institutes and professional schools.
+#    The core business involves the administration of students, teachers,
+#    courses, programs and so on.
+#
+#    Copyright (C) 2015-2022 Université catholique de Louvain (http://www.uclouvain.be)
+#
+#    This program is free software: you can redistribute it and/or modify
+#    it under the terms of the GNU General Public License as published by
+#    the Free Software Foundation, either version 3 of the License, or
+#    (at your option) any later version.
+#
+#    This program is distributed in the hope that it will be useful,
+#    but WITHOUT ANY WARRANTY; without even the implied warranty of
+#    MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+#    GNU General Public License for more details.
+#
+#    A copy of this license - GNU General Public License - is available
+#    at the root of the source code of this program.  If not,
+#    see http://www.gnu.org/licenses/.
+#
+##############################################################################
+from django import template
+
+from continuing_education.business.pagination import CURSOR_PARAMETER, DIRECTION_PARAMETER, PAGE_SIZE_PARAMETER, \
+    PAGE_SIZES
+
+register = template.Library()
+
+
+@register.simple_tag(takes_context=True)
+def keyset_query(context, cursor=None, direction=None, page_size=None):
+    query = context['request'].GET.copy()
+    for parameter in (CURSOR_PARAMETER, DIRECTION_PARAMETER, 'page'):
+        query.pop(parameter, None)
+    if cursor:
+        query[CURSOR_PARAMETER] = cursor
+        query[DIRECTION_PARAMETER] = direction
+    if page_size:
+        query[PAGE_SIZE_PARAMETER] = page_size
+    return query.urlencode()
+
+
+@register.simple_tag
+def get_page_sizes():
+    return PAGE_SIZES
@@ -85,7 +85,7 @@ class AddressListCreateTestCase(APITestCase):
     def test_create_valid_address(self):
         self.assertEqual(3, Address.objects.all().count())
         data = {
-            'location': self.address.location,
+            'location': 'Rue de Dinant',
             'postal_code': self.address.postal_code,
             'city': self.address.city,
             'country': self.country.iso_code,
@@ -99,6 +99,18 @@ class AddressListCreateTestCase(APITestCase):
         self.assertEqual(response.status_code, status.HTTP_201_CREATED)
         self.assertEqual(4, Address.objects.all().count())
 
+    def test_create_existing_address_reuses_it(self):
+        data = {
+            'location': self.address.location,
+            'postal_code': self.address.postal_code,
+            'city': self.address.city,
+            'country': self.country.iso_code,
+        }
+        response = self.client.post(self.url, data=data, format='json')
+        self.assertEqual(response.status_code, status.HTTP_201_CREATED)
+        self.assertEqual(response.data['uuid'], str(self.address.uuid))
+        self.assertEqual(3, Address.objects.all().count())
+
 
 class AddressDetailUpdateTestCase(APITestCase):
     @classmethod
@@ -152,11 +164,14 @@ class AddressDetailUpdateTestCase(APITestCase):
         self.assertEqual(response.status_code, status.HTTP_200_OK)
 
         serializer = AddressPostSerializer(
-            Address.objects.all().first(),
+            Address.objects.all().last(),
             context={'request': RequestFactory().get(self.url)},
         )
         self.assertEqual(response.data, serializer.data)
-        self.assertEqual(1, Address.objects.all().count())
+        # Copy-on-write: the address may be shared, the new content gets its own row
+        self.assertEqual(2, Address.objects.all().count())
+        self.address.refresh_from_db()
+        self.assertEqual(self.address.location, "Rue Bauloy")
 
     def test_update_invalid_address(self):
         response = self.client.put(self.invalid_url)
@@ -0,0 +1,61 @@
+##############################################################################
+#
+#    OSIS stands for Open Student Information System. It's an application
+#    designed to manage the core business of higher education institutions,
+#    such as universities, faculties, institutes and professional schools.
+#    The core business involves the administration of students, teachers,
+#    courses, programs and so on.
+#
+#    Copyright (C) 2015-2022 Université catholique de Louvain (http://www.uclouvain.be)
+#
+#    This program is free software: you can redistribute it and/or modify
+#    it under the terms of the GNU General Public License as published by
+#    the Free Software Foundation, either version 3 of the License, or
+#    (at your option) any later version.
+#
+#    This program is distributed in the hope that it will be useful,
+#    but WITHOUT ANY WARRANTY; without even the implied warranty of
+#    MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+#    GNU General Public License for more details.
+#
+#    A copy of this license - GNU General Public License - is available
+#    at the root of the source code of this program.  If not,
+#    see http://www.gnu.org/licenses/.
+#
+##############################################################################
+from unittest import mock
+
+from django.test import TestCase
+
+from base.tests.factories.academic_year import create_current_academic_year, AcademicYearFactory
+from continuing_education.business.academic_year import current_academic_year, clear_current_academic_year_cache, \
+    CURRENT_ACADEMIC_YEAR_TIMEOUT
+
+
+class TestCurrentAcademicYear(TestCase):
+    @classmethod
+    def setUpTestData(cls):
+        cls.academic_year = create_current_academic_year()
+
+    def setUp(self):
+        clear_current_academic_year_cache()
+        self.addCleanup(clear_current_academic_year_cache)
+
+    def test_memoized(self):
+        self.assertEqual(current_academic_year(), self.academic_year)
+        with self.assertNumQueries(0):
+            self.assertEqual(current_academic_year(), self.academic_year)
+
+    def test_cleared_when_academic_year_saved(self):
+        current_academic_year()
+        AcademicYearFactory(year=self.academic_year.year + 1)
+        with self.assertNumQueries(1):
+            current_academic_year()
+
+    @mock.patch('continuing_education.business.academic_year.time.time')
+    def test_resolved_again_in_next_time_bucket(self, mock_time):
+        mock_time.return_value = 0
+        current_academic_year()
+        mock_time.return_value = CURRENT_ACADEMIC_YEAR_TIMEOUT
+        with self.assertNumQueries(1):
+            current_academic_year()
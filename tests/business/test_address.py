@@ -0,0 +1,91 @@
+##############################################################################
+#
+#    OSIS stands for Open Student Information System. It's an application
+#    designed to manage the core business of higher education institutions,
+#    such as universities, faculties, institutes and professional schools.
+#    The core business involves the administration of students, teachers,
+#    courses, programs and so on.
+#
+#    Copyright (C) 2015-2022 Université catholique de Louvain (http://www.uclouvain.be)
+#
+#    This program is free software: you can redistribute it and/or modify
+#    it under the terms of the GNU General Public License as published by
+#    the Free Software Foundation, either version 3 of the License, or
+#    (at your option) any later version.
+#
+#    This program is distributed in the hope that it will be useful,
+#    but WITHOUT ANY WARRANTY; without even the implied warranty of
+#    MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+#    GNU General Public License for more details.
+#
+#    A copy of this license - GNU General Public License - is available
+#    at the root of the source code of this program.  If not,
+#    see http://www.gnu.org/licenses/.
+#
+##############################################################################
+from django.db.models import ProtectedError
+from django.test import TestCase
+
+from continuing_education.business.address import get_address_content
+from continuing_education.forms.address import AddressForm
+from continuing_education.models.address import Address
+from continuing_education.tests.factories.admission import AdmissionFactory
+from reference.tests.factories.country import CountryFactory
+
+
+class TestAddressInterning(TestCase):
+    @classmethod
+    def setUpTestData(cls):
+        cls.country = CountryFactory()
+        cls.address = Address.objects.intern(
+            location='Rue Bauloy', postal_code='1348', city='Louvain-la-Neuve', country=cls.country
+        )
+
+    def test_intern_reuses_identical_address(self):
+        address = Address.objects.intern(
+            location='Rue Bauloy', postal_code='1348', city='Louvain-la-Neuve', country_id=self.country.pk
+        )
+        self.assertEqual(address, self.address)
+
+    def test_intern_creates_new_content(self):
+        address = Address.objects.intern(
+            location='Rue de Dinant', postal_code='1348', city='Louvain-la-Neuve', country=self.country
+        )
+        self.assertNotEqual(address, self.address)
+        self.assertEqual(Address.objects.count(), 2)
+
+    def test_form_save_is_copy_on_write(self):
+        data = {
+            'location': 'Rue de Dinant',
+            'postal_code': '1348',
+            'city': 'Louvain-la-Neuve',
+            'country': self.country.pk,
+        }
+        form = AddressForm(data, instance=self.address)
+        self.assertTrue(form.is_valid(), form.errors)
+        address = form.save()
+        self.assertNotEqual(address, self.address)
+        self.address.refresh_from_db()
+        self.assertEqual(self.address.location, 'Rue Bauloy')
+
+
+class TestSharedAddress(TestCase):
+    @classmethod
+    def setUpTestData(cls):
+        cls.country = CountryFactory()
+        cls.address = Address.objects.intern(
+            location='Rue Bauloy', postal_code='1348', city='Louvain-la-Neuve', country=cls.country
+        )
+        cls.admission = AdmissionFactory(address=cls.address, billing_address=cls.address)
+        cls.other_admission = AdmissionFactory(address=cls.address)
+
+    def test_shared_address_not_deleted_with_its_usages(self):
+        self.other_admission.delete()
+        self.assertTrue(Address.objects.filter(pk=self.address.pk).exists())
+        with self.assertRaises(ProtectedError):
+            self.address.delete()
+
+    def test_identical_address_can_still_be_saved(self):
+        address = Address.objects.create(**get_address_content(self.address))
+        self.assertEqual(address.content_hash, self.address.content_hash)
+        self.assertEqual(Address.objects.intern(**get_address_content(address)), self.address)
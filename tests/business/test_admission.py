@@ -39,6 +39,7 @@ from base.tests.factories.education_group_year import EducationGroupYearFactory
 from continuing_education.business import admission
 from continuing_education.business.admission import _get_formatted_admission_data, _get_managers_mails, \
     check_required_field_for_participant, _get_attachments, _build_participant_receivers, _participant_created_admission
+from continuing_education.business.revision import save_and_create_revision, get_revision_messages, ADMISSION_CREATION
 from continuing_education.forms.address import ADDRESS_PARTICIPANT_REQUIRED_FIELDS
 from continuing_education.forms.admission import ADMISSION_PARTICIPANT_REQUIRED_FIELDS
 from continuing_education.models.address import Address
@@ -53,7 +54,6 @@ from continuing_education.tests.factories.file import AdmissionFileFactory
 from continuing_education.tests.factories.iufc_person import IUFCPersonFactory as PersonFactory
 from continuing_education.tests.factories.roles.continuing_education_training_manager import \
     ContinuingEducationTrainingManagerFactory
-from continuing_education.views.common import save_and_create_revision, get_revision_messages, ADMISSION_CREATION
 from osis_common.messaging import message_config
 from reference.tests.factories.country import CountryFactory
 
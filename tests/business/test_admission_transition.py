@@ -0,0 +1,188 @@
+##############################################################################
+#
+#    OSIS stands for Open Student Information System. It's an application
+#    designed to manage the core business of higher education institutions,
+#    such as universities, faculties, institutes and professional schools.
+#    The core business involves the administration of students, teachers,
+#    courses, programs and so on.
+#
+#    Copyright (C) 2015-2022 Université catholique de Louvain (http://www.uclouvain.be)
+#
+#    This program is free software: you can redistribute it and/or modify
+#    it under the terms of the GNU General Public License as published by
+#    the Free Software Foundation, either version 3 of the License, or
+#    (at your option) any later version.
+#
+#    This program is distributed in the hope that it will be useful,
+#    but WITHOUT ANY WARRANTY; without even the implied warranty of
+#    MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+#    GNU General Public License for more details.
+#
+#    A copy of this license - GNU General Public License - is available
+#    at the root of the source code of this program.  If not,
+#    see http://www.gnu.org/licenses/.
+#
+##############################################################################
+from smtplib import SMTPException
+from unittest.mock import patch
+
+from django.conf import settings
+from django.test import TestCase
+from django.utils import translation
+from reversion.models import Version
+
+from base.tests.factories.academic_year import AcademicYearFactory
+from base.tests.factories.person import PersonFactory
+from continuing_education.business.admission_transition import apply_state_transition, \
+    send_state_change_notifications, is_transition_allowed
+from continuing_education.models.admission import Admission
+from continuing_education.models.admission_state_notification import AdmissionStateNotification
+from continuing_education.models.enums import admission_state_choices
+from continuing_education.tests.factories.admission import AdmissionFactory
+
+
+class TestApplyStateTransition(TestCase):
+    @classmethod
+    def setUpTestData(cls):
+        cls.user = PersonFactory().user
+        cls.submitted_admissions = AdmissionFactory.create_batch(3, state=admission_state_choices.SUBMITTED)
+        cls.draft_admission = AdmissionFactory(state=admission_state_choices.DRAFT)
+        cls.academic_year = AcademicYearFactory()
+
+    def test_transition_table(self):
+        self.assertTrue(is_transition_allowed(admission_state_choices.SUBMITTED, admission_state_choices.REJECTED))
+        self.assertFalse(is_transition_allowed(admission_state_choices.DRAFT, admission_state_choices.REJECTED))
+        self.assertFalse(is_transition_allowed('unknown', admission_state_choices.REJECTED))
+
+    def test_moves_allowed_admissions_and_rejects_others(self):
+        ids = [admission.pk for admission in self.submitted_admissions] + [self.draft_admission.pk, 0]
+        with self.captureOnCommitCallbacks() as callbacks, translation.override('fr-be'), \
+                patch('continuing_education.business.background.get_executor') as mock_executor:
+            result = apply_state_transition(
+                ids,
+                admission_state_choices.REJECTED,
+                self.user,
+                reason_by_state={admission_state_choices.REJECTED: 'Full'},
+            )
+
+        self.assertCountEqual(result.moved_ids, [admission.pk for admission in self.submitted_admissions])
+        self.assertEqual(result.rejected_ids, [0, self.draft_admission.pk])
+        self.assertCountEqual(
+            Admission.objects.filter(state=admission_state_choices.REJECTED, state_reason='Full').values_list(
+                'pk', flat=True
+            ),
+            result.moved_ids
+        )
+        self.draft_admission.refresh_from_db()
+        self.assertEqual(self.draft_admission.state, admission_state_choices.DRAFT)
+        self.assertCountEqual(
+            AdmissionStateNotification.objects.values_list(
+                'admission_id', 'original_state', 'new_state', 'reason', 'sender', 'language'
+            ),
+            [
+                (admission_id, admission_state_choices.SUBMITTED, admission_state_choices.REJECTED, 'Full',
+                 self.user.pk, 'fr-be')
+                for admission_id in result.moved_ids
+            ]
+        )
+        self.assertEqual(len(callbacks), 1)
+        mock_executor.return_value.submit.assert_called_once()
+
+    def test_writes_one_revision_per_message(self):
+        Version.objects.all().delete()
+        apply_state_transition(
+            [admission.pk for admission in self.submitted_admissions],
+            admission_state_choices.ACCEPTED,
+            self.user,
+            reason_by_state={admission_state_choices.ACCEPTED: 'Condition'},
+            academic_year_id=self.academic_year.pk,
+        )
+
+        versions = Version.objects.filter(object_id__in=[str(admission.pk) for admission in self.submitted_admissions])
+        self.assertEqual(versions.count(), 3)
+        self.assertEqual(len({version.revision_id for version in versions}), 1)
+        self.assertEqual(versions.first().revision.user, self.user)
+        admission = Admission.objects.get(pk=self.submitted_admissions[0].pk)
+        self.assertEqual(admission.condition_of_acceptance, 'Condition')
+        self.assertEqual(admission.academic_year, self.academic_year)
+
+    def test_nothing_to_move(self):
+        with self.captureOnCommitCallbacks() as callbacks:
+            result = apply_state_transition([self.draft_admission.pk], admission_state_choices.REJECTED, self.user)
+        self.assertEqual(result.moved_ids, [])
+        self.assertEqual(result.rejected_ids, [self.draft_admission.pk])
+        self.assertEqual(callbacks, [])
+
+    def test_nothing_to_notify(self):
+        with self.captureOnCommitCallbacks():
+            apply_state_transition([self.draft_admission.pk], admission_state_choices.REJECTED, self.user)
+        self.assertFalse(AdmissionStateNotification.objects.exists())
+
+
+class TestSendStateChangeNotifications(TestCase):
+    @classmethod
+    def setUpTestData(cls):
+        cls.user = PersonFactory().user
+        cls.admission = AdmissionFactory(state=admission_state_choices.REJECTED)
+        cls.other_admission = AdmissionFactory(state=admission_state_choices.REJECTED)
+
+    @patch('continuing_education.business.admission_transition.send_state_changed_email')
+    def test_send_pending_notifications_in_their_language(self, mock_send):
+        AdmissionStateNotification.objects.create(
+            admission=self.admission,
+            original_state=admission_state_choices.SUBMITTED,
+            new_state=admission_state_choices.REJECTED,
+            sender=self.user,
+            language='fr-be',
+        )
+        languages = []
+        mock_send.side_effect = lambda admission, user: languages.append(translation.get_language())
+
+        self.assertEqual(send_state_change_notifications(), 1)
+
+        mock_send.assert_called_once()
+        notified_admission, user = mock_send.call_args[0]
+        self.assertEqual(notified_admission, self.admission)
+        self.assertEqual(notified_admission._original_state, admission_state_choices.SUBMITTED)
+        self.assertEqual(user, self.user)
+        self.assertEqual(languages, ['fr-be'])
+        self.assertFalse(AdmissionStateNotification.objects.exists())
+
+    @patch('continuing_education.business.admission_transition.send_state_changed_email')
+    def test_failed_notification_kept_for_retry(self, mock_send):
+        failing_notification = AdmissionStateNotification.objects.create(
+            admission=self.admission,
+            original_state=admission_state_choices.SUBMITTED,
+            new_state=admission_state_choices.REJECTED,
+        )
+        AdmissionStateNotification.objects.create(
+            admission=self.other_admission,
+            original_state=admission_state_choices.SUBMITTED,
+            new_state=admission_state_choices.REJECTED,
+        )
+
+        def send_state_changed_email(admission, user):
+            if admission == self.admission:
+                raise SMTPException()
+        mock_send.side_effect = send_state_changed_email
+
+        with self.assertLogs(settings.DEFAULT_LOGGER, level='ERROR'):
+            self.assertEqual(send_state_change_notifications(), 1)
+
+        self.assertEqual(list(AdmissionStateNotification.objects.all()), [failing_notification])
+
+    @patch('continuing_education.business.admission_transition.send_state_changed_email')
+    def test_notification_shows_state_and_reason_of_transition(self, mock_send):
+        AdmissionStateNotification.objects.create(
+            admission=self.admission,
+            original_state=admission_state_choices.SUBMITTED,
+            new_state=admission_state_choices.WAITING,
+            reason='Missing documents',
+        )
+
+        send_state_change_notifications()
+
+        notified_admission = mock_send.call_args[0][0]
+        self.assertEqual(notified_admission.state, admission_state_choices.WAITING)
+        self.assertEqual(notified_admission.state_reason, 'Missing documents')
+        self.assertEqual(notified_admission._original_state, admission_state_choices.SUBMITTED)
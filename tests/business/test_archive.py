@@ -0,0 +1,74 @@
+##############################################################################
+#
+#    OSIS stands for Open Student Information System. It's an application
+#    designed to manage the core business of higher education institutions,
+#    such as universities, faculties, institutes and professional schools.
+#    The core business involves the administration of students, teachers,
+#    courses, programs and so on.
+#
+#    Copyright (C) 2015-2022 Université catholique de Louvain (http://www.uclouvain.be)
+#
+#    This program is free software: you can redistribute it and/or modify
+#    it under the terms of the GNU General Public License as published by
+#    the Free Software Foundation, either version 3 of the License, or
+#    (at your option) any later version.
+#
+#    This program is distributed in the hope that it will be useful,
+#    but WITHOUT ANY WARRANTY; without even the implied warranty of
+#    MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+#    GNU General Public License for more details.
+#
+#    A copy of this license - GNU General Public License - is available
+#    at the root of the source code of this program.  If not,
+#    see http://www.gnu.org/licenses/.
+#
+##############################################################################
+from unittest.mock import patch
+
+from django.test import TestCase
+from reversion.models import Version
+
+from base.tests.factories.person import PersonFactory
+from continuing_education.business.archive import set_archived_state
+from continuing_education.models.admission import Admission
+from continuing_education.models.enums import admission_state_choices
+from continuing_education.tests.factories.admission import AdmissionFactory
+from continuing_education.tests.factories.file import AdmissionFileFactory
+
+
+class TestSetArchivedState(TestCase):
+    @classmethod
+    def setUpTestData(cls):
+        cls.user = PersonFactory().user
+        cls.admissions = AdmissionFactory.create_batch(3, state=admission_state_choices.ACCEPTED)
+
+    def test_archive_admissions_by_batches(self):
+        with patch('continuing_education.business.archive.ARCHIVE_BATCH_SIZE', 2):
+            archived_admissions = set_archived_state(self.user, [admission.pk for admission in self.admissions], True)
+
+        self.assertTrue(all(admission.archived for admission in archived_admissions))
+        for admission in self.admissions:
+            self.assertTrue(Admission.objects.get(pk=admission.pk).archived)
+        self.assertEqual(Admission.objects.filter(archived=False, pk=self.admissions[0].pk).count(), 0)
+
+    def test_unarchive_moves_admissions_back(self):
+        set_archived_state(self.user, [self.admissions[0].pk], True)
+        set_archived_state(self.user, [self.admissions[0].pk], False)
+
+        self.assertFalse(Admission.objects.get(pk=self.admissions[0].pk).archived)
+
+    def test_one_revision_for_all_admissions(self):
+        Version.objects.all().delete()
+        set_archived_state(self.user, [admission.pk for admission in self.admissions], True)
+
+        versions = Version.objects.filter(object_id__in=[str(admission.pk) for admission in self.admissions])
+        self.assertEqual(versions.count(), 3)
+        self.assertEqual(len({version.revision_id for version in versions}), 1)
+        self.assertEqual(versions.first().revision.user, self.user)
+
+    def test_files_follow_the_admission(self):
+        admission = self.admissions[0]
+        admission_file = AdmissionFileFactory(admission=admission)
+        set_archived_state(self.user, [admission.pk], True)
+
+        self.assertCountEqual(Admission.objects.get(pk=admission.pk).admissionfile_set.all(), [admission_file])
@@ -0,0 +1,72 @@
+##############################################################################
+#
+#    OSIS stands for Open Student Information System. It's an application
+#    designed to manage the core business of higher education institutions,
+#    such as universities, faculties, institutes and professional schools.
+#    The core business involves the administration of students, teachers,
+#    courses, programs and so on.
+#
+#    Copyright (C) 2015-2022 Université catholique de Louvain (http://www.uclouvain.be)
+#
+#    This program is free software: you can redistribute it and/or modify
+#    it under the terms of the GNU General Public License as published by
+#    the Free Software Foundation, either version 3 of the License, or
+#    (at your option) any later version.
+#
+#    This program is distributed in the hope that it will be useful,
+#    but WITHOUT ANY WARRANTY; without even the implied warranty of
+#    MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+#    GNU General Public License for more details.
+#
+#    A copy of this license - GNU General Public License - is available
+#    at the root of the source code of this program.  If not,
+#    see http://www.gnu.org/licenses/.
+#
+##############################################################################
+from django.test import TestCase
+
+from base.tests.factories.academic_year import AcademicYearFactory
+from continuing_education.business.awareness import get_awareness_statistics, OTHER_CHANNEL
+from continuing_education.models.admission import Admission
+from continuing_education.models.enums.awareness_channel import AwarenessChannel, AWARENESS_FIELD_NAMES
+from continuing_education.tests.factories.admission import AdmissionFactory
+from continuing_education.tests.factories.continuing_education_training import ContinuingEducationTrainingFactory
+
+NO_AWARENESS = {field_name: False for field_name in AWARENESS_FIELD_NAMES.values()}
+
+
+class TestAwarenessStatistics(TestCase):
+    @classmethod
+    def setUpTestData(cls):
+        cls.academic_year = AcademicYearFactory()
+        cls.formation = ContinuingEducationTrainingFactory()
+        cls.other_formation = ContinuingEducationTrainingFactory()
+        AdmissionFactory(
+            formation=cls.formation, academic_year=cls.academic_year, awareness_other='',
+            **dict(NO_AWARENESS, awareness_press=True, awareness_facebook=True)
+        )
+        AdmissionFactory(
+            formation=cls.formation, academic_year=cls.academic_year, awareness_other='Radio',
+            **dict(NO_AWARENESS, awareness_facebook=True)
+        )
+        AdmissionFactory(
+            formation=cls.other_formation, academic_year=cls.academic_year, awareness_other='',
+            **dict(NO_AWARENESS, awareness_moocs=True)
+        )
+
+    def test_counts_per_formation_and_academic_year(self):
+        with self.assertNumQueries(1):
+            statistics = get_awareness_statistics(Admission.objects.all())
+        self.assertEqual(len(statistics), 2)
+        formation_statistics = next(row for row in statistics if row['formation_id'] == self.formation.pk)
+        self.assertEqual(formation_statistics['academic_year_id'], self.academic_year.pk)
+        self.assertEqual(formation_statistics['admissions_number'], 2)
+        self.assertEqual(formation_statistics[AwarenessChannel.FACEBOOK.name], 2)
+        self.assertEqual(formation_statistics[AwarenessChannel.PRESS.name], 1)
+        self.assertEqual(formation_statistics[AwarenessChannel.MOOCS.name], 0)
+        self.assertEqual(formation_statistics[OTHER_CHANNEL], 1)
+
+    def test_statistics_of_filtered_list(self):
+        statistics = get_awareness_statistics(Admission.objects.filter(formation=self.other_formation))
+        self.assertEqual(len(statistics), 1)
+        self.assertEqual(statistics[0][AwarenessChannel.MOOCS.name], 1)
@@ -0,0 +1,81 @@
+##############################################################################
+#
+#    OSIS stands for Open Student Information System. It's an application
+#    designed to manage the core business of higher education institutions,
+#    such as universities, faculties, institutes and professional schools.
+#    The core business involves the administration of students, teachers,
+#    courses, programs and so on.
+#
+#    Copyright (C) 2015-2022 Université catholique de Louvain (http://www.uclouvain.be)
+#
+#    This program is free software: you can redistribute it and/or modify
+#    it under the terms of the GNU General Public License as published by
+#    the Free Software Foundation, either version 3 of the License, or
+#    (at your option) any later version.
+#
+#    This program is distributed in the hope that it will be useful,
+#    but WITHOUT ANY WARRANTY; without even the implied warranty of
+#    MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+#    GNU General Public License for more details.
+#
+#    A copy of this license - GNU General Public License - is available
+#    at the root of the source code of this program.  If not,
+#    see http://www.gnu.org/licenses/.
+#
+##############################################################################
+import datetime
+
+from django.core.cache import cache
+from django.test import TestCase
+
+from base.models.enums.entity_type import FACULTY, SCHOOL, INSTITUTE
+from base.tests.factories.entity_version import EntityVersionFactory
+from continuing_education.business.entity import build_faculty_entities_map, get_faculty_entity_ids, \
+    FACULTY_ENTITIES_CACHE_KEY
+
+START_DATE = datetime.date(2010, 1, 1)
+
+
+class TestFacultyEntities(TestCase):
+    @classmethod
+    def setUpTestData(cls):
+        cls.faculty = EntityVersionFactory(entity_type=FACULTY, parent=None, start_date=START_DATE, end_date=None)
+        cls.school = EntityVersionFactory(
+            entity_type=SCHOOL, parent=cls.faculty.entity, start_date=START_DATE, end_date=None
+        )
+        cls.sub_school = EntityVersionFactory(
+            entity_type=INSTITUTE, parent=cls.school.entity, start_date=START_DATE, end_date=None
+        )
+        cls.former_school = EntityVersionFactory(
+            entity_type=SCHOOL, parent=cls.faculty.entity, start_date=START_DATE, end_date=datetime.date(2015, 1, 1)
+        )
+        cls.other_faculty = EntityVersionFactory(
+            entity_type=FACULTY, parent=None, start_date=START_DATE, end_date=None
+        )
+
+    def setUp(self):
+        cache.delete(FACULTY_ENTITIES_CACHE_KEY)
+
+    def test_build_faculty_entities_map(self):
+        faculty_entities = build_faculty_entities_map()
+        self.assertListEqual(
+            faculty_entities[self.faculty.entity_id],
+            [self.faculty.entity_id, self.school.entity_id, self.sub_school.entity_id]
+        )
+        self.assertListEqual(faculty_entities[self.other_faculty.entity_id], [self.other_faculty.entity_id])
+        self.assertNotIn(self.school.entity_id, faculty_entities)
+
+    def test_get_faculty_entity_ids_is_cached(self):
+        get_faculty_entity_ids(self.faculty.entity_id)
+        with self.assertNumQueries(0):
+            get_faculty_entity_ids(self.faculty.entity_id)
+
+    def test_cache_cleared_when_entity_version_changes(self):
+        get_faculty_entity_ids(self.faculty.entity_id)
+        new_school = EntityVersionFactory(
+            entity_type=SCHOOL, parent=self.faculty.entity, start_date=START_DATE, end_date=None
+        )
+        self.assertIn(new_school.entity_id, get_faculty_entity_ids(self.faculty.entity_id))
+
+        new_school.delete()
+        self.assertNotIn(new_school.entity_id, get_faculty_entity_ids(self.faculty.entity_id))
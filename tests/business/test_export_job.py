@@ -0,0 +1,239 @@
+##############################################################################
+#
+#    OSIS stands for Open Student Information System. It's an application
+#    designed to manage the core business of higher education institutions,
+#    such as universities, faculties, institutes and professional schools.
+#    The core business involves the administration of students, teachers,
+#    courses, programs and so on.
+#
+#    Copyright (C) 2015-2022 Université catholique de Louvain (http://www.uclouvain.be)
+#
+#    This program is free software: you can redistribute it and/or modify
+#    it under the terms of the GNU General Public License as published by
+#    the Free Software Foundation, either version 3 of the License, or
+#    (at your option) any later version.
+#
+#    This program is distributed in the hope that it will be useful,
+#    but WITHOUT ANY WARRANTY; without even the implied warranty of
+#    MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+#    GNU General Public License for more details.
+#
+#    A copy of this license - GNU General Public License - is available
+#    at the root of the source code of this program.  If not,
+#    see http://www.gnu.org/licenses/.
+#
+##############################################################################
+import datetime
+import tempfile
+from unittest import mock
+
+from django.conf import settings
+from django.core.cache import cache
+from django.http import QueryDict
+from django.test import TestCase
+from django.utils import timezone, translation
+from openpyxl import load_workbook
+
+from base.tests.factories.academic_year import create_current_academic_year
+from base.tests.factories.education_group import EducationGroupFactory
+from base.tests.factories.education_group_year import EducationGroupYearFactory
+from continuing_education.business.export_job import create_export_job, run_export_job, \
+    delete_expired_export_jobs, fail_stale_export_jobs, EXPORT_JOB_TTL, EXPORT_JOB_STALE_AFTER, STALE_JOB_ERROR, \
+    write_small_export
+from continuing_education.business.search_results import get_search_result_keys, get_user_scope, \
+    REGISTRATIONS_SEARCH
+from continuing_education.models.admission import Admission
+from continuing_education.models.enums.admission_state_choices import ACCEPTED
+from continuing_education.models.enums.export_job_choices import ExportJobKind, ExportJobState
+from continuing_education.models.export_job import ExportJob
+from continuing_education.tests.factories.admission import AdmissionFactory
+from continuing_education.tests.factories.continuing_education_training import ContinuingEducationTrainingFactory
+from continuing_education.tests.factories.roles.continuing_education_manager import ContinuingEducationManagerFactory
+
+
+class TestExportJob(TestCase):
+    @classmethod
+    def setUpTestData(cls):
+        education_group = EducationGroupFactory()
+        EducationGroupYearFactory(
+            education_group=education_group,
+            academic_year=create_current_academic_year()
+        )
+        cls.formation = ContinuingEducationTrainingFactory(education_group=education_group)
+        cls.registrations = AdmissionFactory.create_batch(3, formation=cls.formation, state=ACCEPTED)
+        cls.manager = ContinuingEducationManagerFactory()
+        cls.user = cls.manager.person.user
+
+    def test_create_export_job_records_filters_and_user(self):
+        query_params = QueryDict('state=Accepted&free_text=foo&xls_status=xls_registrations')
+        with mock.patch('continuing_education.business.background.get_executor') as mock_executor:
+            with self.captureOnCommitCallbacks(execute=True):
+                job = create_export_job(self.user, ExportJobKind.REGISTRATIONS.name, query_params)
+
+        self.assertEqual(job.user, self.user)
+        self.assertEqual(job.state, ExportJobState.PENDING.name)
+        self.assertEqual(job.language, translation.get_language())
+        self.assertDictEqual(job.filters, {'state': ['Accepted'], 'free_text': ['foo']})
+        self.assertTrue(mock_executor.return_value.submit.called)
+
+    def test_write_small_export(self):
+        query_params = QueryDict('formation={}'.format(self.formation.pk))
+        with tempfile.TemporaryFile() as output:
+            filename = write_small_export(output, self.user, ExportJobKind.REGISTRATIONS.name, query_params)
+            output.seek(0)
+            worksheet = load_workbook(output).worksheets[0]
+
+        self.assertTrue(filename.endswith('.xlsx'))
+        self.assertEqual(worksheet.max_row, len(self.registrations) + 1)
+
+    @mock.patch('continuing_education.business.export_job.SYNCHRONOUS_EXPORT_LIMIT', 2)
+    def test_large_export_not_written(self):
+        query_params = QueryDict('formation={}'.format(self.formation.pk))
+        with tempfile.TemporaryFile() as output:
+            self.assertIsNone(write_small_export(output, self.user, ExportJobKind.REGISTRATIONS.name, query_params))
+            self.assertEqual(output.tell(), 0)
+
+    def test_run_export_job(self):
+        job = ExportJob.objects.create(
+            user=self.user,
+            kind=ExportJobKind.REGISTRATIONS.name,
+            filters={'formation': [str(self.formation.pk)]}
+        )
+        job = run_export_job(job.pk)
+
+        self.assertEqual(job.state, ExportJobState.DONE.name)
+        self.assertEqual(job.total, len(self.registrations))
+        self.assertEqual(job.progress, len(self.registrations))
+        self.assertEqual(job.percentage, 100)
+        self.assertTrue(job.file.name.endswith('.xlsx'))
+        self.assertIsNotNone(job.finished_at)
+        job.file.delete(save=False)
+
+    def test_run_export_job_with_selected_columns(self):
+        job = ExportJob.objects.create(
+            user=self.user,
+            kind=ExportJobKind.REGISTRATIONS.name,
+            filters={'formation': [str(self.formation.pk)], 'columns': ['email', 'formation']}
+        )
+        job = run_export_job(job.pk)
+
+        worksheet = load_workbook(job.file.path).worksheets[0]
+        self.assertEqual([cell.value for cell in worksheet[1]], ['Email', 'Formation'])
+        self.assertEqual(worksheet.max_row, len(self.registrations) + 1)
+        job.file.delete(save=False)
+
+    def test_run_export_job_reuses_cached_search_results(self):
+        filters = {'formation': [str(self.formation.pk)]}
+        self.addCleanup(cache.clear)
+        get_search_result_keys(
+            Admission.objects.filter(pk__in=[registration.pk for registration in self.registrations[:2]]),
+            ('pk',),
+            REGISTRATIONS_SEARCH,
+            get_user_scope(self.user),
+            filters
+        )
+        job = ExportJob.objects.create(user=self.user, kind=ExportJobKind.REGISTRATIONS.name, filters=filters)
+        job = run_export_job(job.pk)
+
+        self.assertEqual(job.state, ExportJobState.DONE.name)
+        self.assertEqual(job.total, 2)
+        job.file.delete(save=False)
+
+    @mock.patch('continuing_education.business.xls.xls_registration_by_formation.SHEET_WORKERS', 1)
+    def test_run_export_job_by_formation(self):
+        job = ExportJob.objects.create(
+            user=self.user,
+            kind=ExportJobKind.REGISTRATIONS_BY_FORMATION.name,
+            filters={'formation': [str(self.formation.pk)]}
+        )
+        job = run_export_job(job.pk)
+
+        self.assertEqual(job.state, ExportJobState.DONE.name)
+        workbook = load_workbook(job.file.path)
+        self.assertEqual(workbook.sheetnames, [self.formation.acronym, 'Parameters'])
+        self.assertEqual(workbook.worksheets[0].max_row, len(self.registrations) + 1)
+        job.file.delete(save=False)
+
+    def test_run_export_job_failure(self):
+        job = ExportJob.objects.create(user=self.user, kind=ExportJobKind.ADMISSIONS.name)
+        with mock.patch('continuing_education.business.export_job.write_xls', side_effect=ValueError('boom')):
+            job = run_export_job(job.pk)
+
+        self.assertEqual(job.state, ExportJobState.FAILED.name)
+        self.assertEqual(job.error, 'boom')
+
+    def test_delete_expired_export_jobs(self):
+        expired_job = ExportJob.objects.create(user=self.user, kind=ExportJobKind.ADMISSIONS.name)
+        ExportJob.objects.filter(pk=expired_job.pk).update(
+            created_at=timezone.now() - EXPORT_JOB_TTL - datetime.timedelta(minutes=1)
+        )
+        recent_job = ExportJob.objects.create(user=self.user, kind=ExportJobKind.ADMISSIONS.name)
+
+        self.assertEqual(delete_expired_export_jobs(), 1)
+        self.assertFalse(ExportJob.objects.filter(pk=expired_job.pk).exists())
+        self.assertTrue(ExportJob.objects.filter(pk=recent_job.pk).exists())
+
+    def test_run_export_job_in_requester_language(self):
+        job = ExportJob.objects.create(user=self.user, kind=ExportJobKind.ADMISSIONS.name, language='fr-be')
+        with mock.patch(
+                'continuing_education.business.export_job._build_export_file',
+                side_effect=lambda job: translation.get_language()
+        ):
+            with translation.override('en'):
+                self.assertEqual(run_export_job(job.pk), 'fr-be')
+
+    def test_fail_stale_export_jobs(self):
+        stale_job = ExportJob.objects.create(
+            user=self.user, kind=ExportJobKind.ADMISSIONS.name, state=ExportJobState.RUNNING.name
+        )
+        pending_job = ExportJob.objects.create(user=self.user, kind=ExportJobKind.ADMISSIONS.name)
+        done_job = ExportJob.objects.create(
+            user=self.user, kind=ExportJobKind.ADMISSIONS.name, state=ExportJobState.DONE.name
+        )
+        ExportJob.objects.filter(pk__in=[stale_job.pk, pending_job.pk, done_job.pk]).update(
+            updated_at=timezone.now() - EXPORT_JOB_STALE_AFTER - datetime.timedelta(minutes=1)
+        )
+        running_job = ExportJob.objects.create(
+            user=self.user, kind=ExportJobKind.ADMISSIONS.name, state=ExportJobState.RUNNING.name
+        )
+
+        self.assertEqual(fail_stale_export_jobs(), 1)
+        stale_job.refresh_from_db()
+        self.assertEqual(stale_job.state, ExportJobState.FAILED.name)
+        self.assertIsNotNone(stale_job.finished_at)
+        self.assertEqual(ExportJob.objects.get(pk=pending_job.pk).state, ExportJobState.PENDING.name)
+        self.assertEqual(ExportJob.objects.get(pk=done_job.pk).state, ExportJobState.DONE.name)
+        self.assertEqual(ExportJob.objects.get(pk=running_job.pk).state, ExportJobState.RUNNING.name)
+
+    def test_running_state_refreshes_heartbeat(self):
+        job = ExportJob.objects.create(user=self.user, kind=ExportJobKind.ADMISSIONS.name)
+        ExportJob.objects.filter(pk=job.pk).update(
+            updated_at=timezone.now() - EXPORT_JOB_STALE_AFTER - datetime.timedelta(minutes=1)
+        )
+        failed_while_running = []
+
+        def write_xls(*args, **kwargs):
+            failed_while_running.append(fail_stale_export_jobs())
+        with mock.patch('continuing_education.business.export_job.write_xls', side_effect=write_xls):
+            job = run_export_job(job.pk)
+
+        self.assertEqual(failed_while_running, [0])
+        self.assertEqual(job.state, ExportJobState.DONE.name)
+        job.file.delete(save=False)
+
+    def test_job_failed_as_stale_is_not_marked_done(self):
+        job = ExportJob.objects.create(
+            user=self.user,
+            kind=ExportJobKind.REGISTRATIONS.name,
+            filters={'formation': [str(self.formation.pk)]}
+        )
+
+        def write_xls(*args, **kwargs):
+            ExportJob.objects.filter(pk=job.pk).update(state=ExportJobState.FAILED.name, error=STALE_JOB_ERROR)
+        with mock.patch('continuing_education.business.export_job.write_xls', side_effect=write_xls), \
+                self.assertLogs(settings.DEFAULT_LOGGER, level='WARNING'):
+            job = run_export_job(job.pk)
+
+        self.assertEqual(job.state, ExportJobState.FAILED.name)
+        self.assertEqual(job.error, STALE_JOB_ERROR)
+        self.assertFalse(job.file)
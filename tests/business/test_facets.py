@@ -0,0 +1,93 @@
+##############################################################################
+#
+#    OSIS stands for Open Student Information System. It's an application
+#    designed to manage the core business of higher education institutions,
+#    such as universities, faculties, institutes and professional schools.
+#    The core business involves the administration of students, teachers,
+#    courses, programs and so on.
+#
+#    Copyright (C) 2015-2022 Université catholique de Louvain (http://www.uclouvain.be)
+#
+#    This program is free software: you can redistribute it and/or modify
+#    it under the terms of the GNU General Public License as published by
+#    the Free Software Foundation, either version 3 of the License, or
+#    (at your option) any later version.
+#
+#    This program is distributed in the hope that it will be useful,
+#    but WITHOUT ANY WARRANTY; without even the implied warranty of
+#    MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+#    GNU General Public License for more details.
+#
+#    A copy of this license - GNU General Public License - is available
+#    at the root of the source code of this program.  If not,
+#    see http://www.gnu.org/licenses/.
+#
+##############################################################################
+from django.core.cache import cache
+from django.test import TestCase
+
+from base.models.enums import entity_type
+from base.tests.factories.academic_year import create_current_academic_year, AcademicYearFactory
+from base.tests.factories.education_group_year import EducationGroupYearFactory
+from base.tests.factories.entity_version import EntityVersionFactory
+from continuing_education.business.facets import get_facet_counts
+from continuing_education.forms.search import _get_filter_entity_management
+from continuing_education.models.admission import Admission
+from continuing_education.models.enums.admission_state_choices import SUBMITTED, REJECTED
+from continuing_education.tests.factories.admission import AdmissionFactory
+from continuing_education.tests.factories.continuing_education_training import ContinuingEducationTrainingFactory
+
+
+class TestFacetCounts(TestCase):
+    @classmethod
+    def setUpTestData(cls):
+        cls.academic_year = create_current_academic_year()
+        cls.faculty_version = EntityVersionFactory(entity_type=entity_type.FACULTY)
+        school_version = EntityVersionFactory(entity_type=entity_type.SCHOOL, parent=cls.faculty_version.entity)
+        cls.formation = ContinuingEducationTrainingFactory(
+            education_group=EducationGroupYearFactory(
+                academic_year=cls.academic_year,
+                management_entity=school_version.entity
+            ).education_group
+        )
+        cls.other_formation = ContinuingEducationTrainingFactory()
+        AdmissionFactory.create_batch(2, formation=cls.formation, state=SUBMITTED)
+        AdmissionFactory(formation=cls.formation, state=REJECTED)
+        AdmissionFactory(formation=cls.other_formation, state=REJECTED)
+
+    def setUp(self):
+        cache.clear()
+        self.addCleanup(cache.clear)
+
+    def test_counts_per_state_formation_and_faculty(self):
+        with self.assertNumQueries(5):
+            facets = get_facet_counts(Admission.objects.all())
+        self.assertEqual(facets['state'], {SUBMITTED: 2, REJECTED: 2})
+        self.assertEqual(facets['formation'], {self.formation.pk: 3, self.other_formation.pk: 1})
+        self.assertEqual(facets['faculty'], {self.faculty_version.pk: 3})
+
+    def test_counts_of_filtered_list(self):
+        facets = get_facet_counts(Admission.objects.filter(state=REJECTED))
+        self.assertEqual(facets['state'], {REJECTED: 2})
+        self.assertEqual(facets['formation'], {self.formation.pk: 1, self.other_formation.pk: 1})
+        self.assertEqual(facets['faculty'], {self.faculty_version.pk: 1})
+
+    def test_no_counts_for_empty_list(self):
+        self.assertEqual(get_facet_counts(Admission.objects.none()), {'state': {}, 'formation': {}, 'faculty': {}})
+
+    def test_faculty_counts_match_faculty_filter(self):
+        previous_faculty_version = EntityVersionFactory(entity_type=entity_type.FACULTY)
+        EducationGroupYearFactory(
+            education_group=self.other_formation.education_group,
+            academic_year=AcademicYearFactory(year=self.academic_year.year - 1),
+            management_entity=previous_faculty_version.entity
+        )
+
+        facets = get_facet_counts(Admission.objects.all())
+
+        for faculty_version in [self.faculty_version, previous_faculty_version]:
+            self.assertEqual(
+                facets['faculty'][faculty_version.pk],
+                _get_filter_entity_management(Admission.objects.all(), faculty_version).count()
+            )
+        self.assertEqual(facets['faculty'][previous_faculty_version.pk], 1)
@@ -0,0 +1,103 @@
+##############################################################################
+#
+#    OSIS stands for Open Student Information System. It's an application
+#    designed to manage the core business of higher education institutions,
+#    such as universities, faculties, institutes and professional schools.
+#    The core business involves the administration of students, teachers,
+#    courses, programs and so on.
+#
+#    Copyright (C) 2015-2022 Université catholique de Louvain (http://www.uclouvain.be)
+#
+#    This program is free software: you can redistribute it and/or modify
+#    it under the terms of the GNU General Public License as published by
+#    the Free Software Foundation, either version 3 of the License, or
+#    (at your option) any later version.
+#
+#    This program is distributed in the hope that it will be useful,
+#    but WITHOUT ANY WARRANTY; without even the implied warranty of
+#    MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+#    GNU General Public License for more details.
+#
+#    A copy of this license - GNU General Public License - is available
+#    at the root of the source code of this program.  If not,
+#    see http://www.gnu.org/licenses/.
+#
+##############################################################################
+import datetime
+
+from django.test import TestCase
+
+from base.models.enums.entity_type import FACULTY, SCHOOL
+from base.tests.factories.academic_year import create_current_academic_year
+from base.tests.factories.education_group_year import EducationGroupYearFactory
+from base.tests.factories.entity_version import EntityVersionFactory
+from base.tests.factories.person import PersonFactory
+from continuing_education.business.filter_choices import get_faculty_choices, get_manager_choices, \
+    get_managed_training_choices, clear_filter_choices_cache
+from continuing_education.forms.search import ManagerFilterForm, AdmissionFilterForm
+from continuing_education.tests.factories.continuing_education_training import ContinuingEducationTrainingFactory
+from continuing_education.tests.factories.roles.continuing_education_training_manager import \
+    ContinuingEducationTrainingManagerFactory
+
+START_DATE = datetime.date(2010, 1, 1)
+
+
+class TestFilterChoices(TestCase):
+    @classmethod
+    def setUpTestData(cls):
+        academic_year = create_current_academic_year()
+        cls.faculty_z = EntityVersionFactory(acronym='ZFAC', entity_type=FACULTY, start_date=START_DATE, end_date=None)
+        cls.faculty_a = EntityVersionFactory(acronym='AFAC', entity_type=FACULTY, start_date=START_DATE, end_date=None)
+        EntityVersionFactory(acronym='SCH', entity_type=SCHOOL, start_date=START_DATE, end_date=None)
+        education_group_year = EducationGroupYearFactory(academic_year=academic_year)
+        cls.training = ContinuingEducationTrainingFactory(education_group=education_group_year.education_group)
+        cls.training_manager = ContinuingEducationTrainingManagerFactory(training=cls.training)
+
+    def setUp(self):
+        clear_filter_choices_cache()
+        self.addCleanup(clear_filter_choices_cache)
+
+    def test_faculty_choices(self):
+        self.assertListEqual(
+            get_faculty_choices(),
+            [(self.faculty_a.pk, 'AFAC'), (self.faculty_z.pk, 'ZFAC')]
+        )
+
+    def test_manager_choices(self):
+        self.assertListEqual(
+            get_manager_choices(),
+            [(self.training_manager.person.pk, str(self.training_manager.person))]
+        )
+        self.assertListEqual(get_managed_training_choices(), [(self.training.pk, self.training.acronym_and_title)])
+
+    def test_choices_are_cached(self):
+        ManagerFilterForm()
+        with self.assertNumQueries(0):
+            form = ManagerFilterForm()
+            str(form['person'])
+            str(form['faculty'])
+            str(form['training'])
+
+    def test_faculty_choices_resolved_at_form_init(self):
+        form = AdmissionFilterForm()
+        new_faculty = EntityVersionFactory(acronym='BFAC', entity_type=FACULTY, start_date=START_DATE, end_date=None)
+        self.assertNotIn((new_faculty.pk, 'BFAC'), form.fields['faculty'].choices)
+        self.assertIn((new_faculty.pk, 'BFAC'), AdmissionFilterForm().fields['faculty'].choices)
+
+    def test_cache_cleared_when_training_manager_added(self):
+        get_manager_choices()
+        new_manager = ContinuingEducationTrainingManagerFactory(training=self.training)
+        self.assertIn(new_manager.person.pk, [person_id for person_id, name in get_manager_choices()])
+
+    def test_cache_cleared_when_training_manager_deleted(self):
+        new_manager = ContinuingEducationTrainingManagerFactory()
+        self.assertIn(new_manager.training.pk, [training_id for training_id, label in get_managed_training_choices()])
+        new_manager.delete()
+        self.assertNotIn(
+            new_manager.training.pk, [training_id for training_id, label in get_managed_training_choices()]
+        )
+
+    def test_form_validation_restricted_to_choices(self):
+        self.assertTrue(ManagerFilterForm({'faculty': self.faculty_a.pk}).is_valid())
+        self.assertTrue(ManagerFilterForm({'person': self.training_manager.person.pk}).is_valid())
+        self.assertFalse(ManagerFilterForm({'person': PersonFactory().pk}).is_valid())
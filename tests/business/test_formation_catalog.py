@@ -0,0 +1,142 @@
+##############################################################################
+#
+#    OSIS stands for Open Student Information System. It's an application
+#    designed to manage the core business of higher education institutions,
+#    such as universities, faculties, institutes and professional schools.
+#    The core business involves the administration of students, teachers,
+#    courses, programs and so on.
+#
+#    Copyright (C) 2015-2022 Université catholique de Louvain (http://www.uclouvain.be)
+#
+#    This program is free software: you can redistribute it and/or modify
+#    it under the terms of the GNU General Public License as published by
+#    the Free Software Foundation, either version 3 of the License, or
+#    (at your option) any later version.
+#
+#    This program is distributed in the hope that it will be useful,
+#    but WITHOUT ANY WARRANTY; without even the implied warranty of
+#    MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+#    GNU General Public License for more details.
+#
+#    A copy of this license - GNU General Public License - is available
+#    at the root of the source code of this program.  If not,
+#    see http://www.gnu.org/licenses/.
+#
+##############################################################################
+from django.test import TestCase
+
+from base.models.enums import entity_type
+from base.models.enums.education_group_types import TrainingType
+from base.tests.factories.academic_year import AcademicYearFactory
+from base.tests.factories.education_group_type import EducationGroupTypeFactory
+from base.tests.factories.education_group_year import EducationGroupYearFactory
+from base.tests.factories.entity_version import EntityVersionFactory
+from continuing_education.business.formation_catalog import refresh_formation_catalog
+from continuing_education.models.continuing_education_training import CONTINUING_EDUCATION_TRAINING_TYPES
+from continuing_education.models.formation_catalog import FormationCatalog
+from continuing_education.tests.factories.continuing_education_training import ContinuingEducationTrainingFactory
+
+
+class TestFormationCatalog(TestCase):
+    @classmethod
+    def setUpTestData(cls):
+        cls.academic_year = AcademicYearFactory(current=True)
+        cls.previous_academic_year = AcademicYearFactory(year=cls.academic_year.year - 1)
+        cls.faculty_version = EntityVersionFactory(entity_type=entity_type.FACULTY)
+        cls.school_version = EntityVersionFactory(entity_type=entity_type.SCHOOL, parent=cls.faculty_version.entity)
+        cls.education_group_type = EducationGroupTypeFactory(name=CONTINUING_EDUCATION_TRAINING_TYPES[0])
+        cls.other_education_group_type = EducationGroupTypeFactory(name=TrainingType.BACHELOR.name)
+        with cls.captureOnCommitCallbacks(execute=True):
+            cls.previous_education_group_year = EducationGroupYearFactory(
+                academic_year=cls.previous_academic_year,
+                acronym='OLDACRO',
+                management_entity=cls.faculty_version.entity,
+                education_group_type=cls.education_group_type,
+            )
+            cls.education_group = cls.previous_education_group_year.education_group
+            cls.education_group_year = EducationGroupYearFactory(
+                education_group=cls.education_group,
+                academic_year=cls.academic_year,
+                acronym='NEWACRO',
+                title='New title',
+                management_entity=cls.school_version.entity,
+                education_group_type=cls.education_group_type,
+            )
+            cls.other_education_group_year = EducationGroupYearFactory(
+                academic_year=cls.academic_year,
+                education_group_type=cls.other_education_group_type,
+            )
+
+    def test_row_built_from_most_recent_education_group_year(self):
+        catalog_row = FormationCatalog.objects.get(education_group=self.education_group)
+        self.assertEqual(catalog_row.education_group_year, self.education_group_year)
+        self.assertEqual(catalog_row.acronym, 'NEWACRO')
+        self.assertEqual(catalog_row.title, 'New title')
+        self.assertEqual(catalog_row.management_entity, self.school_version.entity)
+        self.assertEqual(catalog_row.faculty, self.faculty_version.entity)
+        self.assertIsNone(catalog_row.training)
+
+    def test_no_row_for_education_group_out_of_continuing_education(self):
+        self.assertFalse(
+            FormationCatalog.objects.filter(education_group=self.other_education_group_year.education_group).exists()
+        )
+
+    def test_row_for_education_group_with_training_out_of_continuing_education_types(self):
+        with self.captureOnCommitCallbacks(execute=True):
+            training = ContinuingEducationTrainingFactory(
+                education_group=self.other_education_group_year.education_group
+            )
+        catalog_row = FormationCatalog.objects.get(education_group=self.other_education_group_year.education_group)
+        self.assertEqual(catalog_row.training, training)
+
+    def test_refreshed_only_on_commit(self):
+        with self.captureOnCommitCallbacks() as callbacks:
+            self.education_group_year.acronym = 'RENAMED'
+            self.education_group_year.save()
+        self.assertEqual(FormationCatalog.objects.get(education_group=self.education_group).acronym, 'NEWACRO')
+
+        for callback in callbacks:
+            callback()
+        self.assertEqual(FormationCatalog.objects.get(education_group=self.education_group).acronym, 'RENAMED')
+
+    def test_refreshed_when_training_changes(self):
+        with self.captureOnCommitCallbacks(execute=True):
+            training = ContinuingEducationTrainingFactory(education_group=self.education_group, active=False)
+        catalog_row = FormationCatalog.objects.get(education_group=self.education_group)
+        self.assertEqual(catalog_row.training, training)
+        self.assertFalse(catalog_row.active)
+
+        with self.captureOnCommitCallbacks(execute=True):
+            training.active = True
+            training.training_aid = True
+            training.save()
+        catalog_row.refresh_from_db()
+        self.assertTrue(catalog_row.active)
+        self.assertTrue(catalog_row.training_aid)
+
+        with self.captureOnCommitCallbacks(execute=True):
+            training.delete()
+        self.assertIsNone(FormationCatalog.objects.get(education_group=self.education_group).training)
+
+    def test_refreshed_when_education_group_year_changes(self):
+        with self.captureOnCommitCallbacks(execute=True):
+            self.education_group_year.acronym = 'RENAMED'
+            self.education_group_year.save()
+        self.assertEqual(FormationCatalog.objects.get(education_group=self.education_group).acronym, 'RENAMED')
+
+        with self.captureOnCommitCallbacks(execute=True):
+            self.education_group_year.delete()
+        self.assertEqual(FormationCatalog.objects.get(education_group=self.education_group).acronym, 'OLDACRO')
+
+    def test_refreshed_when_management_entity_version_changes(self):
+        other_faculty = EntityVersionFactory(entity_type=entity_type.FACULTY)
+        with self.captureOnCommitCallbacks(execute=True):
+            self.school_version.parent = other_faculty.entity
+            self.school_version.save()
+        catalog_row = FormationCatalog.objects.get(education_group=self.education_group)
+        self.assertEqual(catalog_row.faculty, other_faculty.entity)
+
+    def test_full_refresh(self):
+        FormationCatalog.objects.all().delete()
+        refresh_formation_catalog()
+        self.assertTrue(FormationCatalog.objects.filter(education_group=self.education_group).exists())
@@ -0,0 +1,106 @@
+##############################################################################
+#
+#    OSIS stands for Open Student Information System. It's an application
+#    designed to manage the core business of higher education institutions,
+#    such as universities, faculties, institutes and professional schools.
+#    The core business involves the administration of students, teachers,
+#    courses, programs and so on.
+#
+#    Copyright (C) 2015-2022 Université catholique de Louvain (http://www.uclouvain.be)
+#
+#    This program is free software: you can redistribute it and/or modify
+#    it under the terms of the GNU General Public License as published by
+#    the Free Software Foundation, either version 3 of the License, or
+#    (at your option) any later version.
+#
+#    This program is distributed in the hope that it will be useful,
+#    but WITHOUT ANY WARRANTY; without even the implied warranty of
+#    MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+#    GNU General Public License for more details.
+#
+#    A copy of this license - GNU General Public License - is available
+#    at the root of the source code of this program.  If not,
+#    see http://www.gnu.org/licenses/.
+#
+##############################################################################
+from django.core.cache import cache
+from django.test import TestCase
+
+from base.tests.factories.academic_year import create_current_academic_year
+from base.tests.factories.education_group_year import EducationGroupYearFactory
+from continuing_education.business.formation_choices import get_formation_choices, FORMATION_CHOICES_CACHE_KEY
+from continuing_education.forms.search import AdmissionFilterForm, STATE_TO_DISPLAY, STATE_FOR_REGISTRATION
+from continuing_education.models.enums.admission_state_choices import SUBMITTED, ACCEPTED
+from continuing_education.tests.factories.admission import AdmissionFactory
+from continuing_education.tests.factories.continuing_education_training import ContinuingEducationTrainingFactory
+
+
+class TestFormationChoices(TestCase):
+    @classmethod
+    def setUpTestData(cls):
+        academic_year = create_current_academic_year()
+        cls.formations = []
+        for acronym in ['ZFORM', 'AFORM']:
+            education_group_year = EducationGroupYearFactory(academic_year=academic_year, acronym=acronym)
+            cls.formations.append(
+                ContinuingEducationTrainingFactory(education_group=education_group_year.education_group)
+            )
+        cls.submitted = AdmissionFactory(formation=cls.formations[0], state=SUBMITTED)
+        cls.accepted = AdmissionFactory(formation=cls.formations[1], state=ACCEPTED)
+
+    def setUp(self):
+        cache.delete(FORMATION_CHOICES_CACHE_KEY)
+
+    def test_choices_by_state_group(self):
+        self.assertListEqual(
+            get_formation_choices(STATE_TO_DISPLAY),
+            [(self.formations[0].pk, self.formations[0].acronym_and_title)]
+        )
+        self.assertListEqual(
+            get_formation_choices(STATE_FOR_REGISTRATION),
+            [(self.formations[1].pk, self.formations[1].acronym_and_title)]
+        )
+
+    def test_choices_are_cached(self):
+        AdmissionFilterForm()
+        with self.assertNumQueries(0):
+            get_formation_choices(STATE_TO_DISPLAY)
+            form = AdmissionFilterForm()
+            str(form['formation'])
+
+    def test_cache_cleared_when_admission_state_changes(self):
+        get_formation_choices(STATE_TO_DISPLAY)
+        self.accepted.state = SUBMITTED
+        self.accepted.save()
+        self.assertListEqual(
+            [formation_id for formation_id, label in get_formation_choices(STATE_TO_DISPLAY)],
+            [self.formations[1].pk, self.formations[0].pk]
+        )
+
+    def test_cache_kept_when_admission_changes_without_state_change(self):
+        get_formation_choices(STATE_TO_DISPLAY)
+        self.submitted.save(update_fields=['comment'])
+        with self.assertNumQueries(0):
+            get_formation_choices(STATE_TO_DISPLAY)
+
+    def test_cache_kept_when_admission_saved_without_state_or_formation_change(self):
+        get_formation_choices(STATE_TO_DISPLAY)
+        self.submitted.comment = 'Comment'
+        self.submitted.save()
+        with self.assertNumQueries(0):
+            get_formation_choices(STATE_TO_DISPLAY)
+
+    def test_cache_cleared_when_admission_formation_changes(self):
+        get_formation_choices(STATE_TO_DISPLAY)
+        self.submitted.formation = self.formations[1]
+        self.submitted.save()
+        self.assertListEqual(
+            [formation_id for formation_id, label in get_formation_choices(STATE_TO_DISPLAY)],
+            [self.formations[1].pk]
+        )
+
+    def test_form_validation_restricted_to_choices(self):
+        form = AdmissionFilterForm({'formation': self.formations[1].pk})
+        self.assertFalse(form.is_valid())
+        form = AdmissionFilterForm({'formation': self.formations[0].pk})
+        self.assertTrue(form.is_valid())
@@ -0,0 +1,77 @@
+##############################################################################
+#
+#    OSIS stands for Open Student Information System. It's an application
+#    designed to manage the core business of higher education institutions,
+#    such as universities, faculties, institutes and professional schools.
+#    The core business involves the administration of students, teachers,
+#    courses, programs and so on.
+#
+#    Copyright (C) 2015-2022 Université catholique de Louvain (http://www.uclouvain.be)
+#
+#    This program is free software: you can redistribute it and/or modify
+#    it under the terms of the GNU General Public License as published by
+#    the Free Software Foundation, either version 3 of the License, or
+#    (at your option) any later version.
+#
+#    This program is distributed in the hope that it will be useful,
+#    but WITHOUT ANY WARRANTY; without even the implied warranty of
+#    MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+#    GNU General Public License for more details.
+#
+#    A copy of this license - GNU General Public License - is available
+#    at the root of the source code of this program.  If not,
+#    see http://www.gnu.org/licenses/.
+#
+##############################################################################
+from django.core.cache import cache
+from django.test import TestCase
+
+from continuing_education.business.manager_contacts import get_manager_contacts, ManagerContact
+from continuing_education.models.continuing_education_training import ContinuingEducationTraining
+from continuing_education.tests.factories.continuing_education_training import ContinuingEducationTrainingFactory
+from continuing_education.tests.factories.iufc_person import IUFCPersonFactory as PersonFactory
+from continuing_education.tests.factories.roles.continuing_education_training_manager import \
+    ContinuingEducationTrainingManagerFactory
+
+
+class TestManagerContacts(TestCase):
+    @classmethod
+    def setUpTestData(cls):
+        cls.training = ContinuingEducationTrainingFactory()
+        cls.manager = PersonFactory(last_name="Bbb", first_name="Anne")
+        cls.other_manager = PersonFactory(last_name="Aaa", first_name="Marc")
+        ContinuingEducationTrainingManagerFactory(person=cls.manager, training=cls.training)
+        ContinuingEducationTrainingManagerFactory(person=cls.other_manager, training=cls.training)
+
+    def setUp(self):
+        cache.clear()
+        self.addCleanup(cache.clear)
+
+    def test_contacts_sorted_by_name_and_cached(self):
+        self.assertEqual(get_manager_contacts(self.training.pk), [
+            ManagerContact(person.pk, str(person), person.email, person.language)
+            for person in (self.other_manager, self.manager)
+        ])
+        with self.assertNumQueries(0):
+            get_manager_contacts(self.training.pk)
+
+    def test_cache_cleared_when_manager_added_or_deleted(self):
+        get_manager_contacts(self.training.pk)
+        training_manager = ContinuingEducationTrainingManagerFactory(training=self.training)
+        self.assertEqual(len(get_manager_contacts(self.training.pk)), 3)
+        training_manager.delete()
+        self.assertEqual(len(get_manager_contacts(self.training.pk)), 2)
+
+    def test_cache_cleared_when_manager_changes(self):
+        get_manager_contacts(self.training.pk)
+        self.manager.email = 'new@uclouvain.be'
+        self.manager.save()
+        self.assertIn('new@uclouvain.be', [contact.email for contact in get_manager_contacts(self.training.pk)])
+
+    def test_formation_administrators_of_prefetched_trainings(self):
+        trainings = list(ContinuingEducationTraining.objects.filter(pk=self.training.pk).with_managers())
+        with self.assertNumQueries(0):
+            self.assertEqual(
+                trainings[0].formation_administrators,
+                "{} - {}".format(self.other_manager, self.manager)
+            )
@@ -0,0 +1,103 @@
+##############################################################################
+#
+#    OSIS stands for Open Student Information System. It's an application
+#    designed to manage the core business of higher education institutions,
+#    such as universities, faculties, institutes and professional schools.
+#    The core business involves the administration of students, teachers,
+#    courses, programs and so on.
+#
+#    Copyright (C) 2015-2022 Université catholique de Louvain (http://www.uclouvain.be)
+#
+#    This program is free software: you can redistribute it and/or modify
+#    it under the terms of the GNU General Public License as published by
+#    the Free Software Foundation, either version 3 of the License, or
+#    (at your option) any later version.
+#
+#    This program is distributed in the hope that it will be useful,
+#    but WITHOUT ANY WARRANTY; without even the implied warranty of
+#    MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+#    GNU General Public License for more details.
+#
+#    A copy of this license - GNU General Public License - is available
+#    at the root of the source code of this program.  If not,
+#    see http://www.gnu.org/licenses/.
+#
+##############################################################################
+from django.test import TestCase
+
+from continuing_education.business.pagination import KeysetPaginator, InvalidCursor, NEXT, PREVIOUS, encode_cursor, \
+    decode_cursor, get_page_size, DEFAULT_PAGE_SIZE
+from continuing_education.models.prospect import Prospect
+from continuing_education.tests.factories.continuing_education_training import ContinuingEducationTrainingFactory
+from continuing_education.tests.factories.prospect import ProspectFactory
+
+
+class TestKeysetPaginator(TestCase):
+    @classmethod
+    def setUpTestData(cls):
+        formations = [ContinuingEducationTrainingFactory() for _ in range(2)]
+        cls.prospects = [ProspectFactory(formation=formations[index % 2]) for index in range(5)]
+        cls.keys = ('formation_id', 'pk')
+        cls.ordered_prospects = sorted(cls.prospects, key=lambda prospect: (prospect.formation_id, prospect.pk))
+
+    def setUp(self):
+        self.paginator = KeysetPaginator(Prospect.objects.all(), self.keys, page_size=2)
+
+    def test_first_page(self):
+        page = self.paginator.page()
+        self.assertListEqual(list(page), self.ordered_prospects[:2])
+        self.assertTrue(page.has_next)
+        self.assertFalse(page.has_previous)
+        self.assertIsNone(page.previous_cursor)
+
+    def test_browse_next_pages(self):
+        first_page = self.paginator.page()
+        second_page = self.paginator.page(first_page.next_cursor, NEXT)
+        self.assertListEqual(list(second_page), self.ordered_prospects[2:4])
+        self.assertTrue(second_page.has_previous)
+        last_page = self.paginator.page(second_page.next_cursor, NEXT)
+        self.assertListEqual(list(last_page), self.ordered_prospects[4:])
+        self.assertFalse(last_page.has_next)
+
+    def test_browse_previous_page(self):
+        second_page = self.paginator.page(self.paginator.page().next_cursor, NEXT)
+        last_page = self.paginator.page(second_page.next_cursor, NEXT)
+        previous_page = self.paginator.page(last_page.previous_cursor, PREVIOUS)
+        self.assertListEqual(list(previous_page), self.ordered_prospects[2:4])
+        self.assertTrue(previous_page.has_previous)
+        self.assertTrue(previous_page.has_next)
+
+    def test_previous_page_reaching_the_start_returns_first_page(self):
+        cursor = encode_cursor([self.ordered_prospects[1].formation_id, self.ordered_prospects[1].pk])
+        page = self.paginator.page(cursor, PREVIOUS)
+        self.assertListEqual(list(page), self.ordered_prospects[:2])
+        self.assertFalse(page.has_previous)
+
+    def test_descending_keys(self):
+        paginator = KeysetPaginator(Prospect.objects.all(), ('-pk',), page_size=3)
+        first_page = paginator.page()
+        second_page = paginator.page(first_page.next_cursor, NEXT)
+        self.assertListEqual(list(first_page) + list(second_page), self.prospects[::-1])
+
+    def test_no_offset_nor_count_query(self):
+        cursor = self.paginator.page().next_cursor
+        with self.assertNumQueries(1) as context:
+            self.paginator.page(cursor, NEXT)
+        sql = context.captured_queries[0]['sql']
+        self.assertNotIn('OFFSET', sql)
+        self.assertNotIn('COUNT', sql)
+
+
+class TestCursor(TestCase):
+    def test_round_trip(self):
+        self.assertListEqual(decode_cursor(encode_cursor([1, 'Dupont', 0.25]), 3), [1, 'Dupont', 0.25])
+
+    def test_invalid_cursor(self):
+        for cursor in ['not a cursor', encode_cursor([1]), encode_cursor([1, None]), encode_cursor({'pk': 1})]:
+            with self.subTest(cursor=cursor), self.assertRaises(InvalidCursor):
+                decode_cursor(cursor, 2)
+
+    def test_page_size(self):
+        self.assertEqual(get_page_size('25'), 25)
+        self.assertEqual(get_page_size('7'), DEFAULT_PAGE_SIZE)
+        self.assertEqual(get_page_size(None), DEFAULT_PAGE_SIZE)
@@ -23,12 +23,18 @@
 #    see http://www.gnu.org/licenses/.
 #
 ##############################################################################
+import datetime
+from unittest import mock
+
 from django.test import TestCase
+from django.utils import timezone
 
 from base.tests.factories.academic_year import create_current_academic_year
 from base.tests.factories.education_group import EducationGroupFactory
 from base.tests.factories.education_group_year import EducationGroupYearFactory
-from continuing_education.business.prospect import get_prospects_by_user
+from continuing_education.business.prospect import get_prospects_by_user, get_new_prospects_by_user, \
+    get_last_prospect_export_date, get_last_prospect_id, acknowledge_prospect_export
+from continuing_education.models.prospect import Prospect
 from continuing_education.tests.factories.continuing_education_training import ContinuingEducationTrainingFactory
 from continuing_education.tests.factories.prospect import ProspectFactory
 from continuing_education.tests.factories.roles.continuing_education_training_manager import \
@@ -55,3 +61,71 @@ class TestProspect(TestCase):
             get_prospects_by_user(manager.person.user),
             [prospect_1, prospect_2]
         )
+
+
+class TestNewProspects(TestCase):
+    @classmethod
+    def setUpTestData(cls):
+        cls.academic_year = create_current_academic_year()
+        cls.training = cls._create_training()
+        cls.user = ContinuingEducationTrainingManagerFactory(training=cls.training).person.user
+
+    @classmethod
+    def _create_training(cls):
+        education_group = EducationGroupFactory()
+        EducationGroupYearFactory(education_group=education_group, academic_year=cls.academic_year)
+        return ContinuingEducationTrainingFactory(education_group=education_group)
+
+    def setUp(self):
+        patcher = mock.patch('continuing_education.business.prospect.PROSPECT_COMMIT_DELAY', datetime.timedelta(0))
+        patcher.start()
+        self.addCleanup(patcher.stop)
+
+    def test_first_export_returns_all_prospects(self):
+        prospects = ProspectFactory.create_batch(2, formation=self.training)
+        Prospect.objects.filter(pk=prospects[0].pk).update(created_at=None)
+        ProspectFactory()
+
+        self.assertIsNone(get_last_prospect_export_date(self.user))
+        self.assertListEqual(get_new_prospects_by_user(self.user, get_last_prospect_id()), prospects)
+
+    def test_export_does_not_move_watermark_until_acknowledged(self):
+        prospect = ProspectFactory(formation=self.training)
+        up_to_id = get_last_prospect_id()
+
+        self.assertListEqual(get_new_prospects_by_user(self.user, up_to_id), [prospect])
+        self.assertListEqual(get_new_prospects_by_user(self.user, up_to_id), [prospect])
+
+        acknowledge_prospect_export(self.user, up_to_id)
+        self.assertListEqual(get_new_prospects_by_user(self.user, get_last_prospect_id()), [])
+        self.assertIsNotNone(get_last_prospect_export_date(self.user))
+
+    def test_prospects_created_after_export_are_not_acknowledged(self):
+        ProspectFactory(formation=self.training)
+        up_to_id = get_last_prospect_id()
+        new_prospect = ProspectFactory(formation=self.training)
+
+        self.assertNotIn(new_prospect, get_new_prospects_by_user(self.user, up_to_id))
+        acknowledge_prospect_export(self.user, up_to_id)
+        self.assertListEqual(get_new_prospects_by_user(self.user, get_last_prospect_id()), [new_prospect])
+
+    def test_newly_assigned_training_exports_all_its_prospects(self):
+        ProspectFactory(formation=self.training)
+        acknowledge_prospect_export(self.user, get_last_prospect_id())
+        other_training = self._create_training()
+        older_prospect = ProspectFactory(formation=other_training)
+        ProspectFactory(formation=self.training)
+        acknowledge_prospect_export(self.user, get_last_prospect_id())
+
+        ContinuingEducationTrainingManagerFactory(training=other_training, person=self.user.person)
+        self.assertListEqual(get_new_prospects_by_user(self.user, get_last_prospect_id()), [older_prospect])
+
+    def test_prospects_just_created_are_left_for_next_export(self):
+        prospect = ProspectFactory(formation=self.training)
+        Prospect.objects.filter(pk=prospect.pk).update(created_at=timezone.now() - datetime.timedelta(minutes=5))
+        ProspectFactory(formation=self.training)
+
+        with mock.patch(
+                'continuing_education.business.prospect.PROSPECT_COMMIT_DELAY', datetime.timedelta(minutes=1)
+        ):
+            self.assertEqual(get_last_prospect_id(), prospect.pk)
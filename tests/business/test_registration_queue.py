@@ -36,6 +36,8 @@ from base.tests.factories.user import UserFactory
 from continuing_education.business.registration_queue import get_json_for_epc, format_address_for_json, \
     save_role_registered_in_admission, send_admission_to_queue, _gender_to_sex, MAX_LENGTH_FOR_STREET_FIELD_IN_EPC, \
     MAX_LENGTH_FOR_POSTAL_CODE_FIELD_IN_EPC, MAX_LENGTH_FOR_LOCALITY_FIELD_IN_EPC
+from continuing_education.business.revision import UCL_REGISTRATION_REGISTERED, UCL_REGISTRATION_REJECTED, \
+    UCL_REGISTRATION_STATE_CHANGED
 from continuing_education.models.enums.admission_state_choices import VALIDATED
 from continuing_education.models.enums.ucl_registration_state_choices import UCLRegistrationState
 from continuing_education.tests.factories.address import AddressFactory
@@ -45,8 +47,6 @@ from continuing_education.tests.factories.roles.continuing_education_student_wor
     ContinuingEducationStudentWorkerFactory
 from continuing_education.tests.factories.roles.continuing_education_training_manager import \
     ContinuingEducationTrainingManagerFactory
-from continuing_education.views.common import UCL_REGISTRATION_REGISTERED, UCL_REGISTRATION_REJECTED, \
-    UCL_REGISTRATION_STATE_CHANGED
 
 
 class PrepareJSONTestCase(TestCase):
@@ -0,0 +1,76 @@
+##############################################################################
+#
+#    OSIS stands for Open Student Information System. It's an application
+#    designed to manage the core business of higher education institutions,
+#    such as universities, faculties, institutes and professional schools.
+#    The core business involves the administration of students, teachers,
+#    courses, programs and so on.
+#
+#    Copyright (C) 2015-2022 Université catholique de Louvain (http://www.uclouvain.be)
+#
+#    This program is free software: you can redistribute it and/or modify
+#    it under the terms of the GNU General Public License as published by
+#    the Free Software Foundation, either version 3 of the License, or
+#    (at your option) any later version.
+#
+#    This program is distributed in the hope that it will be useful,
+#    but WITHOUT ANY WARRANTY; without even the implied warranty of
+#    MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+#    GNU General Public License for more details.
+#
+#    A copy of this license - GNU General Public License - is available
+#    at the root of the source code of this program.  If not,
+#    see http://www.gnu.org/licenses/.
+#
+##############################################################################
+from unittest import mock
+
+from django.core.cache import cache
+from django.test import TestCase
+
+from continuing_education.business.result_count import get_result_count, get_filters_hash, get_estimated_count
+from continuing_education.models.prospect import Prospect
+from continuing_education.tests.factories.prospect import ProspectFactory
+
+
+class TestResultCount(TestCase):
+    @classmethod
+    def setUpTestData(cls):
+        cls.prospects = ProspectFactory.create_batch(3)
+
+    def setUp(self):
+        cache.clear()
+        self.addCleanup(cache.clear)
+
+    def test_count_is_cached_per_scope_and_filters(self):
+        self.assertEqual(get_result_count(Prospect.objects.all(), 'prospects', 1), 3)
+        with self.assertNumQueries(0):
+            self.assertEqual(get_result_count(Prospect.objects.all(), 'prospects', 1), 3)
+        with self.assertNumQueries(1):
+            self.assertEqual(get_result_count(Prospect.objects.none(), 'prospects', 2), 0)
+        with self.assertNumQueries(1):
+            get_result_count(Prospect.objects.all(), 'prospects', 1, {'free_text': ['test']})
+
+    def test_cache_outdated_when_prospect_created(self):
+        get_result_count(Prospect.objects.all(), 'prospects', 1)
+        ProspectFactory()
+        self.assertEqual(get_result_count(Prospect.objects.all(), 'prospects', 1), 4)
+
+    def test_empty_filters_ignored_in_hash(self):
+        self.assertNotEqual(get_filters_hash({'state': ['Accepted']}), get_filters_hash({'state': ['Rejected']}))
+        self.assertEqual(
+            get_result_count(Prospect.objects.all(), 'prospects', 1, {'free_text': ['']}),
+            get_result_count(Prospect.objects.all(), 'prospects', 1)
+        )
+
+    def test_estimated_count(self):
+        self.assertGreaterEqual(get_estimated_count(Prospect.objects.all()), 1)
+        with mock.patch('continuing_education.business.result_count.ESTIMATED_COUNT_THRESHOLD', 0):
+            result_count = get_result_count(Prospect.objects.all(), 'prospects', 1, estimate=True)
+        self.assertTrue(result_count.estimated)
+
+    def test_exact_count_when_filtered(self):
+        with mock.patch('continuing_education.business.result_count.ESTIMATED_COUNT_THRESHOLD', 0):
+            result_count = get_result_count(Prospect.objects.all(), 'prospects', 1, {'state': ['x']}, estimate=True)
+        self.assertEqual(result_count, 3)
+        self.assertFalse(result_count.estimated)
@@ -0,0 +1,99 @@
+##############################################################################
+#
+#    OSIS stands for Open Student Information System. It's an application
+#    designed to manage the core business of higher education institutions,
+#    such as universities, faculties, institutes and professional schools.
+#    The core business involves the administration of students, teachers,
+#    courses, programs and so on.
+#
+#    Copyright (C) 2015-2022 Université catholique de Louvain (http://www.uclouvain.be)
+#
+#    This program is free software: you can redistribute it and/or modify
+#    it under the terms of the GNU General Public License as published by
+#    the Free Software Foundation, either version 3 of the License, or
+#    (at your option) any later version.
+#
+#    This program is distributed in the hope that it will be useful,
+#    but WITHOUT ANY WARRANTY; without even the implied warranty of
+#    MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+#    GNU General Public License for more details.
+#
+#    A copy of this license - GNU General Public License - is available
+#    at the root of the source code of this program.  If not,
+#    see http://www.gnu.org/licenses/.
+#
+##############################################################################
+from django.test import TestCase
+
+from base.tests.factories.academic_year import create_current_academic_year
+from base.tests.factories.education_group_year import EducationGroupYearFactory
+from base.tests.factories.person import PersonFactory
+from continuing_education.business.search_document import normalize_search_text, search_admissions
+from continuing_education.models.admission import Admission
+from continuing_education.models.admission_search_document import AdmissionSearchDocument
+from continuing_education.tests.factories.address import AddressFactory
+from continuing_education.tests.factories.admission import AdmissionFactory
+from continuing_education.tests.factories.person import ContinuingEducationPersonFactory
+from reference.tests.factories.country import CountryFactory
+
+
+class TestNormalizeSearchText(TestCase):
+    def test_normalize_search_text(self):
+        self.assertEqual(normalize_search_text(' Héloïse GARÇON '), 'heloise garcon')
+        self.assertEqual(normalize_search_text(None), '')
+
+
+class TestAdmissionSearchDocument(TestCase):
+    @classmethod
+    def setUpTestData(cls):
+        cls.person = PersonFactory(first_name='Zoé', last_name='Lemaître', email='zoe.lemaitre@example.com')
+        cls.address = AddressFactory(city='Liège', country=CountryFactory(name='Belgique'))
+        cls.admission = AdmissionFactory(
+            person_information=ContinuingEducationPersonFactory(person=cls.person),
+            address=cls.address,
+        )
+        cls.education_group_year = EducationGroupYearFactory(
+            education_group=cls.admission.formation.education_group,
+            academic_year=create_current_academic_year(),
+            acronym='GESTPME',
+            title='Gestion des PME'
+        )
+        cls.other_admission = AdmissionFactory()
+
+    def _document(self):
+        return AdmissionSearchDocument.objects.get(admission=self.admission).document
+
+    def test_document_built_on_admission_save(self):
+        document = self._document()
+        for value in ['zoe', 'lemaitre', 'zoe.lemaitre@example.com', 'gestpme', 'gestion des pme', 'liege', 'belgique']:
+            self.assertIn(value, document)
+
+    def test_document_updated_on_person_save(self):
+        self.person.last_name = 'Dupré'
+        self.person.save()
+        self.assertIn('dupre', self._document())
+
+    def test_document_updated_on_address_save(self):
+        self.address.city = 'Namur'
+        self.address.save()
+        self.assertIn('namur', self._document())
+        self.assertNotIn('liege', self._document())
+
+    def test_document_updated_on_training_education_group_year_save(self):
+        self.education_group_year.title = 'Gestion financière'
+        self.education_group_year.save()
+        self.assertIn('gestion financiere', self._document())
+
+    def test_search_is_accent_and_case_insensitive(self):
+        results = search_admissions('LEMAITRE', Admission.objects.all())
+        self.assertListEqual(list(results), [self.admission])
+
+        results = search_admissions('liège', Admission.objects.all())
+        self.assertListEqual(list(results), [self.admission])
+
+    def test_search_partial_word(self):
+        self.assertListEqual(list(search_admissions('maîtr', Admission.objects.all())), [self.admission])
+
+    def test_search_results_are_ranked(self):
+        results = search_admissions('gestpme', Admission.objects.all())
+        self.assertGreater(results.get().search_rank, 0)
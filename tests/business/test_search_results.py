@@ -0,0 +1,100 @@
+##############################################################################
+#
+#    OSIS stands for Open Student Information System. It's an application
+#    designed to manage the core business of higher education institutions,
+#    such as universities, faculties, institutes and professional schools.
+#    The core business involves the administration of students, teachers,
+#    courses, programs and so on.
+#
+#    Copyright (C) 2015-2022 Université catholique de Louvain (http://www.uclouvain.be)
+#
+#    This program is free software: you can redistribute it and/or modify
+#    it under the terms of the GNU General Public License as published by
+#    the Free Software Foundation, either version 3 of the License, or
+#    (at your option) any later version.
+#
+#    This program is distributed in the hope that it will be useful,
+#    but WITHOUT ANY WARRANTY; without even the implied warranty of
+#    MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+#    GNU General Public License for more details.
+#
+#    A copy of this license - GNU General Public License - is available
+#    at the root of the source code of this program.  If not,
+#    see http://www.gnu.org/licenses/.
+#
+##############################################################################
+from unittest import mock
+
+from django.core.cache import cache
+from django.http import QueryDict
+from django.test import TestCase
+
+from continuing_education.business.pagination import SearchResultPaginator, KeysetPaginator, NEXT, PREVIOUS
+from continuing_education.business.search_results import get_search_result_keys, get_cached_search_result_ids, \
+    get_search_filters, filter_by_ordered_ids
+from continuing_education.models.admission import Admission
+from continuing_education.tests.factories.admission import AdmissionFactory
+
+KEYS = ('formation_id', 'pk')
+
+
+class TestSearchResults(TestCase):
+    @classmethod
+    def setUpTestData(cls):
+        cls.admissions = AdmissionFactory.create_batch(5)
+        cls.ordered_admissions = sorted(cls.admissions, key=lambda admission: (admission.formation_id, admission.pk))
+
+    def setUp(self):
+        cache.clear()
+        self.addCleanup(cache.clear)
+
+    def test_result_keys_are_cached(self):
+        result_keys = get_search_result_keys(Admission.objects.all(), KEYS, 'admissions', 1, {})
+        self.assertListEqual(
+            result_keys,
+            [(admission.formation_id, admission.pk) for admission in self.ordered_admissions]
+        )
+        with self.assertNumQueries(0):
+            self.assertListEqual(
+                get_search_result_keys(Admission.objects.all(), KEYS, 'admissions', 1, {}), result_keys
+            )
+        self.assertListEqual(
+            get_cached_search_result_ids('admissions', 1, {}),
+            [admission.pk for admission in self.ordered_admissions]
+        )
+        self.assertIsNone(get_cached_search_result_ids('admissions', 2, {}))
+
+    def test_cache_outdated_when_admission_changes(self):
+        get_search_result_keys(Admission.objects.all(), KEYS, 'admissions', 1, {})
+        AdmissionFactory()
+        self.assertIsNone(get_cached_search_result_ids('admissions', 1, {}))
+
+    def test_too_many_results_not_cached(self):
+        with mock.patch('continuing_education.business.search_results.SEARCH_RESULTS_MAX_SIZE', 2):
+            self.assertIsNone(get_search_result_keys(Admission.objects.all(), KEYS, 'admissions', 1, {}))
+        self.assertIsNone(get_cached_search_result_ids('admissions', 1, {}))
+
+    def test_search_filters_ignore_pagination_and_export_parameters(self):
+        self.assertDictEqual(
+            get_search_filters(QueryDict('state=Accepted&free_text=&cursor=abc&page_size=25&columns=email')),
+            {'state': ['Accepted']}
+        )
+
+    def test_filter_by_ordered_ids(self):
+        ids = [admission.pk for admission in self.admissions[::-1]]
+        self.assertListEqual(list(filter_by_ordered_ids(Admission.objects.all(), ids)), self.admissions[::-1])
+
+    def test_paginator_fetches_rows_by_primary_key(self):
+        result_keys = get_search_result_keys(Admission.objects.all(), KEYS, 'admissions', 1, {})
+        paginator = SearchResultPaginator(Admission.objects.all(), result_keys, page_size=2)
+        first_page = paginator.page()
+        with self.assertNumQueries(1):
+            second_page = paginator.page(first_page.next_cursor, NEXT)
+        self.assertListEqual(list(second_page), self.ordered_admissions[2:4])
+        self.assertListEqual(list(paginator.page(second_page.previous_cursor, PREVIOUS)), self.ordered_admissions[:2])
+
+    def test_cursors_shared_with_keyset_paginator(self):
+        result_keys = get_search_result_keys(Admission.objects.all(), KEYS, 'admissions', 1, {})
+        keyset_page = KeysetPaginator(Admission.objects.all(), KEYS, page_size=2).page()
+        paginator = SearchResultPaginator(Admission.objects.all(), result_keys, page_size=2)
+        self.assertListEqual(list(paginator.page(keyset_page.next_cursor, NEXT)), self.ordered_admissions[2:4])
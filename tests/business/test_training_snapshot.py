@@ -0,0 +1,88 @@
+##############################################################################
+#
+#    OSIS stands for Open Student Information System. It's an application
+#    designed to manage the core business of higher education institutions,
+#    such as universities, faculties, institutes and professional schools.
+#    The core business involves the administration of students, teachers,
+#    courses, programs and so on.
+#
+#    Copyright (C) 2015-2022 Université catholique de Louvain (http://www.uclouvain.be)
+#
+#    This program is free software: you can redistribute it and/or modify
+#    it under the terms of the GNU General Public License as published by
+#    the Free Software Foundation, either version 3 of the License, or
+#    (at your option) any later version.
+#
+#    This program is distributed in the hope that it will be useful,
+#    but WITHOUT ANY WARRANTY; without even the implied warranty of
+#    MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+#    GNU General Public License for more details.
+#
+#    A copy of this license - GNU General Public License - is available
+#    at the root of the source code of this program.  If not,
+#    see http://www.gnu.org/licenses/.
+#
+##############################################################################
+from io import StringIO
+
+from django.core.management import call_command
+from django.test import TestCase
+
+from base.tests.factories.academic_year import create_current_academic_year, AcademicYearFactory
+from base.tests.factories.education_group import EducationGroupFactory
+from base.tests.factories.education_group_year import EducationGroupYearFactory
+from continuing_education.business.training_snapshot import refresh_training_snapshots
+from continuing_education.models.continuing_education_training import ContinuingEducationTraining
+from continuing_education.tests.factories.continuing_education_training import ContinuingEducationTrainingFactory
+
+
+class TestTrainingSnapshot(TestCase):
+    @classmethod
+    def setUpTestData(cls):
+        cls.academic_year = create_current_academic_year()
+        cls.next_academic_year = AcademicYearFactory(year=cls.academic_year.year + 1)
+        cls.education_group = EducationGroupFactory()
+        cls.education_group_year = EducationGroupYearFactory(
+            education_group=cls.education_group,
+            academic_year=cls.academic_year,
+            acronym='CURRENT',
+            partial_acronym='LCUR100',
+            title='Current title',
+        )
+        EducationGroupYearFactory(education_group=cls.education_group, academic_year=cls.next_academic_year)
+        cls.training = ContinuingEducationTrainingFactory(education_group=cls.education_group, training_aid=False)
+
+    def test_snapshot_set_when_training_created(self):
+        training = ContinuingEducationTraining.objects.get(pk=self.training.pk)
+        self.assertEqual(training.current_education_group_year, self.education_group_year)
+        self.assertEqual(training.current_year, self.academic_year)
+        self.assertEqual(training.current_management_entity, self.education_group_year.management_entity)
+
+    def test_properties_read_without_query(self):
+        training = ContinuingEducationTraining.objects.formations().get(pk=self.training.pk)
+        with self.assertNumQueries(0):
+            self.assertEqual(training.acronym, 'CURRENT')
+            self.assertEqual(training.partial_acronym, 'LCUR100')
+            self.assertEqual(training.title, 'Current title')
+            self.assertEqual(training.academic_year, self.academic_year)
+            self.assertEqual(str(training), 'CURRENT - Current title')
+
+    def test_snapshot_refreshed_when_education_group_year_changes(self):
+        self.education_group_year.acronym = 'RENAMED'
+        self.education_group_year.save()
+        self.assertEqual(ContinuingEducationTraining.objects.get(pk=self.training.pk).acronym, 'RENAMED')
+
+    def test_next_academic_year_used_when_no_current_one(self):
+        education_group = EducationGroupFactory()
+        next_education_group_year = EducationGroupYearFactory(
+            education_group=education_group,
+            academic_year=self.next_academic_year,
+        )
+        training = ContinuingEducationTrainingFactory(education_group=education_group)
+        self.assertEqual(training.current_education_group_year, next_education_group_year)
+
+    def test_refresh_every_training(self):
+        ContinuingEducationTraining.objects.update(current_education_group_year=None, current_acronym='')
+        call_command('refresh_training_snapshots', stdout=StringIO())
+        self.assertEqual(ContinuingEducationTraining.objects.get(pk=self.training.pk).acronym, 'CURRENT')
+        self.assertEqual(refresh_training_snapshots([self.education_group.pk]), 1)
@@ -34,14 +34,13 @@ from base.tests.factories.education_group_year import EducationGroupYearFactory
 from base.tests.factories.entity_version import EntityVersionFactory
 from base.tests.factories.user import UserFactory
 from continuing_education.business.xls.xls_admission import XLS_DESCRIPTION, XLS_FILENAME, \
-    WORKSHEET_TITLE, \
-    create_xls, prepare_xls_content
-from continuing_education.business.xls.xls_common import ADMISSION_HEADERS
+    WORKSHEET_TITLE, get_export_parameters
+from continuing_education.business.xls.xls_columns import ADMISSION_COLUMNS, get_headers
 from continuing_education.forms.search import CommonFilterForm
+from continuing_education.models.admission import Admission
 from continuing_education.models.enums.admission_state_choices import SUBMITTED
 from continuing_education.tests.factories.admission import AdmissionFactory
 from continuing_education.tests.factories.continuing_education_training import ContinuingEducationTrainingFactory
-from osis_common.document import xls_build
 
 FACULTY_ACRONYM = "AGRO"
 
@@ -73,44 +72,28 @@ class TestAdmissionXls(TestCase):
             state=SUBMITTED
         )
 
-    def test_prepare_xls_content_no_data(self):
-        self.assertEqual(prepare_xls_content([]), [])
+    def test_export_parameters_no_data(self):
+        parameters = get_export_parameters(self.user, Admission.objects.none(), None)
+        self.assertEqual(list(parameters['rows']), [])
 
-    def test_generate_xls_data_with_an_admission(self):
+    def test_export_parameters_with_an_admission(self):
         a_form = CommonFilterForm({"faculty": self.entity_version.id})
         self.assertTrue(a_form.is_valid())
         found_admissions = a_form.get_admissions()
-        create_xls(self.user, found_admissions, None)
+        parameters = get_export_parameters(self.user, found_admissions, a_form, ['first_name', 'email', 'state'])
 
-        xls_data = [[
+        self.assertEqual(parameters['user'], self.user)
+        self.assertEqual(parameters['description'], XLS_DESCRIPTION)
+        self.assertEqual(parameters['filename'], XLS_FILENAME)
+        self.assertEqual(parameters['worksheet_title'], WORKSHEET_TITLE)
+        self.assertEqual(parameters['header_titles'], [str(_('First name')), str(_('Email')), str(_('State'))])
+        self.assertEqual(list(parameters['rows']), [[
             self.admission.person_information.person.first_name,
-            self.admission.person_information.person.last_name,
-            self.admission.email,
-            self.admission.formation,
-            self.entity_version.entity,
+            self.admission.person_information.person.email,
             _(SUBMITTED)
-        ]]
+        ]])
 
-        expected_argument = _generate_xls_build_parameter(xls_data, self.user)
-
-        self.assertEqual(expected_argument['list_description'], _('Admissions list'))
-        self.assertEqual(expected_argument['filename'], _('Admissions_list'))
-        self.assertEqual(expected_argument['username'], self.user.username)
-        self.assertEqual(expected_argument['data'][0]['content'], xls_data)
-        self.assertEqual(expected_argument['data'][0]['header_titles'], ADMISSION_HEADERS)
-        self.assertEqual(expected_argument['data'][0]['worksheet_title'], _('Admissions list'))
-
-
-def _generate_xls_build_parameter(xls_data, user):
-    return {
-        xls_build.LIST_DESCRIPTION_KEY: XLS_DESCRIPTION,
-        xls_build.FILENAME_KEY: XLS_FILENAME,
-        xls_build.USER_KEY: user.username,
-        xls_build.WORKSHEETS_DATA: [{
-            xls_build.CONTENT_KEY: xls_data,
-            xls_build.HEADER_TITLES_KEY: ADMISSION_HEADERS,
-            xls_build.WORKSHEET_TITLE_KEY: WORKSHEET_TITLE,
-            xls_build.STYLED_CELLS: None,
-            xls_build.FONT_ROWS: None,
-        }]
-    }
+    def test_export_parameters_with_all_columns(self):
+        parameters = get_export_parameters(self.user, Admission.objects.filter(pk=self.admission.pk), None)
+        self.assertEqual(parameters['header_titles'], get_headers(ADMISSION_COLUMNS))
+        self.assertEqual(len(list(parameters['rows'])[0]), len(parameters['header_titles']))
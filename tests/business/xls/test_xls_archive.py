@@ -33,13 +33,13 @@ from base.tests.factories.education_group import EducationGroupFactory
 from base.tests.factories.education_group_year import EducationGroupYearFactory
 from base.tests.factories.entity_version import EntityVersionFactory
 from base.tests.factories.user import UserFactory
-from continuing_education.business.xls.xls_archive import ARCHIVE_TITLES, XLS_DESCRIPTION, XLS_FILENAME, \
-    WORKSHEET_TITLE, create_xls, prepare_xls_content
+from continuing_education.business.xls.xls_archive import XLS_DESCRIPTION, XLS_FILENAME, \
+    WORKSHEET_TITLE, get_export_parameters
 from continuing_education.forms.search import ArchiveFilterForm
+from continuing_education.models.admission import Admission
 from continuing_education.models.enums.admission_state_choices import SUBMITTED
 from continuing_education.tests.factories.admission import AdmissionFactory
 from continuing_education.tests.factories.continuing_education_training import ContinuingEducationTrainingFactory
-from osis_common.document import xls_build
 
 FACULTY_ACRONYM = "AGRO"
 
@@ -70,44 +70,30 @@ class TestArchiveXls(TestCase):
             archived=True
         )
 
-    def test_prepare_xls_content_no_data(self):
-        self.assertEqual(prepare_xls_content([]), [])
+    def test_export_parameters_no_data(self):
+        parameters = get_export_parameters(self.user, Admission.objects.none(), None)
+        self.assertEqual(list(parameters['rows']), [])
 
-    def test_generate_xls_data_with_an_archive(self):
+    def test_export_parameters_with_an_archive(self):
         a_form = ArchiveFilterForm({"faculty": self.entity_version.id})
         self.assertTrue(a_form.is_valid())
         found_archives = a_form.get_archives()
-        create_xls(self.user, found_archives, None)
+        parameters = get_export_parameters(
+            self.user, found_archives, a_form, ['last_name', 'first_name', 'email', 'formation', 'state']
+        )
 
-        xls_data = [[
-            self.admission.person_information.person.first_name,
+        self.assertEqual(parameters['user'], self.user)
+        self.assertEqual(parameters['description'], XLS_DESCRIPTION)
+        self.assertEqual(parameters['filename'], XLS_FILENAME)
+        self.assertEqual(parameters['worksheet_title'], WORKSHEET_TITLE)
+        self.assertEqual(
+            parameters['header_titles'],
+            [str(_('Name')), str(_('First name')), str(_('Email')), str(_('Formation')), str(_('State'))]
+        )
+        self.assertEqual(list(parameters['rows']), [[
             self.admission.person_information.person.last_name,
-            self.admission.email,
-            self.admission.formation,
-            self.entity_version.entity,
+            self.admission.person_information.person.first_name,
+            self.admission.person_information.person.email,
+            self.formation.acronym,
             _(SUBMITTED)
-        ]]
-
-        expected_argument = _generate_xls_build_parameter(xls_data, self.user)
-
-        self.assertEqual(expected_argument['list_description'], _('Archives list'))
-        self.assertEqual(expected_argument['filename'], _('Archives_list'))
-        self.assertEqual(expected_argument['username'], self.user.username)
-        self.assertEqual(expected_argument['data'][0]['content'], xls_data)
-        self.assertEqual(expected_argument['data'][0]['header_titles'], ARCHIVE_TITLES)
-        self.assertEqual(expected_argument['data'][0]['worksheet_title'], _('Archives list'))
-
-
-def _generate_xls_build_parameter(xls_data, user):
-    return {
-        xls_build.LIST_DESCRIPTION_KEY: XLS_DESCRIPTION,
-        xls_build.FILENAME_KEY: XLS_FILENAME,
-        xls_build.USER_KEY: user.username,
-        xls_build.WORKSHEETS_DATA: [{
-            xls_build.CONTENT_KEY: xls_data,
-            xls_build.HEADER_TITLES_KEY: ARCHIVE_TITLES,
-            xls_build.WORKSHEET_TITLE_KEY: WORKSHEET_TITLE,
-            xls_build.STYLED_CELLS: None,
-            xls_build.FONT_ROWS: None,
-        }]
-    }
+        ]])
@@ -0,0 +1,152 @@
+##############################################################################
+#
+#    OSIS stands for Open Student Information System. It's an application
+#    designed to manage the core business of higher education institutions,
+#    such as universities, faculties, institutes and professional schools.
+#    The core business involves the administration of students, teachers,
+#    courses, programs and so on.
+#
+#    Copyright (C) 2015-2022 Université catholique de Louvain (http://www.uclouvain.be)
+#
+#    This program is free software: you can redistribute it and/or modify
+#    it under the terms of the GNU General Public License as published by
+#    the Free Software Foundation, either version 3 of the License, or
+#    (at your option) any later version.
+#
+#    This program is distributed in the hope that it will be useful,
+#    but WITHOUT ANY WARRANTY; without even the implied warranty of
+#    MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+#    GNU General Public License for more details.
+#
+#    A copy of this license - GNU General Public License - is available
+#    at the root of the source code of this program.  If not,
+#    see http://www.gnu.org/licenses/.
+#
+##############################################################################
+import datetime
+
+from django.db import connection
+from django.test import TestCase
+from django.test.utils import CaptureQueriesContext
+from django.utils.translation import gettext_lazy as _
+
+from base.tests.factories.academic_year import create_current_academic_year
+from base.tests.factories.education_group import EducationGroupFactory
+from base.tests.factories.education_group_year import EducationGroupYearFactory
+from continuing_education.business.academic_year import clear_current_academic_year_cache
+from continuing_education.business.manager_contacts import clear_manager_contacts_cache
+from continuing_education.business.xls import xls_registration
+from continuing_education.business.xls.xls_columns import ADMISSION_COLUMNS, REGISTRATION_COLUMNS, \
+    iterate_column_rows, get_fields, get_headers
+from continuing_education.models.admission import Admission
+from continuing_education.models.enums.admission_state_choices import ACCEPTED
+from continuing_education.tests.factories.address import AddressFactory
+from continuing_education.tests.factories.admission import AdmissionFactory
+from continuing_education.tests.factories.continuing_education_training import ContinuingEducationTrainingFactory
+from continuing_education.tests.factories.person import ContinuingEducationPersonFactory
+from continuing_education.tests.factories.roles.continuing_education_training_manager import \
+    ContinuingEducationTrainingManagerFactory
+from reference.tests.factories.country import CountryFactory
+
+
+class TestColumnRegistry(TestCase):
+    def test_registration_columns_extend_admission_columns(self):
+        admission_headers = get_headers(ADMISSION_COLUMNS)
+        registration_headers = get_headers(REGISTRATION_COLUMNS)
+        self.assertEqual(registration_headers[:len(admission_headers)], admission_headers)
+        self.assertEqual(len(registration_headers), len(admission_headers) + 24)
+
+    def test_select_keeps_registry_order_and_ignores_unknown_names(self):
+        columns = ADMISSION_COLUMNS.select(['formation', 'unknown', 'last_name'])
+        self.assertEqual([column.name for column in columns], ['last_name', 'formation'])
+
+    def test_select_all_columns_when_nothing_is_selected(self):
+        self.assertEqual(ADMISSION_COLUMNS.select([]), list(ADMISSION_COLUMNS))
+
+    def test_fields_are_restricted_to_selected_columns(self):
+        columns = ADMISSION_COLUMNS.select(['email', 'formation', 'faculty'])
+        self.assertEqual(get_fields(columns), ['pk', 'person_information__person__email', 'formation'])
+
+
+class TestIterateColumnRows(TestCase):
+    @classmethod
+    def setUpTestData(cls):
+        education_group = EducationGroupFactory()
+        EducationGroupYearFactory(education_group=education_group, academic_year=create_current_academic_year())
+        cls.formation = ContinuingEducationTrainingFactory(education_group=education_group)
+        ContinuingEducationTrainingManagerFactory(training=cls.formation)
+        country = CountryFactory()
+        cls.address = AddressFactory(country=country)
+        cls.registration = AdmissionFactory(
+            formation=cls.formation,
+            state=ACCEPTED,
+            citizenship=country,
+            person_information=ContinuingEducationPersonFactory(birth_country=country,
+                                                                birth_date=datetime.date(1977, 4, 22)),
+            address=cls.address,
+            billing_address=cls.address,
+            residence_address=None,
+            awareness_press=True,
+            awareness_other='Radio',
+            payment_complete=False,
+        )
+
+    def test_formatted_values(self):
+        columns = REGISTRATION_COLUMNS.select([
+            'state', 'birth_date', 'address', 'residence_address', 'formation', 'formation_administrators',
+            'awareness', 'payment_complete'
+        ])
+        rows = list(iterate_column_rows(Admission.objects.all(), columns))
+        self.assertEqual([str(value) for value in rows[0]], [
+            str(_(ACCEPTED)),
+            '1977-04-22',
+            self.registration.complete_contact_address,
+            '',
+            self.formation.acronym,
+            self.formation.formation_administrators,
+            self.registration.awareness_list,
+            'No',
+        ])
+
+    def setUp(self):
+        clear_manager_contacts_cache([self.formation.pk])
+        clear_current_academic_year_cache()
+
+    def _count_export_queries(self, chunk_size):
+        clear_manager_contacts_cache([self.formation.pk])
+        with CaptureQueriesContext(connection) as context:
+            rows = list(iterate_column_rows(Admission.objects.all(), list(REGISTRATION_COLUMNS), chunk_size))
+        return len(rows), len(context.captured_queries)
+
+    def test_query_count_does_not_depend_on_rows_number(self):
+        AdmissionFactory.create_batch(9, formation=self.formation)
+        rows_number, queries_number = self._count_export_queries(chunk_size=100)
+        self.assertEqual(rows_number, 10)
+
+        AdmissionFactory.create_batch(
+            990, formation=self.formation, person_information=self.registration.person_information
+        )
+        self.assertEqual(self._count_export_queries(chunk_size=100), (1000, queries_number))
+
+    def test_only_selected_fields_are_fetched(self):
+        columns = ADMISSION_COLUMNS.select(['last_name', 'email'])
+        with self.assertNumQueries(1):
+            rows = list(iterate_column_rows(Admission.objects.all(), columns))
+        person = self.registration.person_information.person
+        self.assertEqual(rows, [[person.last_name, person.email]])
+
+    def test_distinct_queryset_keeps_rows_with_same_values(self):
+        AdmissionFactory(formation=self.formation, person_information=self.registration.person_information)
+        columns = ADMISSION_COLUMNS.select(['last_name'])
+        rows = list(iterate_column_rows(Admission.objects.all().distinct(), columns))
+        self.assertEqual(len(rows), 2)
+
+    def test_export_parameters_with_selected_columns(self):
+        parameters = xls_registration.get_export_parameters(
+            None, Admission.objects.all(), None, ['formation', 'payment_complete']
+        )
+        self.assertEqual(parameters['header_titles'], ['Formation', 'Payment complete'])
+        self.assertEqual(
+            [[str(value) for value in row] for row in parameters['rows']],
+            [[self.formation.acronym, 'No']]
+        )
@@ -30,8 +30,9 @@ from django.test import TestCase
 from base.tests.factories.academic_year import create_current_academic_year
 from base.tests.factories.education_group import EducationGroupFactory
 from base.tests.factories.education_group_year import EducationGroupYearFactory
-from continuing_education.business.xls.xls_common import extract_xls_data_from_admission, \
-    extract_xls_data_from_registration
+from continuing_education.business.xls.xls_columns import ADMISSION_COLUMNS, REGISTRATION_COLUMNS, \
+    iterate_column_rows
+from continuing_education.models.admission import Admission
 from continuing_education.models.enums.admission_state_choices import ACCEPTED
 from continuing_education.tests.factories.address import AddressFactory
 from continuing_education.tests.factories.admission import AdmissionFactory
@@ -77,13 +78,21 @@ class TestXlsCommon(TestCase):
             residence_address=cls.address
         )
 
+    def _extract_admission_row(self):
+        return next(iterate_column_rows(Admission.objects.filter(pk=self.registration.pk), list(ADMISSION_COLUMNS)))
+
+    def _extract_registration_row(self):
+        return next(
+            iterate_column_rows(Admission.objects.filter(pk=self.registration.pk), list(REGISTRATION_COLUMNS))
+        )
+
     def test_upper_in_country_city(self):
-        result = extract_xls_data_from_admission(self.registration)
+        result = self._extract_admission_row()
         self.assertEqual(result[5], COUNTRY_NAME.upper())
         self.assertEqual(result[7], CITY_NAME.upper())
         self.assertEqual(result[8], COUNTRY_NAME.upper())
 
-        result = extract_xls_data_from_registration(self.registration)
+        result = self._extract_registration_row()
         self.assertEqual(result[10], "{} - {} {} - {}".format(self.address.location, self.address.postal_code,
                                                               self.address.city.upper(), COUNTRY_NAME.upper()))
         self.assertEqual(result[36], "{} - {} {} - {}".format(self.address.location, self.address.postal_code,
@@ -92,15 +101,15 @@ class TestXlsCommon(TestCase):
                                                               self.address.city.upper(), COUNTRY_NAME.upper()))
 
     def test_birth_date(self):
-        result = extract_xls_data_from_admission(self.registration)
+        result = self._extract_admission_row()
         self.assertEqual(result[IDX_COL_BIRTHDATE], self.registration.person_information.birth_date)
 
-        result = extract_xls_data_from_registration(self.registration)
+        result = self._extract_registration_row()
         self.assertEqual(result[IDX_COL_BIRTHDATE], self.registration.person_information.birth_date)
 
     def test_email(self):
-        result = extract_xls_data_from_admission(self.registration)
+        result = self._extract_admission_row()
         self.assertEqual(result[IDX_COL_MAIL], self.registration.person_information.person.email)
 
-        result = extract_xls_data_from_registration(self.registration)
+        result = self._extract_registration_row()
         self.assertEqual(result[IDX_COL_MAIL], self.registration.person_information.person.email)
@@ -23,20 +23,34 @@
 #    see http://www.gnu.org/licenses/.
 #
 ##############################################################################
+import os
+import time
+from unittest import skipUnless
 
-from django.test import TestCase
+from django.db import connection
+from django.test import TestCase, tag
+from django.test.utils import CaptureQueriesContext
 from django.utils.translation import gettext_lazy as _
 
 from base.models.enums import entity_type
+from base.models.education_group import EducationGroup
 from base.tests.factories.academic_year import AcademicYearFactory
+from base.tests.factories.education_group_type import EducationGroupTypeFactory
 from base.tests.factories.education_group_year import EducationGroupYearFactory
 from base.tests.factories.entity_version import EntityVersionFactory
 from base.tests.factories.user import UserFactory
+from continuing_education.business.formation_catalog import refresh_formation_catalog
 from continuing_education.business.xls.xls_formation import _get_titles, XLS_DESCRIPTION, XLS_FILENAME, \
     WORKSHEET_TITLE, \
-    create_xls, prepare_xls_content
+    create_xls, prepare_xls_content, extract_xls_data_from_formation
+from continuing_education.models.continuing_education_training import CONTINUING_EDUCATION_TRAINING_TYPES
+from continuing_education.models.formation_catalog import FormationCatalog
+from continuing_education.templatetags.formation import get_faculty, get_most_recent_education_group, \
+    get_active_continuing_education_formation
 from continuing_education.forms.search import FormationFilterForm
 from continuing_education.tests.factories.continuing_education_training import ContinuingEducationTrainingFactory
+from continuing_education.tests.factories.roles.continuing_education_training_manager import \
+    ContinuingEducationTrainingManagerFactory
 from osis_common.document import xls_build
 
 ACRONYM = "ACRO"
@@ -60,6 +74,7 @@ class TestFormationXls(TestCase):
             education_group=cls.education_group_yr.education_group,
             active=True
         )
+        refresh_formation_catalog()
 
     def test_prepare_xls_content_no_data(self):
         self.assertEqual(prepare_xls_content([]), [])
@@ -86,6 +101,120 @@ class TestFormationXls(TestCase):
         self.assertEqual(expected_argument['data'][0]['header_titles'], _get_titles)
         self.assertEqual(expected_argument['data'][0]['worksheet_title'], _('Formations list'))
 
+    def test_formation_missing_from_catalog(self):
+        FormationCatalog.objects.filter(education_group=self.formation.education_group).delete()
+
+        rows = prepare_xls_content([self.formation.education_group])
+
+        self.assertEqual(rows[0][:4], [
+            ACRONYM,
+            self.entity_version.entity,
+            self.education_group_yr.title,
+            _('Active'),
+        ])
+
+
+class TestFormationXlsQueries(TestCase):
+    @classmethod
+    def setUpTestData(cls):
+        cls.academic_year = AcademicYearFactory(current=True)
+        cls.previous_academic_year = AcademicYearFactory(year=cls.academic_year.year - 1)
+        cls.faculty_version = EntityVersionFactory(entity_type=entity_type.FACULTY)
+        cls.school_version = EntityVersionFactory(entity_type=entity_type.SCHOOL, parent=cls.faculty_version.entity)
+        cls.education_group_type = EducationGroupTypeFactory(name=CONTINUING_EDUCATION_TRAINING_TYPES[0])
+
+    def _create_formations(self, number):
+        with self.captureOnCommitCallbacks(execute=True):
+            for index in range(number):
+                management_entity = self.faculty_version.entity if index % 2 else self.school_version.entity
+                old_education_group_year = EducationGroupYearFactory(
+                    academic_year=self.previous_academic_year,
+                    management_entity=management_entity,
+                    education_group_type=self.education_group_type
+                )
+                EducationGroupYearFactory(
+                    education_group=old_education_group_year.education_group,
+                    academic_year=self.academic_year,
+                    management_entity=management_entity,
+                    education_group_type=self.education_group_type
+                )
+                if index % 3:
+                    training = ContinuingEducationTrainingFactory(
+                        education_group=old_education_group_year.education_group,
+                        active=bool(index % 2)
+                    )
+                    ContinuingEducationTrainingManagerFactory(training=training)
+
+    def _count_export_queries(self):
+        with CaptureQueriesContext(connection) as context:
+            rows = prepare_xls_content(EducationGroup.objects.all())
+        return len(context.captured_queries), rows
+
+    def test_query_count_does_not_depend_on_formations_number(self):
+        self._create_formations(3)
+        queries_for_3_formations, rows = self._count_export_queries()
+        self.assertEqual(len(rows), 3)
+
+        self._create_formations(12)
+        queries_for_15_formations, rows = self._count_export_queries()
+        self.assertEqual(len(rows), 15)
+        self.assertEqual(queries_for_3_formations, queries_for_15_formations)
+
+    def test_same_content_as_per_formation_resolution(self):
+        self._create_formations(6)
+        for formation in EducationGroup.objects.all():
+            most_recent_education_group = get_most_recent_education_group(formation)
+            training = getattr(formation, 'continuingeducationtraining', None)
+            self.assertEqual(extract_xls_data_from_formation(formation), [
+                most_recent_education_group.acronym,
+                get_faculty(most_recent_education_group),
+                most_recent_education_group.title,
+                get_active_continuing_education_formation(formation),
+                _('Yes') if training and training.training_aid else _('No'),
+                _('Yes') if training and training.registration_required else _('No'),
+                training.formation_administrators if training else '',
+            ])
+
+
+@tag('benchmark')
+@skipUnless(os.environ.get('RUN_BENCHMARKS'), 'Benchmarks are only run when RUN_BENCHMARKS is set')
+class BenchmarkFormationXls(TestCase):
+    CATALOG_SIZE = 3000
+
+    @classmethod
+    def setUpTestData(cls):
+        academic_year = AcademicYearFactory(current=True)
+        management_entity = EntityVersionFactory(entity_type=entity_type.FACULTY).entity
+        education_group_type = EducationGroupTypeFactory(name=CONTINUING_EDUCATION_TRAINING_TYPES[0])
+        for index in range(cls.CATALOG_SIZE):
+            education_group_year = EducationGroupYearFactory(
+                academic_year=academic_year,
+                management_entity=management_entity,
+                education_group_type=education_group_type
+            )
+            if index % 2:
+                ContinuingEducationTrainingFactory(education_group=education_group_year.education_group)
+        refresh_formation_catalog()
+
+    def test_catalog_export(self):
+        formations = list(EducationGroup.objects.all())
+
+        start = time.perf_counter()
+        with CaptureQueriesContext(connection) as context:
+            rows = prepare_xls_content(formations)
+        batch_duration = time.perf_counter() - start
+
+        start = time.perf_counter()
+        for formation in formations:
+            most_recent_education_group = get_most_recent_education_group(formation)
+            get_faculty(most_recent_education_group)
+            get_active_continuing_education_formation(formation)
+        per_formation_duration = time.perf_counter() - start
+
+        self.assertEqual(len(rows), self.CATALOG_SIZE)
+        self.assertLessEqual(len(context.captured_queries), 5)
+        self.assertLess(batch_duration, per_formation_duration)
+
 
 def _generate_xls_build_parameter(xls_data, user):
     return {
@@ -32,13 +32,14 @@ from base.tests.factories.education_group import EducationGroupFactory
 from base.tests.factories.education_group_year import EducationGroupYearFactory
 from base.tests.factories.entity_version import EntityVersionFactory
 from base.tests.factories.user import UserFactory
-from continuing_education.business.xls.xls_registration import _get_titles, XLS_DESCRIPTION, XLS_FILENAME, \
-    WORKSHEET_TITLE, create_xls_registration, prepare_xls_content
+from continuing_education.business.xls.xls_columns import REGISTRATION_COLUMNS, get_headers
+from continuing_education.business.xls.xls_registration import XLS_DESCRIPTION, XLS_FILENAME, \
+    WORKSHEET_TITLE, get_export_parameters
 from continuing_education.forms.search import RegistrationFilterForm
+from continuing_education.models.admission import Admission
 from continuing_education.models.enums.admission_state_choices import ACCEPTED
 from continuing_education.tests.factories.admission import AdmissionFactory
 from continuing_education.tests.factories.continuing_education_training import ContinuingEducationTrainingFactory
-from osis_common.document import xls_build
 
 FACULTY_ACRONYM = "AGRO"
 
@@ -71,46 +72,33 @@ class TestRegistrationXls(TestCase):
             payment_complete=False,
         )
 
-    def test_prepare_xls_content_no_data(self):
-        self.assertEqual(prepare_xls_content([]), [])
+    def test_export_parameters_no_data(self):
+        parameters = get_export_parameters(self.user, Admission.objects.none(), None)
+        self.assertEqual(list(parameters['rows']), [])
 
-    def test_generate_xls_data_with_an_admission(self):
+    def test_export_parameters_with_a_registration(self):
         a_form = RegistrationFilterForm({"faculty": self.entity_version.id})
         self.assertTrue(a_form.is_valid())
         found_registrations = a_form.get_registrations()
-        create_xls_registration(self.user, found_registrations, None)
+        parameters = get_export_parameters(
+            self.user, found_registrations, a_form, ['email', 'ucl_registration_complete', 'payment_complete']
+        )
 
-        xls_data = [[
-            self.registration.person_information.person.first_name,
-            self.registration.person_information.person.last_name,
-            self.registration.email,
-            self.registration.formation,
-            self.entity_version.entity,
+        self.assertEqual(parameters['user'], self.user)
+        self.assertEqual(parameters['description'], XLS_DESCRIPTION)
+        self.assertEqual(parameters['filename'], XLS_FILENAME)
+        self.assertEqual(parameters['worksheet_title'], WORKSHEET_TITLE)
+        self.assertEqual(
+            parameters['header_titles'],
+            [str(_('Email')), str(_('UCLouvain registration complete')), str(_('Payment complete'))]
+        )
+        self.assertEqual(list(parameters['rows']), [[
+            self.registration.person_information.person.email,
             _('Yes'),
             _('No'),
-            self.registration.state
-        ]]
-
-        expected_argument = _generate_xls_build_parameter(xls_data, self.user)
-
-        self.assertEqual(expected_argument['list_description'], _('Registrations list'))
-        self.assertEqual(expected_argument['filename'], _('Registrations_list'))
-        self.assertEqual(expected_argument['username'], self.user.username)
-        self.assertEqual(expected_argument['data'][0]['content'], xls_data)
-        self.assertEqual(expected_argument['data'][0]['header_titles'], _get_titles())
-        self.assertEqual(expected_argument['data'][0]['worksheet_title'], _('Registrations list'))
-
+        ]])
 
-def _generate_xls_build_parameter(xls_data, user):
-    return {
-        xls_build.LIST_DESCRIPTION_KEY: XLS_DESCRIPTION,
-        xls_build.FILENAME_KEY: XLS_FILENAME,
-        xls_build.USER_KEY: user.username,
-        xls_build.WORKSHEETS_DATA: [{
-            xls_build.CONTENT_KEY: xls_data,
-            xls_build.HEADER_TITLES_KEY: _get_titles(),
-            xls_build.WORKSHEET_TITLE_KEY: WORKSHEET_TITLE,
-            xls_build.STYLED_CELLS: None,
-            xls_build.FONT_ROWS: None,
-        }]
-    }
+    def test_export_parameters_with_all_columns(self):
+        parameters = get_export_parameters(self.user, Admission.objects.filter(pk=self.registration.pk), None)
+        self.assertEqual(parameters['header_titles'], get_headers(REGISTRATION_COLUMNS))
+        self.assertEqual(len(list(parameters['rows'])[0]), len(parameters['header_titles']))
@@ -0,0 +1,148 @@
+##############################################################################
+#
+#    OSIS stands for Open Student Information System. It's an application
+#    designed to manage the core business of higher education institutions,
+#    such as universities, faculties, institutes and professional schools.
+#    The core business involves the administration of students, teachers,
+#    courses, programs and so on.
+#
+#    Copyright (C) 2015-2022 Université catholique de Louvain (http://www.uclouvain.be)
+#
+#    This program is free software: you can redistribute it and/or modify
+#    it under the terms of the GNU General Public License as published by
+#    the Free Software Foundation, either version 3 of the License, or
+#    (at your option) any later version.
+#
+#    This program is distributed in the hope that it will be useful,
+#    but WITHOUT ANY WARRANTY; without even the implied warranty of
+#    MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+#    GNU General Public License for more details.
+#
+#    A copy of this license - GNU General Public License - is available
+#    at the root of the source code of this program.  If not,
+#    see http://www.gnu.org/licenses/.
+#
+##############################################################################
+from concurrent.futures import Future
+from unittest import mock
+
+from django.test import TestCase
+from django.utils import translation
+
+from base.tests.factories.academic_year import create_current_academic_year
+from base.tests.factories.education_group import EducationGroupFactory
+from base.tests.factories.education_group_year import EducationGroupYearFactory
+from continuing_education.business.search_document import search_admissions
+from continuing_education.business.xls import xls_registration_by_formation
+from continuing_education.business.xls.xls_columns import REGISTRATION_COLUMNS, iterate_column_rows
+from continuing_education.business.xls.xls_registration_by_formation import build_sheets, build_sheet_rows
+from continuing_education.business.xls.xls_streaming import _to_cell_value
+from continuing_education.models.admission import Admission
+from continuing_education.models.enums.admission_state_choices import ACCEPTED
+from continuing_education.tests.factories.admission import AdmissionFactory
+from continuing_education.tests.factories.continuing_education_training import ContinuingEducationTrainingFactory
+
+
+class FakeProcessPoolExecutor:
+    def __init__(self, *args, **kwargs):
+        pass
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *args):
+        return False
+
+    def submit(self, function, *args):
+        future = Future()
+        future.set_result(function(*args))
+        return future
+
+
+class TestXlsRegistrationByFormation(TestCase):
+    @classmethod
+    def setUpTestData(cls):
+        academic_year = create_current_academic_year()
+        cls.registrations_by_acronym = {}
+        for acronym, number in [('ZZZ2MC', 2), ('AAA2FC', 3)]:
+            education_group = EducationGroupFactory()
+            EducationGroupYearFactory(education_group=education_group, academic_year=academic_year, acronym=acronym)
+            formation = ContinuingEducationTrainingFactory(education_group=education_group)
+            cls.registrations_by_acronym[acronym] = AdmissionFactory.create_batch(
+                number, formation=formation, state=ACCEPTED
+            )
+
+    def test_one_sheet_per_formation_ordered_by_acronym(self):
+        sheets = list(build_sheets(Admission.objects.all(), workers=1))
+
+        self.assertEqual([title for title, rows in sheets], ['AAA2FC', 'ZZZ2MC'])
+        self.assertEqual([len(rows) for title, rows in sheets], [3, 2])
+
+    def test_sheets_built_by_process_pool(self):
+        with mock.patch.object(
+                xls_registration_by_formation, 'ProcessPoolExecutor', side_effect=FakeProcessPoolExecutor
+        ) as mock_executor:
+            sheets = list(build_sheets(Admission.objects.all(), ['email'], workers=4))
+
+        self.assertEqual(mock_executor.call_args[1]['max_workers'], 2)
+        self.assertEqual(mock_executor.call_args[1]['mp_context'].get_start_method(), 'spawn')
+        self.assertEqual(sheets, list(build_sheets(Admission.objects.all(), ['email'], workers=1)))
+
+    def test_sheets_submitted_with_a_bounded_window(self):
+        academic_year = create_current_academic_year()
+        for acronym in ['BBB2FC', 'CCC2FC']:
+            education_group = EducationGroupFactory()
+            EducationGroupYearFactory(education_group=education_group, academic_year=academic_year, acronym=acronym)
+            AdmissionFactory(formation=ContinuingEducationTrainingFactory(education_group=education_group))
+        submitted = []
+
+        class RecordingProcessPoolExecutor(FakeProcessPoolExecutor):
+            def submit(self, function, *args):
+                submitted.append(args)
+                return super().submit(function, *args)
+
+        with mock.patch.object(
+                xls_registration_by_formation, 'ProcessPoolExecutor', side_effect=RecordingProcessPoolExecutor
+        ):
+            sheets = build_sheets(Admission.objects.all(), ['email'], workers=2)
+            title, rows = next(sheets)
+            self.assertEqual(title, 'AAA2FC')
+            self.assertEqual(len(submitted), 3)
+            self.assertEqual(len(list(sheets)), 3)
+        self.assertEqual(len(submitted), 4)
+
+    def test_build_sheet_rows_in_given_language(self):
+        with mock.patch.object(
+                xls_registration_by_formation, 'iterate_column_rows',
+                side_effect=lambda registrations, columns: [[translation.get_language()]]
+        ):
+            with translation.override('en'):
+                rows = build_sheet_rows([], language='fr-be')
+        self.assertEqual(rows, [['fr-be']])
+
+    def test_build_sheet_rows(self):
+        registrations = self.registrations_by_acronym['ZZZ2MC']
+        rows = build_sheet_rows(sorted(registration.pk for registration in registrations))
+
+        self.assertEqual(rows, [
+            [_to_cell_value(value) for value in row]
+            for row in iterate_column_rows(
+                Admission.objects.filter(pk__in=[registration.pk for registration in registrations]).order_by('pk'),
+                list(REGISTRATION_COLUMNS)
+            )
+        ])
+
+    def test_build_sheet_rows_with_selected_columns(self):
+        registrations = sorted(self.registrations_by_acronym['ZZZ2MC'], key=lambda registration: -registration.pk)
+        rows = build_sheet_rows([registration.pk for registration in registrations], ['email'])
+
+        self.assertEqual(rows, [[registration.person_information.person.email] for registration in registrations])
+
+    def test_sheets_keep_the_free_text_search_order(self):
+        registrations_list = search_admissions('ZZZ2MC', Admission.objects.all())
+
+        sheets = list(build_sheets(registrations_list, ['email'], workers=1))
+
+        self.assertEqual(sheets, [
+            ('ZZZ2MC', [[registration.person_information.person.email] for registration in registrations_list])
+        ])
@@ -0,0 +1,91 @@
+##############################################################################
+#
+#    OSIS stands for Open Student Information System. It's an application
+#    designed to manage the core business of higher education institutions,
+#    such as universities, faculties, institutes and professional schools.
+#    The core business involves the administration of students, teachers,
+#    courses, programs and so on.
+#
+#    Copyright (C) 2015-2022 Université catholique de Louvain (http://www.uclouvain.be)
+#
+#    This program is free software: you can redistribute it and/or modify
+#    it under the terms of the GNU General Public License as published by
+#    the Free Software Foundation, either version 3 of the License, or
+#    (at your option) any later version.
+#
+#    This program is distributed in the hope that it will be useful,
+#    but WITHOUT ANY WARRANTY; without even the implied warranty of
+#    MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+#    GNU General Public License for more details.
+#
+#    A copy of this license - GNU General Public License - is available
+#    at the root of the source code of this program.  If not,
+#    see http://www.gnu.org/licenses/.
+#
+##############################################################################
+import io
+
+from django.test import TestCase
+from openpyxl import load_workbook
+
+from base.tests.factories.academic_year import create_current_academic_year
+from base.tests.factories.education_group import EducationGroupFactory
+from base.tests.factories.education_group_year import EducationGroupYearFactory
+from base.tests.factories.user import UserFactory
+from continuing_education.business.xls.xls_columns import ADMISSION_COLUMNS, iterate_column_rows, get_headers
+from continuing_education.business.xls.xls_streaming import write_xls, write_xls_sheets
+from continuing_education.models.admission import Admission
+from continuing_education.tests.factories.admission import AdmissionFactory
+from continuing_education.tests.factories.continuing_education_training import ContinuingEducationTrainingFactory
+
+
+class TestXlsStreaming(TestCase):
+    @classmethod
+    def setUpTestData(cls):
+        cls.user = UserFactory()
+        cls.education_group = EducationGroupFactory()
+        EducationGroupYearFactory(
+            education_group=cls.education_group,
+            academic_year=create_current_academic_year()
+        )
+        cls.formation = ContinuingEducationTrainingFactory(education_group=cls.education_group)
+        cls.admissions = AdmissionFactory.create_batch(5, formation=cls.formation)
+
+    def test_write_xls(self):
+        queryset = Admission.objects.filter(formation=self.formation)
+        columns = list(ADMISSION_COLUMNS)
+        output = io.BytesIO()
+        write_xls(
+            output,
+            user=self.user,
+            rows=iterate_column_rows(queryset, columns, chunk_size=2),
+            header_titles=get_headers(columns),
+            description='Admissions list',
+            worksheet_title='Admissions list',
+            filters={'Faculty': 'AGRO'}
+        )
+
+        workbook = load_workbook(output)
+        worksheet = workbook['Admissions list']
+        rows = list(worksheet.values)
+        self.assertEqual(list(rows[0]), get_headers(columns))
+        self.assertEqual(len(rows), len(self.admissions) + 1)
+        self.assertEqual(
+            sorted(row[2] for row in rows[1:]),
+            sorted(admission.person_information.person.email for admission in self.admissions)
+        )
+        self.assertIn('Parameters', workbook.sheetnames)
+
+    def test_write_xls_sheets_with_unique_titles(self):
+        output = io.BytesIO()
+        write_xls_sheets(
+            output,
+            user=self.user,
+            sheets=[('CERT/AGRO', [['a']]), ('CERT/AGRO', [['b'], ['c']])],
+            header_titles=['Header'],
+            description='Registrations list by formation',
+        )
+
+        workbook = load_workbook(output)
+        self.assertEqual(workbook.sheetnames, ['CERT-AGRO', 'CERT-AGRO (2)', 'Parameters'])
+        self.assertEqual(list(workbook['CERT-AGRO (2)'].values), [('Header',), ('b',), ('c',)])
@@ -33,12 +33,14 @@ from django.utils import timezone
 from django.utils.translation import pgettext_lazy, gettext as _
 
 from backoffice.settings.base import INSTALLED_APPS
+from base.models.education_group import EducationGroup
 from base.models.enums.entity_type import FACULTY, SCHOOL
 from base.tests.factories.academic_year import create_current_academic_year, AcademicYearFactory
 from base.tests.factories.education_group import EducationGroupFactory
 from base.tests.factories.education_group_type import EducationGroupTypeFactory
 from base.tests.factories.education_group_year import EducationGroupYearFactory
 from base.tests.factories.entity_version import EntityVersionFactory
+from continuing_education.business.formation_catalog import refresh_formation_catalog
 from continuing_education.forms.search import ADMISSION_STATE_CHOICES
 from continuing_education.forms.search import AdmissionFilterForm, RegistrationFilterForm, FormationFilterForm, \
     ArchiveFilterForm, ALL_CHOICE, ACTIVE, INACTIVE, FORMATION_STATE_CHOICES, NOT_ORGANIZED, ManagerFilterForm, \
@@ -579,6 +581,7 @@ class TestFormationFilterForm(TestCase):
             management_entity=similar_entity_version.entity,
             academic_year=cls.academic_year
         )
+        refresh_formation_catalog()
 
     def test_get_state_choices(self):
         form = FormationFilterForm(data={})
@@ -612,18 +615,19 @@ class TestFormationFilterForm(TestCase):
                                           self.education_group_yr_not_organized.education_group])
 
     def test_formation_filter_by_free_text(self):
-        iufc_education_group_yr_testtext_in_acronym = EducationGroupYearFactory(
-            acronym="TestText",
-            education_group_type=self.continuing_education_group_type,
-            management_entity=self.entity_version.entity,
-            academic_year=self.academic_year
-        )
-        iufc_education_group_yr_testtext_in_title = EducationGroupYearFactory(
-            education_group_type=self.continuing_education_group_type,
-            title='TestText',
-            management_entity=self.entity_version.entity,
-            academic_year=self.academic_year
-        )
+        with self.captureOnCommitCallbacks(execute=True):
+            iufc_education_group_yr_testtext_in_acronym = EducationGroupYearFactory(
+                acronym="TestText",
+                education_group_type=self.continuing_education_group_type,
+                management_entity=self.entity_version.entity,
+                academic_year=self.academic_year
+            )
+            iufc_education_group_yr_testtext_in_title = EducationGroupYearFactory(
+                education_group_type=self.continuing_education_group_type,
+                title='TestText',
+                management_entity=self.entity_version.entity,
+                academic_year=self.academic_year
+            )
         self._assert_results_count_equal({'free_text': "testtext"},
                                          [iufc_education_group_yr_testtext_in_acronym.education_group,
                                           iufc_education_group_yr_testtext_in_title.education_group])
@@ -700,3 +704,78 @@ def create_entity_version(an_acronym):
                                           end_date=None,
                                           start_date=start_date)
     return entity_version
+
+
+class TestExistsSubqueryFilters(TestCase):
+    @classmethod
+    def setUpTestData(cls):
+        cls.current_academic_yr = create_current_academic_year()
+        previous_academic_yr = AcademicYearFactory(year=cls.current_academic_yr.year - 1)
+        cls.faculty = create_entity_version("FACEXISTS")
+        cls.education_group_type = EducationGroupTypeFactory(name=CONTINUING_EDUCATION_TRAINING_TYPES[0])
+        cls.formations = []
+        for acronym in ['EXISTS1', 'EXISTS2']:
+            education_group = EducationGroupFactory()
+            for academic_year in [previous_academic_yr, cls.current_academic_yr]:
+                # Several years per education group, which would multiply the rows of a join
+                EducationGroupYearFactory(
+                    education_group=education_group,
+                    academic_year=academic_year,
+                    acronym=acronym,
+                    title='Title {}'.format(acronym),
+                    management_entity=cls.faculty.entity,
+                    education_group_type=cls.education_group_type,
+                )
+            cls.formations.append(ContinuingEducationTrainingFactory(education_group=education_group))
+        cls.admissions = [
+            AdmissionFactory(formation=formation, state=SUBMITTED)
+            for formation in cls.formations
+            for _ in range(2)
+        ]
+        AdmissionFactory(state=SUBMITTED)
+        refresh_formation_catalog()
+
+    def _assert_no_deduplication(self, qs, legacy_qs):
+        self.assertCountEqual(list(qs), list(legacy_qs))
+        self.assertEqual(qs.count(), len(list(legacy_qs)))
+        self.assertIn('EXISTS', str(qs.query))
+
+        plan = qs.explain()
+        legacy_plan = legacy_qs.explain()
+        self.assertTrue('Unique' in legacy_plan or 'HashAggregate' in legacy_plan)
+        self.assertNotIn('Unique', plan)
+        self.assertNotIn('HashAggregate', plan)
+
+    def test_admissions_by_faculty(self):
+        form = AdmissionFilterForm({'faculty': self.faculty.id})
+        self.assertTrue(form.is_valid())
+        legacy_qs = Admission.objects.filter(
+            formation__education_group__educationgroupyear__management_entity=self.faculty.entity,
+            state__in=STATE_TO_DISPLAY,
+            archived=False,
+        ).distinct()
+
+        self.assertCountEqual(form.get_admissions(), self.admissions)
+        self._assert_no_deduplication(form.get_admissions().order_by('pk'), legacy_qs.order_by('pk'))
+
+    def test_formations_by_acronym_title_and_faculty(self):
+        form = FormationFilterForm({'acronym': 'EXISTS', 'title': 'Title', 'faculty': self.faculty.id})
+        self.assertTrue(form.is_valid())
+        legacy_qs = EducationGroup.objects.filter(
+            educationgroupyear__education_group_type__name__in=CONTINUING_EDUCATION_TRAINING_TYPES,
+        ).filter(
+            educationgroupyear__management_entity=self.faculty.entity
+        ).filter(
+            educationgroupyear__acronym__icontains='EXISTS'
+        ).filter(
+            educationgroupyear__title__icontains='Title'
+        ).distinct()
+
+        results = form.get_formations()
+        self.assertListEqual(list(results), [formation.education_group for formation in self.formations])
+        # Served from the formation catalog: one row per education group, nothing to deduplicate
+        self.assertCountEqual(list(results), list(legacy_qs))
+        plan = results.explain()
+        self.assertIn('formation_catalog', str(results.query))
+        self.assertNotIn('Unique', plan)
+        self.assertNotIn('HashAggregate', plan)
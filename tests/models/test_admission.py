@@ -38,6 +38,7 @@ from base.tests.factories.entity_version import EntityVersionFactory
 from continuing_education.models import admission
 from continuing_education.models.admission import Admission
 from continuing_education.models.enums import admission_state_choices
+from continuing_education.models.enums.awareness_channel import AwarenessChannel, AWARENESS_BITS
 from continuing_education.tests.factories.admission import AdmissionFactory
 from continuing_education.tests.factories.continuing_education_training import ContinuingEducationTrainingFactory
 from continuing_education.tests.factories.iufc_person import IUFCPersonFactory as PersonFactory
@@ -154,3 +155,13 @@ class TestAdmissionGetProperties(TestCase):
         self.admission.awareness_other = ''
         self.admission.save()
         self.assertEqual(self.admission.awareness_list, "{}".format(_("By Facebook")))
+
+    def test_awareness_booleans_stored_in_channels_bits(self):
+        self.assertEqual(self.admission.awareness_channels, AWARENESS_BITS[AwarenessChannel.FACEBOOK])
+        self.admission.awareness_moocs = True
+        self.admission.awareness_facebook = False
+        self.admission.save()
+        self.admission.refresh_from_db()
+        self.assertTrue(self.admission.awareness_moocs)
+        self.assertFalse(self.admission.awareness_facebook)
+        self.assertEqual(self.admission.awareness_channels, AWARENESS_BITS[AwarenessChannel.MOOCS])
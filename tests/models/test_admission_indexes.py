@@ -0,0 +1,140 @@
+##############################################################################
+#
+#    OSIS stands for Open Student Information System. It's an application
+#    designed to manage the core business of higher education institutions,
+#    such as universities, faculties, institutes and professional schools.
+#    The core business involves the administration of students, teachers,
+#    courses, programs and so on.
+#
+#    Copyright (C) 2015-2022 Université catholique de Louvain (http://www.uclouvain.be)
+#
+#    This program is free software: you can redistribute it and/or modify
+#    it under the terms of the GNU General Public License as published by
+#    the Free Software Foundation, either version 3 of the License, or
+#    (at your option) any later version.
+#
+#    This program is distributed in the hope that it will be useful,
+#    but WITHOUT ANY WARRANTY; without even the implied warranty of
+#    MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+#    GNU General Public License for more details.
+#
+#    A copy of this license - GNU General Public License - is available
+#    at the root of the source code of this program.  If not,
+#    see http://www.gnu.org/licenses/.
+#
+##############################################################################
+import itertools
+import uuid
+
+from django.db import connection
+from django.test import TestCase
+
+from continuing_education.forms.search import get_queryset_by_faculty_formation
+from continuing_education.models.admission import Admission, filter_authorized_admissions
+from continuing_education.models.enums import admission_state_choices
+from continuing_education.tests.factories.admission import AdmissionFactory
+from continuing_education.tests.factories.continuing_education_training import ContinuingEducationTrainingFactory
+from continuing_education.tests.factories.roles.continuing_education_training_manager import \
+    ContinuingEducationTrainingManagerFactory
+
+SEEDED_ADMISSIONS_NUMBER = 2000
+SEQUENTIAL_SCAN = 'Seq Scan on {}'.format(Admission._meta.db_table)
+
+
+class TestAdmissionQueryPlans(TestCase):
+    """
+    The hot admission filters must be answered by an index. Sequential scans are disabled so that the planner
+    only falls back to one when no index supports the query, whatever the size of the seeded dataset.
+    """
+
+    @classmethod
+    def setUpTestData(cls):
+        cls.formations = ContinuingEducationTrainingFactory.create_batch(5)
+        cls.training_manager = ContinuingEducationTrainingManagerFactory(training=cls.formations[0])
+        model_admission = AdmissionFactory(formation=cls.formations[0])
+        states = itertools.cycle(state for state, label in admission_state_choices.STATE_CHOICES)
+        admissions = []
+        for index in range(SEEDED_ADMISSIONS_NUMBER):
+            admission = Admission.objects.get(pk=model_admission.pk)
+            admission.pk = None
+            admission.uuid = uuid.uuid4()
+            admission.formation = cls.formations[index % len(cls.formations)]
+            admission.state = next(states)
+            admission.archived = index % 7 == 0
+            admission.registration_file_received = index % 3 == 0
+            admission.diploma_produced = index % 5 == 0
+            admission.payment_complete = index % 2 == 0
+            admission.assessment_succeeded = index % 4 != 0
+            admissions.append(admission)
+        Admission.objects.bulk_create(admissions, batch_size=500)
+        with connection.cursor() as cursor:
+            cursor.execute('ANALYZE {}'.format(Admission._meta.db_table))
+
+    def setUp(self):
+        with connection.cursor() as cursor:
+            cursor.execute('SET LOCAL enable_seqscan = off')
+
+    def assertIndexScan(self, queryset, index_name):
+        plan = queryset.explain()
+        self.assertNotIn(SEQUENTIAL_SCAN, plan, plan)
+        self.assertIn(index_name, plan, plan)
+
+    def test_registrations_to_validate(self):
+        self.assertIndexScan(Admission.objects.filter(
+            state=admission_state_choices.REGISTRATION_SUBMITTED,
+            registration_file_received=False
+        ).formations(), 'admission_registration_todo')
+
+    def test_admissions_to_accept(self):
+        self.assertIndexScan(Admission.objects.filter(
+            state__in=[admission_state_choices.SUBMITTED, admission_state_choices.WAITING]
+        ).formations(), 'admission_to_accept')
+
+    def test_diplomas_to_produce(self):
+        self.assertIndexScan(Admission.objects.filter(
+            diploma_produced=False,
+            ucl_registration_complete=True,
+            payment_complete=True,
+            assessment_succeeded=True,
+            state=admission_state_choices.VALIDATED
+        ), 'admission_diploma_todo')
+
+    def test_search_by_states(self):
+        self.assertIndexScan(get_queryset_by_faculty_formation(
+            None,
+            None,
+            [admission_state_choices.ACCEPTED, admission_state_choices.REJECTED],
+            archived_status=False,
+        ), 'admission_live_state')
+
+    def test_search_archives_by_states(self):
+        self.assertIndexScan(get_queryset_by_faculty_formation(
+            None,
+            None,
+            [admission_state_choices.ACCEPTED, admission_state_choices.REJECTED],
+            archived_status=True,
+        ), 'admission_archive_state')
+
+    def test_search_by_formation(self):
+        self.assertIndexScan(get_queryset_by_faculty_formation(
+            None,
+            self.formations[1],
+            admission_state_choices.REGISTRATION_SUBMITTED,
+            archived_status=False,
+            received_file=True,
+        ), 'admission_formation_state')
+
+    def test_authorized_admissions(self):
+        self.assertIndexScan(
+            filter_authorized_admissions(self.training_manager.person.user, Admission.objects.all()),
+            'admission_formation_state'
+        )
+
+    def test_authorized_registrations_to_validate(self):
+        self.assertIndexScan(filter_authorized_admissions(
+            self.training_manager.person.user,
+            Admission.objects.filter(
+                state=admission_state_choices.REGISTRATION_SUBMITTED,
+                registration_file_received=False
+            )
+        ), 'admission_registration_todo')
@@ -48,6 +48,11 @@ from base.tests.factories.education_group_year import EducationGroupYearFactory
 from base.tests.factories.entity_version import EntityVersionFactory
 from base.tests.factories.person import PersonWithPermissionsFactory
 from continuing_education.business.enums.rejected_reason import DONT_MEET_ADMISSION_REQUIREMENTS
+from continuing_education.business.formation_catalog import refresh_formation_catalog
+from continuing_education.business.revision import (
+    get_versions, save_and_create_revision, VERSION_MESSAGES,
+    get_revision_messages,
+)
 from continuing_education.models.admission import Admission
 from continuing_education.models.continuing_education_person import ContinuingEducationPerson
 from continuing_education.models.enums import file_category_choices, admission_state_choices
@@ -64,10 +69,6 @@ from continuing_education.tests.factories.roles.continuing_education_manager imp
 from continuing_education.tests.factories.roles.continuing_education_training_manager import \
     ContinuingEducationTrainingManagerFactory
 from continuing_education.views.admission import admission_detail
-from continuing_education.views.common import (
-    get_versions, save_and_create_revision, VERSION_MESSAGES,
-    get_revision_messages,
-)
 from reference.tests.factories.country import CountryFactory
 
 FILE_CONTENT = "test-content"
@@ -132,6 +133,7 @@ class ViewAdmissionTestCase(TestCase):
             'birth_location': cls.admission.person_information.birth_location,
             'birth_country': cls.admission.person_information.birth_country.id,
         }
+        refresh_formation_catalog()
 
     def setUp(self):
         self.client.force_login(self.manager.person.user)
@@ -143,6 +145,23 @@ class ViewAdmissionTestCase(TestCase):
         self.assertTemplateUsed(response, 'continuing_education/admissions.html')
         self.assertEqual(len(response.context['admissions'].object_list), 2)
 
+    def test_admission_facets(self):
+        response = self.client.get(reverse('admission_facets'), HTTP_X_REQUESTED_WITH='XMLHttpRequest')
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        facets = response.json()
+        self.assertEqual(facets['state'], {SUBMITTED: 1, ACCEPTED_NO_REGISTRATION_REQUIRED: 1})
+        self.assertEqual(
+            facets['formation'],
+            {str(self.formation.pk): 1, str(self.formation_no_registration_required.pk): 1}
+        )
+
+    def test_admission_facets_scoped_by_training_manager(self):
+        self.client.force_login(self.training_manager.person.user)
+        response = self.client.get(
+            reverse('admission_facets'), data={'state': SUBMITTED}, HTTP_X_REQUESTED_WITH='XMLHttpRequest'
+        )
+        self.assertEqual(response.json()['formation'], {str(self.formation.pk): 1})
+
     def test_list_admissions_filtered_by_training_manager_with_no_admission(self):
         other_training_manager = ContinuingEducationTrainingManagerFactory()
         self.client.force_login(other_training_manager.person.user)
@@ -167,6 +186,13 @@ class ViewAdmissionTestCase(TestCase):
         self.assertEqual(response.status_code, status.HTTP_200_OK)
         self.assertTemplateUsed(response, 'continuing_education/admissions.html')
 
+    def test_list_admissions_invalid_cursor_returns_first_page(self):
+        url = reverse('admission')
+        response = self.client.get(url, {'cursor': 'invalid', 'direction': 'next'})
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        self.assertEqual(len(response.context['admissions'].object_list), 2)
+        self.assertFalse(response.context['admissions'].has_previous)
+
     def test_admission_detail(self):
         url = reverse('admission_detail', args=[self.admission.id])
         response = self.client.get(url)
@@ -190,6 +190,13 @@ class ViewArchiveTestCase(TestCase):
         self.assertEqual(msg[0], "{} {}".format(_('File is now'),
                                                 _('archived')))
 
+    def test_archive_procedure_non_numeric_id(self):
+        response = self.client.post(reverse('archives_procedure'),
+                                    data={"selected_action": [str(self.registration_1_unarchived.id), 'abc']})
+        self.assertEqual(response.status_code, HttpResponseForbidden.status_code)
+        self.registration_1_unarchived.refresh_from_db()
+        self.assertFalse(self.registration_1_unarchived.archived)
+
     def test_list(self):
         response = self.client.post(reverse('archive'))
         self.assertEqual(response.status_code, 200)
@@ -0,0 +1,83 @@
+##############################################################################
+#
+#    OSIS stands for Open Student Information System. It's an application
+#    designed to manage the core business of higher education institutions,
+#    such as universities, faculties, institutes and professional schools.
+#    The core business involves the administration of students, teachers,
+#    courses, programs and so on.
+#
+#    Copyright (C) 2015-2022 Université catholique de Louvain (http://www.uclouvain.be)
+#
+#    This program is free software: you can redistribute it and/or modify
+#    it under the terms of the GNU General Public License as published by
+#    the Free Software Foundation, either version 3 of the License, or
+#    (at your option) any later version.
+#
+#    This program is distributed in the hope that it will be useful,
+#    but WITHOUT ANY WARRANTY; without even the implied warranty of
+#    MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+#    GNU General Public License for more details.
+#
+#    A copy of this license - GNU General Public License - is available
+#    at the root of the source code of this program.  If not,
+#    see http://www.gnu.org/licenses/.
+#
+##############################################################################
+from unittest import mock
+
+from django.test import TestCase
+from django.urls import reverse
+
+from base.tests.factories.user import UserFactory
+from continuing_education.models.enums.export_job_choices import ExportJobKind, ExportJobState
+from continuing_education.models.export_job import ExportJob
+from continuing_education.tests.factories.roles.continuing_education_manager import ContinuingEducationManagerFactory
+
+
+class ViewExportJobTestCase(TestCase):
+    @classmethod
+    def setUpTestData(cls):
+        cls.manager = ContinuingEducationManagerFactory()
+        cls.user = cls.manager.person.user
+        cls.job = ExportJob.objects.create(user=cls.user, kind=ExportJobKind.REGISTRATIONS.name)
+
+    def setUp(self):
+        self.client.force_login(self.user)
+
+    @mock.patch('continuing_education.business.export_job.SYNCHRONOUS_EXPORT_LIMIT', 0)
+    def test_xls_export_creates_job_and_redirects(self):
+        with mock.patch('continuing_education.business.background.get_executor'):
+            response = self.client.get(reverse('registration'), data={'xls_status': 'xls_registrations'})
+
+        job = ExportJob.objects.exclude(pk=self.job.pk).get()
+        self.assertEqual(job.kind, ExportJobKind.REGISTRATIONS.name)
+        self.assertRedirects(response, reverse('export_job_detail', kwargs={'job_uuid': job.uuid}))
+
+    def test_small_xls_export_is_streamed(self):
+        response = self.client.get(reverse('registration'), data={'xls_status': 'xls_registrations'})
+
+        self.assertTrue(response.streaming)
+        self.assertIn('attachment', response['Content-Disposition'])
+        self.assertIn('.xlsx', response['Content-Disposition'])
+        self.assertFalse(ExportJob.objects.exclude(pk=self.job.pk).exists())
+        response.close()
+
+    def test_export_job_detail(self):
+        response = self.client.get(reverse('export_job_detail', kwargs={'job_uuid': self.job.uuid}))
+        self.assertEqual(response.status_code, 200)
+        self.assertTemplateUsed(response, 'continuing_education/export_job_detail.html')
+
+    def test_export_job_status(self):
+        response = self.client.get(reverse('export_job_status', kwargs={'job_uuid': self.job.uuid}))
+        self.assertEqual(response.status_code, 200)
+        self.assertEqual(response.json()['state'], ExportJobState.PENDING.name)
+        self.assertIsNone(response.json()['download_url'])
+
+    def test_download_not_available_while_pending(self):
+        response = self.client.get(reverse('download_export_job', kwargs={'job_uuid': self.job.uuid}))
+        self.assertEqual(response.status_code, 404)
+
+    def test_job_of_another_user_not_found(self):
+        self.client.force_login(UserFactory())
+        response = self.client.get(reverse('export_job_status', kwargs={'job_uuid': self.job.uuid}))
+        self.assertEqual(response.status_code, 404)
@@ -42,6 +42,7 @@ from base.tests.factories.education_group import EducationGroupFactory
 from base.tests.factories.education_group_type import EducationGroupTypeFactory
 from base.tests.factories.education_group_year import EducationGroupYearFactory
 from base.tests.factories.entity_version import EntityVersionFactory
+from continuing_education.business.formation_catalog import refresh_formation_catalog
 from continuing_education.forms.formation import ContinuingEducationTrainingForm
 from continuing_education.models.continuing_education_training import ContinuingEducationTraining
 from continuing_education.tests.factories.address import AddressFactory
@@ -99,9 +100,11 @@ class ViewFormationTestCase(TestCase):
         cls.continuing_education_training = ContinuingEducationTrainingFactory(
             education_group=cls.formation_AAAA.education_group
         )
+        refresh_formation_catalog()
 
     def setUp(self):
         self.client.force_login(self.manager.person.user)
+        self.addCleanup(cache.clear)
 
     def test_current_year_formation_list(self):
         response = self.client.get(reverse('formation'))
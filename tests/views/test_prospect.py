@@ -23,6 +23,8 @@
 #    see http://www.gnu.org/licenses/.
 #
 ##############################################################################
+from unittest import mock
+
 from django.contrib import messages
 from django.contrib.messages import get_messages
 from django.test import TestCase
@@ -33,6 +35,7 @@ from base.tests.factories.academic_year import create_current_academic_year
 from base.tests.factories.education_group import EducationGroupFactory
 from base.tests.factories.education_group_year import EducationGroupYearFactory
 from continuing_education.models.prospect import Prospect
+from continuing_education.models.prospect_export_watermark import ProspectExportWatermark
 from continuing_education.tests.factories.continuing_education_training import ContinuingEducationTrainingFactory
 from continuing_education.tests.factories.prospect import ProspectFactory
 from continuing_education.tests.factories.roles.continuing_education_manager import ContinuingEducationManagerFactory
@@ -135,3 +138,33 @@ class ProspectDetailsTestCase(TestCase):
     def test_prospect_details_unexisting_prospect(self):
         response = self.client.get(reverse('prospect_details', kwargs={'prospect_id': self.prospect.pk + 1}))
         self.assertEqual(response.status_code, 404)
+
+
+class ProspectDeltaXlsTestCase(TestCase):
+    @classmethod
+    def setUpTestData(cls):
+        cls.manager = ContinuingEducationManagerFactory()
+
+    def setUp(self):
+        self.client.force_login(self.manager.person.user)
+
+    def test_prospect_delta_xls_does_not_record_watermark(self):
+        response = self.client.get(reverse('prospects_delta_xls'), data={'up_to': 1})
+        self.assertEqual(response.status_code, 200)
+        self.assertFalse(ProspectExportWatermark.objects.filter(user=self.manager.person.user).exists())
+
+    def test_acknowledge_prospect_delta_xls(self):
+        with mock.patch('continuing_education.views.prospect.acknowledge_prospect_export') as mock_acknowledge:
+            response = self.client.post(reverse('prospects_delta_xls_acknowledge'), data={'up_to': 12})
+        self.assertRedirects(response, reverse('prospects'))
+        mock_acknowledge.assert_called_once_with(self.manager.person.user, 12)
+
+    def test_acknowledge_prospect_delta_xls_without_export(self):
+        with mock.patch('continuing_education.views.prospect.acknowledge_prospect_export') as mock_acknowledge:
+            response = self.client.post(reverse('prospects_delta_xls_acknowledge'), data={'up_to': 'abc'})
+        self.assertRedirects(response, reverse('prospects'))
+        self.assertFalse(mock_acknowledge.called)
+
+    def test_acknowledge_prospect_delta_xls_not_allowed_with_get(self):
+        response = self.client.get(reverse('prospects_delta_xls_acknowledge'), data={'up_to': 12})
+        self.assertEqual(response.status_code, 405)
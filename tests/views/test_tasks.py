@@ -156,6 +156,15 @@ class ViewUpdateTasksTestCase(TestCase):
             response.context['admissions_to_accept']
         )
 
+    def test_list_tasks_without_archived_admissions(self):
+        archived_registration = AdmissionFactory(
+            state=admission_state_choices.REGISTRATION_SUBMITTED,
+            formation=self.formation,
+            archived=True
+        )
+        response = self.client.get(reverse('list_tasks'))
+        self.assertNotIn(archived_registration, response.context['registrations_to_validate'])
+
     def test_paper_registrations_file_received(self):
         post_data = {
             "selected_registrations_to_validate":
@@ -376,11 +385,24 @@ class ViewTasksTrainingManagerTestCase(TestCase):
 
     def test_process_admissions_to_draft(self):
         post_data = {
-            "selected_admissions_to_accept":
-                [str(registration.pk) for registration in self.admissions_to_accept],
+            "selected_admissions_to_accept": [str(self.admission_to_validate.pk)],
             "new_state": admission_state_choices.DRAFT,
         }
-        self._process_admission_to_state(post_data, admission_state_choices.DRAFT)
+        response = self.client.post(reverse('process_admissions'), data=post_data)
+        self.admission_to_validate.refresh_from_db()
+        self.assertEqual(self.admission_to_validate.state, admission_state_choices.DRAFT)
+        self.assertRedirects(response, reverse('list_tasks'))
+
+    def test_process_admissions_not_allowed_transition(self):
+        admission_waiting = AdmissionFactory(state=admission_state_choices.WAITING, formation=self.formation)
+        post_data = {
+            "selected_admissions_to_accept": [str(admission_waiting.pk)],
+            "new_state": admission_state_choices.DRAFT,
+        }
+        response = self.client.post(reverse('process_admissions'), data=post_data)
+        admission_waiting.refresh_from_db()
+        self.assertEqual(admission_waiting.state, admission_state_choices.WAITING)
+        self.assertRedirects(response, reverse('list_tasks'))
 
     def test_process_admissions_incorrect_state(self):
         post_data = {
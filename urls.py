@@ -28,7 +28,8 @@ from django.urls import path
 
 import continuing_education.views.file
 from continuing_education.business import registration_queue
-from continuing_education.views import (home, admission, registration, archive, formation, prospect, tasks, managers)
+from continuing_education.views import (home, admission, registration, archive, formation, prospect, tasks, managers,
+                                        export_job)
 from continuing_education.views.autocomplete.continuing_education_training import \
     ContinuingEducationTrainingAutocomplete
 
@@ -36,6 +37,7 @@ urlpatterns = [
     path('', home.main_view, name='continuing_education'),
     path('admission/', include([
         path('', admission.list_admissions, name='admission'),
+        path('facets/', admission.admission_facets, name='admission_facets'),
         path('new/', admission.admission_form, name='admission_new'),
         path('edit/<int:admission_id>/', admission.admission_form, name='admission_edit'),
         path('delete_draft/', admission.delete_draft, name='admission_delete_draft'),
@@ -52,6 +54,7 @@ urlpatterns = [
     ])),
     path('registration/', include([
         path('', registration.list_registrations, name='registration'),
+        path('facets/', registration.registration_facets, name='registration_facets'),
         path('edit/<int:admission_id>/', registration.registration_edit, name='registration_edit'),
         path('list/receive_files/', registration.receive_files_procedure, name='receive_files_procedure'),
         path('change_received_file_state/<int:admission_id>/', registration.receive_file_procedure,
@@ -74,6 +77,8 @@ urlpatterns = [
         path('', prospect.list_prospects, name='prospects'),
         path('<int:prospect_id>/', prospect.prospect_details, name='prospect_details'),
         path('reporting', prospect.prospect_xls, name='prospects_xls'),
+        path('reporting/new', prospect.prospect_delta_xls, name='prospects_delta_xls'),
+        path('reporting/new/ack', prospect.acknowledge_prospect_delta_xls, name='prospects_delta_xls_acknowledge'),
         path('delete', prospect.delete_prospects, name='prospects_delete'),
     ])),
     path('tasks/', include([
@@ -83,6 +88,11 @@ urlpatterns = [
         path('mark_diplomas_produced', tasks.mark_diplomas_produced, name='mark_diplomas_produced'),
         path('process_admissions', tasks.process_admissions, name='process_admissions'),
     ])),
+    path('export/<uuid:job_uuid>/', include([
+        path('', export_job.export_job_detail, name='export_job_detail'),
+        path('status/', export_job.export_job_status, name='export_job_status'),
+        path('download/', export_job.download_export_job, name='download_export_job'),
+    ])),
     path('training-autocomplete/', ContinuingEducationTrainingAutocomplete.as_view(), name='training_autocomplete'),
     path('managers/', include([
         path('', managers.list_managers, name='list_managers'),
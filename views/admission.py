@@ -42,8 +42,13 @@ from base.views.common import display_success_messages, display_error_messages,
     display_warning_messages
 from continuing_education.business.admission import send_invoice_uploaded_email, save_state_changed_and_send_email, \
     check_required_field_for_participant
+from continuing_education.business.export_job import EXPORT_COLUMNS_PARAMETER
+from continuing_education.business.facets import get_facet_counts
 from continuing_education.business.registration_queue import send_admission_to_queue
-from continuing_education.business.xls.xls_admission import create_xls
+from continuing_education.business.revision import save_and_create_revision, get_versions, ADMISSION_CREATION, \
+    get_revision_messages
+from continuing_education.business.search_results import ADMISSIONS_SEARCH, get_user_scope
+from continuing_education.business.xls.xls_columns import ADMISSION_COLUMNS
 from continuing_education.forms.account import ContinuingEducationPersonForm
 from continuing_education.forms.address import AddressForm, ADDRESS_PARTICIPANT_REQUIRED_FIELDS
 from continuing_education.forms.admission import AdmissionForm, RejectedAdmissionForm, WaitingAdmissionForm, \
@@ -60,11 +65,11 @@ from continuing_education.models.continuing_education_training import Continuing
 from continuing_education.models.enums import admission_state_choices, file_category_choices
 from continuing_education.models.enums.admission_state_choices import REJECTED, SUBMITTED, WAITING, DRAFT, VALIDATED, \
     ACCEPTED, CANCELLED, ACCEPTED_NO_REGISTRATION_REQUIRED, CANCELLED_NO_REGISTRATION_REQUIRED
+from continuing_education.models.enums.export_job_choices import ExportJobKind
 from continuing_education.models.enums.ucl_registration_state_choices import UCLRegistrationState
 from continuing_education.models.file import AdmissionFile
-from continuing_education.views.common import display_errors, save_and_create_revision, get_versions, \
-    ADMISSION_CREATION, get_revision_messages
-from continuing_education.views.common import get_object_list
+from continuing_education.views.common import display_errors, get_admission_keyset_object_list, get_list_count
+from continuing_education.views.export_job import start_export_job
 from continuing_education.views.file import _get_file_category_choices_with_disabled_parameter, _upload_file
 from continuing_education.views.home import is_continuing_education_student_worker
 from continuing_education.views.registration import _update_or_create_specific_address
@@ -75,28 +80,41 @@ from osis_common.decorators.ajax import ajax_required
 @permission_required('continuing_education.export_admission', raise_exception=True)
 @cache_filter(exclude_params=['xls_status'])
 def list_admissions(request):
-    search_form = AdmissionFilterForm(request.GET)
-
-    if search_form.is_valid():
-        admission_list = search_form.get_admissions()
-        admission_list = filter_authorized_admissions(request.user, admission_list)
-    else:
-        admission_list = Admission.objects.none()
-
     if request.GET.get('xls_status') == "xls_admissions":
-        return export_admissions(request, admission_list, search_form)
+        return export_admissions(request)
 
+    search_form = AdmissionFilterForm(request.GET)
+    admission_list = _get_admission_list(request, search_form)
+
+    scope = get_user_scope(request.user)
     return render(request, "continuing_education/admissions.html", {
-        'admissions': get_object_list(request, admission_list),
-        'admissions_number': admission_list.count(),
+        'admissions': get_admission_keyset_object_list(request, admission_list, ADMISSIONS_SEARCH, scope),
+        'admissions_number': get_list_count(request, ADMISSIONS_SEARCH, admission_list, scope, estimate=True),
         'search_form': search_form,
+        'export_columns': ADMISSION_COLUMNS.choices(),
+        'selected_export_columns': request.GET.getlist(EXPORT_COLUMNS_PARAMETER),
     })
 
 
+@ajax_required
+@login_required
+@permission_required('continuing_education.export_admission', raise_exception=True)
+@require_GET
+def admission_facets(request):
+    search_form = AdmissionFilterForm(request.GET)
+    return JsonResponse(get_facet_counts(_get_admission_list(request, search_form)))
+
+
+def _get_admission_list(request, search_form):
+    if search_form.is_valid():
+        return filter_authorized_admissions(request.user, search_form.get_admissions())
+    return Admission.objects.none()
+
+
 @login_required
 @permission_required('continuing_education.export_admission')
-def export_admissions(request, admission_list, search_form):
-    return create_xls(request.user, admission_list, search_form)
+def export_admissions(request):
+    return start_export_job(request, ExportJobKind.ADMISSIONS.name)
 
 
 @login_required
@@ -104,7 +122,7 @@ def export_admissions(request, admission_list, search_form):
 def admission_detail(request, admission_id):
     user_is_continuing_education_student_worker = is_continuing_education_student_worker(request.user)
     admission = get_object_or_404(
-        Admission.objects.formations().select_related(
+        Admission.objects.formations().with_formation_managers().select_related(
             'billing_address__country',
             'address__country',
             'person_information__person',
@@ -112,7 +130,6 @@ def admission_detail(request, admission_id):
             'citizenship',
             'formation__education_group',
         ).prefetch_related(
-            'formation__managers',
             'formation__education_group__educationgroupyear_set__educationgroupversion_set',
         ),
         pk=admission_id
@@ -288,11 +305,7 @@ def admission_form(request, admission_id=None):
     address_form = AddressForm(request.POST or None, instance=address)
     state = admission.state if admission else None
     if adm_form.is_valid() and person_form.is_valid() and address_form.is_valid() and base_person_form.is_valid():
-        if address:
-            address = address_form.save()
-        else:
-            address = Address(**address_form.cleaned_data)
-            address.save()
+        address = address_form.save()
 
         person_must_be_saved = not selected_person or admission_id
         if person_must_be_saved:
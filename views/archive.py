@@ -33,40 +33,47 @@ from rules.contrib.views import permission_required
 
 from base.utils.cache import cache_filter
 from base.views.common import display_success_messages, display_error_messages
-from continuing_education.business.xls.xls_archive import create_xls
+from continuing_education.business.archive import set_archived_state
+from continuing_education.business.export_job import EXPORT_COLUMNS_PARAMETER
+from continuing_education.business.search_results import ARCHIVES_SEARCH, get_user_scope
+from continuing_education.business.xls.xls_columns import REGISTRATION_COLUMNS
 from continuing_education.forms.search import ArchiveFilterForm
 from continuing_education.models.admission import Admission, filter_authorized_admissions, can_access_admission, \
     admission_getter
-from continuing_education.views.common import get_object_list, FILE_ARCHIVED, save_and_create_revision, \
-    FILE_UNARCHIVED, get_revision_messages
+from continuing_education.models.enums.export_job_choices import ExportJobKind
+from continuing_education.views.common import get_admission_keyset_object_list, get_list_count
+from continuing_education.views.export_job import start_export_job
 
 
 @login_required
 @permission_required('continuing_education.view_admission_archives', raise_exception=True)
 @cache_filter(exclude_params=['xls_status'])
 def list_archives(request):
+    if request.GET.get('xls_status') == "xls_archives":
+        return export_archives(request)
+
     search_form = ArchiveFilterForm(data=request.GET, user=request.user)
-    archive_list = []
+    archive_list = Admission.objects.none()
 
     if search_form.is_valid():
         archive_list = search_form.get_archives()
 
     archive_list = filter_authorized_admissions(request.user, archive_list)
 
-    if request.GET.get('xls_status') == "xls_archives":
-        return export_archives(request, archive_list, search_form)
-
+    scope = get_user_scope(request.user)
     return render(request, "continuing_education/archives.html", {
-        'archives': get_object_list(request, archive_list),
-        'archives_number': len(archive_list),
-        'search_form': search_form
+        'archives': get_admission_keyset_object_list(request, archive_list, ARCHIVES_SEARCH, scope),
+        'archives_number': get_list_count(request, ARCHIVES_SEARCH, archive_list, scope, estimate=True),
+        'search_form': search_form,
+        'export_columns': REGISTRATION_COLUMNS.choices(),
+        'selected_export_columns': request.GET.getlist(EXPORT_COLUMNS_PARAMETER),
     })
 
 
 @login_required
 @permission_required('continuing_education.export_admission_archives')
-def export_archives(request, archive_list, search_form):
-    return create_xls(request.user, archive_list, search_form)
+def export_archives(request):
+    return start_export_job(request, ExportJobKind.ARCHIVES.name)
 
 
 @login_required
@@ -91,9 +98,15 @@ def archives_procedure(request):
 
 def change_archive_status(new_archive_status, request):
     selected_admissions_id = request.POST.getlist("selected_action", default=[])
-    for admission_id in selected_admissions_id:
-        admission = Admission.objects.get(id=admission_id)
-        can_access_admission(request.user, admission)
+    # A non-numeric id is refused like the id of an admission out of reach
+    if not all(admission_id.isdigit() for admission_id in selected_admissions_id):
+        raise PermissionDenied
+    authorized_admissions_number = filter_authorized_admissions(
+        request.user,
+        Admission.objects.filter(id__in=selected_admissions_id)
+    ).count()
+    if authorized_admissions_number != len(set(map(int, selected_admissions_id))):
+        raise PermissionDenied
     redirection = request.headers.get('referer')
     if selected_admissions_id:
         _mark_folders_as_archived(request, selected_admissions_id, new_archive_status)
@@ -104,8 +117,7 @@ def change_archive_status(new_archive_status, request):
 
 
 def _mark_folders_as_archived(request, selected_admissions_id, new_archive_status):
-    for admission_id in selected_admissions_id:
-        _mark_as_archived(request.user, admission_id, new_archive_status)
+    set_archived_state(request.user, selected_admissions_id, new_archive_status)
     _set_success_message(request, len(selected_admissions_id) > 1, new_archive_status)
 
 
@@ -119,16 +131,7 @@ def _set_success_message(request, is_plural, admission_archived=True):
 
 def _mark_as_archived(user, admission_id, archive_state=True):
     admission = get_object_or_404(Admission, pk=admission_id)
-    _set_archived_state(user, admission, archive_state)
-
-
-def _set_archived_state(user, admission, archived_state):
-    if admission:
-        admission.archived = archived_state
-        save_and_create_revision(
-            get_revision_messages(FILE_ARCHIVED) if admission.archived else get_revision_messages(FILE_UNARCHIVED),
-            admission, user
-        )
+    set_archived_state(user, [admission.pk], archive_state)
 
 
 def _set_error_message(request):
@@ -138,8 +141,7 @@ def _set_error_message(request):
 
 def _switch_archived_state(user, admission_id):
     admission = get_object_or_404(Admission, pk=admission_id)
-    _set_archived_state(user, admission, not admission.archived)
-    return admission
+    return set_archived_state(user, [admission.pk], not admission.archived)[0]
 
 
 @login_required
@@ -33,9 +33,9 @@ class ContinuingEducationTrainingAutocomplete(autocomplete.Select2QuerySetView):
         if not self.request.user.is_authenticated:
             return ContinuingEducationTraining.objects.none()
 
-        qs = ContinuingEducationTraining.objects.all().distinct()
+        qs = ContinuingEducationTraining.objects.filter(formation_catalog__isnull=False)
 
         if self.q:
-            qs = qs.filter(education_group__educationgroupyear__acronym__istartswith=self.q)
+            qs = qs.filter(formation_catalog__acronym__istartswith=self.q)
 
-        return qs.order_by('education_group__educationgroupyear__acronym')
+        return qs.order_by('formation_catalog__acronym')
@@ -23,69 +23,29 @@
 #    see http://www.gnu.org/licenses/.
 #
 ##############################################################################
-import operator
-from functools import reduce
-
-import reversion
 from django.contrib import messages
-from django.contrib.contenttypes.models import ContentType
 from django.core.paginator import Paginator, PageNotAnInteger, EmptyPage
-from django.db.models import Prefetch, Q
+from django.db.models import Value
+from django.db.models.functions import Coalesce
 from django.utils.translation import gettext_lazy as _
-from reversion.models import Version
 
+from continuing_education.business.pagination import KeysetPaginator, SearchResultPaginator, CURSOR_PARAMETER, \
+    DIRECTION_PARAMETER, PAGE_SIZE_PARAMETER, NEXT, get_page_size
+from continuing_education.business.result_count import get_result_count
+from continuing_education.business.revision import get_revision_messages, UCL_REGISTRATION_COMPLETE, \
+    REGISTRATION_FILE_RECEIVED
+from continuing_education.business.search_results import get_search_filters, get_search_result_keys
 from continuing_education.models.admission import Admission
-from continuing_education.models.enums.admission_state_choices import ACCEPTED, VALIDATED, REGISTRATION_SUBMITTED, \
-    SUBMITTED
-from continuing_education.models.enums.ucl_registration_state_choices import UCLRegistrationState
-
-UCL_REGISTRATION_COMPLETE = {'icon': 'fas fa-university', 'text': _('UCLouvain registration complete')}
-REGISTRATION_FILE_RECEIVED = {'icon': 'fas fa-receipt', 'text': _('Registration file received')}
-FILE_ARCHIVED = {'icon': 'fas fa-folder-plus', 'text': _('File archived')}
-FILE_UNARCHIVED = {'icon': 'fas fa-folder-minus', 'text': _('File unarchived')}
-ADMISSION_CREATION = {'icon': 'fas fa-plus-circle', 'text': _('Creation of the admission')}
-REGISTRATION_VALIDATED = {'icon': 'fas fa-check-double', 'text': _('Registration validated')}
-ADMISSION_ACCEPTED = {'icon': 'fas fa-check', 'text': _('Admission accepted')}
-SUBMITTED_REGISTRATION = {'icon': 'far fa-paper-plane', 'text': _('Registration submitted')}
-SUBMITTED_ADMISSION = {'icon': 'far fa-paper-plane', 'text': _('Admission submitted')}
-
-STATE_CHANGED = {'icon': 'fas fa-exchange-alt', 'text': ''}
-STATE_CHANGED_MESSAGE = _('State : %(old_state)s -> %(new_state)s')
-
-MAIL = {'icon': 'far fa-envelope-open', 'text': ''}
-MAIL_MESSAGE = _('Mail sent to %(receiver)s')
-
-UCL_REGISTRATION_SENDED = {'icon': 'glyphicon glyphicon-time', 'text': _('Folder sended to EPC : waiting for response')}
-UCL_REGISTRATION_REJECTED = {'icon': 'glyphicon glyphicon-remove',
-                             'text': _('Folder injection into EPC failed : ')}
-UCL_REGISTRATION_REGISTERED = {'icon': 'glyphicon glyphicon-ok-circle',
-                               'text': _('Folder injection into EPC succeeded : UCLouvain registration completed')}
-UCL_REGISTRATION_STATE_CHANGED = {'icon': 'glyphicon glyphicon-question-sign',
-                                  'text': _('Folder injection into EPC succeeded : UCLouvain registration state : ')}
-
-REGISTRATIONS_UCL_MESSAGES = {
-    UCLRegistrationState.SENDED.name: UCL_REGISTRATION_SENDED,
-    UCLRegistrationState.REJECTED.name: UCL_REGISTRATION_REJECTED,
-    UCLRegistrationState.INSCRIT.name: UCL_REGISTRATION_REGISTERED,
-}
-
-VERSION_MESSAGES = [
-    UCL_REGISTRATION_COMPLETE['text'],
-    REGISTRATION_FILE_RECEIVED['text'],
-    FILE_ARCHIVED['text'],
-    FILE_UNARCHIVED['text'],
-    ADMISSION_CREATION['text'],
-    REGISTRATION_VALIDATED['text'],
-    ADMISSION_ACCEPTED['text'],
-    SUBMITTED_REGISTRATION['text'],
-    SUBMITTED_ADMISSION['text'],
-    _('Mail sent to '),
-    ' ► ',
-    UCL_REGISTRATION_SENDED['text'],
-    UCL_REGISTRATION_REJECTED['text'],
-    UCL_REGISTRATION_REGISTERED['text'],
-    UCL_REGISTRATION_STATE_CHANGED['text'],
-]
+
+ADMISSION_KEYSET = ('formation_id', 'person_last_name', 'pk')
+RANKED_ADMISSION_KEYSET = ('-search_rank', 'pk')
+PROSPECT_KEYSET = ('pk',)
+ADMISSION_ROWS = Admission.objects.select_related(
+    'person_information__person',
+    'formation__education_group',
+    'formation__current_year',
+    'academic_year',
+)
 
 
 def display_errors(request, errors):
@@ -94,10 +54,12 @@ def display_errors(request, errors):
             messages.add_message(request, messages.ERROR, "{} : {}".format(_(key), value[0]), "alert-danger")
 
 
-def get_object_list(request, objects):
+def get_object_list(request, objects, count=None):
     if objects is None:
         objects = []
     paginator = Paginator(objects, 10)
+    if count is not None:
+        paginator.count = count
     page = request.GET.get('page')
 
     try:
@@ -109,23 +71,41 @@ def get_object_list(request, objects):
     return object_list
 
 
-def save_and_create_revision(message, admission=None, user=None):
-    with reversion.create_revision():
-        existing_message = reversion.get_comment()
-        if admission:
-            admission.save()
-        if user:
-            reversion.set_user(user)
-        append_message = existing_message + " <br> &nbsp; " if existing_message else ''
-        reversion.set_comment(append_message + message if message else existing_message)
+def get_keyset_object_list(request, objects, keys):
+    return _get_page(request, KeysetPaginator(objects, keys, get_page_size(request.GET.get(PAGE_SIZE_PARAMETER))))
+
 
+def get_admission_keyset_object_list(request, admission_list, list_name=None, scope=None):
+    """
+    Page of the admission list. When the list is a named search, its sorted results are cached
+    for the user scope and the search parameters, and the page rows are fetched by primary key.
+    """
+    if 'search_rank' in admission_list.query.annotations:
+        keys = RANKED_ADMISSION_KEYSET
+    else:
+        keys = ADMISSION_KEYSET
+        admission_list = admission_list.annotate(
+            person_last_name=Coalesce('person_information__person__last_name', Value(''))
+        )
+    if list_name:
+        result_keys = get_search_result_keys(admission_list, keys, list_name, scope, get_search_filters(request.GET))
+        if result_keys is not None:
+            return _get_page(request, SearchResultPaginator(
+                ADMISSION_ROWS, result_keys, get_page_size(request.GET.get(PAGE_SIZE_PARAMETER))
+            ))
+    return get_keyset_object_list(request, admission_list, keys)
 
-def _get_icon(message):
-    return '<i class="{type}"></i> '.format(type=message['icon'])
 
+def _get_page(request, paginator):
+    try:
+        return paginator.page(request.GET.get(CURSOR_PARAMETER), request.GET.get(DIRECTION_PARAMETER, NEXT))
+    except (TypeError, ValueError):
+        return paginator.page()
 
-def get_revision_messages(message, msgs=None):
-    return ("<br>" if msgs else '') + _get_icon(message) + str(message['text'])
+
+def get_list_count(request, list_name, objects, scope, estimate=False):
+    """ Cached number of objects of the list for the filters of the request """
+    return get_result_count(objects, list_name, scope, get_search_filters(request.GET), estimate)
 
 
 def get_appropriate_revision_message(form):
@@ -135,40 +115,3 @@ def get_appropriate_revision_message(form):
     if 'registration_file_received' in form.changed_data and form.cleaned_data['registration_file_received']:
         msgs.append(get_revision_messages(REGISTRATION_FILE_RECEIVED, msgs))
     return ' '.join(msgs) if msgs else ''
-
-
-def get_versions(admission):
-    query = reduce(operator.or_, (Q(revision__comment__contains=item) for item in VERSION_MESSAGES))
-    reversions = Version.objects.filter(
-        content_type=ContentType.objects.get_for_model(Admission),
-        object_id=admission.id,
-    ).filter(query).select_related(
-        "revision",
-        "revision__user",
-    ).prefetch_related(
-        Prefetch(
-            "revision__user__person",
-            to_attr="author"
-        )
-    ).select_related('revision__user__person').order_by(
-        "-revision__date_created"
-    )
-    return reversions
-
-
-def get_valid_state_change_message(instance):
-    if instance.state == ACCEPTED:
-        message = ADMISSION_ACCEPTED
-    elif instance.state == VALIDATED:
-        message = REGISTRATION_VALIDATED
-    elif instance.state == REGISTRATION_SUBMITTED:
-        message = SUBMITTED_REGISTRATION
-    elif instance.state == SUBMITTED:
-        message = SUBMITTED_ADMISSION
-    else:
-        STATE_CHANGED['text'] = STATE_CHANGED_MESSAGE % {
-            'old_state': _(instance._original_state),
-            'new_state': _(instance.state)
-        }
-        message = STATE_CHANGED
-    return message
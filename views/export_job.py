@@ -0,0 +1,81 @@
+##############################################################################
+#
+#    OSIS stands for Open Student Information System. It's an application
+#    designed to manage the core business of higher education institutions,
+#    such as universities, faculties, institutes and professional schools.
+#    The core business involves the administration of students, teachers,
+#    courses, programs and so on.
+#
+#    Copyright (C) 2015-2022 Université catholique de Louvain (http://www.uclouvain.be)
+#
+#    This program is free software: you can redistribute it and/or modify
+#    it under the terms of the GNU General Public License as published by
+#    the Free Software Foundation, either version 3 of the License, or
+#    (at your option) any later version.
+#
+#    This program is distributed in the hope that it will be useful,
+#    but WITHOUT ANY WARRANTY; without even the implied warranty of
+#    MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+#    GNU General Public License for more details.
+#
+#    A copy of this license - GNU General Public License - is available
+#    at the root of the source code of this program.  If not,
+#    see http://www.gnu.org/licenses/.
+#
+##############################################################################
+import tempfile
+
+from django.contrib.auth.decorators import login_required
+from django.http import FileResponse, Http404, JsonResponse
+from django.shortcuts import render, get_object_or_404, redirect
+from django.urls import reverse
+from django.views.decorators.http import require_GET
+
+from continuing_education.business.export_job import create_export_job, fail_stale_export_jobs, write_small_export
+from continuing_education.models.export_job import ExportJob
+
+
+def start_export_job(request, kind):
+    """ Small exports are streamed right away, the larger ones are generated by an export job """
+    output = tempfile.TemporaryFile()
+    filename = write_small_export(output, request.user, kind, request.GET)
+    if filename is not None:
+        output.seek(0)
+        return FileResponse(output, as_attachment=True, filename=filename)
+    output.close()
+    job = create_export_job(request.user, kind, request.GET)
+    return redirect(reverse('export_job_detail', kwargs={'job_uuid': job.uuid}))
+
+
+@login_required
+@require_GET
+def export_job_detail(request, job_uuid):
+    fail_stale_export_jobs()
+    job = get_object_or_404(ExportJob, uuid=job_uuid, user=request.user)
+    return render(request, "continuing_education/export_job_detail.html", {
+        'job': job,
+    })
+
+
+@login_required
+@require_GET
+def export_job_status(request, job_uuid):
+    fail_stale_export_jobs()
+    job = get_object_or_404(ExportJob, uuid=job_uuid, user=request.user)
+    return JsonResponse(data={
+        'state': job.state,
+        'state_display': str(job.get_state_display()),
+        'progress': job.progress,
+        'total': job.total,
+        'percentage': job.percentage,
+        'download_url': reverse('download_export_job', kwargs={'job_uuid': job.uuid}) if job.is_done() else None,
+    })
+
+
+@login_required
+@require_GET
+def download_export_job(request, job_uuid):
+    job = get_object_or_404(ExportJob, uuid=job_uuid, user=request.user)
+    if not job.is_done() or not job.file:
+        raise Http404()
+    return FileResponse(job.file.open('rb'), as_attachment=True, filename=job.file.name.split('/')[-1])
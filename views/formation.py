@@ -37,19 +37,20 @@ from base.utils.cache import cache_filter
 from base.views.common import display_success_messages, display_error_messages
 from continuing_education.auth.roles.continuing_education_training_manager import \
     is_continuing_education_training_manager, ContinuingEducationTrainingManager
+from continuing_education.business.search_results import ALL_TRAININGS_SCOPE
 from continuing_education.business.xls.xls_formation import create_xls
 from continuing_education.forms.address import AddressForm
 from continuing_education.forms.formation import ContinuingEducationTrainingForm
 from continuing_education.forms.search import FormationFilterForm
 from continuing_education.models.continuing_education_training import ContinuingEducationTraining
-from continuing_education.views.common import get_object_list
+from continuing_education.views.common import get_object_list, get_list_count
 
 
 @login_required
 @permission_required('continuing_education.view_continuingeducationtraining', raise_exception=True)
 @cache_filter(exclude_params=['xls_status'])
 def list_formations(request):
-    formation_list = []
+    formation_list = EducationGroup.objects.none()
 
     search_form = FormationFilterForm(request.GET)
     if search_form.is_valid():
@@ -64,11 +65,12 @@ def list_formations(request):
         ).values_list('training', flat=True).distinct(
             'training')
     ) if continuing_education_training_manager else None
+    formations_number = get_list_count(request, 'formations', formation_list, ALL_TRAININGS_SCOPE)
     return render(
         request, "continuing_education/formations.html",
         {
-            'formations': get_object_list(request, formation_list),
-            'formations_number': len(formation_list),
+            'formations': get_object_list(request, formation_list, formations_number),
+            'formations_number': formations_number,
             'search_form': search_form,
             'continuing_education_training_manager': continuing_education_training_manager,
             'trainings_managing': trainings_managing
@@ -27,22 +27,26 @@
 from django.contrib.auth.decorators import login_required
 from django.shortcuts import render, redirect, reverse, get_object_or_404
 from django.utils.translation import gettext_lazy as _
+from django.views.decorators.http import require_http_methods
 from rules.contrib.views import permission_required, objectgetter
 
 from base.views.common import display_error_messages, display_success_messages
-from continuing_education.business.prospect import get_prospects_by_user
-from continuing_education.business.xls.xls_prospect import create_xls
+from continuing_education.business.prospect import get_prospects_queryset_by_user, get_last_prospect_export_date, \
+    get_last_prospect_id, acknowledge_prospect_export
+from continuing_education.business.xls.xls_prospect import create_xls, create_delta_xls
 from continuing_education.models.prospect import Prospect
-from continuing_education.views.common import get_object_list
+from continuing_education.views.common import get_keyset_object_list, PROSPECT_KEYSET, get_list_count
 
 
 @login_required
 @permission_required('continuing_education.view_prospect', raise_exception=True)
 def list_prospects(request):
-    prospects_list = get_prospects_by_user(request.user)
+    prospects_list = get_prospects_queryset_by_user(request.user)
     return render(request, "continuing_education/prospects.html", {
-        'prospects': get_object_list(request, prospects_list),
-        'prospects_count': len(prospects_list)
+        'prospects': get_keyset_object_list(request, prospects_list, PROSPECT_KEYSET),
+        'prospects_count': get_list_count(request, 'prospects', prospects_list, request.user.pk),
+        'last_prospect_export_date': get_last_prospect_export_date(request.user),
+        'last_prospect_id': get_last_prospect_id(),
     })
 
 
@@ -65,6 +69,31 @@ def prospect_xls(request):
     return create_xls(request.user)
 
 
+@login_required
+@permission_required('continuing_education.export_prospect', raise_exception=True)
+def prospect_delta_xls(request):
+    up_to_id = _get_up_to_id(request.GET)
+    return create_delta_xls(request.user, get_last_prospect_id() if up_to_id is None else up_to_id)
+
+
+@login_required
+@require_http_methods(['POST'])
+@permission_required('continuing_education.export_prospect', raise_exception=True)
+def acknowledge_prospect_delta_xls(request):
+    up_to_id = _get_up_to_id(request.POST)
+    if up_to_id is None:
+        display_error_messages(request, _("Please produce the xls of new prospects first"))
+    else:
+        acknowledge_prospect_export(request.user, up_to_id)
+        display_success_messages(request, _("New prospects marked as exported"))
+    return redirect(reverse('prospects'))
+
+
+def _get_up_to_id(data):
+    up_to_id = data.get('up_to', '')
+    return int(up_to_id) if up_to_id.isdigit() else None
+
+
 @login_required
 @permission_required('continuing_education.delete_prospect', raise_exception=True)
 def delete_prospects(request):
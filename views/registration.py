@@ -25,58 +25,89 @@
 ##############################################################################
 from django.contrib.auth.decorators import login_required
 from django.core.exceptions import PermissionDenied
-from django.http import HttpResponseRedirect
+from django.http import HttpResponseRedirect, JsonResponse
 from django.shortcuts import render, redirect, get_object_or_404
 from django.urls import reverse
 from django.utils.translation import gettext_lazy as _
+from django.views.decorators.http import require_GET
 from rules.contrib.views import permission_required
 
 from base.utils.cache import cache_filter
 from base.views.common import display_error_messages, display_success_messages
-from continuing_education.business.xls.xls_registration import create_xls_registration
+from continuing_education.business.export_job import EXPORT_COLUMNS_PARAMETER
+from continuing_education.business.facets import get_facet_counts
+from continuing_education.business.revision import save_and_create_revision
+from continuing_education.business.search_results import REGISTRATIONS_SEARCH, ALL_TRAININGS_SCOPE, get_user_scope
+from continuing_education.business.xls.xls_columns import REGISTRATION_COLUMNS
 from continuing_education.forms.address import AddressForm
 from continuing_education.forms.registration import RegistrationForm
 from continuing_education.forms.search import RegistrationFilterForm
-from continuing_education.models.address import Address
 from continuing_education.models.admission import Admission, filter_authorized_admissions, can_access_admission, \
     admission_getter
 from continuing_education.models.enums import admission_state_choices
+from continuing_education.models.enums.export_job_choices import ExportJobKind
 from continuing_education.models.enums.ucl_registration_state_choices import UCLRegistrationState
-from continuing_education.views.common import get_object_list, save_and_create_revision, \
-    get_appropriate_revision_message
+from continuing_education.views.common import get_admission_keyset_object_list, \
+    get_appropriate_revision_message, get_list_count
+from continuing_education.views.export_job import start_export_job
 from continuing_education.views.home import is_continuing_education_student_worker
+from osis_common.decorators.ajax import ajax_required
 
 
 @login_required
 @permission_required('continuing_education.view_admission', raise_exception=True)
 @cache_filter(exclude_params=['xls_status'])
 def list_registrations(request):
+    if request.GET.get('xls_status') == "xls_registrations":
+        return export_registrations(request)
+    if request.GET.get('xls_status') == "xls_registrations_by_formation":
+        return export_registrations_by_formation(request)
+
     search_form = RegistrationFilterForm(request.GET, user=request.user)
     user_is_continuing_education_student_worker = is_continuing_education_student_worker(request.user)
+    admission_list = _get_registration_list(request, search_form)
+
+    scope = ALL_TRAININGS_SCOPE if user_is_continuing_education_student_worker else get_user_scope(request.user)
+    return render(request, "continuing_education/registrations.html", {
+        'admissions': get_admission_keyset_object_list(request, admission_list, REGISTRATIONS_SEARCH, scope),
+        'admissions_number': get_list_count(request, REGISTRATIONS_SEARCH, admission_list, scope, estimate=True),
+        'search_form': search_form,
+        'user_is_continuing_education_student_worker': user_is_continuing_education_student_worker,
+        'ucl_registration_state_choices': UCLRegistrationState.__members__,
+        'export_columns': REGISTRATION_COLUMNS.choices(),
+        'selected_export_columns': request.GET.getlist(EXPORT_COLUMNS_PARAMETER),
+    })
+
+
+@ajax_required
+@login_required
+@permission_required('continuing_education.view_admission', raise_exception=True)
+@require_GET
+def registration_facets(request):
+    search_form = RegistrationFilterForm(request.GET, user=request.user)
+    return JsonResponse(get_facet_counts(_get_registration_list(request, search_form)))
+
+
+def _get_registration_list(request, search_form):
     admission_list = Admission.registration_objects.all()
     if search_form.is_valid():
         admission_list = search_form.get_registrations()
 
-    if not user_is_continuing_education_student_worker:
+    if not is_continuing_education_student_worker(request.user):
         admission_list = filter_authorized_admissions(request.user, admission_list)
+    return admission_list
 
-    if request.GET.get('xls_status') == "xls_registrations":
-        return export_registrations(request, admission_list, search_form)
 
-    return render(request, "continuing_education/registrations.html", {
-        'admissions': get_object_list(request, admission_list),
-        'admissions_number': admission_list.count(),
-        'search_form': search_form,
-        'user_is_continuing_education_student_worker': user_is_continuing_education_student_worker,
-        'ucl_registration_state_choices': UCLRegistrationState.__members__
-    })
+@login_required
+@permission_required('continuing_education.export_admission')
+def export_registrations(request):
+    return start_export_job(request, ExportJobKind.REGISTRATIONS.name)
 
 
 @login_required
 @permission_required('continuing_education.export_admission')
-def export_registrations(request, admission_list, search_form):
-    if request.GET.get('xls_status') == "xls_registrations":
-        return create_xls_registration(request.user, admission_list, search_form)
+def export_registrations_by_formation(request):
+    return start_export_job(request, ExportJobKind.REGISTRATIONS_BY_FORMATION.name)
 
 
 @login_required
@@ -143,13 +174,8 @@ def registration_edit(request, admission_id):
 def _update_or_create_specific_address(admission_address, specific_address, specific_address_form, use_address):
     if use_address:
         return admission_address
-    elif specific_address == admission_address:
-        # We must create a new specific address, not update the admission's address.
-        specific_address = Address.objects.create(**specific_address_form.cleaned_data)
-        return specific_address
-    else:
-        specific_address = specific_address_form.save()
-        return specific_address
+    # The form interns the address, so the admission's address is never updated through the specific one.
+    return specific_address_form.save()
 
 
 @login_required
@@ -214,5 +240,5 @@ def list_cancelled(request):
     admission_list = filter_authorized_admissions(request.user, admission_list)
 
     return render(request, "continuing_education/cancellations.html", {
-        'admissions': get_object_list(request, admission_list)
+        'admissions': get_admission_keyset_object_list(request, admission_list)
     })
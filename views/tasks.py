@@ -25,7 +25,6 @@
 ##############################################################################
 from django.contrib.auth.decorators import login_required
 from django.core.exceptions import PermissionDenied
-from django.db.models import Q
 from django.shortcuts import render, redirect
 from django.urls import reverse
 from django.utils.translation import gettext_lazy as _
@@ -36,15 +35,15 @@ from base.views.common import display_error_messages, display_success_messages
 from continuing_education.auth.roles.continuing_education_manager import is_continuing_education_manager
 from continuing_education.auth.roles.continuing_education_training_manager import \
     is_continuing_education_training_manager
-from continuing_education.business.admission import save_state_changed_and_send_email
+from continuing_education.business.admission_transition import apply_state_transition
+from continuing_education.business.revision import save_and_create_revision, get_revision_messages, \
+    REGISTRATION_FILE_RECEIVED
 from continuing_education.forms.admission import RejectedAdmissionForm, WaitingAdmissionForm, \
     ConditionAcceptanceAdmissionForm, CancelAdmissionForm
 from continuing_education.models.admission import Admission, filter_authorized_admissions
 from continuing_education.models.enums import admission_state_choices
 from continuing_education.models.enums.admission_state_choices import ACCEPTED, ACCEPTED_NO_REGISTRATION_REQUIRED, \
     REJECTED, WAITING, CANCELLED, CANCELLED_NO_REGISTRATION_REQUIRED
-from continuing_education.views.common import save_and_create_revision, get_revision_messages, \
-    REGISTRATION_FILE_RECEIVED
 from continuing_education.views.home import is_continuing_education_student_worker
 
 
@@ -56,7 +55,7 @@ def list_tasks(request):
     if not is_continuing_education_mgr and not is_continuing_education_training_mgr \
             and not is_continuing_education_student_worker(request.user):
         raise PermissionDenied
-    all_admissions = Admission.objects.select_related(
+    all_admissions = Admission.objects.filter(archived=False).select_related(
         'person_information__person', 'formation__education_group'
     )
     if not is_continuing_education_student_worker(request.user):
@@ -68,7 +67,7 @@ def list_tasks(request):
     ).formations()
 
     admissions_to_accept = all_admissions.filter(
-        Q(state=admission_state_choices.SUBMITTED) | Q(state=admission_state_choices.WAITING)
+        state__in=[admission_state_choices.SUBMITTED, admission_state_choices.WAITING]
     ).formations()
 
     admissions_diploma_to_produce = all_admissions.filter(
@@ -145,9 +144,13 @@ def process_admissions(request):
     selected_admission_ids = request.POST.getlist("selected_admissions_to_accept", default=[])
     new_state = request.POST.get('new_state')
     if selected_admission_ids:
-        _process_admissions_list(request, selected_admission_ids, new_state)
-        msg = _('Successfully change of state %s admission(s).') % len(selected_admission_ids)
-        display_success_messages(request, msg)
+        result = _process_admissions_list(request, selected_admission_ids, new_state)
+        if result.moved_ids:
+            msg = _('Successfully change of state %s admission(s).') % len(result.moved_ids)
+            display_success_messages(request, msg)
+        if result.rejected_ids:
+            msg = _('%s admission(s) cannot change to this state.') % len(result.rejected_ids)
+            display_error_messages(request, msg)
     else:
         display_error_messages(request, _('Please select at least one admission to process.'))
 
@@ -155,11 +158,8 @@ def process_admissions(request):
 
 
 def _process_admissions_list(request, registrations_ids_list, new_status):
-    admissions_list = Admission.objects.filter(id__in=registrations_ids_list)
-    admissions_list_states = admissions_list.values_list('state', flat=True)
-    if not all(state == admission_state_choices.SUBMITTED or admission_state_choices.WAITING
-               for state in admissions_list_states):
-        raise PermissionDenied(_('The admission must be submitted or waiting to be accepted.'))
+    if new_status not in admission_state_choices.NEW_ADMIN_STATE.keys():
+        raise PermissionDenied(_('Incorrect state'))
 
     condition_exists = request.POST.get('condition_of_acceptance_existing') == 'True'
     reason_by_state = {
@@ -170,25 +170,13 @@ def _process_admissions_list(request, registrations_ids_list, new_status):
         CANCELLED: request.POST.get('state_reason'),
         CANCELLED_NO_REGISTRATION_REQUIRED: request.POST.get('state_reason')
     }
-
-    if new_status not in admission_state_choices.NEW_ADMIN_STATE.keys():
-        raise PermissionDenied(_('Incorrect state'))
-
-    for admission in admissions_list:
-        _update_admission(request, admission, new_status, reason_by_state)
-
-
-def _update_admission(request, admission, new_status, reason_by_state):
-    admission._original_state = admission.state
-    admission.state = new_status
-    reason = reason_by_state.get(admission.state, '')
-    if admission.state in [ACCEPTED, ACCEPTED_NO_REGISTRATION_REQUIRED]:
-        admission.condition_of_acceptance = reason
-        admission.academic_year_id = request.POST.get('academic_year')
-    else:
-        admission.state_reason = reason
-    admission.save()
-    save_state_changed_and_send_email(admission, request.user)
+    return apply_state_transition(
+        registrations_ids_list,
+        new_status,
+        request.user,
+        reason_by_state=reason_by_state,
+        academic_year_id=request.POST.get('academic_year'),
+    )
 
 
 @require_http_methods(['POST'])